@@ -1,23 +1,71 @@
-"""Data Layer - Repository implementations"""
+"""Data Layer - Repository implementations
+
+AI SDK(openai, anthropic, google.generativeai), pymongo, sqlite3를 쓰는 구현체는
+CLI 시작 시간을 줄이기 위해 처음 접근할 때 import합니다 (PEP 562 모듈 __getattr__).
+"""
+
+import importlib
+from typing import TYPE_CHECKING
 
 from diary.data.repositories.file_credential_repository import FileSystemCredentialRepository
 from diary.data.repositories.file_user_preferences_repository import FileSystemUserPreferencesRepository
 from diary.data.repositories.file_writing_style_examples_repository import FileSystemWritingStyleExamplesRepository
 from diary.data.repositories.file_chat_repository import FileSystemChatRepository
-from diary.data.repositories.openai_client import OpenAIClient
-from diary.data.repositories.anthropic_client import AnthropicClient
-from diary.data.repositories.google_ai_client import GoogleAIClient
-from diary.data.repositories.mongodb_chat_repository import MongoDBChatRepository
-from diary.data.repositories.mongodb_diary_repository import MongoDBDiaryRepository
+from diary.data.repositories.file_log_chat_repository import FileSystemLogChatRepository
+from diary.data.repositories.jsonl_telemetry_repository import JsonlTelemetryRepository
+from diary.data.repositories.file_job_checkpoint_repository import FileSystemJobCheckpointRepository
+from diary.data.repositories.fake_ai_client import FakeAIClient, FakeAIBehavior
+from diary.data.repositories.ai_client_registry import AIClientRegistry, ai_client_registry
+
+if TYPE_CHECKING:
+    from diary.data.repositories.openai_client import OpenAIClient
+    from diary.data.repositories.anthropic_client import AnthropicClient
+    from diary.data.repositories.google_ai_client import GoogleAIClient
+    from diary.data.repositories.mongodb_chat_repository import MongoDBChatRepository
+    from diary.data.repositories.mongodb_diary_repository import MongoDBDiaryRepository
+    from diary.data.repositories.sqlite_chat_repository import SQLiteChatRepository
+    from diary.data.repositories.sqlite_diary_repository import SQLiteDiaryRepository
+
+# 지연 로딩 대상: 이름 → 모듈 경로
+_LAZY_MODULES = {
+    "OpenAIClient": "diary.data.repositories.openai_client",
+    "AnthropicClient": "diary.data.repositories.anthropic_client",
+    "GoogleAIClient": "diary.data.repositories.google_ai_client",
+    "MongoDBChatRepository": "diary.data.repositories.mongodb_chat_repository",
+    "MongoDBDiaryRepository": "diary.data.repositories.mongodb_diary_repository",
+    "SQLiteChatRepository": "diary.data.repositories.sqlite_chat_repository",
+    "SQLiteDiaryRepository": "diary.data.repositories.sqlite_diary_repository",
+}
+
+
+def __getattr__(name: str):
+    """무거운 의존성을 가진 구현체를 처음 접근할 때 import"""
+    module_path = _LAZY_MODULES.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "FileSystemCredentialRepository",
     "FileSystemUserPreferencesRepository",
     "FileSystemWritingStyleExamplesRepository",
     "FileSystemChatRepository",
+    "FileSystemLogChatRepository",
+    "JsonlTelemetryRepository",
+    "FileSystemJobCheckpointRepository",
     "MongoDBChatRepository",
     "MongoDBDiaryRepository",
+    "SQLiteChatRepository",
+    "SQLiteDiaryRepository",
     "OpenAIClient",
     "AnthropicClient",
     "GoogleAIClient",
+    "FakeAIClient",
+    "FakeAIBehavior",
+    "AIClientRegistry",
+    "ai_client_registry",
 ]
@@ -0,0 +1,82 @@
+"""AI 클라이언트 레지스트리 (Provider별 지연 로딩)
+
+openai / anthropic / google.generativeai SDK는 import 비용이 크므로,
+선택된 Provider의 클라이언트 모듈만 처음 사용할 때 import합니다.
+"""
+
+import importlib
+from typing import Dict, Tuple
+
+from diary.domain.entities.ai_credential import AIProvider
+from diary.domain.interfaces.ai_client import AIClientInterface
+
+
+class AIClientRegistry:
+    """AIProvider → AI 클라이언트 클래스 매핑
+
+    클래스는 "모듈 경로 + 클래스 이름"으로 등록하고, create() 시점에만 import합니다.
+    """
+
+    def __init__(self):
+        self._entries: Dict[AIProvider, Tuple[str, str]] = {}
+
+    def register(self, provider: AIProvider, module_path: str, class_name: str) -> None:
+        """
+        클라이언트 등록 (import하지 않음)
+
+        Args:
+            provider: AI 서비스 제공자
+            module_path: 클라이언트 모듈 경로 (예: "diary.data.repositories.openai_client")
+            class_name: 클라이언트 클래스 이름 (예: "OpenAIClient")
+        """
+        self._entries[provider] = (module_path, class_name)
+
+    def is_registered(self, provider: AIProvider) -> bool:
+        """등록 여부 확인"""
+        return provider in self._entries
+
+    def get_client_class(self, provider: AIProvider) -> type:
+        """
+        클라이언트 클래스 조회 (이때 모듈을 import)
+
+        Args:
+            provider: AI 서비스 제공자
+
+        Returns:
+            AIClientInterface 구현 클래스
+
+        Raises:
+            ValueError: 등록되지 않은 provider인 경우
+        """
+        entry = self._entries.get(provider)
+        if entry is None:
+            raise ValueError(f"{provider.value} AI 클라이언트가 등록되어 있지 않습니다")
+
+        module_path, class_name = entry
+        module = importlib.import_module(module_path)
+        return getattr(module, class_name)
+
+    def create(self, provider: AIProvider, api_key: str, **kwargs) -> AIClientInterface:
+        """
+        클라이언트 생성
+
+        Args:
+            provider: AI 서비스 제공자
+            api_key: API 키
+            **kwargs: 클라이언트별 추가 인자 (model 등)
+
+        Returns:
+            AI 클라이언트 인스턴스
+
+        Raises:
+            ValueError: 등록되지 않은 provider인 경우
+        """
+        client_class = self.get_client_class(provider)
+        return client_class(api_key=api_key, **kwargs)
+
+
+# 기본 레지스트리 (지원하는 Provider 등록)
+ai_client_registry = AIClientRegistry()
+ai_client_registry.register(AIProvider.OPENAI, "diary.data.repositories.openai_client", "OpenAIClient")
+ai_client_registry.register(AIProvider.ANTHROPIC, "diary.data.repositories.anthropic_client", "AnthropicClient")
+ai_client_registry.register(AIProvider.GOOGLE, "diary.data.repositories.google_ai_client", "GoogleAIClient")
@@ -1,9 +1,11 @@
 """Anthropic Claude API 클라이언트 구현"""
 
-from typing import List
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from anthropic import Anthropic
 from anthropic.types import TextBlock
 
+from diary.domain.entities.token_usage import TokenUsage
 from diary.domain.interfaces.ai_client import AIClientInterface
 
 
@@ -16,15 +18,22 @@ class AnthropicClient(AIClientInterface):
             api_key: Anthropic API 키
             model: 사용할 모델 (기본: claude-sonnet-4-5, Smart and general)
         """
-        self.client = Anthropic(api_key=api_key)
+        # 재시도는 InstrumentedAIClient에서 수행하여 횟수를 기록함
+        self.client = Anthropic(api_key=api_key, max_retries=0)
         self.model = model
+        # 마지막 사용량은 호출한 스레드별로 보관 (서버 모드에서 여러 요청이 클라이언트 하나를 공유)
+        self._local = threading.local()
 
-    def chat(self, messages: List[dict]) -> str:
+    def chat(
+        self, messages: List[dict], session_id: Optional[str] = None, model: Optional[str] = None
+    ) -> str:
         """
         Anthropic Messages API 호출
 
         Args:
             messages: [{"role": "user", "content": "..."}, ...]
+            session_id: 채팅 세션 ID (매 요청에 전체 히스토리를 보내므로 사용하지 않음)
+            model: 이번 요청에만 사용할 모델 (None이면 기본 모델)
 
         Returns:
             AI 응답 텍스트
@@ -33,31 +42,17 @@ class AnthropicClient(AIClientInterface):
             Exception: API 호출 실패 시
         """
         try:
-            # Anthropic API는 system 메시지를 별도 파라미터로 받음
-            system_message = None
-            conversation_messages = []
-
-            for msg in messages:
-                # UTF-8 인코딩 문제 방지: 서로게이트 문자 제거
-                content = msg["content"]
-                if isinstance(content, str):
-                    content = content.encode("utf-8", errors="ignore").decode("utf-8")
-
-                if msg["role"] == "system":
-                    system_message = content
-                else:
-                    conversation_messages.append(
-                        {"role": msg["role"], "content": content}
-                    )
+            system_blocks, conversation_messages = self._prepare_messages(messages)
 
             # API 호출
             response = self.client.messages.create(
-                model=self.model,
+                model=model or self.model,
                 max_tokens=1000,
                 temperature=0.7,
-                system=system_message if system_message else "",
+                system=system_blocks,
                 messages=conversation_messages,
             )
+            self._local.last_usage = self._parse_usage(response, model)
 
             # TextBlock만 추출 (타입 안전성)
             for block in response.content:
@@ -68,4 +63,106 @@ class AnthropicClient(AIClientInterface):
             return ""
 
         except Exception as e:
-            raise Exception(f"Anthropic API 호출 실패: {str(e)}")
+            raise Exception(f"Anthropic API 호출 실패: {str(e)}") from e
+
+    def chat_stream(
+        self, messages: List[dict], session_id: Optional[str] = None, model: Optional[str] = None
+    ) -> Iterator[str]:
+        """
+        Anthropic Messages API 스트리밍 호출
+
+        Args:
+            messages: [{"role": "user", "content": "..."}, ...]
+            session_id: 채팅 세션 ID (사용하지 않음)
+            model: 이번 요청에만 사용할 모델 (None이면 기본 모델)
+
+        Yields:
+            AI 응답 텍스트 조각
+
+        Raises:
+            Exception: API 호출 실패 시
+        """
+        try:
+            self._local.last_usage = None
+            system_blocks, conversation_messages = self._prepare_messages(messages)
+
+            with self.client.messages.stream(
+                model=model or self.model,
+                max_tokens=1000,
+                temperature=0.7,
+                system=system_blocks,
+                messages=conversation_messages,
+            ) as stream:
+                for text in stream.text_stream:
+                    yield text
+                self._local.last_usage = self._parse_usage(stream.get_final_message(), model)
+
+        except Exception as e:
+            raise Exception(f"Anthropic API 호출 실패: {str(e)}") from e
+
+    def get_last_usage(self) -> Optional[TokenUsage]:
+        """마지막 호출의 토큰 사용량 (프롬프트 캐시 읽기/쓰기 포함)"""
+        return getattr(self._local, "last_usage", None)
+
+    def get_model_name(self) -> Optional[str]:
+        """기본 모델 이름"""
+        return self.model
+
+    def _prepare_messages(self, messages: List[dict]) -> Tuple[List[dict], List[dict]]:
+        """
+        API 전송용 (system 블록, 대화 메시지) 분리
+
+        Anthropic API는 system 메시지를 별도 파라미터로 받음
+        (시스템 프롬프트 + 대화 요약처럼 여러 개면 순서대로 블록으로 전달)
+        """
+        system_parts = []
+        conversation_messages = []
+
+        for msg in messages:
+            # UTF-8 인코딩 문제 방지: 서로게이트 문자 제거
+            content = msg["content"]
+            if isinstance(content, str):
+                content = content.encode("utf-8", errors="ignore").decode("utf-8")
+
+            if msg["role"] == "system":
+                system_parts.append(content)
+            else:
+                conversation_messages.append(
+                    {"role": msg["role"], "content": content}
+                )
+
+        return self._build_system_blocks(system_parts), conversation_messages
+
+    def _build_system_blocks(self, system_parts: List[str]) -> List[dict]:
+        """
+        system 파라미터용 텍스트 블록 생성
+
+        첫 블록(세션 내내 변하지 않는 시스템 프롬프트)에 cache_control을 붙여
+        Provider 측 프롬프트 캐시를 사용합니다. 대화 요약처럼 바뀌는 블록은 캐시 지점 뒤에 둡니다.
+        """
+        blocks = []
+        for index, text in enumerate(system_parts):
+            if not text:
+                continue
+            block: Dict[str, Any] = {"type": "text", "text": text}
+            if index == 0:
+                block["cache_control"] = {"type": "ephemeral"}
+            blocks.append(block)
+        return blocks
+
+    def _parse_usage(self, response, model: Optional[str] = None) -> Optional[TokenUsage]:
+        """응답의 usage를 TokenUsage로 변환"""
+        usage = getattr(response, "usage", None)
+        if usage is None:
+            return None
+
+        cached = getattr(usage, "cache_read_input_tokens", None) or 0
+        created = getattr(usage, "cache_creation_input_tokens", None) or 0
+        return TokenUsage(
+            model=getattr(response, "model", None) or model or self.model,
+            # Anthropic의 input_tokens는 캐시 적중/기록분을 제외한 값
+            prompt_tokens=(usage.input_tokens or 0) + cached + created,
+            completion_tokens=usage.output_tokens or 0,
+            cached_tokens=cached,
+            cache_creation_tokens=created,
+        )
@@ -0,0 +1,71 @@
+"""보관 계층 압축 코덱
+
+zstandard가 설치되어 있으면 zstd, 없으면 표준 라이브러리 gzip으로 압축합니다.
+두 형식 모두 압축 프레임을 이어 붙인 파일을 한 번에 풀 수 있어서,
+세그먼트 파일에 새 세션을 추가할 때 기존 내용을 다시 압축하지 않습니다.
+"""
+
+import gzip
+import io
+
+
+ZSTD_CODEC = "zstd"
+GZIP_CODEC = "gzip"
+
+# 코덱 → 세그먼트 파일 확장자
+CODEC_SUFFIXES = {ZSTD_CODEC: ".zst", GZIP_CODEC: ".gz"}
+
+# zstd 압축 레벨 (기본 3보다 약간 높게: 보관용이라 쓰기 속도보다 크기 우선)
+ZSTD_LEVEL = 9
+
+
+def _zstandard():
+    """zstandard 모듈 (설치되어 있지 않으면 None, 처음 필요할 때 import)"""
+    try:
+        import zstandard
+    except ImportError:
+        return None
+    return zstandard
+
+
+def default_codec() -> str:
+    """새로 압축할 때 사용할 코덱"""
+    return ZSTD_CODEC if _zstandard() else GZIP_CODEC
+
+
+def compress(data: bytes, codec: str) -> bytes:
+    """
+    데이터 압축 (프레임 하나)
+
+    Raises:
+        ValueError: 지원하지 않는 코덱이거나 zstandard가 없는 경우
+    """
+    if codec == GZIP_CODEC:
+        return gzip.compress(data)
+    if codec == ZSTD_CODEC:
+        return _require_zstandard().ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+    raise ValueError(f"지원하지 않는 압축 코덱: {codec}")
+
+
+def decompress(data: bytes, codec: str) -> bytes:
+    """
+    압축 해제 (이어 붙인 프레임 모두)
+
+    Raises:
+        ValueError: 지원하지 않는 코덱이거나 zstandard가 없는 경우
+    """
+    if codec == GZIP_CODEC:
+        return gzip.decompress(data)
+    if codec == ZSTD_CODEC:
+        reader = _require_zstandard().ZstdDecompressor().stream_reader(
+            io.BytesIO(data), read_across_frames=True
+        )
+        return reader.read()
+    raise ValueError(f"지원하지 않는 압축 코덱: {codec}")
+
+
+def _require_zstandard():
+    zstandard = _zstandard()
+    if zstandard is None:
+        raise ValueError("zstd로 압축된 보관 데이터를 읽으려면 zstandard 패키지가 필요합니다: uv sync --extra archive")
+    return zstandard
@@ -0,0 +1,117 @@
+"""원자적 파일 쓰기와 파일 잠금
+
+같은 디렉토리의 임시 파일에 다 쓴 뒤 os.replace로 교체하므로, 쓰는 도중 프로세스가
+죽어도 파일은 이전 내용이나 새 내용 중 하나로 남습니다 (잘린 파일이 생기지 않음).
+
+fsync 정책:
+- none: fsync하지 않음. 프로세스가 죽는 것에는 안전하지만 OS가 멈추거나 전원이 꺼지면
+  최근 쓰기가 사라지거나 빈 파일이 남을 수 있습니다.
+- file: 교체 전에 임시 파일을 fsync. 전원이 꺼져도 이전 내용이나 새 내용 중 하나가 남습니다.
+- full: 교체 후 디렉토리까지 fsync. 함수가 끝나면 새 내용이 디스크에 반영되어 있습니다.
+
+추가 전용 로그는 append_bytes로 덧붙입니다. 덧붙이기는 원자적이지 않으므로
+(중단되면 마지막 줄이 잘릴 수 있음) 읽는 쪽에서 잘린 마지막 줄을 버려야 합니다.
+
+읽고 고쳐 쓰는 파일(버전 확인, 인덱스 갱신)은 file_lock으로 잠급니다.
+"""
+
+import os
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows: 같은 프로세스 안에서만 잠금
+    fcntl = None
+
+
+FSYNC_NONE = "none"
+FSYNC_FILE = "file"
+FSYNC_FULL = "full"
+
+FSYNC_POLICIES = (FSYNC_NONE, FSYNC_FILE, FSYNC_FULL)
+
+DEFAULT_FSYNC_POLICY = FSYNC_FILE
+
+# 쓰다 만 임시 파일 확장자 (세션 목록에서 제외됨)
+TMP_SUFFIX = ".tmp"
+
+# 잠금 파일별 스레드 잠금 (fcntl 잠금은 같은 프로세스의 스레드끼리는 막지 못함)
+_thread_locks: Dict[str, threading.Lock] = defaultdict(threading.Lock)
+_thread_locks_guard = threading.Lock()
+
+
+def validate_fsync_policy(policy: str) -> str:
+    """
+    fsync 정책 검증
+
+    Raises:
+        ValueError: 지원하지 않는 정책인 경우
+    """
+    if policy not in FSYNC_POLICIES:
+        raise ValueError(f"지원하지 않는 fsync 정책: {policy} (사용 가능: {', '.join(FSYNC_POLICIES)})")
+    return policy
+
+
+def atomic_write_bytes(path: Path, data: bytes, fsync: str = DEFAULT_FSYNC_POLICY) -> None:
+    """임시 파일에 쓰고 path로 교체 (실패하면 임시 파일을 지우고 기존 파일은 그대로 둠)"""
+    # 프로세스/스레드별 임시 파일 이름 (mkstemp와 달리 umask 기준 권한으로 생성)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}{TMP_SUFFIX}")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+            if fsync != FSYNC_NONE:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    if fsync == FSYNC_FULL:
+        _fsync_directory(path.parent)
+
+
+def append_bytes(path: Path, data: bytes, fsync: str = DEFAULT_FSYNC_POLICY) -> None:
+    """파일 끝에 덧붙임 (파일이 없으면 만들고, full 정책이면 새 파일의 디렉토리 항목도 fsync)"""
+    created = not path.exists()
+    with open(path, "ab") as f:
+        f.write(data)
+        if fsync != FSYNC_NONE:
+            f.flush()
+            os.fsync(f.fileno())
+
+    if created and fsync == FSYNC_FULL:
+        _fsync_directory(path.parent)
+
+
+def _fsync_directory(directory: Path) -> None:
+    """디렉토리 항목(교체한 파일 이름) fsync (Windows는 디렉토리를 열 수 없어 건너뜀)"""
+    if os.name == "nt":
+        return
+    dir_fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
+
+@contextmanager
+def file_lock(lock_path: Path) -> Iterator[None]:
+    """lock_path로 배타 잠금 (같은 프로세스의 스레드끼리, fcntl을 지원하면 다른 프로세스와도)"""
+    with _thread_locks_guard:
+        thread_lock = _thread_locks[str(lock_path)]
+
+    with thread_lock:
+        if fcntl is None:
+            yield
+            return
+        with open(lock_path, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
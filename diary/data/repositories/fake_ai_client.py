@@ -0,0 +1,215 @@
+"""결정적(deterministic) 가짜 AI 클라이언트 구현
+
+API 키나 네트워크 없이 ChatService / ChatUI를 측정하고 테스트하기 위한 구현체입니다.
+- 지연시간 분포, 스트리밍 조각 간격, 오류 주입을 설정할 수 있음
+- 같은 시드와 같은 입력이면 항상 같은 응답과 같은 지연시간을 생성
+- 일기 요청에는 [DIARY_START]/[DIARY_END]로 감싼 고정 일기를 응답
+"""
+
+import math
+import os
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Iterator, List, Optional
+
+from diary.domain.entities.token_usage import TokenUsage
+from diary.domain.interfaces.ai_client import AIClientInterface
+
+
+DEFAULT_QUESTIONS = [
+    "안녕하세요! 오늘 하루는 어떠셨나요?",
+    "그랬군요. 그때 기분이 어땠나요?",
+    "오늘 가장 기억에 남는 순간은 언제였나요?",
+    "그 일 이후에는 어떻게 보내셨어요?",
+]
+
+DEFAULT_DIARY = (
+    "아침 공기가 생각보다 차가웠다. 바쁘게 흘러간 하루 속에서도 "
+    "잠깐 멈춰 숨을 고르던 순간이 오래 남는다. 내일은 조금 더 나에게 다정해지고 싶다."
+)
+
+DIARY_OFFER = "오늘 대화를 바탕으로 일기를 작성해드릴까요?"
+
+
+@dataclass
+class FakeAIBehavior:
+    """가짜 AI 응답 동작 설정
+
+    Attributes:
+        latency_ms: 응답(스트리밍이면 첫 조각)까지의 평균 지연시간
+        latency_jitter_ms: 지연시간 변동 폭
+        latency_distribution: "fixed", "uniform"(±jitter), "lognormal"(jitter를 표준편차로 사용)
+        chunk_interval_ms: 스트리밍 조각 사이 간격
+        chunk_size: 스트리밍 조각 하나의 글자 수
+        error_rate: 호출이 실패할 확률 (0.0 ~ 1.0)
+        error_message: 실패 시 오류 메시지 (재시도 판별용 상태 코드 포함 권장)
+        offer_after_turns: 사용자 메시지가 이 개수를 넘으면 일기 작성을 제안
+        seed: 난수 시드 (같은 시드면 같은 지연시간/오류 순서)
+        questions: 일반 대화에서 순서대로 돌려줄 질문 목록
+        diary_text: 일기 요청 시 돌려줄 일기 본문
+    """
+
+    latency_ms: float = 0.0
+    latency_jitter_ms: float = 0.0
+    latency_distribution: str = "fixed"
+    chunk_interval_ms: float = 0.0
+    chunk_size: int = 8
+    error_rate: float = 0.0
+    error_message: str = "503 Service Unavailable (fake error injection)"
+    offer_after_turns: int = 3
+    seed: int = 0
+    questions: List[str] = field(default_factory=lambda: list(DEFAULT_QUESTIONS))
+    diary_text: str = DEFAULT_DIARY
+
+    @classmethod
+    def from_env(cls) -> "FakeAIBehavior":
+        """
+        환경 변수로 동작 설정
+
+        DAILY_FAKE_LATENCY_MS, DAILY_FAKE_LATENCY_JITTER_MS, DAILY_FAKE_LATENCY_DISTRIBUTION,
+        DAILY_FAKE_CHUNK_MS, DAILY_FAKE_CHUNK_SIZE, DAILY_FAKE_ERROR_RATE,
+        DAILY_FAKE_ERROR_MESSAGE (예: "429 rate limit"으로 요청 한도 초과 재현), DAILY_FAKE_SEED
+        """
+        return cls(
+            latency_ms=float(os.getenv("DAILY_FAKE_LATENCY_MS", 0)),
+            latency_jitter_ms=float(os.getenv("DAILY_FAKE_LATENCY_JITTER_MS", 0)),
+            latency_distribution=os.getenv("DAILY_FAKE_LATENCY_DISTRIBUTION", "fixed"),
+            chunk_interval_ms=float(os.getenv("DAILY_FAKE_CHUNK_MS", 0)),
+            chunk_size=int(os.getenv("DAILY_FAKE_CHUNK_SIZE", 8)),
+            error_rate=float(os.getenv("DAILY_FAKE_ERROR_RATE", 0)),
+            error_message=os.getenv("DAILY_FAKE_ERROR_MESSAGE", cls.error_message),
+            seed=int(os.getenv("DAILY_FAKE_SEED", 0)),
+        )
+
+    def sample_latency(self, rng: random.Random) -> float:
+        """지연시간 샘플 (초)"""
+        if self.latency_distribution == "uniform":
+            value = rng.uniform(
+                self.latency_ms - self.latency_jitter_ms, self.latency_ms + self.latency_jitter_ms
+            )
+        elif self.latency_distribution == "lognormal" and self.latency_ms > 0:
+            # 평균이 latency_ms, 표준편차가 latency_jitter_ms인 로그정규분포 (긴 꼬리 재현)
+            sigma_sq = math.log(1 + (self.latency_jitter_ms / self.latency_ms) ** 2)
+            mu = math.log(self.latency_ms) - sigma_sq / 2
+            value = rng.lognormvariate(mu, math.sqrt(sigma_sq))
+        else:
+            value = self.latency_ms
+        return max(0.0, value) / 1000
+
+    def should_fail(self, rng: random.Random) -> bool:
+        """이번 호출을 실패시킬지 여부"""
+        return self.error_rate > 0 and rng.random() < self.error_rate
+
+    def respond(self, messages: List[dict]) -> str:
+        """
+        대화 내용에 대한 결정적 응답 생성
+
+        Args:
+            messages: [{"role": "user", "content": "..."}, ...]
+
+        Returns:
+            응답 텍스트 (일기 요청이면 [DIARY_START]/[DIARY_END] 형식)
+        """
+        user_messages = [m["content"] for m in messages if m["role"] == "user"]
+        assistant_messages = [m["content"] for m in messages if m["role"] == "assistant"]
+        last_user = user_messages[-1] if user_messages else ""
+        last_assistant = assistant_messages[-1] if assistant_messages else ""
+
+        if self._is_diary_request(last_user, last_assistant):
+            return f"[DIARY_START]\n{self.diary_text}\n[DIARY_END]"
+
+        if len(user_messages) > self.offer_after_turns:
+            return DIARY_OFFER
+
+        return self.questions[len(assistant_messages) % len(self.questions)]
+
+    def split_chunks(self, text: str) -> List[str]:
+        """스트리밍용 조각 분할"""
+        size = max(1, self.chunk_size)
+        return [text[i:i + size] for i in range(0, len(text), size)] or [""]
+
+    def _is_diary_request(self, last_user: str, last_assistant: str) -> bool:
+        """일기 작성 요청인지 판단"""
+        if "일기" in last_user and any(word in last_user for word in ("써", "작성")):
+            return True
+        if "일기를 작성해드릴까요" in last_assistant:
+            return any(word in last_user for word in ("네", "응", "좋아", "그래", "yes", "ㅇㅇ"))
+        return False
+
+
+class FakeAIClient(AIClientInterface):
+    """네트워크 없이 동작하는 결정적 가짜 AI 클라이언트"""
+
+    def __init__(
+        self,
+        behavior: Optional[FakeAIBehavior] = None,
+        model: str = "fake-model",
+        sleep=time.sleep,
+    ):
+        """
+        Args:
+            behavior: 응답 동작 설정 (기본: 지연 없음, 오류 없음)
+            model: 보고할 모델 이름
+            sleep: 대기 함수 (테스트에서 교체 가능)
+        """
+        self.behavior = behavior or FakeAIBehavior()
+        self.model = model
+        self._sleep = sleep
+        self._rng = random.Random(self.behavior.seed)
+        self._lock = threading.Lock()
+        # 마지막 사용량은 호출한 스레드별로 보관 (서버 모드에서 여러 요청이 클라이언트 하나를 공유)
+        self._local = threading.local()
+        self.call_count = 0
+
+    def chat(
+        self, messages: List[dict], session_id: Optional[str] = None, model: Optional[str] = None
+    ) -> str:
+        """가짜 응답 생성 (설정된 지연/오류 적용, model은 사용량에만 반영)"""
+        latency, fail = self._next_call()
+        self._sleep(latency)
+        if fail:
+            raise Exception(f"Fake API 호출 실패: {self.behavior.error_message}")
+
+        reply = self.behavior.respond(messages)
+        self._local.last_usage = self._build_usage(messages, reply, model)
+        return reply
+
+    def chat_stream(
+        self, messages: List[dict], session_id: Optional[str] = None, model: Optional[str] = None
+    ) -> Iterator[str]:
+        """가짜 스트리밍 응답 (첫 조각까지 지연 후 조각 간격마다 전송)"""
+        latency, fail = self._next_call()
+        self._sleep(latency)
+        if fail:
+            raise Exception(f"Fake API 호출 실패: {self.behavior.error_message}")
+
+        reply = self.behavior.respond(messages)
+        for index, chunk in enumerate(self.behavior.split_chunks(reply)):
+            if index and self.behavior.chunk_interval_ms:
+                self._sleep(self.behavior.chunk_interval_ms / 1000)
+            yield chunk
+        self._local.last_usage = self._build_usage(messages, reply, model)
+
+    def get_last_usage(self) -> Optional[TokenUsage]:
+        """마지막 호출의 (추정) 토큰 사용량"""
+        return getattr(self._local, "last_usage", None)
+
+    def get_model_name(self) -> Optional[str]:
+        """모델 이름"""
+        return self.model
+
+    def _next_call(self) -> tuple[float, bool]:
+        """호출 순서에 따른 (지연시간, 실패 여부) 결정 (스레드 안전)"""
+        with self._lock:
+            self.call_count += 1
+            return self.behavior.sample_latency(self._rng), self.behavior.should_fail(self._rng)
+
+    def _build_usage(self, messages: List[dict], reply: str, model: Optional[str] = None) -> TokenUsage:
+        """글자 수 기반 토큰 사용량 (한 글자 = 1토큰으로 단순 계산)"""
+        return TokenUsage(
+            model=model or self.model,
+            prompt_tokens=sum(len(m["content"]) for m in messages),
+            completion_tokens=len(reply),
+        )
@@ -0,0 +1,213 @@
+"""OpenAI 호환 로컬 HTTP 대역(stand-in) 서버
+
+실제 OpenAIClient를 이 서버로 향하게 하면(base_url 또는 OPENAI_BASE_URL)
+네트워크/API 키 없이 HTTP·SSE 경로까지 포함해 측정할 수 있습니다.
+응답 내용과 지연/오류는 FakeAIBehavior를 그대로 사용합니다.
+
+실행:
+    python -m diary.data.repositories.fake_openai_server --port 8089
+    OPENAI_BASE_URL=http://127.0.0.1:8089/v1 uv run main.py
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+from diary.data.repositories.fake_ai_client import FakeAIBehavior
+
+
+class FakeOpenAIServer:
+    """/v1/chat/completions 만 지원하는 OpenAI 호환 가짜 서버"""
+
+    def __init__(
+        self,
+        behavior: Optional[FakeAIBehavior] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        model: str = "fake-model",
+    ):
+        """
+        Args:
+            behavior: 응답 동작 설정
+            host: 바인딩할 호스트
+            port: 바인딩할 포트 (0이면 빈 포트 자동 선택)
+            model: 요청에 모델이 없을 때 응답에 표시할 모델 이름
+        """
+        self.behavior = behavior or FakeAIBehavior()
+        self.model = model
+        self._rng = random.Random(self.behavior.seed)
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        """OpenAIClient에 넘길 base_url (예: http://127.0.0.1:8089/v1)"""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self) -> str:
+        """
+        백그라운드 스레드에서 서버 시작
+
+        Returns:
+            base_url
+        """
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self.base_url
+
+    def serve_forever(self) -> None:
+        """현재 스레드에서 서버 실행 (Ctrl+C로 종료)"""
+        self._httpd.serve_forever()
+
+    def stop(self) -> None:
+        """서버 종료"""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread:
+            self._thread.join(timeout=5)
+
+    def __enter__(self):
+        """Context manager 지원"""
+        self.start()
+        return self
+
+    def __exit__(self, _exc_type, _exc_val, _exc_tb):
+        """Context manager 종료 시 서버 종료"""
+        self.stop()
+
+    def _next_call(self) -> tuple[float, bool]:
+        """호출 순서에 따른 (지연시간, 실패 여부) 결정"""
+        with self._lock:
+            return self.behavior.sample_latency(self._rng), self.behavior.should_fail(self._rng)
+
+    def _make_handler(self):
+        """요청 핸들러 클래스 생성 (서버 인스턴스를 클로저로 참조)"""
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                # 벤치마크 출력이 지저분해지지 않도록 접근 로그 생략
+                pass
+
+            def do_POST(self):
+                if not self.path.rstrip("/").endswith("/chat/completions"):
+                    self._send_json(404, {"error": {"message": "not found"}})
+                    return
+
+                length = int(self.headers.get("Content-Length", 0))
+                try:
+                    body = json.loads(self.rfile.read(length) or b"{}")
+                except json.JSONDecodeError:
+                    self._send_json(400, {"error": {"message": "invalid JSON"}})
+                    return
+
+                latency, fail = server._next_call()
+                time.sleep(latency)
+                if fail:
+                    self._send_json(503, {"error": {"message": server.behavior.error_message}})
+                    return
+
+                messages = body.get("messages", [])
+                reply = server.behavior.respond(messages)
+                # 요청한 모델을 그대로 돌려줌 (모델 라우팅 확인용)
+                model = body.get("model") or server.model
+                usage = {
+                    "prompt_tokens": sum(len(m.get("content") or "") for m in messages),
+                    "completion_tokens": len(reply),
+                    "total_tokens": 0,
+                    "prompt_tokens_details": {"cached_tokens": 0},
+                }
+                usage["total_tokens"] = usage["prompt_tokens"] + usage["completion_tokens"]
+
+                if body.get("stream"):
+                    self._send_stream(reply, usage, body.get("stream_options") or {}, model)
+                else:
+                    self._send_json(200, {
+                        "id": f"chatcmpl-{uuid.uuid4().hex}",
+                        "object": "chat.completion",
+                        "created": int(time.time()),
+                        "model": model,
+                        "choices": [{
+                            "index": 0,
+                            "message": {"role": "assistant", "content": reply},
+                            "finish_reason": "stop",
+                        }],
+                        "usage": usage,
+                    })
+
+            def _send_json(self, status: int, payload: dict):
+                data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _send_stream(self, reply: str, usage: dict, stream_options: dict, model: str):
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Cache-Control", "no-cache")
+                self.send_header("Connection", "close")
+                self.end_headers()
+                self.close_connection = True
+
+                completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+                created = int(time.time())
+
+                def event(choices: list, extra: Optional[dict] = None):
+                    payload = {
+                        "id": completion_id,
+                        "object": "chat.completion.chunk",
+                        "created": created,
+                        "model": model,
+                        "choices": choices,
+                    }
+                    payload.update(extra or {})
+                    self.wfile.write(f"data: {json.dumps(payload, ensure_ascii=False)}\n\n".encode("utf-8"))
+                    self.wfile.flush()
+
+                chunks = server.behavior.split_chunks(reply)
+                for index, chunk in enumerate(chunks):
+                    if index and server.behavior.chunk_interval_ms:
+                        time.sleep(server.behavior.chunk_interval_ms / 1000)
+                    delta = {"content": chunk}
+                    if index == 0:
+                        delta["role"] = "assistant"
+                    event([{"index": 0, "delta": delta, "finish_reason": None}])
+
+                event([{"index": 0, "delta": {}, "finish_reason": "stop"}])
+                if stream_options.get("include_usage"):
+                    event([], {"usage": usage})
+                self.wfile.write(b"data: [DONE]\n\n")
+                self.wfile.flush()
+
+        return Handler
+
+
+def main():
+    """명령행 실행: 환경 변수(DAILY_FAKE_*)로 동작 설정"""
+    parser = argparse.ArgumentParser(description="OpenAI 호환 가짜 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    args = parser.parse_args()
+
+    server = FakeOpenAIServer(FakeAIBehavior.from_env(), host=args.host, port=args.port)
+    print(f"Fake OpenAI server: {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
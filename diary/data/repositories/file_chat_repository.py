@@ -1,126 +1,568 @@
 """파일 시스템 기반 채팅 저장소 구현"""
 
 import json
+import os
+from collections import defaultdict
+from datetime import datetime
 from pathlib import Path
-from typing import Optional, List
+from typing import ContextManager, Dict, Optional, List
 
 from diary.domain.interfaces.chat_repository import ChatRepositoryInterface
+from diary.domain.interfaces.user_scoped_repository import DEFAULT_USER_ID, validate_user_id
+from diary.data.repositories.user_paths import user_scoped_path
 from diary.domain.entities.chat_session import ChatSession
+from diary.domain.exceptions import SessionConflictError
+from diary.domain.services.system_prompt_builder import compute_prompt_hash
+from diary.data.repositories.archive_codec import CODEC_SUFFIXES, compress, decompress, default_codec
+from diary.data.repositories.atomic_file import (
+    DEFAULT_FSYNC_POLICY,
+    FSYNC_NONE,
+    atomic_write_bytes,
+    file_lock,
+    validate_fsync_policy,
+)
+from diary.data.repositories.session_manifest import (
+    MANIFEST_FILE,
+    ManifestData,
+    SessionManifest,
+    SessionManifestEntry,
+)
+from diary.data.repositories.session_codec import (
+    DEFAULT_SESSION_CODEC,
+    SESSION_CODEC_SUFFIXES,
+    codec_for_path,
+    decode_session,
+    encode_session,
+    validate_codec,
+)
+from diary.data.repositories.prompt_store import (
+    FileSystemPromptStore,
+    PromptCompactionReport,
+    compact_message,
+    expand_message,
+    is_inline_prompt,
+    to_prompt_ref,
+)
+
+
+# tail 인덱스에 보관하는 최근 메시지 수 (이보다 많이 요청하면 전체 파일을 읽음)
+TAIL_INDEX_SIZE = 50
+
+TAIL_INDEX_SUFFIX = ".tail.json"
+
+ARCHIVE_INDEX_FILE = "index.json"
+
+LOCK_SUFFIX = ".lock"
+
+# manifest 이전에 활성 세션 ID를 저장하던 파일 (manifest를 처음 만들 때 옮기고 삭제)
+LEGACY_ACTIVE_SESSION_FILE = "active_session.json"
+
+# 읽을 수 없는 세션 파일은 지우지 않고 이 확장자를 붙여 옮겨 둠
+CORRUPT_SUFFIX = ".corrupt"
 
 
 class FileSystemChatRepository(ChatRepositoryInterface):
     """
-    채팅 세션을 JSON 파일로 저장하는 구현체
+    채팅 세션을 파일로 저장하는 구현체
 
     파일 구조:
-    - data/chats/{session_id}.json : 각 세션 데이터
-    - data/chats/active_session.json : 현재 활성 세션 ID
+    - data/chats/{session_id}.json : 각 세션 데이터 (msgpack 코덱이면 {session_id}.msgpack)
+    - data/chats/{session_id}.tail.json : 첫 메시지 + 최근 메시지 인덱스 (이어하기용)
+    - data/chats/manifest.json : 세션 목록 인덱스 (세션별 생성/수정 시각, 종료 여부 + 활성 세션 ID)
+    - data/chats/prompts/{hash}.txt : 시스템 프롬프트 본문 (세션에는 해시만 저장)
+    - data/chats/archive/{YYYY-MM}.jsonl.zst : 보관된 세션 (마지막 수정 월별, zstd가 없으면 .gz)
+    - data/chats/archive/index.json : 보관된 세션 ID → 세그먼트 파일, 마지막 수정 시각
+    - data/chats/{session_id}.lock : 저장 중 잠금 파일 (버전 확인과 쓰기를 한 번에)
+    - data/chats/{session_id}.json.corrupt : 읽을 수 없어서 옮겨 둔 세션 파일
+
+    기본 사용자 외의 사용자는 data/users/{user_id}/chats/ 아래에 같은 구조로 저장합니다.
+
+    세션 목록과 활성 세션은 manifest로 찾으므로 디렉토리 전체를 읽지 않습니다.
+    manifest가 없거나 손상되었으면 세션 파일로 다시 만들고, rebuild_manifest()로 직접 다시 만들 수도 있습니다.
+
+    tail 인덱스에는 저장 당시 세션 파일의 수정 시각/크기를 기록해 두고,
+    세션 파일이 바뀌었으면(인덱스가 오래되었으면) 전체 파일을 읽습니다.
+
+    모든 파일은 임시 파일에 쓴 뒤 교체하므로, 저장 중에 중단되어도 세션 파일이 잘리지 않습니다.
     """
 
-    def __init__(self, data_dir: Path = Path("data/chats")):
-        self.data_dir = data_dir
+    def __init__(
+        self,
+        data_dir: Path = Path("data/chats"),
+        user_id: str = DEFAULT_USER_ID,
+        codec: str = DEFAULT_SESSION_CODEC,
+        fsync: str = DEFAULT_FSYNC_POLICY,
+    ):
+        """
+        Args:
+            data_dir: 채팅 데이터 디렉토리 (기본 사용자의 세션 위치)
+            user_id: 사용자 ID
+            codec: 세션 파일 코덱 ("json": 공백 없는 JSON, "msgpack": msgpack 패키지 필요).
+                다른 코덱으로 저장된 세션도 읽을 수 있고, 다음 저장 때 이 코덱으로 바뀝니다.
+            fsync: fsync 정책 ("none", "file", "full", atomic_file 모듈 참고)
+
+        Raises:
+            ValueError: 사용자 ID, 코덱, fsync 정책이 올바르지 않은 경우
+        """
+        self.root_dir = data_dir
+        self.user_id = validate_user_id(user_id)
+        self.codec = validate_codec(codec)
+        self.fsync = validate_fsync_policy(fsync)
+        self.data_dir = user_scoped_path(data_dir, user_id)
         self.data_dir.mkdir(parents=True, exist_ok=True)
-        self.active_session_file = self.data_dir / "active_session.json"
+        self.prompt_store = FileSystemPromptStore(self.data_dir / "prompts")
+        self.archive_dir = self.data_dir / "archive"
+        self.manifest = SessionManifest(self.data_dir, self._scan_manifest, self.fsync)
+
+    def for_user(self, user_id: str) -> "FileSystemChatRepository":
+        """다른 사용자의 세션 저장소"""
+        return FileSystemChatRepository(self.root_dir, user_id, codec=self.codec, fsync=self.fsync)
 
     def save_session(self, session: ChatSession) -> None:
-        """세션을 JSON 파일로 저장"""
-        session_file = self.data_dir / f"{session.session_id}.json"
+        """세션을 파일로 저장 (session.version이 파일의 버전과 같을 때만, 저장 후 버전 증가)
+
+        Raises:
+            SessionConflictError: 다른 곳에서 먼저 저장했거나 삭제한 경우
+        """
+        session_file = self._session_file(session.session_id)
+        target_file = self._target_file(session.session_id)
 
         try:
-            # 세션 데이터 저장
-            with open(session_file, "w", encoding="utf-8") as f:
-                json.dump(session.to_dict(), f, indent=2, ensure_ascii=False)
-
-            # 활성 세션인 경우 active_session.json 업데이트
-            if session.is_active:
-                with open(self.active_session_file, "w", encoding="utf-8") as f:
-                    json.dump({"session_id": session.session_id}, f, ensure_ascii=False)
-            else:
-                # 비활성화된 세션이 현재 활성 세션이면 active_session.json 제거
-                if self.active_session_file.exists():
-                    with open(self.active_session_file, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-                        if data.get("session_id") == session.session_id:
-                            self.active_session_file.unlink()
+            with self._session_lock(session.session_id):
+                stored_version = self._stored_version(session_file)
+                # 버전 0: 새 세션이거나 버전이 생기기 전에 저장한 파일
+                expected = (None, 0) if session.version == 0 else (session.version,)
+                if stored_version not in expected:
+                    raise SessionConflictError(session.session_id, session.version, stored_version)
+
+                if stored_version is None:
+                    # 새 세션은 파일보다 manifest에 먼저 등록 (중간에 중단되어도 목록에서 사라지지 않음)
+                    self.manifest.record(session)
+                self._write_session(session_file, target_file, session)
+                session.mark_saved(session.version + 1)
+                self.manifest.record(session)
 
         except (UnicodeEncodeError, TypeError) as e:
+            # 직렬화에 실패하면 교체 전이므로 기존 파일은 그대로 남음
             print(f"Warning: Failed to save session {session.session_id}: {e}")
-            # 손상된 파일 삭제
-            if session_file.exists():
-                session_file.unlink()
 
     def get_session(self, session_id: str) -> Optional[ChatSession]:
-        """특정 세션 조회"""
-        session_file = self.data_dir / f"{session_id}.json"
+        """특정 세션 조회 (없으면 보관된 세션에서 찾음)"""
+        session_file = self._session_file(session_id)
 
         if not session_file.exists():
-            return None
+            return self._get_archived_session(session_id)
 
         try:
-            with open(session_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                return ChatSession.from_dict(data)
-        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            return self._to_session(self._read_session_file(session_file))
+        except ValueError as e:
             print(e)
-            # JSON 파일이 손상된 경우 None 반환하고 파일 삭제
-            print(f"Warning: Corrupted session file {session_id}, removing it.")
-            session_file.unlink()
+            # 파일이 손상된 경우 None 반환 (복구할 수 있도록 지우지 않고 옮겨 둠)
+            corrupt_file = session_file.with_name(session_file.name + CORRUPT_SUFFIX)
+            print(f"Warning: Corrupted session file {session_id}, moved to {corrupt_file.name}.")
+            session_file.replace(corrupt_file)
+            self._tail_index_file(session_id).unlink(missing_ok=True)
+            self.manifest.remove([session_id])
             return None
 
     def get_active_session(self) -> Optional[ChatSession]:
         """현재 활성화된 세션 반환"""
-        if not self.active_session_file.exists():
+        session_id = self.manifest.active_session_id()
+        if session_id:
+            return self.get_session(session_id)
+        return None
+
+    def get_active_session_tail(self, tail_size: int) -> Optional[ChatSession]:
+        """활성 세션을 첫 메시지 + 최근 tail_size개 메시지만 반환 (tail 인덱스 사용)"""
+        session_id = self.manifest.active_session_id()
+        if not session_id:
             return None
 
-        try:
-            with open(self.active_session_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                session_id = data.get("session_id")
-                if session_id:
-                    return self.get_session(session_id)
-        except (json.JSONDecodeError, UnicodeDecodeError) as e:
-            print(e)
-            # active_session.json이 손상된 경우 파일 삭제
-            print("Warning: Corrupted active_session.json, removing it.")
-            self.active_session_file.unlink()
+        if tail_size <= TAIL_INDEX_SIZE:
+            session = self._read_tail_index(session_id, max(1, tail_size))
+            if session:
+                return session
 
-        return None
+        # 인덱스가 없거나 오래되었으면 전체 파일을 읽음 (다음 저장 때 인덱스 갱신)
+        return self.get_session(session_id)
 
     def list_sessions(self, limit: int = 10) -> List[ChatSession]:
-        """세션 목록 조회 (최신순)"""
-        session_files = sorted(
-            self.data_dir.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True
-        )
-
+        """세션 목록 조회 (최신순, manifest 순서대로 limit개만 읽음)"""
         sessions = []
-        for session_file in session_files:
-            # active_session.json은 제외
-            if session_file.name == "active_session.json":
-                continue
-
+        missing = []
+        for entry in self.manifest.recent():
             if len(sessions) >= limit:
                 break
+            session_file = self._session_file(entry.session_id)
+            if not session_file.exists():
+                # 등록 후 파일을 쓰기 전에 중단되었거나 다른 곳에서 지운 세션
+                missing.append(entry.session_id)
+                continue
+            sessions.append(self._to_session(self._read_session_file(session_file)))
 
-            with open(session_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                sessions.append(ChatSession.from_dict(data))
-
+        self.manifest.remove(missing)
         return sessions
 
     def delete_session(self, session_id: str) -> bool:
-        """세션 삭제"""
-        session_file = self.data_dir / f"{session_id}.json"
+        """세션 삭제 (보관된 세션도 삭제)"""
+        if not self._session_file(session_id).exists():
+            return self._remove_archived({session_id}) > 0
+
+        self._remove_session_files(session_id)
+        self.manifest.remove([session_id])
+        return True
+
+    def rebuild_manifest(self) -> int:
+        """
+        세션 파일을 모두 읽어 manifest를 다시 만듦 (manifest 없이 세션 파일을 옮겨 넣은 경우 등)
+
+        Returns:
+            manifest에 등록한 세션 수
+        """
+        return self.manifest.rebuild()
+
+    def archive_sessions(self, updated_before: datetime) -> int:
+        """
+        마지막 수정이 updated_before 이전인 종료 세션을 월별 압축 세그먼트로 이동
+
+        세그먼트에 압축 프레임을 이어 붙이고 인덱스를 갱신한 뒤에 원본 파일을 지우므로,
+        중간에 중단되어도 세션을 잃지 않습니다 (같은 세션이 양쪽에 있으면 원본이 우선).
+        """
+        by_segment: Dict[str, List[dict]] = defaultdict(list)
+        codec = default_codec()
+
+        for entry in self.manifest.recent():
+            if entry.is_active or entry.updated_at >= updated_before:
+                continue
+            session_file = self._session_file(entry.session_id)
+            if not session_file.exists():
+                continue
+            data = self._read_session_file(session_file)
+            updated_at = datetime.fromisoformat(data["updated_at"])
+            if updated_at >= updated_before:
+                # manifest의 수정 시각은 순서가 바뀔 때만 갱신되므로 세션 파일 기준으로 다시 확인
+                continue
+            segment = f"{updated_at:%Y-%m}.jsonl{CODEC_SUFFIXES[codec]}"
+            by_segment[segment].append(data)
+
+        if not by_segment:
+            return 0
+
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        index = self._read_archive_index()
+        for segment, sessions in by_segment.items():
+            lines = "".join(json.dumps(data, ensure_ascii=False) + "\n" for data in sessions)
+            with open(self.archive_dir / segment, "ab") as f:
+                f.write(compress(lines.encode("utf-8"), codec))
+                f.flush()
+                os.fsync(f.fileno())
+            for data in sessions:
+                index[data["session_id"]] = {"segment": segment, "updated_at": data["updated_at"]}
+        self._write_archive_index(index)
+
+        archived = [data["session_id"] for sessions in by_segment.values() for data in sessions]
+        for session_id in archived:
+            self._remove_session_files(session_id)
+        self.manifest.remove(archived)
+        return len(archived)
+
+    def expire_archived_sessions(self, updated_before: datetime) -> int:
+        """마지막 수정이 updated_before 이전인 보관 세션 삭제 (해당 세그먼트만 다시 씀)"""
+        index = self._read_archive_index()
+        expired = {
+            session_id for session_id, entry in index.items()
+            if datetime.fromisoformat(entry["updated_at"]) < updated_before
+        }
+        return self._remove_archived(expired)
+
+    def _session_files(self) -> List[Path]:
+        """세션 파일 목록 (모든 코덱, manifest와 tail 인덱스 제외, 디렉토리 전체를 읽음)"""
+        reserved = {MANIFEST_FILE, LEGACY_ACTIVE_SESSION_FILE}
+        return sorted(
+            path
+            for suffix in SESSION_CODEC_SUFFIXES.values()
+            for path in self.data_dir.glob(f"*{suffix}")
+            if path.name not in reserved and not path.name.endswith(TAIL_INDEX_SUFFIX)
+        )
+
+    def _scan_manifest(self) -> ManifestData:
+        """
+        세션 파일을 모두 읽어 manifest 내용 생성
+
+        활성 세션은 예전 active_session.json이 가리키는 진행 중 세션, 없으면 가장 최근에 수정한 진행 중 세션입니다.
+        active_session.json은 옮긴 뒤 삭제합니다.
+        """
+        data = ManifestData()
+        for session_file in self._session_files():
+            try:
+                entry = SessionManifestEntry.from_session_dict(self._read_session_file(session_file))
+            except (ValueError, KeyError) as e:
+                print(f"Warning: Skipping unreadable session file {session_file.name}: {e}")
+                continue
+            data.entries[entry.session_id] = entry
+
+        legacy_file = self.data_dir / LEGACY_ACTIVE_SESSION_FILE
+        try:
+            legacy_id = json.loads(legacy_file.read_text(encoding="utf-8")).get("session_id")
+        except (OSError, ValueError, AttributeError):
+            legacy_id = None
+        active = [entry for entry in data.entries.values() if entry.is_active]
+        if legacy_id in {entry.session_id for entry in active}:
+            data.active_session_id = legacy_id
+        elif active:
+            data.active_session_id = max(active, key=lambda e: e.updated_at).session_id
+        legacy_file.unlink(missing_ok=True)
+        return data
 
+    def _target_file(self, session_id: str) -> Path:
+        """이 저장소의 코덱으로 저장할 세션 파일 경로"""
+        return self.data_dir / f"{session_id}{SESSION_CODEC_SUFFIXES[self.codec]}"
+
+    def _session_file(self, session_id: str) -> Path:
+        """세션 파일 경로 (이 저장소의 코덱 파일이 없으면 다른 코덱으로 저장된 파일, 둘 다 없으면 저장할 경로)"""
+        target_file = self._target_file(session_id)
+        if target_file.exists():
+            return target_file
+        for suffix in SESSION_CODEC_SUFFIXES.values():
+            path = self.data_dir / f"{session_id}{suffix}"
+            if path.exists():
+                return path
+        return target_file
+
+    def _read_session_file(self, session_file: Path) -> dict:
+        """
+        세션 파일을 확장자의 코덱으로 읽음
+
+        Raises:
+            ValueError: 파일이 손상된 경우
+        """
+        return decode_session(session_file.read_bytes(), codec_for_path(session_file))
+
+    def _write_session(self, session_file: Path, target_file: Path, session: ChatSession) -> None:
+        """
+        버전을 확인한 세션을 저장 (저장 잠금 안에서 호출)
+
+        일부만 읽은 세션이면 생략된 중간 메시지는 기존 파일에서 가져옵니다.
+
+        Args:
+            session_file: 지금 세션이 저장되어 있는 파일 (없을 수 있음)
+            target_file: 이 저장소의 코덱으로 저장할 파일
+            session: 저장할 세션 (버전은 저장 전 버전)
+        """
+        data = self._to_full_dict(session_file, session)
+        data["version"] = session.version + 1
+        self._write_snapshot(target_file, data)
+        if session_file != target_file:
+            # 다른 코덱으로 저장되어 있던 파일은 새 코덱 파일로 대체
+            session_file.unlink(missing_ok=True)
+
+    def _write_snapshot(self, session_file: Path, data: dict) -> None:
+        """세션 전체를 파일 확장자의 코덱으로 다시 쓰고 tail 인덱스 갱신"""
+        atomic_write_bytes(session_file, encode_session(data, codec_for_path(session_file)), self.fsync)
+        self._write_tail_index(session_file, data)
+
+    def _remove_session_files(self, session_id: str) -> None:
+        """세션 파일(모든 코덱), tail 인덱스, 잠금 파일 삭제"""
+        for suffix in SESSION_CODEC_SUFFIXES.values():
+            (self.data_dir / f"{session_id}{suffix}").unlink(missing_ok=True)
+        self._tail_index_file(session_id).unlink(missing_ok=True)
+        (self.data_dir / f"{session_id}{LOCK_SUFFIX}").unlink(missing_ok=True)
+
+    def _get_archived_session(self, session_id: str) -> Optional[ChatSession]:
+        """보관 세그먼트에서 세션 조회"""
+        entry = self._read_archive_index().get(session_id)
+        if not entry:
+            return None
+
+        found = None
+        for data in self._read_segment(entry["segment"]):
+            if data["session_id"] == session_id:
+                found = data  # 같은 세션이 다시 보관되었으면 마지막 것 사용
+        return self._to_session(found) if found else None
+
+    def _read_segment(self, segment: str) -> List[dict]:
+        """세그먼트의 세션 딕셔너리 목록 (없으면 빈 리스트)"""
+        segment_file = self.archive_dir / segment
+        if not segment_file.exists():
+            return []
+        text = decompress(segment_file.read_bytes(), self._segment_codec(segment)).decode("utf-8")
+        return [json.loads(line) for line in text.splitlines() if line]
+
+    @staticmethod
+    def _segment_codec(segment: str) -> str:
+        """세그먼트 파일 확장자로 압축 코덱 판별"""
+        return next(codec for codec, suffix in CODEC_SUFFIXES.items() if segment.endswith(suffix))
+
+    def _remove_archived(self, session_ids: set) -> int:
+        """보관 세션 삭제 (세션이 남지 않은 세그먼트는 파일째 삭제)"""
+        index = self._read_archive_index()
+        targets = {session_id: index[session_id] for session_id in session_ids if session_id in index}
+        if not targets:
+            return 0
+
+        for segment in {entry["segment"] for entry in targets.values()}:
+            remaining = [data for data in self._read_segment(segment) if data["session_id"] not in targets]
+            segment_file = self.archive_dir / segment
+            if not remaining:
+                segment_file.unlink(missing_ok=True)
+                continue
+            lines = "".join(json.dumps(data, ensure_ascii=False) + "\n" for data in remaining)
+            atomic_write_bytes(segment_file, compress(lines.encode("utf-8"), self._segment_codec(segment)), self.fsync)
+
+        for session_id in targets:
+            del index[session_id]
+        self._write_archive_index(index)
+        return len(targets)
+
+    def _read_archive_index(self) -> Dict[str, dict]:
+        """보관 인덱스 (없으면 빈 딕셔너리)"""
+        index_file = self.archive_dir / ARCHIVE_INDEX_FILE
+        if not index_file.exists():
+            return {}
+        with open(index_file, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _write_archive_index(self, index: Dict[str, dict]) -> None:
+        """보관 인덱스 저장 (임시 파일에 쓰고 교체)"""
+        data = json.dumps(index, ensure_ascii=False).encode("utf-8")
+        atomic_write_bytes(self.archive_dir / ARCHIVE_INDEX_FILE, data, self.fsync)
+
+    def _to_full_dict(self, session_file: Path, session: ChatSession) -> dict:
+        """
+        저장할 전체 세션 딕셔너리
+
+        일부만 읽은 세션이면 기존 파일의 중간 메시지와 합칩니다.
+        시스템 프롬프트 본문은 프롬프트 저장소에 넣고 해시만 남깁니다.
+
+        Raises:
+            ValueError: 기존 파일에 생략된 메시지가 없는 경우
+        """
+        data = session.to_dict()
+        data["messages"] = [compact_message(msg, self.prompt_store) for msg in data["messages"]]
+        if not session.is_partial:
+            return data
+
+        stored_messages = self._read_session_file(session_file)["messages"]
+        if len(stored_messages) < 1 + session.omitted_messages:
+            raise ValueError(f"세션 {session.session_id}의 생략된 메시지를 파일에서 찾을 수 없습니다.")
+
+        data["messages"] = (
+            data["messages"][:1]
+            + stored_messages[1:1 + session.omitted_messages]
+            + data["messages"][1:]
+        )
+        return data
+
+    def _to_session(self, data: dict) -> ChatSession:
+        """저장된 딕셔너리를 세션으로 변환 (프롬프트 참조는 본문으로 복원)"""
+        messages = [expand_message(msg, self.prompt_store) for msg in data.get("messages", [])]
+        return ChatSession.from_dict({**data, "messages": messages})
+
+    def compact_stored_prompts(self, dry_run: bool = False) -> PromptCompactionReport:
+        """
+        프롬프트 본문을 그대로 담고 있는 기존 세션 파일을 해시 참조로 압축
+
+        크기는 세션 파일 기준으로 계산합니다 (tail 인덱스는 다시 쓰기만 함).
+
+        Args:
+            dry_run: True면 파일을 바꾸지 않고 절약될 크기만 계산
+
+        Returns:
+            PromptCompactionReport
+        """
+        report = PromptCompactionReport(dry_run=dry_run)
+        new_prompts = set()
+        for session_file in self._session_files():
+            report.sessions_scanned += 1
+            data = self._read_session_file(session_file)
+
+            messages = data.get("messages", [])
+            inline_prompts = [msg["content"] for msg in messages if is_inline_prompt(msg)]
+            if not inline_prompts:
+                continue
+
+            for text in inline_prompts:
+                prompt_hash = compute_prompt_hash(text)
+                if prompt_hash not in new_prompts and not self.prompt_store.contains(prompt_hash):
+                    new_prompts.add(prompt_hash)
+                    report.prompt_bytes += len(text.encode("utf-8"))
+
+            data["messages"] = [
+                compact_message(msg, self.prompt_store) if not dry_run else to_prompt_ref(msg)
+                for msg in messages
+            ]
+            serialized = encode_session(data, codec_for_path(session_file))
+            report.sessions_compacted += 1
+            report.bytes_before += session_file.stat().st_size
+            report.bytes_after += len(serialized)
+
+            if not dry_run:
+                self._write_snapshot(session_file, data)
+
+        return report
+
+    def _session_lock(self, session_id: str) -> ContextManager[None]:
+        """세션 저장 잠금 (같은 프로세스의 스레드끼리, fcntl을 지원하면 다른 프로세스와도)"""
+        return file_lock(self.data_dir / f"{session_id}{LOCK_SUFFIX}")
+
+    def _stored_version(self, session_file: Path) -> Optional[int]:
+        """
+        파일에 저장된 세션 버전 (파일이 없으면 None, 버전이 생기기 전에 저장한 파일은 0)
+
+        tail 인덱스가 최신이면 인덱스에서, 아니면 세션 파일에서 읽습니다.
+        """
         if not session_file.exists():
-            return False
+            return None
+        index = self._read_tail_index_data(session_file.stem)
+        if index is not None:
+            return index.get("version", 0)
+        return self._read_session_file(session_file).get("version", 0)
 
-        # 활성 세션이면 active_session.json도 제거
-        if self.active_session_file.exists():
-            with open(self.active_session_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                if data.get("session_id") == session_id:
-                    self.active_session_file.unlink()
+    def _tail_index_file(self, session_id: str) -> Path:
+        """세션의 tail 인덱스 파일 경로"""
+        return self.data_dir / f"{session_id}{TAIL_INDEX_SUFFIX}"
 
-        # 세션 파일 삭제
-        session_file.unlink()
-        return True
+    @staticmethod
+    def _file_version(path: Path) -> str:
+        """파일 버전 (inode + 수정 시각 + 크기, 임시 파일로 교체할 때마다 inode가 바뀜)"""
+        stat = path.stat()
+        return f"{stat.st_ino}-{stat.st_mtime_ns}-{stat.st_size}"
+
+    def _write_tail_index(self, session_file: Path, data: dict) -> None:
+        """세션 파일을 저장한 뒤 첫 메시지 + 최근 메시지 인덱스 기록"""
+        messages = data["messages"]
+        index = {
+            **{key: value for key, value in data.items() if key != "messages"},
+            "source_version": self._file_version(session_file),
+            "message_count": len(messages),
+            "head": messages[:1],
+            "tail": messages[1:][-TAIL_INDEX_SIZE:],
+        }
+        # 인덱스는 세션 파일에서 다시 만들 수 있고 오래되면 쓰지 않으므로 fsync하지 않음
+        serialized = json.dumps(index, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        atomic_write_bytes(self._tail_index_file(data["session_id"]), serialized, FSYNC_NONE)
+
+    def _read_tail_index_data(self, session_id: str) -> Optional[dict]:
+        """최신 tail 인덱스 딕셔너리 (인덱스가 없거나 오래되었으면 None)"""
+        index_file = self._tail_index_file(session_id)
+        session_file = self._session_file(session_id)
+        try:
+            with open(index_file, "r", encoding="utf-8") as f:
+                index = json.load(f)
+            if index.get("source_version") != self._file_version(session_file):
+                return None
+        except (OSError, json.JSONDecodeError, UnicodeDecodeError):
+            return None
+        return index
+
+    def _read_tail_index(self, session_id: str, tail_size: int) -> Optional[ChatSession]:
+        """tail 인덱스로 일부만 읽은 세션 생성 (인덱스가 없거나 오래되었으면 None)"""
+        index = self._read_tail_index_data(session_id)
+        if index is None:
+            return None
+
+        count = index["message_count"]
+        tail = index["tail"][-tail_size:] if count > 1 else []
+        session = self._to_session({**index, "messages": index["head"] + tail})
+        session.omitted_messages = max(0, count - 1 - len(tail))
+        return session
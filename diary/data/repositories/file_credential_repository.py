@@ -1,11 +1,19 @@
 """파일 시스템 기반 인증 정보 저장소 구현체 (Data Layer)"""
 
 import json
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 
 from diary.domain.entities.ai_credential import AICredential, AIProvider
 from diary.domain.interfaces.credential_repository import CredentialRepositoryInterface
+from diary.domain.interfaces.user_scoped_repository import DEFAULT_USER_ID
+from diary.data.repositories.atomic_file import atomic_write_bytes, file_lock
+from diary.data.repositories.user_paths import user_scoped_path
+
+
+LOCK_SUFFIX = ".lock"
 
 
 class FileSystemCredentialRepository(CredentialRepositoryInterface):
@@ -14,6 +22,11 @@ class FileSystemCredentialRepository(CredentialRepositoryInterface):
     JSON 파일로 credentials를 저장합니다.
     Domain의 CredentialRepositoryInterface를 구현합니다 (의존성 역전).
 
+    - 읽은 내용은 파일의 (inode, 수정 시각, 크기)와 함께 캐시하고, 셋 다 같으면 다시 읽지 않습니다
+      (쓸 때마다 새 파일로 교체하므로 다른 프로세스가 고치면 inode가 바뀌어 다음 조회에서 다시 읽음).
+    - 변경은 파일 잠금({파일명}.lock) 안에서 최신 내용을 읽고 임시 파일에 써서 교체합니다.
+      batch() 안의 변경은 잠금을 잡은 채로 모았다가 한 번만 씁니다.
+
     파일 구조:
     {
         "credentials": [
@@ -29,24 +42,72 @@ class FileSystemCredentialRepository(CredentialRepositoryInterface):
     }
     """
 
-    def __init__(self, file_path: Optional[str] = None):
+    def __init__(self, file_path: Optional[str] = None, user_id: str = DEFAULT_USER_ID):
         """
         Args:
             file_path: credentials JSON 파일 경로 (기본: data/credentials.json)
+            user_id: 사용자 ID (기본 사용자 외에는 data/users/{user_id}/credentials.json)
         """
         if file_path is None:
             # 프로젝트 루트의 data/ 디렉토리 사용
             project_root = Path(__file__).parent.parent.parent.parent
-            self.file_path = project_root / "data" / "credentials.json"
+            self.base_path = project_root / "data" / "credentials.json"
         else:
-            self.file_path = Path(file_path)
+            self.base_path = Path(file_path)
+        self.user_id = user_id
+        self.file_path = user_scoped_path(self.base_path, user_id)
+        self.lock_path = self.file_path.with_name(f"{self.file_path.name}{LOCK_SUFFIX}")
+
+        # 마지막으로 읽거나 쓴 (파일 상태, credentials 리스트), 스레드끼리 함께 바꾸도록 한 튜플로 보관
+        self._cache: Optional[Tuple[Optional[Tuple[int, int, int]], List[dict]]] = None
+        # batch() 중인 스레드의 변경 내용 (스레드마다 따로)
+        self._local = threading.local()
 
         # data 디렉토리가 없으면 생성
         self.file_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # 파일이 없으면 빈 구조로 초기화
+        # 파일이 없으면 빈 구조로 초기화 (다른 프로세스가 동시에 만드는 경우를 위해 잠금 안에서 확인)
         if not self.file_path.exists():
-            self._write_data({"credentials": []})
+            with file_lock(self.lock_path):
+                if not self.file_path.exists():
+                    self._write_data({"credentials": []})
+
+    def for_user(self, user_id: str) -> "FileSystemCredentialRepository":
+        """다른 사용자의 인증 정보 저장소"""
+        return FileSystemCredentialRepository(str(self.base_path), user_id)
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """여러 변경을 잠금 한 번, 쓰기 한 번으로 저장 (예외가 나면 모두 버림, 중첩하면 바깥 구간에 포함)"""
+        if getattr(self._local, "pending", None) is not None:
+            yield
+            return
+
+        with file_lock(self.lock_path):
+            self._local.pending = self._read_credentials()
+            self._local.dirty = False
+            try:
+                yield
+                if self._local.dirty:
+                    self._write_data({"credentials": self._local.pending})
+            finally:
+                self._local.pending = None
+
+    def _file_stat(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            stat = self.file_path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+    def _read_credentials(self) -> List[dict]:
+        """파일의 credentials 리스트 (파일이 그대로면 캐시 사용, 호출한 쪽이 고쳐도 되도록 복사본 반환)"""
+        stat = self._file_stat()
+        cache = self._cache
+        if cache is None or stat is None or cache[0] != stat:
+            cache = (stat, self._read_data().get("credentials", []))
+            self._cache = cache
+        return [dict(cred_dict) for cred_dict in cache[1]]
 
     def _read_data(self) -> dict:
         """JSON 파일 읽기"""
@@ -58,18 +119,22 @@ class FileSystemCredentialRepository(CredentialRepositoryInterface):
             return {"credentials": []}
 
     def _write_data(self, data: dict) -> None:
-        """JSON 파일 쓰기"""
-        with open(self.file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        """JSON 파일 쓰기 (임시 파일에 쓰고 교체)"""
+        content = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+        atomic_write_bytes(self.file_path, content)
+        self._cache = (self._file_stat(), [dict(cred_dict) for cred_dict in data["credentials"]])
 
     def _get_credentials_list(self) -> List[dict]:
-        """credentials 리스트 조회"""
-        data = self._read_data()
-        return data.get("credentials", [])
+        """credentials 리스트 조회 (batch() 안이면 아직 저장하지 않은 변경 포함)"""
+        pending = getattr(self._local, "pending", None)
+        if pending is not None:
+            return [dict(cred_dict) for cred_dict in pending]
+        return self._read_credentials()
 
     def _save_credentials_list(self, credentials: List[dict]) -> None:
-        """credentials 리스트 저장"""
-        self._write_data({"credentials": credentials})
+        """credentials 리스트 저장 (batch() 안에서만 호출, 구간이 끝날 때 한 번에 씀)"""
+        self._local.pending = credentials
+        self._local.dirty = True
 
     def save(self, credential: AICredential) -> None:
         """AI 인증 정보 저장
@@ -80,16 +145,17 @@ class FileSystemCredentialRepository(CredentialRepositoryInterface):
         Raises:
             ValueError: 이미 동일한 provider의 credential이 존재하는 경우
         """
-        credentials = self._get_credentials_list()
+        with self.batch():
+            credentials = self._get_credentials_list()
 
-        # 중복 확인
-        for cred_dict in credentials:
-            if cred_dict["provider"] == credential.provider.value:
-                raise ValueError(f"{credential.provider.value} 인증 정보가 이미 존재합니다")
+            # 중복 확인
+            for cred_dict in credentials:
+                if cred_dict["provider"] == credential.provider.value:
+                    raise ValueError(f"{credential.provider.value} 인증 정보가 이미 존재합니다")
 
-        # 추가
-        credentials.append(credential.to_dict())
-        self._save_credentials_list(credentials)
+            # 추가
+            credentials.append(credential.to_dict())
+            self._save_credentials_list(credentials)
 
     def get_by_provider(self, provider: AIProvider) -> Optional[AICredential]:
         """특정 AI provider의 인증 정보 조회
@@ -140,19 +206,20 @@ class FileSystemCredentialRepository(CredentialRepositoryInterface):
         Raises:
             ValueError: 해당 provider의 credential이 존재하지 않는 경우
         """
-        credentials = self._get_credentials_list()
+        with self.batch():
+            credentials = self._get_credentials_list()
 
-        updated = False
-        for i, cred_dict in enumerate(credentials):
-            if cred_dict["provider"] == credential.provider.value:
-                credentials[i] = credential.to_dict()
-                updated = True
-                break
+            updated = False
+            for i, cred_dict in enumerate(credentials):
+                if cred_dict["provider"] == credential.provider.value:
+                    credentials[i] = credential.to_dict()
+                    updated = True
+                    break
 
-        if not updated:
-            raise ValueError(f"{credential.provider.value} 인증 정보가 존재하지 않습니다")
+            if not updated:
+                raise ValueError(f"{credential.provider.value} 인증 정보가 존재하지 않습니다")
 
-        self._save_credentials_list(credentials)
+            self._save_credentials_list(credentials)
 
     def delete(self, provider: AIProvider) -> None:
         """AI 인증 정보 삭제
@@ -163,18 +230,19 @@ class FileSystemCredentialRepository(CredentialRepositoryInterface):
         Raises:
             ValueError: 해당 provider의 credential이 존재하지 않는 경우
         """
-        credentials = self._get_credentials_list()
+        with self.batch():
+            credentials = self._get_credentials_list()
 
-        initial_count = len(credentials)
-        credentials = [
-            cred_dict for cred_dict in credentials
-            if cred_dict["provider"] != provider.value
-        ]
+            initial_count = len(credentials)
+            credentials = [
+                cred_dict for cred_dict in credentials
+                if cred_dict["provider"] != provider.value
+            ]
 
-        if len(credentials) == initial_count:
-            raise ValueError(f"{provider.value} 인증 정보가 존재하지 않습니다")
+            if len(credentials) == initial_count:
+                raise ValueError(f"{provider.value} 인증 정보가 존재하지 않습니다")
 
-        self._save_credentials_list(credentials)
+            self._save_credentials_list(credentials)
 
     def exists(self, provider: AIProvider) -> bool:
         """특정 provider의 인증 정보가 존재하는지 확인
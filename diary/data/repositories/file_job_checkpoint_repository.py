@@ -0,0 +1,88 @@
+"""파일 시스템 기반 일괄 작업 체크포인트 저장소 구현"""
+
+import json
+import os
+import re
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional, Set
+
+from diary.domain.interfaces.job_checkpoint_repository import JobCheckpointRepositoryInterface
+
+
+class FileSystemJobCheckpointRepository(JobCheckpointRepositoryInterface):
+    """작업별 JSON 파일에 완료된 항목을 기록하는 구현체
+
+    파일 구조 (data/jobs/{job_id}.json):
+    {
+        "job_id": "sessions",
+        "completed": ["session-1", "session-2"],
+        "updated_at": "2024-02-17T12:00:00"
+    }
+    """
+
+    def __init__(self, base_dir: Optional[str] = None):
+        """
+        Args:
+            base_dir: 체크포인트 디렉토리 (기본: data/jobs)
+        """
+        if base_dir is None:
+            # 프로젝트 루트의 data/ 디렉토리 사용
+            project_root = Path(__file__).parent.parent.parent.parent
+            self.base_dir = project_root / "data" / "jobs"
+        else:
+            self.base_dir = Path(base_dir)
+
+        self.base_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def load_completed(self, job_id: str) -> Set[str]:
+        """완료된 항목 ID 조회 (파일이 손상되었으면 빈 집합)"""
+        file_path = self._get_file_path(job_id)
+        if not file_path.exists():
+            return set()
+
+        try:
+            with open(file_path, "r", encoding="utf-8") as f:
+                return set(json.load(f).get("completed", []))
+        except (json.JSONDecodeError, OSError):
+            return set()
+
+    def mark_completed(self, job_id: str, item_ids: List[str]) -> None:
+        """완료 항목 추가 (임시 파일에 쓴 뒤 교체하여 중단되어도 파일이 깨지지 않음)"""
+        if not item_ids:
+            return
+
+        with self._lock:
+            completed = self.load_completed(job_id)
+            completed.update(item_ids)
+
+            file_path = self._get_file_path(job_id)
+            temp_path = file_path.with_suffix(".json.tmp")
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "job_id": job_id,
+                        "completed": sorted(completed),
+                        "updated_at": datetime.now().isoformat(),
+                    },
+                    f,
+                    indent=2,
+                    ensure_ascii=False,
+                )
+            os.replace(temp_path, file_path)
+
+    def clear(self, job_id: str) -> bool:
+        """체크포인트 파일 삭제"""
+        file_path = self._get_file_path(job_id)
+        if not file_path.exists():
+            return False
+
+        file_path.unlink()
+        return True
+
+    def _get_file_path(self, job_id: str) -> Path:
+        """작업 ID → 파일 경로 (파일 이름에 쓸 수 없는 문자는 '_'로 치환)"""
+        safe_id = re.sub(r"[^\w.-]", "_", job_id)
+        return self.base_dir / f"{safe_id}.json"
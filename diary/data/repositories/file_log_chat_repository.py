@@ -0,0 +1,293 @@
+"""파일 시스템 기반 채팅 저장소 - 스냅샷 + 추가 전용 로그 구조
+
+FileSystemChatRepository는 저장할 때마다 세션 전체를 다시 씁니다 (메시지 수에 비례).
+이 구현체는 마지막 스냅샷 이후의 저장을 세션별 JSONL 로그에 한 줄씩 덧붙여서,
+턴마다 새 메시지만큼만 씁니다. 로그가 길어지거나 세션이 끝나면 스냅샷으로 합칩니다.
+
+로그 한 줄은 저장 한 번(이벤트)이고, 저장 후 버전을 담고 있습니다.
+- 읽을 때는 스냅샷 버전 다음 버전부터 차례로 적용합니다.
+- 스냅샷 버전 이하의 줄은 스냅샷으로 합친 뒤 로그를 지우기 전에 중단되어 남은 것이므로 건너뜁니다.
+- 마지막 줄이 잘렸거나(쓰는 중 중단) 읽을 수 없으면 그 줄부터 버리고, 다음에 덧붙일 때 잘라냅니다.
+"""
+
+import copy
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from diary.domain.entities.chat_session import ChatSession
+from diary.domain.interfaces.user_scoped_repository import DEFAULT_USER_ID
+from diary.data.repositories.atomic_file import DEFAULT_FSYNC_POLICY, append_bytes
+from diary.data.repositories.file_chat_repository import FileSystemChatRepository
+from diary.data.repositories.prompt_store import compact_message
+from diary.data.repositories.session_codec import DEFAULT_SESSION_CODEC
+
+
+LOG_SUFFIX = ".log.jsonl"
+
+# 로그 이벤트가 이만큼 쌓이면 다음 저장 때 스냅샷으로 합침
+DEFAULT_COMPACT_AFTER = 100
+
+# 이벤트에서 세션 딕셔너리에 그대로 덮어쓰는 키 (messages는 뒤에 추가)
+_EVENT_HEADER_KEYS = ("version", "updated_at", "is_active", "metadata")
+
+
+@dataclass
+class _LogState:
+    """마지막으로 확인한 세션 상태 (다른 프로세스가 파일을 바꾸지 않았으면 다시 읽지 않음)
+
+    Attributes:
+        version: 로그까지 적용한 버전
+        message_count: 로그까지 적용한 메시지 수
+        metadata: 로그까지 적용한 metadata
+        events: 스냅샷 이후 로그 이벤트 수
+        log_size: 로그 파일에서 올바른 줄까지의 크기 (바이트)
+        source: 확인 당시 스냅샷 + 로그 파일 버전
+    """
+    version: int
+    message_count: int
+    metadata: dict
+    events: int
+    log_size: int
+    source: str
+
+
+def _apply_header(data: dict, event: dict) -> None:
+    """이벤트의 버전, 수정 시각, 종료 여부, metadata(있으면)를 세션/인덱스 딕셔너리에 적용"""
+    for key in _EVENT_HEADER_KEYS:
+        if key in event:
+            data[key] = event[key]
+
+
+class FileSystemLogChatRepository(FileSystemChatRepository):
+    """
+    채팅 세션을 스냅샷 + 추가 전용 JSONL 로그로 저장하는 구현체
+
+    파일 구조 (FileSystemChatRepository에 추가):
+    - data/chats/{session_id}.log.jsonl : 마지막 스냅샷 이후의 저장 이벤트
+
+    새 세션, 세션 종료, 코덱 변경, 로그가 compact_after개를 넘은 경우에는 스냅샷을 다시 씁니다.
+    tail 인덱스는 스냅샷을 쓸 때만 갱신하고, 이어하기 때 로그의 메시지를 그 뒤에 붙입니다.
+
+    FileSystemChatRepository는 로그를 읽지 않으므로, 되돌리려면 먼저 compact_sessions()로 합쳐야 합니다.
+    """
+
+    def __init__(
+        self,
+        data_dir: Path = Path("data/chats"),
+        user_id: str = DEFAULT_USER_ID,
+        codec: str = DEFAULT_SESSION_CODEC,
+        fsync: str = DEFAULT_FSYNC_POLICY,
+        compact_after: int = DEFAULT_COMPACT_AFTER,
+    ):
+        """
+        Args:
+            data_dir: 채팅 데이터 디렉토리 (기본 사용자의 세션 위치)
+            user_id: 사용자 ID
+            codec: 스냅샷 코덱 (로그는 항상 JSONL)
+            fsync: fsync 정책 (로그를 덧붙일 때도 적용)
+            compact_after: 스냅샷으로 합치기 전까지 로그에 쌓는 이벤트 수
+
+        Raises:
+            ValueError: 사용자 ID, 코덱, fsync 정책이 올바르지 않거나 compact_after가 1보다 작은 경우
+        """
+        if compact_after < 1:
+            raise ValueError(f"compact_after는 1 이상이어야 합니다: {compact_after}")
+        super().__init__(data_dir, user_id, codec=codec, fsync=fsync)
+        self.compact_after = compact_after
+        self._log_states: Dict[str, _LogState] = {}
+
+    def for_user(self, user_id: str) -> "FileSystemLogChatRepository":
+        """다른 사용자의 세션 저장소"""
+        return FileSystemLogChatRepository(
+            self.root_dir, user_id, codec=self.codec, fsync=self.fsync, compact_after=self.compact_after
+        )
+
+    def compact_sessions(self) -> int:
+        """
+        로그가 있는 모든 세션을 스냅샷으로 합침
+
+        Returns:
+            합친 세션 수
+        """
+        compacted = 0
+        for session_file in self._session_files():
+            session_id = session_file.stem
+            if not self._log_file(session_id).exists():
+                continue
+            with self._session_lock(session_id):
+                session_file = self._session_file(session_id)
+                if not session_file.exists():
+                    continue
+                self._write_snapshot(session_file, self._read_session_file(session_file))
+            compacted += 1
+        return compacted
+
+    def _log_file(self, session_id: str) -> Path:
+        """세션의 로그 파일 경로"""
+        return self.data_dir / f"{session_id}{LOG_SUFFIX}"
+
+    def _source_version(self, session_file: Path) -> str:
+        """스냅샷 + 로그 파일 버전 (로그가 없으면 스냅샷만)"""
+        log_file = self._log_file(session_file.stem)
+        log_version = self._file_version(log_file) if log_file.exists() else "-"
+        return f"{self._file_version(session_file)}+{log_version}"
+
+    def _read_log(self, session_id: str, snapshot_version: int) -> Tuple[List[dict], int]:
+        """
+        스냅샷 이후의 로그 이벤트
+
+        Returns:
+            (snapshot_version 다음부터 차례로 이어지는 이벤트, 올바른 줄까지의 로그 크기)
+        """
+        try:
+            raw = self._log_file(session_id).read_bytes()
+        except FileNotFoundError:
+            return [], 0
+
+        events = []
+        version = snapshot_version
+        valid_size = 0
+        *lines, torn = raw.split(b"\n")
+        for line in lines:
+            try:
+                event = json.loads(line)
+                event_version = event["version"]
+                event["messages"]
+            except (ValueError, KeyError, TypeError):
+                print(f"Warning: Corrupted log line in session {session_id}, ignoring the rest of the log.")
+                return events, valid_size
+            if event_version > version + 1:
+                print(f"Warning: Missing log events in session {session_id}, ignoring the rest of the log.")
+                return events, valid_size
+            if event_version == version + 1:
+                events.append(event)
+                version = event_version
+            valid_size += len(line) + 1
+
+        if torn:
+            print(f"Warning: Discarding incomplete last line in session log {session_id}.")
+        return events, valid_size
+
+    def _read_session_file(self, session_file: Path) -> dict:
+        """스냅샷에 로그 이벤트를 적용한 세션 딕셔너리"""
+        data = super()._read_session_file(session_file)
+        events, _ = self._read_log(session_file.stem, data.get("version", 0))
+        for event in events:
+            data["messages"].extend(event["messages"])
+            _apply_header(data, event)
+        return data
+
+    def _read_tail_index_data(self, session_id: str) -> Optional[dict]:
+        """스냅샷의 tail 인덱스에 로그 이벤트를 적용 (인덱스가 없거나 오래되었으면 None)"""
+        index = super()._read_tail_index_data(session_id)
+        if index is None:
+            return None
+        events, _ = self._read_log(session_id, index.get("version", 0))
+        for event in events:
+            index["tail"] = index["tail"] + event["messages"]
+            index["message_count"] += len(event["messages"])
+            _apply_header(index, event)
+        return index
+
+    def _current_state(self, session_file: Path) -> Optional[_LogState]:
+        """
+        저장된 세션 상태 (파일이 없으면 None)
+
+        캐시가 오래되었으면 스냅샷 헤더(tail 인덱스가 최신이면 인덱스, 아니면 스냅샷 전체)와 로그를 다시 읽습니다.
+        """
+        if not session_file.exists():
+            return None
+        session_id = session_file.stem
+        source = self._source_version(session_file)
+        state = self._log_states.get(session_id)
+        if state and state.source == source:
+            return state
+
+        index = super()._read_tail_index_data(session_id)
+        if index is not None:
+            header, message_count = index, index["message_count"]
+        else:
+            header = super()._read_session_file(session_file)
+            message_count = len(header["messages"])
+        events, log_size = self._read_log(session_id, header.get("version", 0))
+
+        state = _LogState(
+            version=header.get("version", 0),
+            message_count=message_count,
+            metadata=header.get("metadata", {}),
+            events=len(events),
+            log_size=log_size,
+            source=source,
+        )
+        for event in events:
+            state.version = event["version"]
+            state.message_count += len(event["messages"])
+            state.metadata = event.get("metadata", state.metadata)
+        self._log_states[session_id] = state
+        return state
+
+    def _stored_version(self, session_file: Path) -> Optional[int]:
+        """로그까지 적용한 세션 버전 (파일이 없으면 None)"""
+        state = self._current_state(session_file)
+        return state.version if state else None
+
+    def _write_session(self, session_file: Path, target_file: Path, session: ChatSession) -> None:
+        """새 메시지만 로그에 덧붙임 (덧붙일 수 없으면 스냅샷으로 합침)"""
+        state = self._current_state(session_file)
+        if state is None or not (
+            session_file == target_file
+            and session.is_active
+            and state.events < self.compact_after
+            # 저장된 메시지 + 저장 전 메시지가 세션 전체와 맞아야 새 메시지만 덧붙일 수 있음
+            and session.get_message_count() - session.unsaved_count == state.message_count
+        ):
+            super()._write_session(session_file, target_file, session)
+            return
+
+        event = {
+            "version": session.version + 1,
+            "updated_at": session.updated_at.isoformat(),
+            "is_active": session.is_active,
+            "messages": [
+                compact_message(msg.to_dict(), self.prompt_store) for msg in session.get_unsaved_messages()
+            ],
+        }
+        if session.metadata != state.metadata:
+            event["metadata"] = session.metadata
+        line = (json.dumps(event, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+        log_file = self._log_file(session.session_id)
+        if log_file.exists() and log_file.stat().st_size != state.log_size:
+            # 잘린 마지막 줄(또는 읽을 수 없는 줄부터 끝까지)을 잘라낸 뒤 덧붙임
+            os.truncate(log_file, state.log_size)
+        append_bytes(log_file, line, self.fsync)
+
+        state.version = event["version"]
+        state.message_count += len(event["messages"])
+        state.metadata = copy.deepcopy(session.metadata)
+        state.events += 1
+        state.log_size += len(line)
+        state.source = self._source_version(session_file)
+
+    def _write_snapshot(self, session_file: Path, data: dict) -> None:
+        """스냅샷을 다시 쓰고 로그 삭제 (지우기 전에 중단되어 남은 이벤트는 스냅샷 버전 이하라 건너뜀)"""
+        super()._write_snapshot(session_file, data)
+        session_id = session_file.stem
+        self._log_file(session_id).unlink(missing_ok=True)
+        self._log_states[session_id] = _LogState(
+            version=data.get("version", 0),
+            message_count=len(data["messages"]),
+            metadata=copy.deepcopy(data.get("metadata", {})),
+            events=0,
+            log_size=0,
+            source=self._source_version(session_file),
+        )
+
+    def _remove_session_files(self, session_id: str) -> None:
+        """세션 파일, tail 인덱스, 잠금 파일과 로그 삭제"""
+        super()._remove_session_files(session_id)
+        self._log_file(session_id).unlink(missing_ok=True)
+        self._log_states.pop(session_id, None)
@@ -6,12 +6,18 @@ from typing import Optional
 
 from diary.domain.entities.user_preferences import UserPreferences
 from diary.domain.interfaces.user_preferences_repository import UserPreferencesRepositoryInterface
+from diary.domain.interfaces.user_scoped_repository import DEFAULT_USER_ID
+from diary.data.repositories.atomic_file import atomic_write_bytes, file_lock
+from diary.data.repositories.user_paths import user_scoped_path
+
+LOCK_SUFFIX = ".lock"
 
 
 class FileSystemUserPreferencesRepository(UserPreferencesRepositoryInterface):
     """파일 시스템 기반 사용자 설정 저장소
 
     JSON 파일로 사용자 설정을 저장합니다.
+    저장은 임시 파일에 쓰고 교체하므로, 동시에 읽는 쪽이 반쯤 쓴 파일을 보지 않습니다.
     Domain의 UserPreferencesRepositoryInterface를 구현합니다 (의존성 역전).
 
     파일 구조:
@@ -22,21 +28,29 @@ class FileSystemUserPreferencesRepository(UserPreferencesRepositoryInterface):
     }
     """
 
-    def __init__(self, file_path: Optional[str] = None):
+    def __init__(self, file_path: Optional[str] = None, user_id: str = DEFAULT_USER_ID):
         """
         Args:
             file_path: preferences JSON 파일 경로 (기본: data/user_preferences.json)
+            user_id: 사용자 ID (기본 사용자 외에는 data/users/{user_id}/user_preferences.json)
         """
         if file_path is None:
             # 프로젝트 루트의 data/ 디렉토리 사용
             project_root = Path(__file__).parent.parent.parent.parent
-            self.file_path = project_root / "data" / "user_preferences.json"
+            self.base_path = project_root / "data" / "user_preferences.json"
         else:
-            self.file_path = Path(file_path)
+            self.base_path = Path(file_path)
+        self.user_id = user_id
+        self.file_path = user_scoped_path(self.base_path, user_id)
+        self.lock_path = self.file_path.with_name(f"{self.file_path.name}{LOCK_SUFFIX}")
 
         # data 디렉토리가 없으면 생성
         self.file_path.parent.mkdir(parents=True, exist_ok=True)
 
+    def for_user(self, user_id: str) -> "FileSystemUserPreferencesRepository":
+        """다른 사용자의 설정 저장소"""
+        return FileSystemUserPreferencesRepository(str(self.base_path), user_id)
+
     def save(self, preferences: UserPreferences) -> None:
         """사용자 설정 저장
 
@@ -46,12 +60,21 @@ class FileSystemUserPreferencesRepository(UserPreferencesRepositoryInterface):
         Raises:
             IOError: 파일 쓰기 실패 시
         """
+        content = json.dumps(preferences.to_dict(), indent=2, ensure_ascii=False).encode("utf-8")
         try:
-            with open(self.file_path, "w", encoding="utf-8") as f:
-                json.dump(preferences.to_dict(), f, indent=2, ensure_ascii=False)
+            atomic_write_bytes(self.file_path, content)
         except IOError as e:
             raise IOError(f"사용자 설정 저장 실패: {e}")
 
+    def create_if_missing(self, preferences: UserPreferences) -> UserPreferences:
+        """설정 파일이 없을 때만 저장 (파일 잠금 안에서 확인하므로 동시에 만들어도 한 번만 씀)"""
+        with file_lock(self.lock_path):
+            existing = self.get()
+            if existing is not None:
+                return existing
+            self.save(preferences)
+            return preferences
+
     def get(self) -> Optional[UserPreferences]:
         """사용자 설정 조회
 
@@ -80,6 +103,18 @@ class FileSystemUserPreferencesRepository(UserPreferencesRepositoryInterface):
         """
         return self.file_path.exists()
 
+    def get_version(self) -> Optional[str]:
+        """설정 파일의 버전 (수정 시각 + 크기)
+
+        Returns:
+            "수정시각ns-크기" 문자열 (파일이 없으면 "missing")
+        """
+        try:
+            stat = self.file_path.stat()
+        except FileNotFoundError:
+            return "missing"
+        return f"{stat.st_mtime_ns}-{stat.st_size}"
+
     def delete(self) -> None:
         """사용자 설정 삭제
 
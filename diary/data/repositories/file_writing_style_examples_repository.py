@@ -1,9 +1,82 @@
 """파일 시스템 기반 일기 작성 스타일 예시 문장 저장소 구현체 (Data Layer)"""
 
+import hashlib
+import json
+import math
+import re
+from collections import Counter
 from pathlib import Path
+from typing import Dict, Optional, Tuple
 
 from diary.domain.entities.writing_style import WritingStyle
 from diary.domain.interfaces.writing_style_examples_repository import WritingStyleExamplesRepositoryInterface
+from diary.domain.interfaces.user_scoped_repository import DEFAULT_USER_ID
+from diary.data.repositories.atomic_file import FSYNC_NONE, atomic_write_bytes
+from diary.data.repositories.user_paths import user_scoped_path
+
+
+# 예시 파일별 검색 인덱스를 저장하는 디렉토리 (예시 디렉토리 안)
+INDEX_DIR = ".index"
+
+# 인덱스 형식을 바꾸면 올려서 기존 인덱스를 다시 만듦
+INDEX_VERSION = 1
+
+# 글자 n-gram 크기 (한국어는 형태소 분석 없이 2글자 단위로 비교)
+NGRAM_SIZE = 2
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+
+def char_ngrams(text: str, n: int = NGRAM_SIZE) -> Counter:
+    """단어별 글자 n-gram 빈도 (n글자 이하인 단어는 단어 그대로)"""
+    grams: Counter = Counter()
+    for word in _WORD_PATTERN.findall(text.lower()):
+        if len(word) <= n:
+            grams[word] += 1
+        else:
+            grams.update(word[i:i + n] for i in range(len(word) - n + 1))
+    return grams
+
+
+def _tfidf(grams: Counter, idf: Dict[str, float]) -> Dict[str, float]:
+    """TF-IDF 벡터 (빈도는 로그로 눌러서, 인덱스에 없는 n-gram은 버림)"""
+    return {gram: (1 + math.log(count)) * idf[gram] for gram, count in grams.items() if gram in idf}
+
+
+def build_examples_index(examples: list[str], source_hash: str) -> dict:
+    """예시 문장 TF-IDF 인덱스 (문장 벡터는 길이 1로 정규화)"""
+    counts = [char_ngrams(example) for example in examples]
+    document_frequency = Counter(gram for grams in counts for gram in grams)
+    total = len(examples)
+    idf = {
+        gram: math.log((1 + total) / (1 + frequency)) + 1
+        for gram, frequency in document_frequency.items()
+    }
+
+    vectors = []
+    for grams in counts:
+        vector = _tfidf(grams, idf)
+        norm = math.sqrt(sum(weight * weight for weight in vector.values())) or 1.0
+        vectors.append({gram: weight / norm for gram, weight in vector.items()})
+
+    return {
+        "version": INDEX_VERSION,
+        "source_hash": source_hash,
+        "examples": examples,
+        "idf": idf,
+        "vectors": vectors,
+    }
+
+
+def rank_examples(index: dict, text: str, limit: int) -> list[str]:
+    """text와 코사인 유사도가 높은 예시 limit개 (같으면 파일 순서, 겹치는 표현이 없으면 앞에서부터)"""
+    query = _tfidf(char_ngrams(text), index["idf"])
+    scores = [
+        sum(weight * query[gram] for gram, weight in vector.items() if gram in query)
+        for vector in index["vectors"]
+    ]
+    ranked = sorted(range(len(scores)), key=lambda i: (-scores[i], i))
+    return [index["examples"][i] for i in ranked[:limit]]
 
 
 class FileSystemWritingStyleExamplesRepository(WritingStyleExamplesRepositoryInterface):
@@ -12,28 +85,43 @@ class FileSystemWritingStyleExamplesRepository(WritingStyleExamplesRepositoryInt
     텍스트 파일로 스타일별 예시 문장을 관리합니다.
     Domain의 WritingStyleExamplesRepositoryInterface를 구현합니다 (의존성 역전).
 
+    일기를 만들 때는 대화와 비슷한 예시만 고르도록 예시 파일별 TF-IDF(글자 2-gram) 인덱스를
+    .index/{style}.json에 저장합니다. 인덱스는 예시 파일 내용의 SHA-256으로 확인해서
+    파일이 바뀌었을 때만 다시 만들고, 프로세스 안에서는 파일 버전(수정 시각+크기)이 같으면 다시 읽지 않습니다.
+
     파일 구조:
     data/writing_examples/
     ├── emotional_literary.txt  (한 줄에 하나씩 예시 문장)
     ├── objective_third_person.txt
-    └── first_person_autobiography.txt
+    ├── first_person_autobiography.txt
+    └── .index/                 (검색 인덱스, 지워도 다시 만들어짐)
     """
 
-    def __init__(self, examples_dir: Path | None = None):
+    def __init__(self, examples_dir: Path | None = None, user_id: str = DEFAULT_USER_ID):
         """
         Args:
             examples_dir: 예시 문장 디렉토리 경로 (기본: data/writing_examples/)
+            user_id: 사용자 ID (기본 사용자 외에는 data/users/{user_id}/writing_examples/)
         """
         if examples_dir is None:
             # 프로젝트 루트의 data/writing_examples/ 디렉토리 사용
             project_root = Path(__file__).parent.parent.parent.parent
-            self.examples_dir = project_root / "data" / "writing_examples"
+            self.base_dir = project_root / "data" / "writing_examples"
         else:
-            self.examples_dir = examples_dir
+            self.base_dir = examples_dir
+        self.user_id = user_id
+        self.examples_dir = user_scoped_path(self.base_dir, user_id)
+
+        # 스타일 → (파일 버전, 인덱스)
+        self._indexes: Dict[WritingStyle, Tuple[str, dict]] = {}
 
         # 디렉토리가 없으면 생성
         self.examples_dir.mkdir(parents=True, exist_ok=True)
 
+    def for_user(self, user_id: str) -> "FileSystemWritingStyleExamplesRepository":
+        """다른 사용자의 예시 문장 저장소"""
+        return FileSystemWritingStyleExamplesRepository(self.base_dir, user_id)
+
     def _get_file_path(self, style: WritingStyle) -> Path:
         """스타일에 해당하는 예시 파일 경로 반환
 
@@ -61,14 +149,85 @@ class FileSystemWritingStyleExamplesRepository(WritingStyleExamplesRepositoryInt
             return []
 
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                # 각 줄을 읽고, 빈 줄과 주석(#) 제거
-                examples = [
-                    line.strip()
-                    for line in f.readlines()
-                    if line.strip() and not line.strip().startswith("#")  # 빈 줄과 주석 제외
-                ]
-                return examples
+            return self._parse_examples(file_path.read_text(encoding="utf-8"))
         except Exception:
             # 읽기 실패 시 빈 리스트 반환 (에러를 던지지 않음)
             return []
+
+    @staticmethod
+    def _parse_examples(content: str) -> list[str]:
+        """각 줄을 읽고, 빈 줄과 주석(#) 제거"""
+        return [
+            line.strip()
+            for line in content.splitlines()
+            if line.strip() and not line.strip().startswith("#")  # 빈 줄과 주석 제외
+        ]
+
+    def get_version(self, style: WritingStyle) -> Optional[str]:
+        """특정 스타일 예시 파일의 버전 (수정 시각 + 크기)
+
+        Args:
+            style: 일기 작성 스타일
+
+        Returns:
+            "수정시각ns-크기" 문자열 (파일이 없으면 "missing")
+        """
+        try:
+            stat = self._get_file_path(style).stat()
+        except FileNotFoundError:
+            return "missing"
+        return f"{stat.st_mtime_ns}-{stat.st_size}"
+
+    def find_similar_examples(self, style: WritingStyle, text: str, limit: int) -> list[str]:
+        """text(대화 내용)와 TF-IDF 코사인 유사도가 가장 높은 예시 문장 limit개 조회
+
+        Args:
+            style: 일기 작성 스타일
+            text: 비교할 대화 내용
+            limit: 최대 예시 수
+
+        Returns:
+            비슷한 순서의 예시 문장 리스트 (파일이 없거나 비어있으면 빈 리스트)
+        """
+        index = self._load_index(style)
+        if not index or limit <= 0:
+            return []
+        return rank_examples(index, text, limit)
+
+    def _get_index_path(self, style: WritingStyle) -> Path:
+        return self.examples_dir / INDEX_DIR / f"{style.value}.json"
+
+    def _load_index(self, style: WritingStyle) -> Optional[dict]:
+        """스타일의 검색 인덱스 (파일 버전이 같으면 메모리, 내용이 같으면 저장된 인덱스 사용)"""
+        version = self.get_version(style)
+        cached = self._indexes.get(style)
+        if cached and cached[0] == version:
+            return cached[1]
+
+        try:
+            content = self._get_file_path(style).read_bytes()
+        except OSError:
+            return None
+        source_hash = hashlib.sha256(content).hexdigest()
+
+        index_path = self._get_index_path(style)
+        try:
+            index = json.loads(index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            index = None
+        if not index or index.get("version") != INDEX_VERSION or index.get("source_hash") != source_hash:
+            examples = self._parse_examples(content.decode("utf-8", errors="replace"))
+            index = build_examples_index(examples, source_hash)
+            try:
+                index_path.parent.mkdir(parents=True, exist_ok=True)
+                # 다시 만들 수 있는 캐시이므로 fsync하지 않음
+                atomic_write_bytes(
+                    index_path, json.dumps(index, ensure_ascii=False).encode("utf-8"), fsync=FSYNC_NONE
+                )
+            except OSError:
+                pass  # 저장하지 못해도 이번 검색에는 사용
+
+        if version is None:
+            return index  # 버전을 알 수 없으면 메모리에 보관하지 않음
+        self._indexes[style] = (version, index)
+        return index
@@ -1,13 +1,42 @@
 """Google Gemini API 클라이언트 구현"""
 
-from typing import List
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Iterator, List, Optional, Tuple
 import google.generativeai as genai
+from google.generativeai.types import content_types
 
+from diary.domain.entities.token_usage import TokenUsage
 from diary.domain.interfaces.ai_client import AIClientInterface
 
 
+@dataclass
+class _LiveChat:
+    """세션별로 유지하는 Gemini 채팅 객체
+
+    Attributes:
+        model_name: 채팅 생성에 사용한 모델
+        system_instruction: 채팅 생성에 사용한 시스템 지시사항
+        chat: Gemini ChatSession 객체
+        turns: 지금까지 주고받은 (role, content) 목록 (히스토리 비교용)
+    """
+    model_name: str
+    system_instruction: Optional[str]
+    chat: "genai.ChatSession"
+    turns: List[Tuple[str, str]] = field(default_factory=list)
+
+
 class GoogleAIClient(AIClientInterface):
-    """Google Gemini 모델을 사용하는 AI 클라이언트"""
+    """Google Gemini 모델을 사용하는 AI 클라이언트
+
+    session_id가 주어지면 세션별 채팅 객체를 유지하고 새 사용자 메시지만 전송합니다.
+    전달된 히스토리나 모델이 유지 중인 채팅과 다르면(이어하기, 요약으로 잘림, 모델 라우팅 등)
+    채팅을 다시 만듭니다.
+    """
+
+    # 동시에 유지할 세션별 채팅 객체 수
+    MAX_LIVE_CHATS = 16
 
     def __init__(self, api_key: str, model: str = "gemini-1.5-flash"):
         """
@@ -16,14 +45,23 @@ class GoogleAIClient(AIClientInterface):
             model: 사용할 모델 (기본: gemini-1.5-flash)
         """
         genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel(model)
+        self.model_name = model
+        self._models: "OrderedDict[Tuple[str, Optional[str]], genai.GenerativeModel]" = OrderedDict()
+        self._live_chats: "OrderedDict[str, _LiveChat]" = OrderedDict()
+        self._lock = threading.Lock()
+        # 마지막 사용량은 호출한 스레드별로 보관 (서버 모드에서 여러 요청이 클라이언트 하나를 공유)
+        self._local = threading.local()
 
-    def chat(self, messages: List[dict]) -> str:
+    def chat(
+        self, messages: List[dict], session_id: Optional[str] = None, model: Optional[str] = None
+    ) -> str:
         """
         Google Gemini API 호출
 
         Args:
             messages: [{"role": "user", "content": "..."}, ...]
+            session_id: 채팅 세션 ID (주어지면 세션별 채팅 객체 재사용)
+            model: 이번 요청에만 사용할 모델 (None이면 기본 모델)
 
         Returns:
             AI 응답 텍스트
@@ -32,43 +70,170 @@ class GoogleAIClient(AIClientInterface):
             Exception: API 호출 실패 시
         """
         try:
-            # Gemini API는 system 메시지를 별도로 처리
-            system_instruction = None
-            chat_history = []
-            last_user_message = None
-
-            for msg in messages:
-                # UTF-8 인코딩 문제 방지: 서로게이트 문자 제거
-                content = msg["content"]
-                if isinstance(content, str):
-                    content = content.encode('utf-8', errors='ignore').decode('utf-8')
-
-                if msg["role"] == "system":
-                    system_instruction = content
-                elif msg["role"] == "user":
-                    last_user_message = content
-                elif msg["role"] == "assistant":
-                    if last_user_message:
-                        chat_history.append({
-                            "role": "user",
-                            "parts": [last_user_message]
-                        })
-                        last_user_message = None
-                    chat_history.append({
-                        "role": "model",
-                        "parts": [content]
-                    })
-
-            # 채팅 세션 시작
-            chat = self.model.start_chat(history=chat_history)
-
-            # 시스템 지시사항을 첫 메시지에 포함
-            if system_instruction and not chat_history:
-                last_user_message = f"{system_instruction}\n\n{last_user_message}"
-
-            # 메시지 전송
-            response = chat.send_message(last_user_message)
-            return response.text
+            system_instruction, turns = self._split_messages(messages)
+            if not turns or turns[-1][0] != "user":
+                raise ValueError("마지막 메시지는 사용자 메시지여야 합니다")
+
+            previous_turns = turns[:-1]
+            user_message = turns[-1][1]
+
+            live = self._get_live_chat(
+                session_id, model or self.model_name, system_instruction, previous_turns
+            )
+
+            # 메시지 전송 (새 사용자 메시지만)
+            response = live.chat.send_message(user_message)
+            self._local.last_usage = self._parse_usage(response, live.model_name)
+            reply = response.text
+
+            live.turns = previous_turns + [("user", user_message), ("assistant", reply)]
+            return reply
+
+        except Exception as e:
+            raise Exception(f"Google AI API 호출 실패: {str(e)}") from e
+
+    def chat_stream(
+        self, messages: List[dict], session_id: Optional[str] = None, model: Optional[str] = None
+    ) -> Iterator[str]:
+        """
+        Google Gemini API 스트리밍 호출
+
+        Args:
+            messages: [{"role": "user", "content": "..."}, ...]
+            session_id: 채팅 세션 ID (주어지면 세션별 채팅 객체 재사용)
+            model: 이번 요청에만 사용할 모델 (None이면 기본 모델)
+
+        Yields:
+            AI 응답 텍스트 조각
+
+        Raises:
+            Exception: API 호출 실패 시
+        """
+        try:
+            self._local.last_usage = None
+            system_instruction, turns = self._split_messages(messages)
+            if not turns or turns[-1][0] != "user":
+                raise ValueError("마지막 메시지는 사용자 메시지여야 합니다")
+
+            previous_turns = turns[:-1]
+            user_message = turns[-1][1]
+
+            live = self._get_live_chat(
+                session_id, model or self.model_name, system_instruction, previous_turns
+            )
+
+            response = live.chat.send_message(user_message, stream=True)
+            parts = []
+            for chunk in response:
+                text = getattr(chunk, "text", "")
+                if text:
+                    parts.append(text)
+                    yield text
+            self._local.last_usage = self._parse_usage(response, live.model_name)
+
+            live.turns = previous_turns + [("user", user_message), ("assistant", "".join(parts))]
 
         except Exception as e:
-            raise Exception(f"Google AI API 호출 실패: {str(e)}")
+            raise Exception(f"Google AI API 호출 실패: {str(e)}") from e
+
+    def get_last_usage(self) -> Optional[TokenUsage]:
+        """마지막 호출의 토큰 사용량"""
+        return getattr(self._local, "last_usage", None)
+
+    def get_model_name(self) -> Optional[str]:
+        """기본 모델 이름"""
+        return self.model_name
+
+    def _split_messages(self, messages: List[dict]) -> Tuple[Optional[str], List[Tuple[str, str]]]:
+        """시스템 지시사항과 (role, content) 대화 목록으로 분리"""
+        system_instruction = None
+        turns = []
+
+        for msg in messages:
+            # UTF-8 인코딩 문제 방지: 서로게이트 문자 제거
+            content = msg["content"]
+            if isinstance(content, str):
+                content = content.encode('utf-8', errors='ignore').decode('utf-8')
+
+            if msg["role"] == "system":
+                # 시스템 프롬프트 + 대화 요약처럼 여러 개면 순서대로 이어 붙임
+                system_instruction = (
+                    f"{system_instruction}\n\n{content}" if system_instruction else content
+                )
+            else:
+                turns.append((msg["role"], content))
+
+        return system_instruction, turns
+
+    def _get_live_chat(
+        self,
+        session_id: Optional[str],
+        model_name: str,
+        system_instruction: Optional[str],
+        previous_turns: List[Tuple[str, str]],
+    ) -> _LiveChat:
+        """세션의 채팅 객체 조회 (모델이나 히스토리가 달라졌으면 새로 생성)"""
+        with self._lock:
+            if session_id is not None:
+                live = self._live_chats.get(session_id)
+                if (
+                    live is not None
+                    and live.model_name == model_name
+                    and live.system_instruction == system_instruction
+                    and live.turns == previous_turns
+                ):
+                    self._live_chats.move_to_end(session_id)
+                    return live
+
+            model = self._get_model(model_name, system_instruction)
+            live = _LiveChat(
+                model_name=model_name,
+                system_instruction=system_instruction,
+                chat=model.start_chat(history=self._to_gemini_history(previous_turns)),
+                turns=list(previous_turns),
+            )
+
+            if session_id is not None:
+                self._live_chats[session_id] = live
+                self._live_chats.move_to_end(session_id)
+                while len(self._live_chats) > self.MAX_LIVE_CHATS:
+                    self._live_chats.popitem(last=False)
+
+            return live
+
+    def _get_model(self, model_name: str, system_instruction: Optional[str]) -> "genai.GenerativeModel":
+        """(모델, 시스템 지시사항)별 GenerativeModel (네이티브 system_instruction 사용)"""
+        key = (model_name, system_instruction)
+        model = self._models.get(key)
+        if model is None:
+            model = genai.GenerativeModel(model_name, system_instruction=system_instruction)
+            self._models[key] = model
+            while len(self._models) > self.MAX_LIVE_CHATS:
+                self._models.popitem(last=False)
+        else:
+            self._models.move_to_end(key)
+        return model
+
+    def _to_gemini_history(self, turns: List[Tuple[str, str]]) -> List[content_types.ContentDict]:
+        """(role, content) 목록을 Gemini 히스토리 형식으로 변환 (연속된 같은 역할은 합침)"""
+        history: List[content_types.ContentDict] = []
+        for role, content in turns:
+            gemini_role = "model" if role == "assistant" else "user"
+            if history and history[-1]["role"] == gemini_role:
+                history[-1]["parts"].append(content)
+            else:
+                history.append({"role": gemini_role, "parts": [content]})
+        return history
+
+    def _parse_usage(self, response, model_name: str) -> Optional[TokenUsage]:
+        """응답의 usage_metadata를 TokenUsage로 변환"""
+        usage = getattr(response, "usage_metadata", None)
+        if usage is None:
+            return None
+
+        return TokenUsage(
+            model=model_name,
+            prompt_tokens=getattr(usage, "prompt_token_count", 0) or 0,
+            completion_tokens=getattr(usage, "candidates_token_count", 0) or 0,
+            cached_tokens=getattr(usage, "cached_content_token_count", 0) or 0,
+        )
@@ -0,0 +1,61 @@
+"""JSONL 파일 기반 AI 호출 텔레메트리 저장소 구현"""
+
+import json
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+
+from diary.domain.entities.ai_call_record import AICallRecord
+from diary.domain.interfaces.telemetry_repository import TelemetryRepositoryInterface
+
+
+class JsonlTelemetryRepository(TelemetryRepositoryInterface):
+    """AI 호출 기록을 JSONL 파일에 한 줄씩 추가하는 구현체
+
+    파일 구조 (data/telemetry.jsonl):
+    {"timestamp": "...", "provider": "openai", "latency_ms": 812.3, ...}
+    {"timestamp": "...", "provider": "openai", "latency_ms": 640.1, ...}
+    """
+
+    def __init__(self, file_path: Optional[str] = None):
+        """
+        Args:
+            file_path: JSONL 파일 경로 (기본: data/telemetry.jsonl)
+        """
+        if file_path is None:
+            # 프로젝트 루트의 data/ 디렉토리 사용
+            project_root = Path(__file__).parent.parent.parent.parent
+            self.file_path = project_root / "data" / "telemetry.jsonl"
+        else:
+            self.file_path = Path(file_path)
+
+        # data 디렉토리가 없으면 생성
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def append(self, record: AICallRecord) -> None:
+        """호출 기록 한 줄 추가"""
+        line = json.dumps(record.to_dict(), ensure_ascii=False, separators=(",", ":"))
+        with self._lock:
+            with open(self.file_path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+    def list_records(self, since: Optional[datetime] = None) -> List[AICallRecord]:
+        """호출 기록 조회 (손상된 줄은 건너뜀)"""
+        if not self.file_path.exists():
+            return []
+
+        records = []
+        with open(self.file_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    record = AICallRecord.from_dict(json.loads(line))
+                except (json.JSONDecodeError, KeyError, ValueError):
+                    continue
+                if since is None or record.timestamp >= since:
+                    records.append(record)
+
+        return records
@@ -10,16 +10,62 @@ MongoDB 기반 채팅 저장소 구현체
 import os
 from datetime import datetime
 from typing import Optional, List
-from pymongo import MongoClient
+import copy
+import json
+import bson
+from bson.binary import Binary
+from pymongo import MongoClient, ReplaceOne
+from pymongo.errors import DuplicateKeyError
 from pymongo.database import Database
 from pymongo.collection import Collection
 
 from diary.domain.entities import ChatSession, ChatMessage, MessageRole
-from diary.domain.interfaces import ChatRepositoryInterface
+from diary.domain.exceptions import SessionConflictError
+from diary.domain.interfaces import ChatRepositoryInterface, DEFAULT_USER_ID, validate_user_id
+from diary.domain.services.system_prompt_builder import compute_prompt_hash
+from diary.data.repositories.mongodb_partitioning import backfill_user_id, drop_legacy_indexes
+from diary.data.repositories.mongodb_versioning import version_filter
+from diary.data.repositories.archive_codec import compress, decompress, default_codec
+from diary.data.repositories.prompt_store import (
+    PromptCompactionReport,
+    PromptStore,
+    compact_message,
+    expand_message,
+    is_inline_prompt,
+    to_prompt_ref,
+)
+
+
+class MongoDBPromptStore(PromptStore):
+    """프롬프트를 prompts 컬렉션에 {_id: hash, content} 문서로 저장하는 구현체"""
+
+    def __init__(self, collection: Collection):
+        super().__init__()
+        self.collection = collection
+
+    def _save(self, prompt_hash: str, text: str) -> None:
+        # $setOnInsert: 이미 있으면 그대로 둠 (동시에 저장해도 안전)
+        self.collection.update_one(
+            {"_id": prompt_hash},
+            {"$setOnInsert": {"content": text, "created_at": datetime.now().isoformat()}},
+            upsert=True,
+        )
+
+    def _load(self, prompt_hash: str) -> Optional[str]:
+        doc = self.collection.find_one({"_id": prompt_hash})
+        return doc["content"] if doc else None
+
+
+# user_id 없이 만들었던 예전 인덱스 (사용자별 인덱스로 대체)
+_LEGACY_SESSION_INDEXES = ["session_id_1", "created_at_1", "is_active_1", "is_active_1_updated_at_1"]
 
 
 class MongoDBChatRepository(ChatRepositoryInterface):
-    """MongoDB를 사용한 채팅 저장소 구현체"""
+    """MongoDB를 사용한 채팅 저장소 구현체
+
+    모든 문서에 user_id를 저장하고, 조회는 항상 이 저장소의 user_id로 한정합니다.
+    활성 세션도 active_session 컬렉션에 사용자마다 문서 하나로 관리합니다.
+    """
 
     def __init__(
         self,
@@ -28,6 +74,7 @@ class MongoDBChatRepository(ChatRepositoryInterface):
         username: str = "admin",
         password: str = "admin123",
         database: str = "daily_diary",
+        user_id: str = DEFAULT_USER_ID,
     ):
         """
         MongoDB 연결 초기화
@@ -38,7 +85,10 @@ class MongoDBChatRepository(ChatRepositoryInterface):
             username: 사용자명
             password: 비밀번호
             database: 데이터베이스명
+            user_id: 사용자 ID
         """
+        self.user_id = validate_user_id(user_id)
+
         # 환경 변수 우선 사용 (Docker Compose 환경 지원)
         self.host = os.getenv("MONGODB_HOST", host)
         self.port = int(os.getenv("MONGODB_PORT", port))
@@ -54,59 +104,112 @@ class MongoDBChatRepository(ChatRepositoryInterface):
         self.db: Database = self.client[self.database_name]
         self.sessions: Collection = self.db["chat_sessions"]
         self.active_session: Collection = self.db["active_session"]
+        # 오래된 종료 세션 보관 계층 (세션 하나 = 압축된 JSON 문서 하나)
+        self.archived_sessions: Collection = self.db["chat_sessions_archive"]
+        # 시스템 프롬프트 본문 (세션에는 해시만 저장)
+        self.prompt_store = MongoDBPromptStore(self.db["prompts"])
 
         # 인덱스 생성 (성능 최적화)
         self._create_indexes()
 
+    def for_user(self, user_id: str) -> "MongoDBChatRepository":
+        """같은 연결을 공유하는 다른 사용자의 채팅 저장소 (close는 원래 저장소에서만)"""
+        scoped = copy.copy(self)
+        scoped.user_id = validate_user_id(user_id)
+        return scoped
+
     def _create_indexes(self) -> None:
-        """MongoDB 인덱스 생성 (성능 최적화)"""
-        # session_id 고유 인덱스
-        self.sessions.create_index("session_id", unique=True)
-        # created_at 인덱스 (최신순 정렬용)
-        self.sessions.create_index("created_at", background=True)
-        # is_active 인덱스 (활성 세션 조회용)
-        self.sessions.create_index("is_active", background=True)
+        """MongoDB 인덱스 생성 (모두 user_id로 시작)"""
+        # user_id가 없는 기존 문서는 기본 사용자로
+        for collection in (self.sessions, self.active_session, self.archived_sessions):
+            backfill_user_id(collection)
+
+        # 사용자별 session_id 고유 인덱스
+        self.sessions.create_index([("user_id", 1), ("session_id", 1)], unique=True)
+        # 사용자별 최신순 정렬용
+        self.sessions.create_index([("user_id", 1), ("created_at", -1)], background=True)
+        # 보관 대상 조회용 (종료 세션 중 마지막 수정이 오래된 것)
+        self.sessions.create_index([("user_id", 1), ("is_active", 1), ("updated_at", 1)], background=True)
+        drop_legacy_indexes(self.sessions, _LEGACY_SESSION_INDEXES)
+        # 활성 세션: 사용자마다 하나
+        self.active_session.create_index("user_id", unique=True)
+        # 보관 계층: session_id 조회, 보관 기간 만료 삭제용
+        self.archived_sessions.create_index([("user_id", 1), ("session_id", 1)], unique=True)
+        self.archived_sessions.create_index([("user_id", 1), ("updated_at", 1)], background=True)
+        drop_legacy_indexes(self.archived_sessions, ["session_id_1", "updated_at_1"])
+
+    def _session_filter(self, session_id: str) -> dict:
+        """이 사용자의 세션 조회 조건"""
+        return {"user_id": self.user_id, "session_id": session_id}
+
+    def _active_filter(self) -> dict:
+        """이 사용자의 활성 세션 문서 조회 조건"""
+        return {"type": "active", "user_id": self.user_id}
 
     def save_session(self, session: ChatSession) -> None:
-        """채팅 세션 저장"""
+        """채팅 세션 저장 (session.version이 저장소 버전과 같을 때만, 저장 후 버전 증가)
+
+        일부만 읽은 세션이면 messages 배열 전체를 덮어쓰지 않고,
+        읽어온/새로 추가된 메시지를 원래 위치(messages.N)에만 씁니다.
+        시스템 프롬프트 본문은 prompts 컬렉션에 넣고 해시만 남깁니다.
+
+        Raises:
+            SessionConflictError: 다른 곳에서 먼저 저장했거나 삭제한 경우
+        """
         session_doc = {
+            "user_id": self.user_id,
             "session_id": session.session_id,
-            "messages": [
-                {
-                    "role": msg.role.value,
-                    "content": msg.content,
-                    "timestamp": msg.timestamp.isoformat(),
-                }
-                for msg in session.messages
-            ],
             "created_at": session.created_at.isoformat(),
+            "updated_at": session.updated_at.isoformat(),
+            "metadata": session.metadata,
             "is_active": session.is_active,
         }
+        # 토큰 추정기가 캐시한 token_count도 함께 저장 (다시 불러올 때 재계산하지 않음)
+        if session.is_partial:
+            for index, msg in enumerate(session.messages):
+                position = index if index == 0 else index + session.omitted_messages
+                session_doc[f"messages.{position}"] = compact_message(msg.to_dict(), self.prompt_store)
+        else:
+            session_doc["messages"] = [
+                compact_message(msg.to_dict(), self.prompt_store) for msg in session.messages
+            ]
 
-        # Upsert (없으면 생성, 있으면 업데이트)
-        self.sessions.update_one(
-            {"session_id": session.session_id},
-            {"$set": session_doc},
-            upsert=True,
-        )
+        # Compare-and-set: 읽어온 버전 그대로일 때만 저장 (버전 0이면 새 세션으로 생성)
+        try:
+            result = self.sessions.update_one(
+                {**self._session_filter(session.session_id), **version_filter(session.version)},
+                {"$set": session_doc, "$inc": {"version": 1}},
+                upsert=session.version == 0,
+            )
+        except DuplicateKeyError:
+            # 버전 0으로 만들려 했지만 이미 다른 곳에서 저장한 세션
+            result = None
+        if result is None or (result.matched_count == 0 and result.upserted_id is None):
+            current = self.sessions.find_one(self._session_filter(session.session_id), {"version": 1})
+            raise SessionConflictError(
+                session.session_id, session.version, current.get("version", 0) if current else None
+            )
+        session.mark_saved(session.version + 1)
 
         # 활성 세션 관리
         if session.is_active:
             # 활성 세션으로 설정
             self.active_session.update_one(
-                {"type": "active"},
+                self._active_filter(),
                 {"$set": {"session_id": session.session_id, "updated_at": datetime.now().isoformat()}},
                 upsert=True,
             )
         else:
             # 비활성화된 세션이 현재 활성 세션이면 제거
-            active_doc = self.active_session.find_one({"type": "active"})
+            active_doc = self.active_session.find_one(self._active_filter())
             if active_doc and active_doc.get("session_id") == session.session_id:
-                self.active_session.delete_one({"type": "active"})
+                self.active_session.delete_one(self._active_filter())
 
     def get_session(self, session_id: str) -> Optional[ChatSession]:
-        """세션 ID로 채팅 세션 조회"""
-        doc = self.sessions.find_one({"session_id": session_id})
+        """세션 ID로 채팅 세션 조회 (없으면 보관 계층에서 찾음)"""
+        doc = self.sessions.find_one(self._session_filter(session_id))
+        if not doc:
+            doc = self._get_archived_doc(session_id)
         if not doc:
             return None
 
@@ -114,7 +217,7 @@ class MongoDBChatRepository(ChatRepositoryInterface):
 
     def get_active_session(self) -> Optional[ChatSession]:
         """현재 활성화된 세션 반환 (인터페이스 구현)"""
-        doc = self.active_session.find_one({"type": "active"})
+        doc = self.active_session.find_one(self._active_filter())
         if not doc:
             return None
 
@@ -125,24 +228,169 @@ class MongoDBChatRepository(ChatRepositoryInterface):
         # 활성 세션 ID로 실제 세션 조회
         return self.get_session(session_id)
 
+    def get_active_session_tail(self, tail_size: int) -> Optional[ChatSession]:
+        """활성 세션을 첫 메시지 + 최근 tail_size개 메시지만 조회 ($slice, 문서 전체를 전송하지 않음)"""
+        doc = self.active_session.find_one(self._active_filter())
+        if not doc or not doc.get("session_id"):
+            return None
+
+        tail_size = max(1, tail_size)
+        pipeline = [
+            {"$match": self._session_filter(doc["session_id"])},
+            {"$project": {
+                "_id": 0,
+                "session_id": 1,
+                "created_at": 1,
+                "updated_at": 1,
+                "metadata": 1,
+                "is_active": 1,
+                # 이어서 저장할 때 버전 비교에 필요 (빠지면 버전 0으로 읽혀 항상 충돌)
+                "version": 1,
+                "head": {"$slice": ["$messages", 1]},
+                "tail": {"$slice": ["$messages", -tail_size]},
+                "message_count": {"$size": {"$ifNull": ["$messages", []]}},
+            }},
+        ]
+        result = next(self.sessions.aggregate(pipeline), None)
+        if not result:
+            return None
+
+        count = result["message_count"]
+        omitted = max(0, count - 1 - tail_size)
+        raw_messages = result["tail"] if count <= tail_size else result["head"] + result["tail"]
+        session = self._doc_to_session({**result, "messages": raw_messages})
+        session.omitted_messages = omitted
+        return session
+
+    def load_messages(self, session_id: str, start: int, end: int) -> List[ChatMessage]:
+        """세션의 메시지 일부 조회 ($slice로 필요한 구간만 전송)"""
+        if end <= start:
+            return []
+        doc = self.sessions.find_one(
+            self._session_filter(session_id),
+            {"_id": 0, "messages": {"$slice": [start, end - start]}},
+        )
+        if not doc:
+            return []
+        return [
+            ChatMessage.from_dict(expand_message(msg, self.prompt_store))
+            for msg in doc.get("messages", [])
+        ]
+
     def list_sessions(self, limit: int = 10) -> List[ChatSession]:
         """채팅 세션 목록 조회 (최신순)"""
-        cursor = self.sessions.find().sort("created_at", -1).limit(limit)
+        cursor = self.sessions.find({"user_id": self.user_id}).sort("created_at", -1).limit(limit)
         return [self._doc_to_session(doc) for doc in cursor]
 
     def delete_session(self, session_id: str) -> bool:
-        """채팅 세션 삭제"""
-        result = self.sessions.delete_one({"session_id": session_id})
-        return result.deleted_count > 0
+        """채팅 세션 삭제 (보관된 세션도 삭제)"""
+        result = self.sessions.delete_one(self._session_filter(session_id))
+        archived = self.archived_sessions.delete_one(self._session_filter(session_id))
+        return result.deleted_count + archived.deleted_count > 0
+
+    def archive_sessions(self, updated_before: datetime, batch_size: int = 100) -> int:
+        """
+        마지막 수정이 updated_before 이전인 종료 세션을 압축해 chat_sessions_archive로 이동
+
+        보관 문서를 먼저 쓰고 원본을 지우므로 중간에 중단되어도 세션을 잃지 않습니다.
+        """
+        codec = default_codec()
+        cutoff = updated_before.isoformat()
+        archived = 0
+
+        while True:
+            docs = list(
+                self.sessions.find(
+                    {"user_id": self.user_id, "is_active": False, "updated_at": {"$lt": cutoff}}
+                ).limit(batch_size)
+            )
+            if not docs:
+                return archived
+
+            requests = []
+            for doc in docs:
+                doc.pop("_id", None)
+                payload = json.dumps(doc, ensure_ascii=False).encode("utf-8")
+                requests.append(ReplaceOne(
+                    self._session_filter(doc["session_id"]),
+                    {
+                        "user_id": self.user_id,
+                        "session_id": doc["session_id"],
+                        "created_at": doc["created_at"],
+                        "updated_at": doc["updated_at"],
+                        "archived_at": datetime.now().isoformat(),
+                        "codec": codec,
+                        "data": Binary(compress(payload, codec)),
+                    },
+                    upsert=True,
+                ))
+            self.archived_sessions.bulk_write(requests, ordered=False)
+            session_ids = [doc["session_id"] for doc in docs]
+            self.sessions.delete_many(
+                {"user_id": self.user_id, "session_id": {"$in": session_ids}, "is_active": False}
+            )
+            archived += len(docs)
+
+    def expire_archived_sessions(self, updated_before: datetime) -> int:
+        """마지막 수정이 updated_before 이전인 보관 세션 삭제"""
+        result = self.archived_sessions.delete_many(
+            {"user_id": self.user_id, "updated_at": {"$lt": updated_before.isoformat()}}
+        )
+        return result.deleted_count
+
+    def compact_stored_prompts(self, dry_run: bool = False) -> PromptCompactionReport:
+        """
+        프롬프트 본문을 그대로 담고 있는 기존 세션 문서를 해시 참조로 압축
+
+        마이그레이션 작업이라 모든 사용자의 세션을 대상으로 합니다.
+        크기는 BSON 인코딩 기준으로 계산합니다.
+
+        Args:
+            dry_run: True면 문서를 바꾸지 않고 절약될 크기만 계산
+
+        Returns:
+            PromptCompactionReport
+        """
+        report = PromptCompactionReport(dry_run=dry_run)
+        report.sessions_scanned = self.sessions.count_documents({})
+        new_prompts = set()
+        inline_filter = {
+            "messages": {"$elemMatch": {"role": MessageRole.SYSTEM.value, "content": {"$exists": True}}}
+        }
+        for doc in self.sessions.find(inline_filter):
+            messages = doc.get("messages", [])
+            for msg in messages:
+                if not is_inline_prompt(msg):
+                    continue
+                prompt_hash = compute_prompt_hash(msg["content"])
+                if prompt_hash not in new_prompts and not self.prompt_store.contains(prompt_hash):
+                    new_prompts.add(prompt_hash)
+                    report.prompt_bytes += len(bson.encode({"_id": prompt_hash, "content": msg["content"]}))
+
+            compacted = [
+                compact_message(msg, self.prompt_store) if not dry_run else to_prompt_ref(msg)
+                for msg in messages
+            ]
+            report.sessions_compacted += 1
+            report.bytes_before += len(bson.encode(doc))
+            report.bytes_after += len(bson.encode({**doc, "messages": compacted}))
+
+            if not dry_run:
+                self.sessions.update_one({"_id": doc["_id"]}, {"$set": {"messages": compacted}})
+
+        return report
+
+    def _get_archived_doc(self, session_id: str) -> Optional[dict]:
+        """보관된 세션의 압축을 풀어 원래 세션 문서로 반환"""
+        archived = self.archived_sessions.find_one(self._session_filter(session_id))
+        if not archived:
+            return None
+        return json.loads(decompress(bytes(archived["data"]), archived["codec"]).decode("utf-8"))
 
     def _doc_to_session(self, doc: dict) -> ChatSession:
         """MongoDB 문서를 ChatSession 엔티티로 변환"""
         messages = [
-            ChatMessage(
-                role=MessageRole(msg["role"]),
-                content=msg["content"],
-                timestamp=datetime.fromisoformat(msg["timestamp"]),
-            )
+            ChatMessage.from_dict(expand_message(msg, self.prompt_store))
             for msg in doc.get("messages", [])
         ]
 
@@ -150,7 +398,13 @@ class MongoDBChatRepository(ChatRepositoryInterface):
             session_id=doc["session_id"],
             messages=messages,
             created_at=datetime.fromisoformat(doc["created_at"]),
+            updated_at=datetime.fromisoformat(doc["updated_at"])
+            if doc.get("updated_at")
+            else None,
+            metadata=doc.get("metadata", {}),
             is_active=doc.get("is_active", True),
+            version=doc.get("version", 0),
+            unsaved_count=0,
         )
 
     def close(self) -> None:
@@ -8,21 +8,34 @@ MongoDB 기반 일기 저장소 구현체
 - 의존성 역전 원칙(DIP) 적용
 """
 
+import copy
 import os
+import re
 import base64
 from datetime import date, datetime
-from typing import Optional, List, Tuple
+from typing import Any, Dict, Optional, List, Tuple
 from uuid import uuid4
-from pymongo import MongoClient, DESCENDING
+from pymongo import MongoClient, ASCENDING, DESCENDING, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 from pymongo.database import Database
 from pymongo.collection import Collection
 
 from diary.domain.entities import Diary
-from diary.domain.interfaces import DiaryRepositoryInterface
+from diary.domain.exceptions import DiaryConflictError, PartialSaveError
+from diary.domain.interfaces import DiaryRepositoryInterface, DEFAULT_USER_ID, validate_user_id
+from diary.data.repositories.mongodb_partitioning import backfill_user_id, drop_legacy_indexes
+from diary.data.repositories.mongodb_versioning import version_filter
+
+
+# user_id 없이 만들었던 예전 인덱스 (사용자별 인덱스로 대체)
+_LEGACY_DIARY_INDEXES = ["diary_date_1", "diary_id_1", "diary_date_-1", "created_at_-1"]
 
 
 class MongoDBDiaryRepository(DiaryRepositoryInterface):
-    """MongoDB를 사용한 일기 저장소 구현체"""
+    """MongoDB를 사용한 일기 저장소 구현체
+
+    모든 문서에 user_id를 저장하고, 조회는 항상 이 저장소의 user_id로 한정합니다.
+    """
 
     def __init__(
         self,
@@ -31,6 +44,7 @@ class MongoDBDiaryRepository(DiaryRepositoryInterface):
         username: str = "admin",
         password: str = "admin123",
         database: str = "daily_diary",
+        user_id: str = DEFAULT_USER_ID,
     ):
         """
         MongoDB 연결 초기화
@@ -41,7 +55,10 @@ class MongoDBDiaryRepository(DiaryRepositoryInterface):
             username: 사용자명
             password: 비밀번호
             database: 데이터베이스명
+            user_id: 사용자 ID
         """
+        self.user_id = validate_user_id(user_id)
+
         # 환경 변수 우선 사용 (Docker Compose 환경 지원)
         self.host = os.getenv("MONGODB_HOST", host)
         self.port = int(os.getenv("MONGODB_PORT", port))
@@ -60,19 +77,91 @@ class MongoDBDiaryRepository(DiaryRepositoryInterface):
         # 인덱스 생성 (성능 최적화)
         self._create_indexes()
 
+    def for_user(self, user_id: str) -> "MongoDBDiaryRepository":
+        """같은 연결을 공유하는 다른 사용자의 일기 저장소 (close는 원래 저장소에서만)"""
+        scoped = copy.copy(self)
+        scoped.user_id = validate_user_id(user_id)
+        return scoped
+
     def _create_indexes(self) -> None:
-        """MongoDB 인덱스 생성 (성능 최적화)"""
-        # diary_date 고유 인덱스 (하루에 하나의 일기만)
-        self.diaries.create_index("diary_date", unique=True)
-        # diary_id 고유 인덱스
-        self.diaries.create_index("diary_id", unique=True)
-        # 날짜 기준 정렬용 (최신순)
-        self.diaries.create_index([("diary_date", DESCENDING)])
-        # 생성 시각 정렬용 (같은 날짜일 경우 대비)
-        self.diaries.create_index([("created_at", DESCENDING)])
+        """MongoDB 인덱스 생성 (모두 user_id로 시작)"""
+        # user_id가 없는 기존 문서는 기본 사용자로
+        backfill_user_id(self.diaries)
+
+        # 사용자별 diary_date 고유 인덱스 (사용자마다 하루에 하나의 일기만)
+        self.diaries.create_index([("user_id", ASCENDING), ("diary_date", ASCENDING)], unique=True)
+        # 사용자별 diary_id 고유 인덱스
+        self.diaries.create_index([("user_id", ASCENDING), ("diary_id", ASCENDING)], unique=True)
+        # 목록 조회용 (최신순, 같은 날짜면 생성 시각 순)
+        self.diaries.create_index(
+            [("user_id", ASCENDING), ("diary_date", DESCENDING), ("created_at", DESCENDING)]
+        )
+        drop_legacy_indexes(self.diaries, _LEGACY_DIARY_INDEXES)
 
     def save(self, diary: Diary) -> Diary:
-        """일기 저장 (생성 또는 수정)"""
+        """일기 저장 (생성 또는 수정, diary.version이 저장소 버전과 같을 때만)
+
+        Raises:
+            DiaryConflictError: 다른 곳에서 먼저 수정했거나 삭제한 경우
+        """
+        is_new = diary.diary_id is None
+        diary_doc = self._prepare_doc(diary)
+        diary_id = diary_doc["diary_id"]  # _prepare_doc이 새 일기의 ID를 채움
+
+        # Compare-and-set: 읽어온 버전 그대로일 때만 저장 (버전 0이면 없을 때 생성)
+        try:
+            result = self.diaries.update_one(
+                {"user_id": self.user_id, "diary_id": diary_id, **version_filter(diary.version)},
+                {"$set": diary_doc, "$inc": {"version": 1}},
+                upsert=diary.version == 0,
+            )
+        except DuplicateKeyError:
+            if is_new:
+                # 같은 날짜의 일기를 다른 곳에서 먼저 만든 경우 (날짜 고유 인덱스)
+                raise ValueError(f"{diary.diary_date} 날짜의 일기가 이미 존재합니다.")
+            result = None
+        if result is None or (result.matched_count == 0 and result.upserted_id is None):
+            current = self.diaries.find_one({"user_id": self.user_id, "diary_id": diary_id}, {"version": 1})
+            raise DiaryConflictError(diary_id, diary.version, current.get("version", 0) if current else None)
+
+        diary.version += 1
+        return diary
+
+    def save_many(self, diaries: List[Diary]) -> List[Diary]:
+        """일기 여러 개를 bulk_write 한 번으로 저장
+
+        순서 없는 쓰기라 일부가 실패해도 나머지는 저장되므로, 실패한 항목만 골라 PartialSaveError로 알립니다.
+        """
+        if not diaries:
+            return []
+
+        operations = [
+            UpdateOne(
+                {"user_id": self.user_id, "diary_id": diary.diary_id, **version_filter(diary.version)},
+                {"$set": doc, "$inc": {"version": 1}},
+                upsert=diary.version == 0,
+            )
+            for diary, doc in ((diary, self._prepare_doc(diary)) for diary in diaries)
+        ]
+        try:
+            self.diaries.bulk_write(operations, ordered=False)
+        except BulkWriteError as e:
+            write_errors = {error["index"]: error.get("errmsg", "") for error in e.details.get("writeErrors", [])}
+            if not write_errors:
+                raise
+            saved = [diary for index, diary in enumerate(diaries) if index not in write_errors]
+            for diary in saved:
+                diary.version += 1
+            raise PartialSaveError(
+                saved, [(diaries[index], message) for index, message in sorted(write_errors.items())]
+            ) from e
+
+        for diary in diaries:
+            diary.version += 1
+        return diaries
+
+    def _prepare_doc(self, diary: Diary) -> dict:
+        """저장 전 ID/시각을 채우고 MongoDB 문서로 변환"""
         # diary_id가 없으면 새로 생성 (UUID)
         if not diary.diary_id:
             diary.diary_id = str(uuid4())
@@ -93,7 +182,8 @@ class MongoDBDiaryRepository(DiaryRepositoryInterface):
             diary.updated_at = datetime.now()
 
         # MongoDB 문서로 변환
-        diary_doc = {
+        return {
+            "user_id": self.user_id,
             "diary_id": diary.diary_id,
             "diary_date": diary_date_value.isoformat(),
             "content": diary.content,
@@ -101,18 +191,9 @@ class MongoDBDiaryRepository(DiaryRepositoryInterface):
             "updated_at": diary.updated_at.isoformat(),
         }
 
-        # Upsert (diary_id 기준으로 업데이트 또는 생성)
-        self.diaries.update_one(
-            {"diary_id": diary.diary_id},
-            {"$set": diary_doc},
-            upsert=True,
-        )
-
-        return diary
-
     def get_by_date(self, diary_date: date) -> Optional[Diary]:
         """특정 날짜의 일기 조회"""
-        doc = self.diaries.find_one({"diary_date": diary_date.isoformat()})
+        doc = self.diaries.find_one({"user_id": self.user_id, "diary_date": diary_date.isoformat()})
         if not doc:
             return None
 
@@ -120,7 +201,7 @@ class MongoDBDiaryRepository(DiaryRepositoryInterface):
 
     def get_by_id(self, diary_id: str) -> Optional[Diary]:
         """ID로 일기 조회"""
-        doc = self.diaries.find_one({"diary_id": diary_id})
+        doc = self.diaries.find_one({"user_id": self.user_id, "diary_id": diary_id})
         if not doc:
             return None
 
@@ -139,8 +220,8 @@ class MongoDBDiaryRepository(DiaryRepositoryInterface):
         Cursor 형식: base64(diary_date|created_at)
         정렬 순서: diary_date DESC, created_at DESC (최신순)
         """
-        # 필터 조건 구성
-        query = {}
+        # 필터 조건 구성 (이 사용자의 일기만)
+        query: Dict[str, Any] = {"user_id": self.user_id}
 
         # 날짜 범위 필터
         if start_date or end_date:
@@ -194,14 +275,27 @@ class MongoDBDiaryRepository(DiaryRepositoryInterface):
 
         return results, next_cursor
 
+    def search(self, keyword: str, limit: int = 30) -> List[Diary]:
+        """내용에 키워드가 들어간 일기 검색 (정규식 특수문자는 이스케이프)"""
+        query = {
+            "user_id": self.user_id,
+            "content": {"$regex": re.escape(keyword), "$options": "i"},
+        }
+        docs = (
+            self.diaries.find(query)
+            .sort([("diary_date", DESCENDING), ("created_at", DESCENDING)])
+            .limit(limit)
+        )
+        return [self._doc_to_diary(doc) for doc in docs]
+
     def delete(self, diary_id: str) -> bool:
         """일기 삭제"""
-        result = self.diaries.delete_one({"diary_id": diary_id})
+        result = self.diaries.delete_one({"user_id": self.user_id, "diary_id": diary_id})
         return result.deleted_count > 0
 
     def exists_on_date(self, diary_date: date) -> bool:
         """특정 날짜에 일기가 존재하는지 확인"""
-        count = self.diaries.count_documents({"diary_date": diary_date.isoformat()})
+        count = self.diaries.count_documents({"user_id": self.user_id, "diary_date": diary_date.isoformat()})
         return count > 0
 
     def _doc_to_diary(self, doc: dict) -> Diary:
@@ -221,6 +315,7 @@ class MongoDBDiaryRepository(DiaryRepositoryInterface):
             content=doc["content"],
             created_at=datetime.fromisoformat(doc["created_at"]),
             updated_at=datetime.fromisoformat(doc["updated_at"]),
+            version=doc.get("version", 0),
         )
 
     def close(self) -> None:
@@ -0,0 +1,36 @@
+"""MongoDB 사용자별 파티셔닝 공통 처리
+
+모든 문서에 user_id를 두고, 모든 인덱스를 user_id로 시작하게 만들어
+사용자 한 명의 조회가 다른 사용자의 문서를 훑지 않게 합니다.
+같은 이유로 user_id는 그대로 샤드 키({"user_id": 1} 또는 "hashed")로 쓸 수 있습니다
+(샤딩된 컬렉션의 고유 인덱스는 샤드 키로 시작해야 하므로 고유 인덱스도 user_id로 시작).
+
+사용자 구분이 없던 기존 문서는 저장소를 처음 열 때 기본 사용자로 채웁니다.
+"""
+
+from typing import Iterable
+
+from pymongo.collection import Collection
+
+from diary.domain.interfaces.user_scoped_repository import DEFAULT_USER_ID
+
+
+def backfill_user_id(collection: Collection) -> int:
+    """
+    user_id가 없는 기존 문서를 기본 사용자로 채움
+
+    user_id로 시작하는 인덱스의 null 구간만 확인하므로, 채울 문서가 없으면 비용이 거의 없습니다.
+
+    Returns:
+        채운 문서 수
+    """
+    result = collection.update_many({"user_id": None}, {"$set": {"user_id": DEFAULT_USER_ID}})
+    return result.modified_count
+
+
+def drop_legacy_indexes(collection: Collection, index_names: Iterable[str]) -> None:
+    """user_id 없이 만들었던 예전 인덱스 삭제 (전체 사용자에 걸친 고유 제약 제거)"""
+    existing = collection.index_information()
+    for name in index_names:
+        if name in existing:
+            collection.drop_index(name)
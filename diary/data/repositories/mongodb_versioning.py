@@ -0,0 +1,17 @@
+"""MongoDB 낙관적 동시성 제어 공통 처리
+
+세션/일기 문서에 version 필드를 두고, 읽어온 버전과 같을 때만 수정하면서 버전을 올립니다
+({"$inc": {"version": 1}}). 버전 필드가 생기기 전에 저장한 문서는 버전 0으로 봅니다.
+"""
+
+
+def version_filter(version: int) -> dict:
+    """
+    저장소 버전이 version인 문서만 고르는 조건
+
+    Args:
+        version: 읽어온 버전 (0이면 버전 필드가 없는 기존 문서도 포함)
+    """
+    if version == 0:
+        return {"$or": [{"version": 0}, {"version": {"$exists": False}}]}
+    return {"version": version}
@@ -1,29 +1,47 @@
 """OpenAI API 클라이언트 구현"""
 
-from typing import List
+import threading
+from typing import Iterator, List, Optional
 from openai import OpenAI
 
+from diary.domain.entities.token_usage import TokenUsage
 from diary.domain.interfaces.ai_client import AIClientInterface
+from diary.domain.services.system_prompt_builder import compute_prompt_hash
 
 
 class OpenAIClient(AIClientInterface):
-    """OpenAI GPT 모델을 사용하는 AI 클라이언트"""
+    """OpenAI GPT 모델을 사용하는 AI 클라이언트
 
-    def __init__(self, api_key: str, model: str = "gpt-4o-mini"):
+    OpenAI는 1024 토큰 이상의 동일한 요청 앞부분(prefix)을 자동으로 캐시합니다.
+    시스템 메시지를 항상 맨 앞에, 원래 순서 그대로 보내서 prefix가 바이트 단위로 유지되도록 합니다.
+    시스템 프롬프트 해시를 prompt_cache_key로 보내 같은 프롬프트 요청이 같은 캐시로 가도록 합니다.
+    """
+
+    def __init__(
+        self, api_key: str, model: str = "gpt-4o-mini", base_url: Optional[str] = None
+    ):
         """
         Args:
             api_key: OpenAI API 키
             model: 사용할 모델 (기본: gpt-4o-mini, 비용 효율적)
+            base_url: OpenAI 호환 API 주소 (기본: OpenAI, 로컬 가짜 서버 등으로 변경 가능)
         """
-        self.client = OpenAI(api_key=api_key)
+        # 재시도는 InstrumentedAIClient에서 수행하여 횟수를 기록함
+        self.client = OpenAI(api_key=api_key, base_url=base_url, max_retries=0)
         self.model = model
+        # 마지막 사용량은 호출한 스레드별로 보관 (서버 모드에서 여러 요청이 클라이언트 하나를 공유)
+        self._local = threading.local()
 
-    def chat(self, messages: List[dict]) -> str:
+    def chat(
+        self, messages: List[dict], session_id: Optional[str] = None, model: Optional[str] = None
+    ) -> str:
         """
         OpenAI Chat Completion API 호출
 
         Args:
             messages: [{"role": "user", "content": "..."}, ...]
+            session_id: 채팅 세션 ID (매 요청에 전체 히스토리를 보내므로 사용하지 않음)
+            model: 이번 요청에만 사용할 모델 (None이면 기본 모델)
 
         Returns:
             AI 응답 텍스트
@@ -32,25 +50,109 @@ class OpenAIClient(AIClientInterface):
             Exception: API 호출 실패 시
         """
         try:
-            # UTF-8 인코딩 문제 방지: 서로게이트 문자 제거
-            cleaned_messages = []
-            for msg in messages:
-                content = msg["content"]
-                if isinstance(content, str):
-                    content = content.encode('utf-8', errors='ignore').decode('utf-8')
-
-                cleaned_messages.append({
-                    "role": msg["role"],
-                    "content": content
-                })
-
+            prepared = self._prepare_messages(messages)
             response = self.client.chat.completions.create(
-                model=self.model,
-                messages=cleaned_messages,
+                model=model or self.model,
+                messages=prepared,
                 temperature=0.7,
-                max_tokens=1000
+                max_tokens=1000,
+                extra_body=self._cache_options(prepared),
             )
+            self._local.last_usage = self._parse_usage(response.usage, response.model or model)
             return response.choices[0].message.content
 
         except Exception as e:
-            raise Exception(f"OpenAI API 호출 실패: {str(e)}")
+            raise Exception(f"OpenAI API 호출 실패: {str(e)}") from e
+
+    def chat_stream(
+        self, messages: List[dict], session_id: Optional[str] = None, model: Optional[str] = None
+    ) -> Iterator[str]:
+        """
+        OpenAI Chat Completion API 스트리밍 호출
+
+        Args:
+            messages: [{"role": "user", "content": "..."}, ...]
+            session_id: 채팅 세션 ID (사용하지 않음)
+            model: 이번 요청에만 사용할 모델 (None이면 기본 모델)
+
+        Yields:
+            AI 응답 텍스트 조각
+
+        Raises:
+            Exception: API 호출 실패 시
+        """
+        try:
+            self._local.last_usage = None
+            prepared = self._prepare_messages(messages)
+            stream = self.client.chat.completions.create(
+                model=model or self.model,
+                messages=prepared,
+                temperature=0.7,
+                max_tokens=1000,
+                stream=True,
+                stream_options={"include_usage": True},
+                extra_body=self._cache_options(prepared),
+            )
+            for chunk in stream:
+                # 마지막 조각에만 usage가 담겨 옴 (choices는 비어 있음)
+                if getattr(chunk, "usage", None):
+                    self._local.last_usage = self._parse_usage(chunk.usage, chunk.model or model)
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+
+        except Exception as e:
+            raise Exception(f"OpenAI API 호출 실패: {str(e)}") from e
+
+    def get_last_usage(self) -> Optional[TokenUsage]:
+        """마지막 호출의 토큰 사용량 (자동 prefix 캐시 적중 포함)"""
+        return getattr(self._local, "last_usage", None)
+
+    def get_model_name(self) -> Optional[str]:
+        """기본 모델 이름"""
+        return self.model
+
+    def _prepare_messages(self, messages: List[dict]) -> List[dict]:
+        """
+        API 전송용 메시지 정리
+
+        UTF-8 서로게이트 문자를 제거하고, 시스템 메시지(고정 프롬프트 → 대화 요약)를
+        앞으로 모아 캐시 가능한 prefix를 유지합니다.
+        """
+        system_messages = []
+        conversation_messages = []
+        for msg in messages:
+            content = msg["content"]
+            if isinstance(content, str):
+                content = content.encode('utf-8', errors='ignore').decode('utf-8')
+
+            target = system_messages if msg["role"] == "system" else conversation_messages
+            target.append({
+                "role": msg["role"],
+                "content": content
+            })
+
+        return system_messages + conversation_messages
+
+    def _cache_options(self, prepared: List[dict]) -> Optional[dict]:
+        """
+        첫 시스템 메시지(고정 프롬프트) 해시로 prompt_cache_key 생성
+
+        SDK 버전과 관계없이 보낼 수 있도록 extra_body로 전달합니다.
+        """
+        if not prepared or prepared[0]["role"] != "system" or not isinstance(prepared[0]["content"], str):
+            return None
+        return {"prompt_cache_key": compute_prompt_hash(prepared[0]["content"])[:32]}
+
+    def _parse_usage(self, usage, model: Optional[str]) -> Optional[TokenUsage]:
+        """응답의 usage를 TokenUsage로 변환"""
+        if usage is None:
+            return None
+
+        details = getattr(usage, "prompt_tokens_details", None)
+        cached = (getattr(details, "cached_tokens", None) or 0) if details else 0
+        return TokenUsage(
+            model=model or self.model,
+            prompt_tokens=usage.prompt_tokens or 0,
+            completion_tokens=usage.completion_tokens or 0,
+            cached_tokens=cached,
+        )
@@ -0,0 +1,173 @@
+"""시스템 프롬프트 저장소 (해시 기준 한 번만 저장)
+
+세션의 첫 메시지인 시스템 프롬프트는 스타일 예시 문장까지 포함해 수 KB이고,
+같은 설정이면 모든 세션에서 내용이 똑같습니다. 채팅 저장소는 프롬프트 본문을
+SHA-256 해시 기준으로 한 번만 저장하고, 세션에는 해시(prompt_ref)만 남깁니다.
+
+프롬프트는 여러 세션이 함께 참조하므로 세션을 삭제해도 지우지 않습니다.
+"""
+
+import os
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional
+
+from diary.domain.entities.chat_message import MessageRole
+from diary.domain.services.system_prompt_builder import compute_prompt_hash
+
+
+# 저장된 메시지에서 본문 대신 들어가는 프롬프트 해시 키
+PROMPT_REF_KEY = "prompt_ref"
+
+
+@dataclass
+class PromptCompactionReport:
+    """기존 세션의 시스템 프롬프트 압축 결과
+
+    Attributes:
+        sessions_scanned: 확인한 세션 수
+        sessions_compacted: 프롬프트 본문을 참조로 바꾼 세션 수
+        bytes_before: 압축한 세션들의 원래 크기 (바이트)
+        bytes_after: 압축한 세션들의 압축 후 크기 (바이트)
+        prompt_bytes: 새로 저장한 프롬프트 본문 크기 (바이트)
+        dry_run: True면 실제로 쓰지 않고 계산만 함
+    """
+    sessions_scanned: int = 0
+    sessions_compacted: int = 0
+    bytes_before: int = 0
+    bytes_after: int = 0
+    prompt_bytes: int = 0
+    dry_run: bool = False
+
+    @property
+    def reclaimed_bytes(self) -> int:
+        """절약한 공간 (새로 저장한 프롬프트 크기를 뺀 값)"""
+        return self.bytes_before - self.bytes_after - self.prompt_bytes
+
+
+class PromptStore(ABC):
+    """해시 → 프롬프트 본문 저장소 (한 번 읽은 본문은 메모리에 캐시)"""
+
+    def __init__(self):
+        self._cache: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def put(self, text: str) -> str:
+        """
+        프롬프트 본문 저장 (이미 있으면 쓰지 않음)
+
+        Returns:
+            프롬프트 해시
+        """
+        prompt_hash = compute_prompt_hash(text)
+        with self._lock:
+            if prompt_hash in self._cache:
+                return prompt_hash
+        self._save(prompt_hash, text)
+        with self._lock:
+            self._cache[prompt_hash] = text
+        return prompt_hash
+
+    def get(self, prompt_hash: str) -> Optional[str]:
+        """해시로 프롬프트 본문 조회 (없으면 None)"""
+        with self._lock:
+            cached = self._cache.get(prompt_hash)
+        if cached is not None:
+            return cached
+
+        text = self._load(prompt_hash)
+        if text is not None:
+            with self._lock:
+                self._cache[prompt_hash] = text
+        return text
+
+    def contains(self, prompt_hash: str) -> bool:
+        """해시에 해당하는 본문이 이미 저장되어 있는지"""
+        return self.get(prompt_hash) is not None
+
+    @abstractmethod
+    def _save(self, prompt_hash: str, text: str) -> None:
+        """본문 저장 (같은 해시가 이미 있으면 아무것도 하지 않아야 함)"""
+        pass
+
+    @abstractmethod
+    def _load(self, prompt_hash: str) -> Optional[str]:
+        """본문 조회 (없으면 None)"""
+        pass
+
+
+class FileSystemPromptStore(PromptStore):
+    """프롬프트를 {prompts_dir}/{hash}.txt 파일로 저장하는 구현체"""
+
+    def __init__(self, prompts_dir: Path):
+        super().__init__()
+        self.prompts_dir = prompts_dir
+        self.prompts_dir.mkdir(parents=True, exist_ok=True)
+
+    def _prompt_file(self, prompt_hash: str) -> Path:
+        return self.prompts_dir / f"{prompt_hash}.txt"
+
+    def _save(self, prompt_hash: str, text: str) -> None:
+        prompt_file = self._prompt_file(prompt_hash)
+        if prompt_file.exists():
+            return
+        # 다른 프로세스가 반쯤 쓴 파일을 읽지 않도록 임시 파일에 쓰고 교체
+        tmp_file = prompt_file.with_suffix(f".{os.getpid()}.tmp")
+        tmp_file.write_text(text, encoding="utf-8")
+        os.replace(tmp_file, prompt_file)
+
+    def _load(self, prompt_hash: str) -> Optional[str]:
+        try:
+            return self._prompt_file(prompt_hash).read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+
+
+def is_inline_prompt(data: dict) -> bool:
+    """본문을 그대로 담고 있는 시스템 메시지인지"""
+    return data.get("role") == MessageRole.SYSTEM.value and "content" in data
+
+
+def to_prompt_ref(data: dict) -> dict:
+    """시스템 프롬프트 본문을 해시 참조로 바꾼 메시지 (저장소에는 쓰지 않음)"""
+    if not is_inline_prompt(data):
+        return data
+
+    compacted = {key: value for key, value in data.items() if key != "content"}
+    compacted[PROMPT_REF_KEY] = compute_prompt_hash(data["content"])
+    return compacted
+
+
+def compact_message(data: dict, store: PromptStore) -> dict:
+    """
+    저장용 메시지 딕셔너리에서 시스템 프롬프트 본문을 저장소에 넣고 해시 참조로 교체
+
+    시스템 메시지가 아니거나 이미 참조로 바뀐 메시지는 그대로 반환합니다.
+    """
+    if not is_inline_prompt(data):
+        return data
+
+    store.put(data["content"])
+    return to_prompt_ref(data)
+
+
+def expand_message(data: dict, store: PromptStore) -> dict:
+    """
+    저장된 메시지 딕셔너리의 프롬프트 참조를 본문으로 복원
+
+    Raises:
+        ValueError: 참조한 프롬프트가 저장소에 없는 경우
+    """
+    prompt_hash = data.get(PROMPT_REF_KEY)
+    if prompt_hash is None:
+        return data
+
+    content = store.get(prompt_hash)
+    if content is None:
+        raise ValueError(f"시스템 프롬프트 {prompt_hash[:12]}를 찾을 수 없습니다.")
+
+    expanded = {key: value for key, value in data.items() if key != PROMPT_REF_KEY}
+    expanded["content"] = content
+    return expanded
@@ -0,0 +1,99 @@
+"""채팅 세션 파일 직렬화 코덱
+
+기본은 공백 없는 JSON이고, msgpack이 설치되어 있으면 더 빠르고 작은 msgpack으로
+저장할 수 있습니다. 세션 파일은 코덱별 확장자로 구분하므로 코덱을 바꿔도 기존 파일을
+그대로 읽고, 다음 저장 때 새 코덱으로 옮겨 씁니다.
+"""
+
+import json
+
+
+JSON_CODEC = "json"
+MSGPACK_CODEC = "msgpack"
+
+# 코덱 → 세션 파일 확장자
+SESSION_CODEC_SUFFIXES = {JSON_CODEC: ".json", MSGPACK_CODEC: ".msgpack"}
+
+DEFAULT_SESSION_CODEC = JSON_CODEC
+
+
+def _msgpack():
+    """msgpack 모듈 (설치되어 있지 않으면 None, 처음 필요할 때 import)"""
+    try:
+        import msgpack
+    except ImportError:
+        return None
+    return msgpack
+
+
+def available_codecs() -> list:
+    """이 환경에서 사용할 수 있는 코덱 목록"""
+    return [codec for codec in SESSION_CODEC_SUFFIXES if codec != MSGPACK_CODEC or _msgpack()]
+
+
+def validate_codec(codec: str) -> str:
+    """
+    코덱 이름 검증
+
+    Raises:
+        ValueError: 지원하지 않는 코덱이거나 msgpack이 없는 경우
+    """
+    if codec not in SESSION_CODEC_SUFFIXES:
+        raise ValueError(f"지원하지 않는 세션 코덱: {codec} (사용 가능: {', '.join(SESSION_CODEC_SUFFIXES)})")
+    if codec == MSGPACK_CODEC:
+        _require_msgpack()
+    return codec
+
+
+def codec_for_path(path) -> str:
+    """세션 파일 확장자로 코덱 판별 (알 수 없으면 JSON)"""
+    return next(
+        (codec for codec, suffix in SESSION_CODEC_SUFFIXES.items() if str(path).endswith(suffix)),
+        JSON_CODEC,
+    )
+
+
+def encode_session(data: dict, codec: str) -> bytes:
+    """
+    세션 딕셔너리 직렬화
+
+    Raises:
+        ValueError: 지원하지 않는 코덱이거나 msgpack이 없는 경우
+    """
+    if codec == JSON_CODEC:
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    if codec == MSGPACK_CODEC:
+        # packb의 반환 타입은 Optional[bytes]로 선언되어 있음 (bytes가 아니면 저장하지 않음)
+        packed = _require_msgpack().packb(data, use_bin_type=True)
+        if packed is None:
+            raise ValueError("msgpack 직렬화 결과가 비어 있습니다.")
+        return packed
+    raise ValueError(f"지원하지 않는 세션 코덱: {codec}")
+
+
+def decode_session(raw: bytes, codec: str) -> dict:
+    """
+    세션 딕셔너리 역직렬화
+
+    Raises:
+        ValueError: 내용이 손상되었거나 지원하지 않는 코덱인 경우
+    """
+    if codec == JSON_CODEC:
+        data = json.loads(raw.decode("utf-8"))
+    elif codec == MSGPACK_CODEC:
+        try:
+            data = _require_msgpack().unpackb(raw, raw=False)
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"손상된 msgpack 세션 파일: {e}") from e
+    else:
+        raise ValueError(f"지원하지 않는 세션 코덱: {codec}")
+    if not isinstance(data, dict):
+        raise ValueError("세션 파일의 최상위 값이 객체가 아닙니다.")
+    return data
+
+
+def _require_msgpack():
+    msgpack = _msgpack()
+    if msgpack is None:
+        raise ValueError("msgpack 코덱을 사용하려면 msgpack 패키지가 필요합니다: uv sync --extra msgpack")
+    return msgpack
@@ -0,0 +1,254 @@
+"""파일 채팅 저장소의 세션 목록 인덱스 (manifest)
+
+세션 목록과 활성 세션 조회가 디렉토리 전체를 읽지 않도록, 세션마다 ID, 생성/수정 시각,
+종료 여부와 현재 활성 세션 ID를 manifest.json 하나에 모아 둡니다.
+저장소가 세션을 저장/삭제할 때 잠금 안에서 임시 파일에 쓰고 교체하며,
+파일이 없거나 손상되었으면 세션 파일을 읽어 다시 만듭니다.
+
+manifest는 목록이 바뀔 때만 다시 씁니다. 매 턴 바뀌는 메시지 수/수정 시각은 세션 파일과
+tail 인덱스(로그 저장소는 로그 인덱스)에 있으므로, 항목의 수정 시각은 목록 순서가 바뀔 때만 갱신합니다.
+- 새 세션, 세션 종료, 활성 세션 변경, 삭제: 저장소의 fsync 정책을 따름
+- 수정 시각 순서만 바뀜: fsync하지 않음 (중단되어 사라져도 다음 저장 때 바로잡힘)
+- 그 외 (진행 중인 최신 세션에 턴 추가 등): 쓰지 않음
+"""
+
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from diary.domain.entities.chat_session import ChatSession
+from diary.data.repositories.atomic_file import FSYNC_NONE, atomic_write_bytes, file_lock
+
+
+MANIFEST_FILE = "manifest.json"
+
+MANIFEST_LOCK_FILE = "manifest.lock"
+
+
+@dataclass
+class SessionManifestEntry:
+    """세션 목록 항목
+
+    Attributes:
+        session_id: 세션 ID
+        created_at: 생성 시각
+        updated_at: 수정 시각 (목록 정렬 기준, 순서가 바뀔 때만 갱신하므로 실제보다 이를 수 있음)
+        is_active: 진행 중인 세션인지
+    """
+    session_id: str
+    created_at: datetime
+    updated_at: datetime
+    is_active: bool
+
+    @classmethod
+    def from_session(cls, session: ChatSession) -> "SessionManifestEntry":
+        return cls(
+            session_id=session.session_id,
+            created_at=session.created_at,
+            updated_at=session.updated_at,
+            is_active=session.is_active,
+        )
+
+    @classmethod
+    def from_session_dict(cls, data: dict) -> "SessionManifestEntry":
+        """저장된 세션 딕셔너리로 생성 (다시 만들 때 사용)"""
+        return cls(
+            session_id=data["session_id"],
+            created_at=datetime.fromisoformat(data["created_at"]),
+            updated_at=datetime.fromisoformat(data["updated_at"]),
+            is_active=data.get("is_active", True),
+        )
+
+    def to_dict(self) -> dict:
+        """딕셔너리로 변환 (세션 ID는 manifest의 키)"""
+        return {
+            "created_at": self.created_at.isoformat(),
+            "updated_at": self.updated_at.isoformat(),
+            "is_active": self.is_active,
+        }
+
+    @classmethod
+    def from_dict(cls, session_id: str, data: dict) -> "SessionManifestEntry":
+        return cls(
+            session_id=session_id,
+            created_at=datetime.fromisoformat(data["created_at"]),
+            updated_at=datetime.fromisoformat(data["updated_at"]),
+            is_active=data["is_active"],
+        )
+
+
+@dataclass
+class ManifestData:
+    """manifest 내용
+
+    Attributes:
+        entries: 세션 ID → 항목
+        active_session_id: 현재 활성 세션 ID (없으면 None)
+    """
+    entries: Dict[str, SessionManifestEntry] = field(default_factory=dict)
+    active_session_id: Optional[str] = None
+
+
+class SessionManifest:
+    """manifest.json 읽기/갱신 (마지막으로 읽은 내용은 파일이 바뀌기 전까지 메모리에 둠)"""
+
+    def __init__(self, data_dir: Path, scan: Callable[[], ManifestData], fsync: str):
+        """
+        Args:
+            data_dir: 세션 디렉토리
+            scan: 세션 파일을 모두 읽어 manifest 내용을 만드는 함수 (파일이 없거나 손상되었을 때 사용)
+            fsync: 목록이 바뀌는 갱신에 적용할 fsync 정책
+        """
+        self.manifest_file = data_dir / MANIFEST_FILE
+        self.lock_file = data_dir / MANIFEST_LOCK_FILE
+        self._scan = scan
+        self.fsync = fsync
+        self._cache: Optional[Tuple[str, ManifestData]] = None
+
+    def recent(self) -> List[SessionManifestEntry]:
+        """모든 항목 (최근 수정순)"""
+        return sorted(self._load().entries.values(), key=lambda e: e.updated_at, reverse=True)
+
+    def get(self, session_id: str) -> Optional[SessionManifestEntry]:
+        """세션 항목 (없으면 None)"""
+        return self._load().entries.get(session_id)
+
+    def active_session_id(self) -> Optional[str]:
+        """현재 활성 세션 ID (없으면 None)"""
+        return self._load().active_session_id
+
+    def record(self, session: ChatSession) -> None:
+        """저장한 세션의 항목 갱신 (진행 중이면 활성 세션으로, 종료했으면 활성 세션에서 해제)
+
+        목록에 새로 들어가거나 종료 여부/활성 세션/목록 순서가 바뀔 때만 manifest를 다시 씁니다.
+        """
+        entry = SessionManifestEntry.from_session(session)
+
+        def change(data: ManifestData) -> Optional[str]:
+            previous = data.entries.get(entry.session_id)
+            active_session_id = data.active_session_id
+            if entry.is_active:
+                active_session_id = entry.session_id
+            elif active_session_id == entry.session_id:
+                active_session_id = None
+
+            if (
+                previous is None
+                or previous.is_active != entry.is_active
+                or active_session_id != data.active_session_id
+            ):
+                data.entries[entry.session_id] = entry
+                data.active_session_id = active_session_id
+                return self.fsync
+            if self._reorders(data, previous, entry):
+                data.entries[entry.session_id] = entry
+                return FSYNC_NONE
+            return None
+
+        self._modify(change)
+
+    def remove(self, session_ids: Iterable[str]) -> None:
+        """항목 삭제 (활성 세션이면 해제)"""
+        session_ids = set(session_ids)
+        if not session_ids:
+            return
+
+        def change(data: ManifestData) -> Optional[str]:
+            removed = [data.entries.pop(session_id, None) for session_id in session_ids]
+            if data.active_session_id in session_ids:
+                data.active_session_id = None
+            return self.fsync if any(removed) else None
+
+        self._modify(change)
+
+    def rebuild(self) -> int:
+        """
+        세션 파일을 모두 읽어 manifest를 다시 만듦
+
+        Returns:
+            항목 수
+        """
+        with file_lock(self.lock_file):
+            data = self._scan()
+            self._write(data, self.fsync)
+        return len(data.entries)
+
+    def _load(self) -> ManifestData:
+        """manifest 내용 (없거나 손상되었으면 잠그고 다시 만듦)"""
+        try:
+            return self._read()
+        except FileNotFoundError:
+            pass
+        except (ValueError, KeyError, TypeError) as e:
+            print(f"Warning: Corrupted {MANIFEST_FILE} ({e}), rebuilding it.")
+
+        with file_lock(self.lock_file):
+            return self._load_locked()
+
+    def _load_locked(self) -> ManifestData:
+        """잠금 안에서 manifest 내용 (없거나 손상되었으면 다시 만들어 씀)"""
+        try:
+            # 잠금을 기다리는 동안 다른 곳에서 이미 만들었으면 그대로 사용
+            return self._read()
+        except (OSError, ValueError, KeyError, TypeError):
+            data = self._scan()
+            self._write(data, self.fsync)
+            return data
+
+    def _read(self) -> ManifestData:
+        """파일에서 읽음 (파일이 그대로면 캐시 사용)"""
+        source = self._file_version()
+        if self._cache and self._cache[0] == source:
+            return self._cache[1]
+        data = self._parse(self.manifest_file.read_bytes())
+        self._cache = (source, data)
+        return data
+
+    @staticmethod
+    def _reorders(data: ManifestData, previous: SessionManifestEntry, entry: SessionManifestEntry) -> bool:
+        """수정 시각을 갱신하면 목록에서 다른 세션과 순서가 바뀌는지 (저장된 시각과 새 시각 사이에 다른 세션이 있음)"""
+        earliest, latest = sorted((previous.updated_at, entry.updated_at))
+        return any(
+            earliest <= other.updated_at <= latest
+            for session_id, other in data.entries.items()
+            if session_id != entry.session_id
+        )
+
+    def _modify(self, change: Callable[[ManifestData], Optional[str]]) -> None:
+        """잠금 안에서 최신 내용을 읽어 고친 뒤 다시 씀
+
+        change는 다시 쓸 때 적용할 fsync 정책을 반환하고, 바뀐 것이 없으면 None을 반환합니다 (쓰지 않음).
+        """
+        with file_lock(self.lock_file):
+            data = self._load_locked()
+            copied = ManifestData(dict(data.entries), data.active_session_id)
+            fsync = change(copied)
+            if fsync is not None:
+                self._write(copied, fsync)
+
+    def _write(self, data: ManifestData, fsync: str) -> None:
+        payload = {
+            "active_session_id": data.active_session_id,
+            "sessions": {session_id: entry.to_dict() for session_id, entry in data.entries.items()},
+        }
+        serialized = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        atomic_write_bytes(self.manifest_file, serialized, fsync)
+        self._cache = (self._file_version(), data)
+
+    @staticmethod
+    def _parse(raw: bytes) -> ManifestData:
+        payload = json.loads(raw.decode("utf-8"))
+        return ManifestData(
+            entries={
+                session_id: SessionManifestEntry.from_dict(session_id, entry)
+                for session_id, entry in payload["sessions"].items()
+            },
+            active_session_id=payload.get("active_session_id"),
+        )
+
+    def _file_version(self) -> str:
+        """manifest 파일 버전 (교체할 때마다 inode가 바뀜, 파일이 없으면 FileNotFoundError)"""
+        stat = self.manifest_file.stat()
+        return f"{stat.st_ino}-{stat.st_mtime_ns}-{stat.st_size}"
@@ -0,0 +1,427 @@
+"""
+SQLite 기반 채팅 저장소 구현체
+
+아키텍처:
+- Domain Layer의 ChatRepositoryInterface를 구현
+- MongoDB 없이 파일 하나(data/daily.db)에 채팅 세션 영속화 (sqlite_database 모듈 참고)
+- 메시지는 세션 문서에 넣지 않고 (세션, 위치)를 키로 한 행씩 저장
+  - 턴마다 새 메시지 행만 추가 (세션 전체를 다시 쓰지 않음)
+  - 이어하기는 첫 메시지 + 최근 메시지 행만 읽음
+"""
+
+import copy
+import json
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from diary.domain.entities import ChatSession, ChatMessage
+from diary.domain.exceptions import SessionConflictError
+from diary.domain.interfaces import ChatRepositoryInterface, DEFAULT_USER_ID, validate_user_id
+from diary.data.repositories.archive_codec import compress, decompress, default_codec
+from diary.data.repositories.atomic_file import DEFAULT_FSYNC_POLICY
+from diary.data.repositories.prompt_store import PROMPT_REF_KEY, PromptStore, compact_message, expand_message
+from diary.data.repositories.sqlite_database import DEFAULT_SQLITE_PATH, SQLiteDatabase
+
+
+_SCHEMA = [
+    """CREATE TABLE IF NOT EXISTS chat_sessions (
+        id INTEGER PRIMARY KEY,
+        user_id TEXT NOT NULL,
+        session_id TEXT NOT NULL,
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL,
+        metadata TEXT NOT NULL,
+        is_active INTEGER NOT NULL,
+        message_count INTEGER NOT NULL,
+        version INTEGER NOT NULL
+    )""",
+    # 사용자별 session_id 고유 인덱스
+    "CREATE UNIQUE INDEX IF NOT EXISTS chat_sessions_user_session ON chat_sessions (user_id, session_id)",
+    # 사용자별 최신순 정렬용
+    "CREATE INDEX IF NOT EXISTS chat_sessions_user_created ON chat_sessions (user_id, created_at DESC)",
+    # 보관 대상 조회용 (종료 세션 중 마지막 수정이 오래된 것)
+    "CREATE INDEX IF NOT EXISTS chat_sessions_user_archive ON chat_sessions (user_id, is_active, updated_at)",
+    # 세션의 메시지를 위치 순서대로 모아 저장 (시스템 프롬프트는 content 대신 prompt_ref)
+    """CREATE TABLE IF NOT EXISTS chat_messages (
+        session_pk INTEGER NOT NULL REFERENCES chat_sessions (id) ON DELETE CASCADE,
+        position INTEGER NOT NULL,
+        role TEXT NOT NULL,
+        content TEXT,
+        prompt_ref TEXT,
+        timestamp TEXT NOT NULL,
+        token_count INTEGER,
+        token_estimator TEXT,
+        PRIMARY KEY (session_pk, position)
+    ) WITHOUT ROWID""",
+    # 활성 세션: 사용자마다 하나
+    """CREATE TABLE IF NOT EXISTS active_sessions (
+        user_id TEXT PRIMARY KEY,
+        session_id TEXT NOT NULL
+    )""",
+    # 시스템 프롬프트 본문 (세션에는 해시만 저장)
+    """CREATE TABLE IF NOT EXISTS prompts (
+        prompt_hash TEXT PRIMARY KEY,
+        content TEXT NOT NULL,
+        created_at TEXT NOT NULL
+    )""",
+    # 오래된 종료 세션 보관 계층 (세션 하나 = 압축된 JSON 하나)
+    """CREATE TABLE IF NOT EXISTS chat_sessions_archive (
+        user_id TEXT NOT NULL,
+        session_id TEXT NOT NULL,
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL,
+        archived_at TEXT NOT NULL,
+        codec TEXT NOT NULL,
+        data BLOB NOT NULL,
+        PRIMARY KEY (user_id, session_id)
+    )""",
+    # 보관 기간 만료 삭제용
+    "CREATE INDEX IF NOT EXISTS chat_sessions_archive_user_updated ON chat_sessions_archive (user_id, updated_at)",
+]
+
+_SESSION_COLUMNS = "id, session_id, created_at, updated_at, metadata, is_active, message_count, version"
+
+_MESSAGE_COLUMNS = "role, content, prompt_ref, timestamp, token_count, token_estimator"
+
+_SELECT_SESSION = f"SELECT {_SESSION_COLUMNS} FROM chat_sessions WHERE user_id = ? AND session_id = ?"
+
+_SELECT_ACTIVE_SESSION = """SELECT s.id, s.session_id, s.created_at, s.updated_at, s.metadata, s.is_active,
+        s.message_count, s.version
+    FROM active_sessions AS a JOIN chat_sessions AS s ON s.user_id = a.user_id AND s.session_id = a.session_id
+    WHERE a.user_id = ?"""
+
+_LIST_SESSIONS = f"""SELECT {_SESSION_COLUMNS} FROM chat_sessions
+    WHERE user_id = ? ORDER BY created_at DESC LIMIT ?"""
+
+_SELECT_ARCHIVE_CANDIDATES = f"""SELECT {_SESSION_COLUMNS} FROM chat_sessions
+    WHERE user_id = ? AND is_active = 0 AND updated_at < ? LIMIT ?"""
+
+_INSERT_SESSION = """INSERT INTO chat_sessions
+    (user_id, session_id, created_at, updated_at, metadata, is_active, message_count, version)
+    VALUES (?, ?, ?, ?, ?, ?, ?, 1)"""
+
+_UPDATE_SESSION = """UPDATE chat_sessions
+    SET updated_at = ?, metadata = ?, is_active = ?, message_count = ?, version = version + 1
+    WHERE id = ?"""
+
+_DELETE_SESSION = "DELETE FROM chat_sessions WHERE user_id = ? AND session_id = ?"
+
+_DELETE_SESSION_BY_PK = "DELETE FROM chat_sessions WHERE id = ?"
+
+_SELECT_MESSAGES = f"SELECT {_MESSAGE_COLUMNS} FROM chat_messages WHERE session_pk = ? ORDER BY position"
+
+_SELECT_MESSAGE_RANGE = f"""SELECT {_MESSAGE_COLUMNS} FROM chat_messages
+    WHERE session_pk = ? AND position >= ? AND position < ? ORDER BY position"""
+
+# 첫 메시지 + position 이후 메시지 (두 구간 모두 기본 키 범위 검색 후 병합, OR로 쓰면 세션 전체를 훑음)
+_SELECT_HEAD_AND_TAIL = f"""SELECT position, {_MESSAGE_COLUMNS} FROM chat_messages
+    WHERE session_pk = ? AND position = 0
+    UNION ALL
+    SELECT position, {_MESSAGE_COLUMNS} FROM chat_messages WHERE session_pk = ? AND position >= ?
+    ORDER BY position"""
+
+_UPSERT_MESSAGE = f"""INSERT OR REPLACE INTO chat_messages (session_pk, position, {_MESSAGE_COLUMNS})
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)"""
+
+_TRUNCATE_MESSAGES = "DELETE FROM chat_messages WHERE session_pk = ? AND position >= ?"
+
+_SET_ACTIVE = "INSERT OR REPLACE INTO active_sessions (user_id, session_id) VALUES (?, ?)"
+
+_CLEAR_ACTIVE = "DELETE FROM active_sessions WHERE user_id = ? AND session_id = ?"
+
+_SELECT_PROMPT = "SELECT content FROM prompts WHERE prompt_hash = ?"
+
+_INSERT_PROMPT = "INSERT OR IGNORE INTO prompts (prompt_hash, content, created_at) VALUES (?, ?, ?)"
+
+_SELECT_ARCHIVED = "SELECT codec, data FROM chat_sessions_archive WHERE user_id = ? AND session_id = ?"
+
+_INSERT_ARCHIVED = """INSERT OR REPLACE INTO chat_sessions_archive
+    (user_id, session_id, created_at, updated_at, archived_at, codec, data)
+    VALUES (?, ?, ?, ?, ?, ?, ?)"""
+
+_DELETE_ARCHIVED = "DELETE FROM chat_sessions_archive WHERE user_id = ? AND session_id = ?"
+
+_EXPIRE_ARCHIVED = "DELETE FROM chat_sessions_archive WHERE user_id = ? AND updated_at < ?"
+
+
+class SQLitePromptStore(PromptStore):
+    """프롬프트를 prompts 테이블에 (hash, content) 행으로 저장하는 구현체"""
+
+    def __init__(self, db: SQLiteDatabase):
+        super().__init__()
+        self.db = db
+
+    def _save(self, prompt_hash: str, text: str) -> None:
+        # INSERT OR IGNORE: 이미 있으면 그대로 둠 (동시에 저장해도 안전)
+        with self.db.transaction() as conn:
+            conn.execute(_INSERT_PROMPT, (prompt_hash, text, datetime.now().isoformat()))
+
+    def _load(self, prompt_hash: str) -> Optional[str]:
+        row = self.db.connection().execute(_SELECT_PROMPT, (prompt_hash,)).fetchone()
+        return row["content"] if row else None
+
+
+def _message_params(session_pk: int, position: int, data: dict) -> tuple:
+    """저장용 메시지 딕셔너리(프롬프트는 참조로 바꾼 것)를 chat_messages 행 값으로 변환"""
+    return (
+        session_pk,
+        position,
+        data["role"],
+        data.get("content"),
+        data.get(PROMPT_REF_KEY),
+        data["timestamp"],
+        data.get("token_count"),
+        data.get("token_estimator"),
+    )
+
+
+def _row_to_message_dict(row: sqlite3.Row) -> dict:
+    """chat_messages 행을 저장용 메시지 딕셔너리로 변환 (프롬프트는 참조 그대로)"""
+    data = {"role": row["role"], "timestamp": row["timestamp"]}
+    if row["prompt_ref"] is not None:
+        data[PROMPT_REF_KEY] = row["prompt_ref"]
+    else:
+        data["content"] = row["content"]
+    if row["token_count"] is not None:
+        data["token_count"] = row["token_count"]
+        data["token_estimator"] = row["token_estimator"]
+    return data
+
+
+class SQLiteChatRepository(ChatRepositoryInterface):
+    """SQLite를 사용한 채팅 저장소 구현체
+
+    모든 행에 user_id를 저장하고, 조회는 항상 이 저장소의 user_id로 한정합니다.
+    활성 세션도 active_sessions 테이블에 사용자마다 한 행으로 관리합니다.
+    """
+
+    def __init__(
+        self,
+        db_path: Path = DEFAULT_SQLITE_PATH,
+        user_id: str = DEFAULT_USER_ID,
+        fsync: str = DEFAULT_FSYNC_POLICY,
+        database: Optional[SQLiteDatabase] = None,
+    ):
+        """
+        Args:
+            db_path: 데이터베이스 파일 경로
+            user_id: 사용자 ID
+            fsync: fsync 정책 ("none", "file", "full", sqlite_database 모듈 참고)
+            database: 다른 저장소와 공유할 연결 (주어지면 db_path, fsync는 무시)
+
+        Raises:
+            ValueError: 사용자 ID나 fsync 정책이 올바르지 않은 경우
+        """
+        self.user_id = validate_user_id(user_id)
+        self.db = database or SQLiteDatabase(db_path, fsync)
+        self.db.create_schema(_SCHEMA)
+        self.prompt_store = SQLitePromptStore(self.db)
+
+    def for_user(self, user_id: str) -> "SQLiteChatRepository":
+        """같은 연결을 공유하는 다른 사용자의 채팅 저장소 (close는 원래 저장소에서만)"""
+        scoped = copy.copy(self)
+        scoped.user_id = validate_user_id(user_id)
+        return scoped
+
+    def save_session(self, session: ChatSession) -> None:
+        """채팅 세션 저장 (session.version이 저장소 버전과 같을 때만, 저장 후 버전 증가)
+
+        저장된 메시지 수가 이 세션을 읽을 때와 같으면 새 메시지 행만 추가합니다.
+        일부만 읽은 세션이면 생략된 중간 메시지 행은 그대로 둡니다.
+
+        Raises:
+            SessionConflictError: 다른 곳에서 먼저 저장했거나 삭제한 경우
+            ValueError: 일부만 읽은 세션인데 생략된 메시지가 저장소에 없는 경우
+        """
+        # 프롬프트 본문은 트랜잭션 밖에서 먼저 저장 (롤백되어도 프롬프트 캐시와 어긋나지 않도록)
+        messages = [compact_message(msg.to_dict(), self.prompt_store) for msg in session.messages]
+        positions = [index if index == 0 else index + session.omitted_messages for index in range(len(messages))]
+        message_count = session.get_message_count()
+        saved_count = message_count - session.unsaved_count
+        header = (
+            session.updated_at.isoformat(),
+            json.dumps(session.metadata, ensure_ascii=False),
+            int(session.is_active),
+            message_count,
+        )
+
+        with self.db.transaction() as conn:
+            row = conn.execute(_SELECT_SESSION, (self.user_id, session.session_id)).fetchone()
+            stored_version = row["version"] if row else None
+            expected = (None, 0) if session.version == 0 else (session.version,)
+            if stored_version not in expected:
+                raise SessionConflictError(session.session_id, session.version, stored_version)
+            if session.is_partial and (row is None or row["message_count"] < 1 + session.omitted_messages):
+                raise ValueError(f"세션 {session.session_id}의 생략된 메시지를 저장소에서 찾을 수 없습니다.")
+
+            if row is None:
+                cursor = conn.execute(
+                    _INSERT_SESSION, (self.user_id, session.session_id, session.created_at.isoformat(), *header)
+                )
+                assert cursor.lastrowid is not None  # INSERT 직후에는 항상 새 행 ID가 있음
+                session_pk = cursor.lastrowid
+                first_position = 0
+            else:
+                session_pk = row["id"]
+                conn.execute(_UPDATE_SESSION, (*header, session_pk))
+                # 읽은 뒤로 저장된 메시지가 그대로면 새 메시지만, 아니면 가진 메시지를 모두 다시 씀
+                first_position = saved_count if row["message_count"] == saved_count else 0
+                conn.execute(_TRUNCATE_MESSAGES, (session_pk, message_count))
+
+            conn.executemany(_UPSERT_MESSAGE, [
+                _message_params(session_pk, position, data)
+                for position, data in zip(positions, messages)
+                if position >= first_position
+            ])
+
+            # 활성 세션 관리 (세션과 같은 트랜잭션)
+            if session.is_active:
+                conn.execute(_SET_ACTIVE, (self.user_id, session.session_id))
+            else:
+                conn.execute(_CLEAR_ACTIVE, (self.user_id, session.session_id))
+
+        session.mark_saved(session.version + 1)
+
+    def get_session(self, session_id: str) -> Optional[ChatSession]:
+        """세션 ID로 채팅 세션 조회 (없으면 보관 계층에서 찾음)"""
+        with self.db.transaction(write=False) as conn:
+            row = conn.execute(_SELECT_SESSION, (self.user_id, session_id)).fetchone()
+            if not row:
+                return self._get_archived_session(session_id)
+            messages = conn.execute(_SELECT_MESSAGES, (row["id"],)).fetchall()
+        return self._row_to_session(row, messages)
+
+    def get_active_session(self) -> Optional[ChatSession]:
+        """현재 활성화된 세션 반환 (인터페이스 구현)"""
+        with self.db.transaction(write=False) as conn:
+            row = conn.execute(_SELECT_ACTIVE_SESSION, (self.user_id,)).fetchone()
+            if not row:
+                return None
+            messages = conn.execute(_SELECT_MESSAGES, (row["id"],)).fetchall()
+        return self._row_to_session(row, messages)
+
+    def get_active_session_tail(self, tail_size: int) -> Optional[ChatSession]:
+        """활성 세션을 첫 메시지 + 최근 tail_size개 메시지 행만 조회"""
+        with self.db.transaction(write=False) as conn:
+            row = conn.execute(_SELECT_ACTIVE_SESSION, (self.user_id,)).fetchone()
+            if not row:
+                return None
+            start = max(1, row["message_count"] - max(1, tail_size))
+            messages = conn.execute(_SELECT_HEAD_AND_TAIL, (row["id"], row["id"], start)).fetchall()
+
+        session = self._row_to_session(row, messages)
+        session.omitted_messages = start - 1
+        return session
+
+    def load_messages(self, session_id: str, start: int, end: int) -> List[ChatMessage]:
+        """세션의 메시지 일부 조회 (필요한 위치의 행만 읽음)"""
+        if end <= start:
+            return []
+        with self.db.transaction(write=False) as conn:
+            row = conn.execute(_SELECT_SESSION, (self.user_id, session_id)).fetchone()
+            if not row:
+                return []
+            rows = conn.execute(_SELECT_MESSAGE_RANGE, (row["id"], start, end)).fetchall()
+        return [self._to_message(row) for row in rows]
+
+    def list_sessions(self, limit: int = 10) -> List[ChatSession]:
+        """채팅 세션 목록 조회 (최신순)"""
+        with self.db.transaction(write=False) as conn:
+            rows = conn.execute(_LIST_SESSIONS, (self.user_id, limit)).fetchall()
+            return [
+                self._row_to_session(row, conn.execute(_SELECT_MESSAGES, (row["id"],)).fetchall())
+                for row in rows
+            ]
+
+    def delete_session(self, session_id: str) -> bool:
+        """채팅 세션 삭제 (메시지, 보관된 세션도 삭제)"""
+        with self.db.transaction() as conn:
+            deleted = conn.execute(_DELETE_SESSION, (self.user_id, session_id)).rowcount
+            deleted += conn.execute(_DELETE_ARCHIVED, (self.user_id, session_id)).rowcount
+            conn.execute(_CLEAR_ACTIVE, (self.user_id, session_id))
+        return deleted > 0
+
+    def archive_sessions(self, updated_before: datetime, batch_size: int = 100) -> int:
+        """
+        마지막 수정이 updated_before 이전인 종료 세션을 압축해 chat_sessions_archive로 이동
+
+        batch_size개씩 보관 행 추가와 원본 삭제를 한 트랜잭션으로 처리합니다.
+        """
+        codec = default_codec()
+        cutoff = updated_before.isoformat()
+        archived = 0
+
+        while True:
+            with self.db.transaction() as conn:
+                rows = conn.execute(_SELECT_ARCHIVE_CANDIDATES, (self.user_id, cutoff, batch_size)).fetchall()
+                if not rows:
+                    return archived
+
+                now = datetime.now().isoformat()
+                for row in rows:
+                    messages = conn.execute(_SELECT_MESSAGES, (row["id"],)).fetchall()
+                    payload = json.dumps(self._row_to_dict(row, messages), ensure_ascii=False).encode("utf-8")
+                    conn.execute(_INSERT_ARCHIVED, (
+                        self.user_id, row["session_id"], row["created_at"], row["updated_at"],
+                        now, codec, compress(payload, codec),
+                    ))
+                    conn.execute(_DELETE_SESSION_BY_PK, (row["id"],))
+            archived += len(rows)
+
+    def expire_archived_sessions(self, updated_before: datetime) -> int:
+        """마지막 수정이 updated_before 이전인 보관 세션 삭제"""
+        with self.db.transaction() as conn:
+            return conn.execute(_EXPIRE_ARCHIVED, (self.user_id, updated_before.isoformat())).rowcount
+
+    def _get_archived_session(self, session_id: str) -> Optional[ChatSession]:
+        """보관된 세션의 압축을 풀어 세션으로 반환"""
+        archived = self.db.connection().execute(_SELECT_ARCHIVED, (self.user_id, session_id)).fetchone()
+        if not archived:
+            return None
+        data = json.loads(decompress(archived["data"], archived["codec"]).decode("utf-8"))
+        messages = [expand_message(msg, self.prompt_store) for msg in data["messages"]]
+        return ChatSession.from_dict({**data, "messages": messages})
+
+    @staticmethod
+    def _row_to_dict(row: sqlite3.Row, messages: List[sqlite3.Row]) -> Dict:
+        """세션 행과 메시지 행을 저장용 세션 딕셔너리로 변환 (보관용, 프롬프트는 참조 그대로)"""
+        return {
+            "session_id": row["session_id"],
+            "messages": [_row_to_message_dict(message) for message in messages],
+            "created_at": row["created_at"],
+            "updated_at": row["updated_at"],
+            "metadata": json.loads(row["metadata"]),
+            "is_active": bool(row["is_active"]),
+            "version": row["version"],
+        }
+
+    def _to_message(self, row: sqlite3.Row) -> ChatMessage:
+        """메시지 행을 ChatMessage로 변환 (프롬프트 참조는 본문으로 복원)"""
+        return ChatMessage.from_dict(expand_message(_row_to_message_dict(row), self.prompt_store))
+
+    def _row_to_session(self, row: sqlite3.Row, messages: List[sqlite3.Row]) -> ChatSession:
+        """세션 행과 메시지 행을 ChatSession 엔티티로 변환"""
+        return ChatSession(
+            session_id=row["session_id"],
+            messages=[self._to_message(message) for message in messages],
+            created_at=datetime.fromisoformat(row["created_at"]),
+            updated_at=datetime.fromisoformat(row["updated_at"]),
+            metadata=json.loads(row["metadata"]),
+            is_active=bool(row["is_active"]),
+            version=row["version"],
+            unsaved_count=0,
+        )
+
+    def close(self) -> None:
+        """데이터베이스 연결 종료 (리소스 정리)"""
+        self.db.close()
+
+    def __enter__(self):
+        """Context manager 지원"""
+        return self
+
+    def __exit__(self, _exc_type, _exc_val, _exc_tb):
+        """Context manager 종료 시 연결 닫기"""
+        self.close()
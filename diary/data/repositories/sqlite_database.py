@@ -0,0 +1,126 @@
+"""SQLite 데이터베이스 연결 공통 처리
+
+MongoDB 없이 파일 하나(data/daily.db)에 일기와 채팅을 저장하는 저장소가 함께 사용합니다.
+
+- WAL 모드: 읽기가 쓰기를 기다리지 않고, 쓰기는 로그에 덧붙인 뒤 나중에 체크포인트합니다.
+- 스레드마다 연결 하나: WriteBehindSessionWriter, HTTP 서버 워커가 서로 연결을 공유하지 않습니다.
+  쓰기는 BEGIN IMMEDIATE로 시작해서, 다른 연결이 쓰는 중이면 busy_timeout 동안 기다립니다.
+- 모든 쿼리는 모듈 상수 SQL에 값만 바인딩합니다. sqlite3 모듈이 SQL 문자열별로
+  컴파일한 문장(prepared statement)을 연결마다 캐시하므로 같은 쿼리를 다시 파싱하지 않습니다.
+
+fsync 정책(atomic_file 모듈)은 PRAGMA synchronous로 옮깁니다.
+- none: OFF (OS가 멈추면 최근 커밋이 사라질 수 있음)
+- file: NORMAL (WAL 기본값, 전원이 꺼지면 마지막 커밋 몇 개가 사라질 수 있지만 DB는 손상되지 않음)
+- full: FULL (커밋이 끝나면 디스크에 반영)
+"""
+
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List
+
+from diary.data.repositories.atomic_file import (
+    DEFAULT_FSYNC_POLICY,
+    FSYNC_FULL,
+    FSYNC_NONE,
+    validate_fsync_policy,
+)
+
+
+DEFAULT_SQLITE_PATH = Path("data/daily.db")
+
+# 다른 연결이 쓰는 중일 때 기다리는 최대 시간 (ms)
+BUSY_TIMEOUT_MS = 5000
+
+# 연결마다 캐시하는 컴파일된 SQL 문장 수 (저장소 쿼리가 모두 들어가도록 기본 128보다 크게)
+CACHED_STATEMENTS = 256
+
+_SYNCHRONOUS = {FSYNC_NONE: "OFF", FSYNC_FULL: "FULL"}
+
+
+class SQLiteDatabase:
+    """SQLite 파일 하나에 대한 스레드별 연결 관리"""
+
+    def __init__(self, path: Path = DEFAULT_SQLITE_PATH, fsync: str = DEFAULT_FSYNC_POLICY):
+        """
+        Args:
+            path: 데이터베이스 파일 경로 (상위 디렉토리가 없으면 만듦)
+            fsync: fsync 정책 ("none", "file", "full")
+
+        Raises:
+            ValueError: fsync 정책이 올바르지 않은 경우
+        """
+        self.path = Path(path)
+        self.fsync = validate_fsync_policy(fsync)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+
+    def connection(self) -> sqlite3.Connection:
+        """현재 스레드의 연결 (처음 호출할 때 열고 WAL/동기화 설정)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            return conn
+
+        # isolation_level=None: 트랜잭션은 transaction()에서 직접 시작
+        conn = sqlite3.connect(
+            self.path, isolation_level=None, check_same_thread=False, cached_statements=CACHED_STATEMENTS
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute(f"PRAGMA synchronous = {_SYNCHRONOUS.get(self.fsync, 'NORMAL')}")
+        conn.execute("PRAGMA foreign_keys = ON")
+        self._local.conn = conn
+        with self._connections_lock:
+            self._connections.append(conn)
+        return conn
+
+    @contextmanager
+    def transaction(self, write: bool = True) -> Iterator[sqlite3.Connection]:
+        """
+        트랜잭션 (예외가 나면 롤백, 바깥 트랜잭션 안에서 부르면 그 트랜잭션에 포함)
+
+        Args:
+            write: True면 시작할 때 쓰기 잠금을 잡음 (BEGIN IMMEDIATE).
+                False면 읽기 전용으로, 여러 쿼리가 같은 시점의 내용을 읽음
+        """
+        conn = self.connection()
+        if conn.in_transaction:
+            yield conn
+            return
+
+        conn.execute("BEGIN IMMEDIATE" if write else "BEGIN")
+        try:
+            yield conn
+        except BaseException:
+            conn.rollback()
+            raise
+        conn.commit()
+
+    def create_schema(self, statements: List[str]) -> None:
+        """테이블/인덱스 생성 (이미 있으면 그대로 둠)"""
+        with self.transaction() as conn:
+            for statement in statements:
+                conn.execute(statement)
+
+    def has_fts5_trigram(self) -> bool:
+        """FTS5 trigram 토크나이저를 쓸 수 있는지 (SQLite 3.34 이상, FTS5를 포함해 빌드된 경우)"""
+        try:
+            self.connection().execute(
+                "CREATE VIRTUAL TABLE temp.fts5_probe USING fts5(content, tokenize='trigram')"
+            )
+        except sqlite3.OperationalError:
+            return False
+        self.connection().execute("DROP TABLE temp.fts5_probe")
+        return True
+
+    def close(self) -> None:
+        """모든 스레드의 연결 종료"""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
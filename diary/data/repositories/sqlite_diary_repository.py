@@ -0,0 +1,342 @@
+"""
+SQLite 기반 일기 저장소 구현체
+
+아키텍처:
+- Domain Layer의 DiaryRepositoryInterface를 구현
+- MongoDB 없이 파일 하나(data/daily.db)에 일기 영속화 (sqlite_database 모듈 참고)
+- 목록 정렬 순서(user_id, diary_date DESC, created_at DESC) 그대로의 인덱스로 Cursor 기반 페이지네이션
+- FTS5 trigram 인덱스로 내용 검색 (FTS5가 없거나 검색어가 3글자보다 짧으면 내용을 훑음)
+"""
+
+import base64
+import copy
+import sqlite3
+from datetime import date, datetime
+from pathlib import Path
+from typing import List, Optional, Tuple
+from uuid import uuid4
+
+from diary.domain.entities import Diary
+from diary.domain.exceptions import DiaryConflictError, PartialSaveError
+from diary.domain.interfaces import DiaryRepositoryInterface, DEFAULT_USER_ID, validate_user_id
+from diary.data.repositories.atomic_file import DEFAULT_FSYNC_POLICY
+from diary.data.repositories.sqlite_database import DEFAULT_SQLITE_PATH, SQLiteDatabase
+
+
+# id는 FTS5 외부 콘텐츠 테이블의 rowid (VACUUM해도 바뀌지 않도록 INTEGER PRIMARY KEY)
+_SCHEMA = [
+    """CREATE TABLE IF NOT EXISTS diaries (
+        id INTEGER PRIMARY KEY,
+        user_id TEXT NOT NULL,
+        diary_id TEXT NOT NULL,
+        diary_date TEXT NOT NULL,
+        content TEXT NOT NULL,
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL,
+        version INTEGER NOT NULL DEFAULT 0
+    )""",
+    # 사용자별 diary_id 고유 인덱스
+    "CREATE UNIQUE INDEX IF NOT EXISTS diaries_user_diary_id ON diaries (user_id, diary_id)",
+    # 사용자별 diary_date 고유 인덱스 (사용자마다 하루에 하나의 일기만)
+    "CREATE UNIQUE INDEX IF NOT EXISTS diaries_user_date ON diaries (user_id, diary_date)",
+    # 목록 조회용: 커서 조건과 정렬을 인덱스만으로 처리하고 본문은 limit개만 읽음
+    "CREATE INDEX IF NOT EXISTS diaries_user_listing ON diaries (user_id, diary_date DESC, created_at DESC)",
+]
+
+# 내용 검색용 (diaries를 외부 콘텐츠로 쓰고 트리거로 동기화)
+_FTS_SCHEMA = [
+    """CREATE VIRTUAL TABLE IF NOT EXISTS diaries_fts USING fts5(
+        content, content='diaries', content_rowid='id', tokenize='trigram'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS diaries_fts_insert AFTER INSERT ON diaries BEGIN
+        INSERT INTO diaries_fts (rowid, content) VALUES (new.id, new.content);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS diaries_fts_delete AFTER DELETE ON diaries BEGIN
+        INSERT INTO diaries_fts (diaries_fts, rowid, content) VALUES ('delete', old.id, old.content);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS diaries_fts_update AFTER UPDATE OF content ON diaries BEGIN
+        INSERT INTO diaries_fts (diaries_fts, rowid, content) VALUES ('delete', old.id, old.content);
+        INSERT INTO diaries_fts (rowid, content) VALUES (new.id, new.content);
+    END""",
+]
+
+# trigram은 3글자 단위로 색인하므로 이보다 짧은 검색어는 내용을 훑음
+_FTS_MIN_KEYWORD_LENGTH = 3
+
+_COLUMNS = "diary_id, diary_date, content, created_at, updated_at, version"
+
+_SELECT_BY_ID = f"SELECT {_COLUMNS} FROM diaries WHERE user_id = ? AND diary_id = ?"
+
+_SELECT_BY_DATE = f"SELECT {_COLUMNS} FROM diaries WHERE user_id = ? AND diary_date = ?"
+
+_SELECT_VERSION = "SELECT version FROM diaries WHERE user_id = ? AND diary_id = ?"
+
+_EXISTS_ON_DATE = "SELECT 1 FROM diaries WHERE user_id = ? AND diary_date = ?"
+
+# Compare-and-set: 읽어온 버전 그대로일 때만 수정
+_UPDATE = """UPDATE diaries
+    SET diary_date = ?, content = ?, created_at = ?, updated_at = ?, version = version + 1
+    WHERE user_id = ? AND diary_id = ? AND version = ?"""
+
+_INSERT = """INSERT INTO diaries (user_id, diary_id, diary_date, content, created_at, updated_at, version)
+    VALUES (?, ?, ?, ?, ?, ?, 1)"""
+
+_DELETE = "DELETE FROM diaries WHERE user_id = ? AND diary_id = ?"
+
+# 날짜 범위가 없으면 ''~'9999-12-31'로 바인딩 (조건이 바뀌어도 같은 문장을 재사용)
+# 범위의 끝은 커서 날짜까지로 줄여서, 인덱스에서 커서 위치부터 바로 읽음
+_LIST = f"""SELECT {_COLUMNS} FROM diaries
+    WHERE user_id = ? AND diary_date BETWEEN ? AND ? AND (diary_date, created_at) < (?, ?)
+    ORDER BY diary_date DESC, created_at DESC
+    LIMIT ?"""
+
+# CROSS JOIN: FTS 결과부터 읽도록 고정 (일기마다 MATCH를 다시 실행하지 않음)
+_SEARCH_FTS = """SELECT d.diary_id, d.diary_date, d.content, d.created_at, d.updated_at, d.version
+    FROM diaries_fts CROSS JOIN diaries AS d ON d.id = diaries_fts.rowid
+    WHERE diaries_fts MATCH ? AND d.user_id = ?
+    ORDER BY d.diary_date DESC, d.created_at DESC
+    LIMIT ?"""
+
+_SEARCH_SCAN = f"""SELECT {_COLUMNS} FROM diaries
+    WHERE user_id = ? AND instr(lower(content), ?) > 0
+    ORDER BY diary_date DESC, created_at DESC
+    LIMIT ?"""
+
+# 커서가 없을 때 첫 페이지 조건 (모든 (날짜, 생성 시각)보다 큰 값)
+_NO_CURSOR = ("\uffff", "\uffff")
+
+_MIN_DATE, _MAX_DATE = "", "9999-12-31"
+
+
+class SQLiteDiaryRepository(DiaryRepositoryInterface):
+    """SQLite를 사용한 일기 저장소 구현체
+
+    모든 행에 user_id를 저장하고, 조회는 항상 이 저장소의 user_id로 한정합니다.
+    커서 형식과 정렬 순서는 MongoDBDiaryRepository와 같습니다.
+    """
+
+    def __init__(
+        self,
+        db_path: Path = DEFAULT_SQLITE_PATH,
+        user_id: str = DEFAULT_USER_ID,
+        fsync: str = DEFAULT_FSYNC_POLICY,
+        database: Optional[SQLiteDatabase] = None,
+    ):
+        """
+        Args:
+            db_path: 데이터베이스 파일 경로
+            user_id: 사용자 ID
+            fsync: fsync 정책 ("none", "file", "full", sqlite_database 모듈 참고)
+            database: 다른 저장소와 공유할 연결 (주어지면 db_path, fsync는 무시)
+
+        Raises:
+            ValueError: 사용자 ID나 fsync 정책이 올바르지 않은 경우
+        """
+        self.user_id = validate_user_id(user_id)
+        self.db = database or SQLiteDatabase(db_path, fsync)
+        self.db.create_schema(_SCHEMA)
+        self.has_fts = self._create_fts_index()
+
+    def for_user(self, user_id: str) -> "SQLiteDiaryRepository":
+        """같은 연결을 공유하는 다른 사용자의 일기 저장소 (close는 원래 저장소에서만)"""
+        scoped = copy.copy(self)
+        scoped.user_id = validate_user_id(user_id)
+        return scoped
+
+    def _create_fts_index(self) -> bool:
+        """
+        내용 검색용 FTS5 인덱스 생성 (FTS5 trigram을 쓸 수 없으면 False)
+
+        인덱스를 새로 만들었으면 기존 일기로 채웁니다.
+        """
+        if not self.db.has_fts5_trigram():
+            return False
+
+        conn = self.db.connection()
+        existed = conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'diaries_fts'").fetchone()
+        self.db.create_schema(_FTS_SCHEMA)
+        if not existed:
+            with self.db.transaction() as conn:
+                conn.execute("INSERT INTO diaries_fts (diaries_fts) VALUES ('rebuild')")
+        return True
+
+    def save(self, diary: Diary) -> Diary:
+        """일기 저장 (생성 또는 수정, diary.version이 저장소 버전과 같을 때만)
+
+        Raises:
+            ValueError: 같은 날짜의 일기가 이미 있는 경우 (새 일기)
+            DiaryConflictError: 다른 곳에서 먼저 수정했거나 삭제한 경우
+        """
+        is_new = diary.diary_id is None
+        row = self._prepare_row(diary)
+        with self.db.transaction() as conn:
+            self._save_row(conn, diary, row, is_new)
+        diary.version += 1
+        return diary
+
+    def save_many(self, diaries: List[Diary]) -> List[Diary]:
+        """일기 여러 개를 트랜잭션 하나로 저장
+
+        일기마다 savepoint를 두어 충돌하거나 날짜가 겹친 일기만 빼고 나머지는 저장하고,
+        실패한 항목은 PartialSaveError로 알립니다 (MongoDBDiaryRepository와 같음).
+        """
+        if not diaries:
+            return []
+
+        rows = [(diary, diary.diary_id is None, self._prepare_row(diary)) for diary in diaries]
+        saved: List[Diary] = []
+        failed: List[Tuple[Diary, str]] = []
+        with self.db.transaction() as conn:
+            for diary, is_new, row in rows:
+                conn.execute("SAVEPOINT save_diary")
+                try:
+                    self._save_row(conn, diary, row, is_new)
+                except (ValueError, sqlite3.IntegrityError) as e:
+                    conn.execute("ROLLBACK TO save_diary")
+                    failed.append((diary, str(e)))
+                else:
+                    saved.append(diary)
+                conn.execute("RELEASE save_diary")
+
+        for diary in saved:
+            diary.version += 1
+        if failed:
+            raise PartialSaveError(saved, failed)
+        return saved
+
+    def _save_row(self, conn: sqlite3.Connection, diary: Diary, row: tuple, is_new: bool) -> None:
+        """버전을 비교해서 수정하거나 (버전 0이면) 새로 추가 (트랜잭션 안에서 호출)"""
+        diary_date, content, created_at, updated_at = row
+        diary_id = diary.diary_id
+        assert diary_id is not None  # _prepare_row에서 채움
+        try:
+            cursor = conn.execute(
+                _UPDATE, (diary_date, content, created_at, updated_at, self.user_id, diary_id, diary.version)
+            )
+            if cursor.rowcount == 1:
+                return
+            if diary.version == 0:
+                conn.execute(_INSERT, (self.user_id, diary_id, *row))
+                return
+        except sqlite3.IntegrityError:
+            if is_new:
+                # 같은 날짜의 일기를 다른 곳에서 먼저 만든 경우 (날짜 고유 인덱스)
+                raise ValueError(f"{diary_date} 날짜의 일기가 이미 존재합니다.")
+
+        current = conn.execute(_SELECT_VERSION, (self.user_id, diary_id)).fetchone()
+        raise DiaryConflictError(diary_id, diary.version, current["version"] if current else None)
+
+    def _prepare_row(self, diary: Diary) -> tuple:
+        """저장 전 ID/시각을 채우고 (diary_date, content, created_at, updated_at) 값으로 변환"""
+        # diary_id가 없으면 새로 생성 (UUID)
+        if not diary.diary_id:
+            diary.diary_id = str(uuid4())
+            diary.created_at = datetime.now()
+
+        diary.updated_at = datetime.now()
+        if not diary.created_at:
+            diary.created_at = diary.updated_at
+
+        # diary_date가 datetime 타입이면 date로 변환 (안전장치)
+        diary_date_value = diary.diary_date
+        if isinstance(diary_date_value, datetime):
+            diary_date_value = diary_date_value.date()
+
+        return (
+            diary_date_value.isoformat(),
+            diary.content,
+            diary.created_at.isoformat(),
+            diary.updated_at.isoformat(),
+        )
+
+    def get_by_date(self, diary_date: date) -> Optional[Diary]:
+        """특정 날짜의 일기 조회"""
+        row = self.db.connection().execute(_SELECT_BY_DATE, (self.user_id, diary_date.isoformat())).fetchone()
+        return self._row_to_diary(row) if row else None
+
+    def get_by_id(self, diary_id: str) -> Optional[Diary]:
+        """ID로 일기 조회"""
+        row = self.db.connection().execute(_SELECT_BY_ID, (self.user_id, diary_id)).fetchone()
+        return self._row_to_diary(row) if row else None
+
+    def list_diaries(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 30,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> Tuple[List[Diary], Optional[str]]:
+        """
+        일기 목록 조회 (Cursor 기반 페이지네이션, 키셋 방식)
+
+        Cursor 형식: base64(diary_date|created_at) (MongoDBDiaryRepository와 같음)
+        정렬 순서: diary_date DESC, created_at DESC (최신순)
+        """
+        after = _NO_CURSOR
+        if cursor:
+            try:
+                cursor_date, cursor_created = base64.b64decode(cursor).decode("utf-8").split("|")
+                after = (cursor_date, cursor_created)
+            except (ValueError, UnicodeDecodeError):
+                # Cursor 파싱 실패 시 무시하고 처음부터 조회
+                pass
+
+        until = min(end_date.isoformat() if end_date else _MAX_DATE, after[0])
+        params = (self.user_id, start_date.isoformat() if start_date else _MIN_DATE, until, *after, limit + 1)
+        results = [self._row_to_diary(row) for row in self.db.connection().execute(_LIST, params)]
+
+        next_cursor = None
+        if len(results) > limit:
+            # limit+1개를 조회했으므로, 다음 페이지가 있음
+            results = results[:limit]
+            last_diary = results[-1]
+            assert last_diary.created_at is not None  # 저장된 일기는 항상 생성 시각이 있음
+            cursor_value = f"{last_diary.diary_date.isoformat()}|{last_diary.created_at.isoformat()}"
+            next_cursor = base64.b64encode(cursor_value.encode("utf-8")).decode("utf-8")
+
+        return results, next_cursor
+
+    def search(self, keyword: str, limit: int = 30) -> List[Diary]:
+        """내용에 키워드가 들어간 일기 검색 (FTS5 trigram 인덱스, 짧은 검색어는 내용을 훑음)"""
+        conn = self.db.connection()
+        if self.has_fts and len(keyword) >= _FTS_MIN_KEYWORD_LENGTH:
+            # 큰따옴표로 감싸 FTS5 쿼리 문법(AND, *, 괄호 등) 없이 그대로 찾음
+            phrase = '"' + keyword.replace('"', '""') + '"'
+            rows = conn.execute(_SEARCH_FTS, (phrase, self.user_id, limit))
+        else:
+            rows = conn.execute(_SEARCH_SCAN, (self.user_id, keyword.lower(), limit))
+        return [self._row_to_diary(row) for row in rows]
+
+    def delete(self, diary_id: str) -> bool:
+        """일기 삭제"""
+        with self.db.transaction() as conn:
+            return conn.execute(_DELETE, (self.user_id, diary_id)).rowcount > 0
+
+    def exists_on_date(self, diary_date: date) -> bool:
+        """특정 날짜에 일기가 존재하는지 확인"""
+        row = self.db.connection().execute(_EXISTS_ON_DATE, (self.user_id, diary_date.isoformat())).fetchone()
+        return row is not None
+
+    @staticmethod
+    def _row_to_diary(row: sqlite3.Row) -> Diary:
+        """행을 Diary 엔티티로 변환"""
+        return Diary(
+            diary_id=row["diary_id"],
+            diary_date=date.fromisoformat(row["diary_date"]),
+            content=row["content"],
+            created_at=datetime.fromisoformat(row["created_at"]),
+            updated_at=datetime.fromisoformat(row["updated_at"]),
+            version=row["version"],
+        )
+
+    def close(self) -> None:
+        """데이터베이스 연결 종료 (리소스 정리)"""
+        self.db.close()
+
+    def __enter__(self):
+        """Context manager 지원"""
+        return self
+
+    def __exit__(self, _exc_type, _exc_val, _exc_tb):
+        """Context manager 종료 시 연결 닫기"""
+        self.close()
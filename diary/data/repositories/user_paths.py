@@ -0,0 +1,24 @@
+"""사용자별 파일 저장 경로
+
+기본 사용자는 기존 경로(data/credentials.json 등)를 그대로 쓰고,
+다른 사용자는 data/users/{user_id}/ 아래에 같은 이름으로 저장합니다.
+"""
+
+from pathlib import Path
+
+from diary.domain.interfaces.user_scoped_repository import DEFAULT_USER_ID, validate_user_id
+
+
+def user_scoped_path(base_path: Path, user_id: str) -> Path:
+    """
+    기본 사용자 기준 경로를 사용자별 경로로 변환
+
+    예: data/chats → data/users/alice/chats
+
+    Raises:
+        ValueError: 사용자 ID가 올바르지 않은 경우
+    """
+    validate_user_id(user_id)
+    if user_id == DEFAULT_USER_ID:
+        return base_path
+    return base_path.parent / "users" / user_id / base_path.name
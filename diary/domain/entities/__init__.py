@@ -2,19 +2,26 @@
 
 from diary.domain.entities.ai_credential import AICredential, AIProvider
 from diary.domain.entities.user_preferences import UserPreferences
+from diary.domain.entities.model_routing import ModelRouting, RequestType
 from diary.domain.entities.writing_style import WritingStyle, WritingStyleInfo
 from diary.domain.entities.chat_message import ChatMessage, MessageRole
 from diary.domain.entities.chat_session import ChatSession
 from diary.domain.entities.diary import Diary
+from diary.domain.entities.token_usage import TokenUsage
+from diary.domain.entities.ai_call_record import AICallRecord
 
 __all__ = [
     "AICredential",
     "AIProvider",
     "UserPreferences",
+    "ModelRouting",
+    "RequestType",
     "WritingStyle",
     "WritingStyleInfo",
     "ChatMessage",
     "MessageRole",
     "ChatSession",
     "Diary",
+    "TokenUsage",
+    "AICallRecord",
 ]
@@ -0,0 +1,81 @@
+"""AI 호출 기록 엔티티 (사용량/지연시간 텔레메트리)"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional
+
+
+@dataclass
+class AICallRecord:
+    """AI API 호출 한 건의 기록
+
+    Attributes:
+        provider: AI 서비스 제공자 (예: "openai")
+        model: 사용한 모델
+        session_id: 채팅 세션 ID (세션과 무관한 호출이면 None)
+        request_type: 요청 종류 (예: "small_talk", "diary", 모르면 None)
+        prompt_tokens: 입력 토큰 수
+        completion_tokens: 출력 토큰 수
+        cached_tokens: 프롬프트 캐시 적중 토큰 수
+        ttft_ms: 첫 토큰까지 걸린 시간 (스트리밍 호출만, ms)
+        latency_ms: 전체 소요 시간 (재시도 포함, ms)
+        outcome: "ok" 또는 "error"
+        error: 실패 시 오류 메시지
+        retries: 재시도 횟수
+        timestamp: 호출 시작 시각
+    """
+
+    provider: str
+    model: Optional[str] = None
+    session_id: Optional[str] = None
+    request_type: Optional[str] = None
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cached_tokens: int = 0
+    ttft_ms: Optional[float] = None
+    latency_ms: float = 0.0
+    outcome: str = "ok"
+    error: Optional[str] = None
+    retries: int = 0
+    timestamp: datetime = field(default_factory=datetime.now)
+
+    def is_success(self) -> bool:
+        """성공한 호출인지 확인"""
+        return self.outcome == "ok"
+
+    def to_dict(self) -> dict:
+        """딕셔너리로 변환 (저장용)"""
+        return {
+            "timestamp": self.timestamp.isoformat(),
+            "provider": self.provider,
+            "model": self.model,
+            "session_id": self.session_id,
+            "request_type": self.request_type,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "cached_tokens": self.cached_tokens,
+            "ttft_ms": self.ttft_ms,
+            "latency_ms": self.latency_ms,
+            "outcome": self.outcome,
+            "error": self.error,
+            "retries": self.retries,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "AICallRecord":
+        """딕셔너리에서 복원 (로드용)"""
+        return cls(
+            provider=data["provider"],
+            model=data.get("model"),
+            session_id=data.get("session_id"),
+            request_type=data.get("request_type"),
+            prompt_tokens=data.get("prompt_tokens", 0),
+            completion_tokens=data.get("completion_tokens", 0),
+            cached_tokens=data.get("cached_tokens", 0),
+            ttft_ms=data.get("ttft_ms"),
+            latency_ms=data.get("latency_ms", 0.0),
+            outcome=data.get("outcome", "ok"),
+            error=data.get("error"),
+            retries=data.get("retries", 0),
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+        )
@@ -3,6 +3,7 @@
 from enum import Enum
 from datetime import datetime
 from dataclasses import dataclass
+from typing import Any, Dict, Optional
 
 
 class MessageRole(Enum):
@@ -14,10 +15,15 @@ class MessageRole(Enum):
 
 @dataclass
 class ChatMessage:
-    """개별 채팅 메시지"""
+    """개별 채팅 메시지
+
+    token_count는 토큰 추정기가 계산해 둔 값으로, token_estimator 기준이 같을 때만 재사용합니다.
+    """
     role: MessageRole
     content: str
     timestamp: datetime
+    token_count: Optional[int] = None
+    token_estimator: Optional[str] = None
 
     def to_dict(self) -> dict:
         """딕셔너리로 변환 (저장용)"""
@@ -26,11 +32,15 @@ class ChatMessage:
         if isinstance(content, str):
             content = content.encode('utf-8', errors='ignore').decode('utf-8')
 
-        return {
+        data: Dict[str, Any] = {
             "role": self.role.value,
             "content": content,
             "timestamp": self.timestamp.isoformat()
         }
+        if self.token_count is not None:
+            data["token_count"] = self.token_count
+            data["token_estimator"] = self.token_estimator
+        return data
 
     @classmethod
     def from_dict(cls, data: dict) -> "ChatMessage":
@@ -43,5 +53,7 @@ class ChatMessage:
         return cls(
             role=MessageRole(data["role"]),
             content=content,
-            timestamp=datetime.fromisoformat(data["timestamp"])
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+            token_count=data.get("token_count"),
+            token_estimator=data.get("token_estimator"),
         )
@@ -1,12 +1,23 @@
 """채팅 세션 엔티티"""
 
+import copy
+from dataclasses import replace
 from typing import List, Optional
 from datetime import datetime
 from .chat_message import ChatMessage, MessageRole
 
 
 class ChatSession:
-    """대화 세션 - 하루치 대화를 관리"""
+    """대화 세션 - 하루치 대화를 관리
+
+    이어하기 시 저장소가 첫 메시지(시스템 프롬프트)와 최근 메시지만 읽어올 수 있습니다.
+    이때 그 사이의 메시지 수는 omitted_messages에 기록되고, 필요할 때 restore_omitted로 채웁니다.
+
+    version은 읽어온(또는 마지막으로 저장한) 저장소 버전입니다 (0이면 아직 저장하지 않음).
+    저장소는 이 버전이 그대로일 때만 저장하고 버전을 올립니다 (compare-and-set).
+    unsaved_count는 그 이후에 추가한 메시지 수로, 저장이 충돌하면 이 메시지만 최신 세션에 다시 붙입니다.
+    base_metadata는 그 버전의 metadata로, 충돌 시 누적값을 합칠 때 이쪽에서 늘린 양을 구하는 기준입니다.
+    """
 
     def __init__(
         self,
@@ -15,7 +26,11 @@ class ChatSession:
         created_at: Optional[datetime] = None,
         updated_at: Optional[datetime] = None,
         metadata: Optional[dict] = None,
-        is_active: bool = True
+        is_active: bool = True,
+        omitted_messages: int = 0,
+        version: int = 0,
+        unsaved_count: Optional[int] = None,
+        base_metadata: Optional[dict] = None,
     ):
         self.session_id = session_id
         self.messages = messages or []
@@ -23,6 +38,17 @@ class ChatSession:
         self.updated_at = updated_at or datetime.now()
         self.metadata = metadata or {}
         self.is_active = is_active
+        # messages[0]과 messages[1] 사이에서 읽지 않은 메시지 수 (0이면 전체를 읽은 상태)
+        self.omitted_messages = omitted_messages
+        self.version = version
+        # 기본값: 새로 만든 세션(version 0)은 모든 메시지가, 저장소에서 읽은 세션은 아무것도 저장 전이 아님
+        if unsaved_count is None:
+            unsaved_count = len(self.messages) if version == 0 else 0
+        self.unsaved_count = unsaved_count
+        # 기본값: 저장소에서 읽은 세션은 읽은 metadata, 새로 만든 세션은 빈 metadata
+        if base_metadata is None:
+            base_metadata = copy.deepcopy(self.metadata) if version > 0 else {}
+        self.base_metadata = base_metadata
 
     def add_message(self, role: MessageRole, content: str) -> None:
         """
@@ -36,8 +62,24 @@ class ChatSession:
             timestamp=datetime.now()
         )
         self.messages.append(message)
+        self.unsaved_count += 1
         self.updated_at = datetime.now()
 
+    def remove_last_message(self) -> ChatMessage:
+        """
+        마지막으로 추가한 메시지 되돌리기 (AI 호출이 실패한 사용자 메시지 등)
+
+        Returns:
+            제거한 메시지
+
+        Raises:
+            ValueError: 저장 전인 메시지가 없는 경우 (이미 저장한 메시지는 되돌리지 않음)
+        """
+        if self.unsaved_count <= 0 or not self.messages:
+            raise ValueError("되돌릴 저장 전 메시지가 없습니다.")
+        self.unsaved_count -= 1
+        return self.messages.pop()
+
     def get_conversation_history(self) -> List[dict]:
         """
         AI API 호출용 대화 히스토리 반환
@@ -59,8 +101,62 @@ class ChatSession:
         ]
 
     def get_message_count(self) -> int:
-        """총 메시지 수"""
-        return len(self.messages)
+        """총 메시지 수 (읽지 않은 메시지 포함)"""
+        return len(self.messages) + self.omitted_messages
+
+    @property
+    def is_partial(self) -> bool:
+        """중간 메시지를 읽지 않은 상태인지"""
+        return self.omitted_messages > 0
+
+    def restore_omitted(self, older_messages: List[ChatMessage]) -> None:
+        """
+        읽지 않았던 중간 메시지 채우기
+
+        Args:
+            older_messages: 첫 메시지 다음부터 omitted_messages개의 메시지 (순서대로)
+
+        Raises:
+            ValueError: 메시지 수가 맞지 않는 경우
+        """
+        if len(older_messages) != self.omitted_messages:
+            raise ValueError(
+                f"생략된 메시지 수가 맞지 않습니다: {len(older_messages)} != {self.omitted_messages}"
+            )
+        self.messages[1:1] = older_messages
+        self.omitted_messages = 0
+
+    def get_unsaved_messages(self) -> List[ChatMessage]:
+        """마지막으로 읽거나 저장한 버전 이후에 추가한 메시지"""
+        if self.unsaved_count <= 0:
+            return []
+        return self.messages[-self.unsaved_count:]
+
+    def mark_saved(self, version: int) -> None:
+        """저장소가 이 세션을 version으로 저장했음을 기록"""
+        self.version = version
+        self.unsaved_count = 0
+        self.base_metadata = copy.deepcopy(self.metadata)
+
+    def rebase(self, latest: "ChatSession", metadata: Optional[dict] = None) -> None:
+        """
+        다른 곳에서 먼저 저장한 최신 세션 위에 이 세션에서 추가한 메시지를 다시 붙임 (저장 충돌 해결)
+
+        메시지는 최신 세션의 메시지 뒤에 추가한 메시지 순서로 합치고, 종료 여부는 이 세션의 상태를 따릅니다.
+
+        Args:
+            latest: 저장소의 최신 세션 (전체를 읽은 상태)
+            metadata: 합친 metadata (None이면 같은 키는 이 세션의 값)
+        """
+        unsaved = [replace(msg) for msg in self.get_unsaved_messages()]
+        self.messages = [replace(msg) for msg in latest.messages] + unsaved
+        self.omitted_messages = latest.omitted_messages
+        self.created_at = latest.created_at
+        if metadata is None:
+            metadata = {**copy.deepcopy(latest.metadata), **self.metadata}
+        self.metadata = metadata
+        self.base_metadata = copy.deepcopy(latest.metadata)
+        self.version = latest.version
 
     def get_user_message_count(self) -> int:
         """사용자 메시지 수만 카운트"""
@@ -71,6 +167,29 @@ class ChatSession:
         self.is_active = False
         self.updated_at = datetime.now()
 
+    def snapshot(self) -> "ChatSession":
+        """
+        저장용 복사본 생성
+
+        백그라운드 저장 중에 원본 세션이 계속 바뀌어도 저장 내용이 섞이지 않도록
+        메시지 리스트와 metadata를 복사합니다.
+
+        Returns:
+            같은 내용의 새 ChatSession
+        """
+        return ChatSession(
+            session_id=self.session_id,
+            messages=[replace(msg) for msg in self.messages],
+            created_at=self.created_at,
+            updated_at=self.updated_at,
+            metadata=copy.deepcopy(self.metadata),
+            is_active=self.is_active,
+            omitted_messages=self.omitted_messages,
+            version=self.version,
+            unsaved_count=self.unsaved_count,
+            base_metadata=copy.deepcopy(self.base_metadata),
+        )
+
     def to_dict(self) -> dict:
         """딕셔너리로 변환 (저장용)"""
         return {
@@ -79,7 +198,8 @@ class ChatSession:
             "created_at": self.created_at.isoformat(),
             "updated_at": self.updated_at.isoformat(),
             "metadata": self.metadata,
-            "is_active": self.is_active
+            "is_active": self.is_active,
+            "version": self.version,
         }
 
     @classmethod
@@ -93,5 +213,7 @@ class ChatSession:
             created_at=datetime.fromisoformat(data["created_at"]),
             updated_at=datetime.fromisoformat(data["updated_at"]),
             metadata=data.get("metadata", {}),
-            is_active=data.get("is_active", True)
+            is_active=data.get("is_active", True),
+            version=data.get("version", 0),
+            unsaved_count=0,
         )
@@ -20,6 +20,7 @@ class Diary:
         diary_id: 일기 고유 ID (저장소에서 생성)
         created_at: 생성 시각
         updated_at: 수정 시각
+        version: 읽어온 저장소 버전 (0이면 아직 저장하지 않음, 저장소는 이 버전일 때만 수정)
     """
 
     diary_date: date
@@ -27,6 +28,7 @@ class Diary:
     diary_id: Optional[str] = None
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
+    version: int = 0
 
     def __post_init__(self):
         """생성 후 초기화"""
@@ -78,6 +80,7 @@ class Diary:
             "content": self.content,
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "version": self.version,
         }
 
     @classmethod
@@ -101,6 +104,7 @@ class Diary:
             updated_at=datetime.fromisoformat(data["updated_at"])
             if data.get("updated_at")
             else None,
+            version=data.get("version", 0),
         )
 
     def __str__(self) -> str:
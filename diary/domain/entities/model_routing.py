@@ -0,0 +1,81 @@
+"""요청 종류별 모델 라우팅 설정 엔티티"""
+
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Dict, Optional
+
+from .ai_credential import AIProvider
+
+
+class RequestType(Enum):
+    """AI 요청 종류"""
+    GREETING = "greeting"      # 세션 첫 인사
+    SMALL_TALK = "small_talk"  # 인터뷰 질문/일반 대화
+    DIARY = "diary"            # 일기 작성
+    SUMMARY = "summary"        # 오래된 대화 요약
+
+
+# Provider별 빠르고 저렴한 모델 (인사, 짧은 질문, 요약)
+DEFAULT_FAST_MODELS = {
+    AIProvider.OPENAI.value: "gpt-4o-mini",
+    AIProvider.ANTHROPIC.value: "claude-haiku-4-5",
+    AIProvider.GOOGLE.value: "gemini-1.5-flash",
+}
+
+# Provider별 일기 작성용 상위 모델
+DEFAULT_STRONG_MODELS = {
+    AIProvider.OPENAI.value: "gpt-4o",
+    AIProvider.ANTHROPIC.value: "claude-sonnet-4-5-20250929",
+    AIProvider.GOOGLE.value: "gemini-1.5-pro",
+}
+
+
+@dataclass
+class ModelRouting:
+    """요청 종류별 모델 선택 설정
+
+    일기 작성 요청만 상위 모델로 보내고, 나머지는 빠른 모델로 보내 응답 지연과 비용을 줄입니다.
+
+    Attributes:
+        enabled: 라우팅 사용 여부 (False면 모든 요청에 클라이언트 기본 모델 사용)
+        fast_models: Provider 이름 → 빠른 모델
+        strong_models: Provider 이름 → 일기 작성용 모델
+    """
+
+    enabled: bool = True
+    fast_models: Dict[str, str] = field(default_factory=lambda: dict(DEFAULT_FAST_MODELS))
+    strong_models: Dict[str, str] = field(default_factory=lambda: dict(DEFAULT_STRONG_MODELS))
+
+    def get_model(self, provider: str, request_type: RequestType) -> Optional[str]:
+        """
+        요청에 사용할 모델 선택
+
+        Args:
+            provider: Provider 이름 (예: "openai")
+            request_type: 요청 종류
+
+        Returns:
+            모델 이름 (라우팅을 끄거나 설정이 없으면 None = 클라이언트 기본 모델)
+        """
+        if not self.enabled:
+            return None
+
+        models = self.strong_models if request_type == RequestType.DIARY else self.fast_models
+        return models.get(provider)
+
+    def to_dict(self) -> dict:
+        """딕셔너리로 변환 (저장용)"""
+        return {
+            "enabled": self.enabled,
+            "fast_models": dict(self.fast_models),
+            "strong_models": dict(self.strong_models),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ModelRouting":
+        """딕셔너리에서 복원 (저장되지 않은 Provider는 기본값 사용)"""
+        return cls(
+            enabled=data.get("enabled", True),
+            fast_models={**DEFAULT_FAST_MODELS, **data.get("fast_models", {})},
+            strong_models={**DEFAULT_STRONG_MODELS, **data.get("strong_models", {})},
+        )
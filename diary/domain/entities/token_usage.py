@@ -0,0 +1,50 @@
+"""AI 호출 토큰 사용량 엔티티"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class TokenUsage:
+    """AI 응답에 포함된 토큰 사용량
+
+    Attributes:
+        model: 응답을 생성한 모델
+        prompt_tokens: 입력 토큰 수 (캐시 적중분 포함)
+        completion_tokens: 출력 토큰 수
+        cached_tokens: Provider 프롬프트 캐시에서 읽은 입력 토큰 수
+        cache_creation_tokens: 이번 호출에서 캐시에 새로 기록된 입력 토큰 수
+    """
+
+    model: Optional[str] = None
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cached_tokens: int = 0
+    cache_creation_tokens: int = 0
+
+    def get_cache_hit_ratio(self) -> float:
+        """입력 토큰 중 캐시 적중 비율 (0.0 ~ 1.0)"""
+        if self.prompt_tokens <= 0:
+            return 0.0
+        return self.cached_tokens / self.prompt_tokens
+
+    def to_dict(self) -> dict:
+        """딕셔너리로 변환 (저장용)"""
+        return {
+            "model": self.model,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "cached_tokens": self.cached_tokens,
+            "cache_creation_tokens": self.cache_creation_tokens,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "TokenUsage":
+        """딕셔너리에서 복원 (로드용)"""
+        return cls(
+            model=data.get("model"),
+            prompt_tokens=data.get("prompt_tokens", 0),
+            completion_tokens=data.get("completion_tokens", 0),
+            cached_tokens=data.get("cached_tokens", 0),
+            cache_creation_tokens=data.get("cache_creation_tokens", 0),
+        )
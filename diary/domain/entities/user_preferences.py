@@ -1,9 +1,10 @@
 """사용자 설정 엔티티"""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 
+from .model_routing import ModelRouting
 from .writing_style import WritingStyle
 
 
@@ -15,11 +16,15 @@ class UserPreferences:
 
     Attributes:
         writing_style: 선택한 일기 작성 스타일
+        model_routing: 요청 종류별 모델 라우팅 설정
+        compare_styles: 일기 작성 시 모든 스타일의 초안을 함께 만들어 비교할지 여부
         created_at: 설정 생성 일시
         updated_at: 설정 수정 일시
     """
 
     writing_style: WritingStyle = WritingStyle.EMOTIONAL_LITERARY  # 기본값: 갬성모드
+    model_routing: ModelRouting = field(default_factory=ModelRouting)
+    compare_styles: bool = False
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
@@ -43,6 +48,50 @@ class UserPreferences:
         self.writing_style = new_style
         self.updated_at = datetime.now()
 
+    def set_model_routing_enabled(self, enabled: bool) -> None:
+        """모델 라우팅 켜기/끄기
+
+        Args:
+            enabled: 라우팅 사용 여부
+        """
+        self.model_routing.enabled = enabled
+        self.updated_at = datetime.now()
+
+    def set_routing_models(
+        self,
+        provider: str,
+        fast_model: Optional[str] = None,
+        strong_model: Optional[str] = None,
+    ) -> None:
+        """Provider의 빠른 모델/일기 작성용 모델 변경
+
+        Args:
+            provider: Provider 이름 (예: "openai")
+            fast_model: 인사/대화/요약용 모델 (None이면 유지)
+            strong_model: 일기 작성용 모델 (None이면 유지)
+
+        Raises:
+            ValueError: 모델 이름이 비어있는 경우
+        """
+        for model in (fast_model, strong_model):
+            if model is not None and not model.strip():
+                raise ValueError("모델 이름은 비어있을 수 없습니다")
+
+        if fast_model is not None:
+            self.model_routing.fast_models[provider] = fast_model.strip()
+        if strong_model is not None:
+            self.model_routing.strong_models[provider] = strong_model.strip()
+        self.updated_at = datetime.now()
+
+    def set_compare_styles(self, enabled: bool) -> None:
+        """스타일별 초안 비교 켜기/끄기
+
+        Args:
+            enabled: 비교 사용 여부
+        """
+        self.compare_styles = enabled
+        self.updated_at = datetime.now()
+
     def get_style_prompt_instruction(self) -> str:
         """현재 선택된 스타일의 AI 프롬프트 지시사항 반환
 
@@ -55,6 +104,8 @@ class UserPreferences:
         """딕셔너리로 변환 (저장 시 사용)"""
         return {
             "writing_style": self.writing_style.value,
+            "model_routing": self.model_routing.to_dict(),
+            "compare_styles": self.compare_styles,
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
         }
@@ -66,6 +117,8 @@ class UserPreferences:
             writing_style=WritingStyle(
                 data.get("writing_style", WritingStyle.FIRST_PERSON_AUTOBIOGRAPHY.value)
             ),
+            model_routing=ModelRouting.from_dict(data.get("model_routing", {})),
+            compare_styles=data.get("compare_styles", False),
             created_at=datetime.fromisoformat(data["created_at"])
             if data.get("created_at")
             else None,
@@ -63,16 +63,33 @@ class WritingStyle(Enum):
         base_instruction = instructions[self]
 
         # EMOTIONAL_LITERARY 스타일이고 예시가 있으면 강화된 프롬프트 생성
-        if self == WritingStyle.EMOTIONAL_LITERARY and examples:
-            examples_text = "\n".join([f"- {ex}" for ex in examples])
-            return (
-                f"{base_instruction}\n\n"
-                f"다음은 참고할 수 있는 문학적 표현 예시입니다:\n{examples_text}\n\n"
-                f"이러한 스타일을 참고하여 깊이 있고 감성적인 일기를 작성해주세요."
-            )
+        examples_instruction = self.get_examples_instruction(examples or [])
+        if examples_instruction:
+            return f"{base_instruction}\n\n{examples_instruction}"
 
         return base_instruction
 
+    def uses_examples(self) -> bool:
+        """예시 문장을 참고하는 스타일인지 (현재는 EMOTIONAL_LITERARY만)"""
+        return self == WritingStyle.EMOTIONAL_LITERARY
+
+    def get_examples_instruction(self, examples: list[str]) -> str | None:
+        """예시 문장 안내 (시스템 프롬프트 뒤에 따로 붙임)
+
+        Args:
+            examples: 참고할 예시 문장 리스트
+
+        Returns:
+            예시 안내 문구 (예시를 쓰지 않는 스타일이거나 예시가 없으면 None)
+        """
+        if not self.uses_examples() or not examples:
+            return None
+        examples_text = "\n".join([f"- {ex}" for ex in examples])
+        return (
+            f"다음은 참고할 수 있는 문학적 표현 예시입니다:\n{examples_text}\n\n"
+            f"이러한 스타일을 참고하여 깊이 있고 감성적인 일기를 작성해주세요."
+        )
+
 
 @dataclass
 class WritingStyleInfo:
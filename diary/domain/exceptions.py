@@ -0,0 +1,60 @@
+"""도메인 예외
+
+비즈니스 규칙 위반은 ValueError로 알리고, 호출한 쪽이 따로 구분해서 처리해야 하는 오류만 여기 정의합니다.
+"""
+
+from typing import Any, List, Optional, Tuple
+
+
+class ConcurrentModificationError(ValueError):
+    """저장소의 버전이 읽어온 버전과 달라 저장하지 않음 (낙관적 동시성 제어)
+
+    다른 CLI 인스턴스나 서버 워커가 먼저 저장한 경우입니다.
+    최신 내용을 다시 읽어서 변경을 다시 적용해야 합니다.
+
+    Attributes:
+        entity_id: 세션/일기 ID
+        expected_version: 저장하려던 쪽이 읽어온 버전
+        actual_version: 저장소의 현재 버전 (None이면 삭제됨)
+    """
+
+    entity_name = "데이터"
+
+    def __init__(self, entity_id: str, expected_version: int, actual_version: Optional[int]):
+        self.entity_id = entity_id
+        self.expected_version = expected_version
+        self.actual_version = actual_version
+        if actual_version is None:
+            detail = "다른 곳에서 삭제되었습니다"
+        else:
+            detail = f"다른 곳에서 먼저 수정되었습니다 (버전 {expected_version} → {actual_version})"
+        super().__init__(f"{self.entity_name} {entity_id}이(가) {detail}.")
+
+
+class SessionConflictError(ConcurrentModificationError):
+    """채팅 세션 저장 충돌"""
+
+    entity_name = "세션"
+
+
+class DiaryConflictError(ConcurrentModificationError):
+    """일기 저장 충돌"""
+
+    entity_name = "일기"
+
+
+class PartialSaveError(Exception):
+    """여러 항목을 한 번에 저장하다 일부만 저장됨
+
+    순서 없는 일괄 쓰기(MongoDB bulk_write ordered=False 등)는 실패한 항목이 있어도 나머지를 저장하므로,
+    저장된 항목을 실패로 취급하지 않도록 둘을 나눠서 알립니다.
+
+    Attributes:
+        saved: 저장된 항목 리스트
+        failed: (저장하지 못한 항목, 사유) 리스트
+    """
+
+    def __init__(self, saved: List[Any], failed: List[Tuple[Any, str]]):
+        self.saved = saved
+        self.failed = failed
+        super().__init__(f"{len(saved) + len(failed)}개 중 {len(failed)}개를 저장하지 못했습니다: {failed[0][1]}")
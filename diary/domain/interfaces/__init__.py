@@ -1,17 +1,29 @@
 """Domain interfaces (Repository contracts)"""
 
+from diary.domain.interfaces.user_scoped_repository import (
+    DEFAULT_USER_ID,
+    UserScopedRepository,
+    validate_user_id,
+)
 from diary.domain.interfaces.credential_repository import CredentialRepositoryInterface
 from diary.domain.interfaces.user_preferences_repository import UserPreferencesRepositoryInterface
 from diary.domain.interfaces.writing_style_examples_repository import WritingStyleExamplesRepositoryInterface
 from diary.domain.interfaces.ai_client import AIClientInterface
 from diary.domain.interfaces.chat_repository import ChatRepositoryInterface
 from diary.domain.interfaces.diary_repository import DiaryRepositoryInterface
+from diary.domain.interfaces.telemetry_repository import TelemetryRepositoryInterface
+from diary.domain.interfaces.job_checkpoint_repository import JobCheckpointRepositoryInterface
 
 __all__ = [
+    "DEFAULT_USER_ID",
+    "UserScopedRepository",
+    "validate_user_id",
     "CredentialRepositoryInterface",
     "UserPreferencesRepositoryInterface",
     "WritingStyleExamplesRepositoryInterface",
     "AIClientInterface",
     "ChatRepositoryInterface",
     "DiaryRepositoryInterface",
+    "TelemetryRepositoryInterface",
+    "JobCheckpointRepositoryInterface",
 ]
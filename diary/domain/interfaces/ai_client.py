@@ -1,19 +1,25 @@
 """AI 클라이언트 인터페이스 - Domain이 정의, Data가 구현"""
 
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Iterator, List, Optional
+
+from diary.domain.entities.token_usage import TokenUsage
 
 
 class AIClientInterface(ABC):
     """AI API 호출 인터페이스 (OpenAI, Anthropic, Google 등)"""
 
     @abstractmethod
-    def chat(self, messages: List[dict]) -> str:
+    def chat(
+        self, messages: List[dict], session_id: Optional[str] = None, model: Optional[str] = None
+    ) -> str:
         """
         대화 히스토리를 받아 AI 응답 생성
 
         Args:
             messages: [{"role": "user", "content": "..."}, ...] 형식의 대화 기록
+            session_id: 채팅 세션 ID (주어지면 구현체가 세션 단위 상태를 재사용할 수 있음)
+            model: 이번 요청에만 사용할 모델 (None이면 기본 모델)
 
         Returns:
             AI 응답 텍스트
@@ -22,3 +28,42 @@ class AIClientInterface(ABC):
             Exception: AI API 호출 실패 시
         """
         pass
+
+    def chat_stream(
+        self, messages: List[dict], session_id: Optional[str] = None, model: Optional[str] = None
+    ) -> Iterator[str]:
+        """
+        대화 히스토리를 받아 AI 응답을 조각(chunk) 단위로 생성
+
+        스트리밍을 지원하지 않는 구현체는 chat() 결과를 한 번에 돌려줍니다.
+
+        Args:
+            messages: [{"role": "user", "content": "..."}, ...] 형식의 대화 기록
+            session_id: 채팅 세션 ID
+            model: 이번 요청에만 사용할 모델 (None이면 기본 모델)
+
+        Yields:
+            AI 응답 텍스트 조각
+
+        Raises:
+            Exception: AI API 호출 실패 시
+        """
+        yield self.chat(messages, session_id=session_id, model=model)
+
+    def get_last_usage(self) -> Optional[TokenUsage]:
+        """
+        마지막 chat 호출의 토큰 사용량 (캐시 적중 포함)
+
+        Returns:
+            TokenUsage 또는 None (Provider가 사용량을 제공하지 않는 경우)
+        """
+        return None
+
+    def get_model_name(self) -> Optional[str]:
+        """
+        기본으로 사용하는 모델 이름
+
+        Returns:
+            모델 이름 또는 None
+        """
+        return None
@@ -1,18 +1,28 @@
 """채팅 저장소 인터페이스 - Domain이 정의, Data가 구현"""
 
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import Optional, List
+from diary.domain.entities.chat_message import ChatMessage
 from diary.domain.entities.chat_session import ChatSession
+from diary.domain.interfaces.user_scoped_repository import UserScopedRepository
 
 
-class ChatRepositoryInterface(ABC):
-    """채팅 세션 저장 및 조회 인터페이스"""
+class ChatRepositoryInterface(UserScopedRepository, ABC):
+    """채팅 세션 저장 및 조회 인터페이스
+
+    저장/조회는 모두 이 저장소의 user_id 범위 안에서만 이루어지며,
+    활성 세션도 사용자마다 따로 관리합니다.
+    """
 
     @abstractmethod
     def save_session(self, session: ChatSession) -> None:
         """
         채팅 세션 저장
 
+        일부만 읽은 세션(omitted_messages > 0)이면 생략된 중간 메시지는 저장소에 있는 그대로 두고
+        첫 메시지와 읽어온/새로 추가된 메시지만 저장해야 합니다.
+
         Args:
             session: 저장할 채팅 세션
         """
@@ -41,6 +51,39 @@ class ChatRepositoryInterface(ABC):
         """
         pass
 
+    def get_active_session_tail(self, tail_size: int) -> Optional[ChatSession]:
+        """
+        활성 세션을 첫 메시지 + 최근 tail_size개 메시지만 읽어서 반환
+
+        긴 세션도 이어하기 비용이 일정하도록, 중간 메시지는 읽지 않고
+        ChatSession.omitted_messages에 개수만 기록합니다.
+        기본 구현은 전체 세션을 읽습니다.
+
+        Args:
+            tail_size: 읽을 최근 메시지 수
+
+        Returns:
+            활성 세션 (일부만 읽었을 수 있음) 또는 None
+        """
+        return self.get_active_session()
+
+    def load_messages(self, session_id: str, start: int, end: int) -> List[ChatMessage]:
+        """
+        세션의 메시지 일부 조회 (생략된 중간 메시지를 나중에 채울 때 사용)
+
+        기본 구현은 전체 세션을 읽어서 자릅니다.
+
+        Args:
+            session_id: 세션 ID
+            start: 시작 위치 (포함)
+            end: 끝 위치 (미포함)
+
+        Returns:
+            메시지 리스트 (세션이 없으면 빈 리스트)
+        """
+        session = self.get_session(session_id)
+        return session.messages[start:end] if session else []
+
     @abstractmethod
     def list_sessions(self, limit: int = 10) -> List[ChatSession]:
         """
@@ -66,3 +109,30 @@ class ChatRepositoryInterface(ABC):
             삭제 성공 여부
         """
         pass
+
+    def archive_sessions(self, updated_before: datetime) -> int:
+        """
+        마지막 대화가 오래된 종료 세션을 압축 보관 계층으로 이동
+
+        보관된 세션은 get_session으로 그대로 읽을 수 있고, 세션 목록(list_sessions)에서는 빠집니다.
+        기본 구현은 보관 계층이 없으므로 아무것도 하지 않습니다.
+
+        Args:
+            updated_before: 이 시각 이전에 마지막으로 수정된 종료 세션을 보관
+
+        Returns:
+            보관한 세션 수
+        """
+        return 0
+
+    def expire_archived_sessions(self, updated_before: datetime) -> int:
+        """
+        보관 기간이 지난 보관 세션 삭제
+
+        Args:
+            updated_before: 이 시각 이전에 마지막으로 수정된 보관 세션을 삭제
+
+        Returns:
+            삭제한 세션 수
+        """
+        return 0
@@ -1,12 +1,14 @@
 """인증 정보 저장소 인터페이스 (Domain Layer에서 정의)"""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
 
 from diary.domain.entities.ai_credential import AICredential, AIProvider
+from diary.domain.interfaces.user_scoped_repository import UserScopedRepository
 
 
-class CredentialRepositoryInterface(ABC):
+class CredentialRepositoryInterface(UserScopedRepository, ABC):
     """AI 인증 정보 저장소 인터페이스
 
     Data Layer에서 이 인터페이스를 구현합니다 (의존성 역전).
@@ -90,3 +92,13 @@ class CredentialRepositoryInterface(ABC):
             존재 여부
         """
         pass
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """여러 변경을 한 번에 저장하는 구간
+
+        구간 안의 save/update/delete는 모아 두었다가 구간이 끝날 때 한 번에 저장하고,
+        예외가 나면 모두 버립니다. 구간 안의 조회는 아직 저장하지 않은 변경을 포함합니다.
+        기본 구현은 변경마다 바로 저장합니다.
+        """
+        yield
@@ -10,10 +10,15 @@ from abc import ABC, abstractmethod
 from datetime import date
 from typing import Optional, List, Tuple
 from diary.domain.entities.diary import Diary
+from diary.domain.exceptions import PartialSaveError
+from diary.domain.interfaces.user_scoped_repository import UserScopedRepository
 
 
-class DiaryRepositoryInterface(ABC):
-    """일기 저장 및 조회 인터페이스"""
+class DiaryRepositoryInterface(UserScopedRepository, ABC):
+    """일기 저장 및 조회 인터페이스
+
+    저장/조회는 모두 이 저장소의 user_id 범위 안에서만 이루어집니다 (날짜별 일기 하나도 사용자별).
+    """
 
     @abstractmethod
     def save(self, diary: Diary) -> Diary:
@@ -28,6 +33,33 @@ class DiaryRepositoryInterface(ABC):
         """
         pass
 
+    def save_many(self, diaries: List[Diary]) -> List[Diary]:
+        """
+        일기 여러 개를 한 번에 저장 (일괄 생성용)
+
+        기본 구현은 save()를 차례로 호출합니다.
+        DB 구현체는 한 번의 왕복으로 저장하도록 재정의하는 것을 권장합니다.
+
+        Args:
+            diaries: 저장할 일기 리스트
+
+        Returns:
+            저장된 일기 리스트 (diary_id 포함)
+
+        Raises:
+            PartialSaveError: 일부만 저장된 경우 (저장된 일기와 실패한 일기를 구분)
+        """
+        saved = []
+        for index, diary in enumerate(diaries):
+            try:
+                saved.append(self.save(diary))
+            except Exception as e:
+                if not saved:
+                    raise
+                failed = [(diary, str(e))] + [(rest, "이전 일기 저장 실패로 중단") for rest in diaries[index + 1:]]
+                raise PartialSaveError(saved, failed) from e
+        return saved
+
     @abstractmethod
     def get_by_date(self, diary_date: date) -> Optional[Diary]:
         """
@@ -85,6 +117,30 @@ class DiaryRepositoryInterface(ABC):
         """
         pass
 
+    def search(self, keyword: str, limit: int = 30) -> List[Diary]:
+        """
+        내용에 키워드가 들어간 일기 검색 (대소문자 무시, 최신순)
+
+        기본 구현은 list_diaries() 페이지를 차례로 훑습니다.
+        DB 구현체는 저장소 안에서 검색하도록 재정의하는 것을 권장합니다.
+
+        Args:
+            keyword: 검색어
+            limit: 최대 결과 수
+
+        Returns:
+            일기 리스트 (최신순)
+        """
+        needle = keyword.casefold()
+        results: List[Diary] = []
+        cursor = None
+        while len(results) < limit:
+            diaries, cursor = self.list_diaries(cursor=cursor, limit=100)
+            results.extend(d for d in diaries if needle in d.content.casefold())
+            if not cursor:
+                break
+        return results[:limit]
+
     @abstractmethod
     def delete(self, diary_id: str) -> bool:
         """
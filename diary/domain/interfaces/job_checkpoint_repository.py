@@ -0,0 +1,48 @@
+"""일괄 작업 체크포인트 저장소 인터페이스 - Domain이 정의, Data가 구현"""
+
+from abc import ABC, abstractmethod
+from typing import List, Set
+
+
+class JobCheckpointRepositoryInterface(ABC):
+    """일괄 작업의 완료된 항목 기록 인터페이스
+
+    작업이 중간에 중단되어도 다시 실행하면 완료된 항목은 건너뛸 수 있도록 합니다.
+    """
+
+    @abstractmethod
+    def load_completed(self, job_id: str) -> Set[str]:
+        """
+        완료된 항목 ID 조회
+
+        Args:
+            job_id: 작업 ID
+
+        Returns:
+            완료된 항목 ID 집합 (기록이 없으면 빈 집합)
+        """
+        pass
+
+    @abstractmethod
+    def mark_completed(self, job_id: str, item_ids: List[str]) -> None:
+        """
+        항목들을 완료로 기록
+
+        Args:
+            job_id: 작업 ID
+            item_ids: 완료된 항목 ID 리스트
+        """
+        pass
+
+    @abstractmethod
+    def clear(self, job_id: str) -> bool:
+        """
+        작업의 체크포인트 삭제 (처음부터 다시 실행)
+
+        Args:
+            job_id: 작업 ID
+
+        Returns:
+            삭제 성공 여부 (기록이 없으면 False)
+        """
+        pass
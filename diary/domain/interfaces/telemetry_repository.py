@@ -0,0 +1,37 @@
+"""AI 호출 텔레메트리 저장소 인터페이스 - Domain이 정의, Data가 구현"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, Optional
+
+from diary.domain.entities.ai_call_record import AICallRecord
+
+
+class TelemetryRepositoryInterface(ABC):
+    """AI 호출 기록 저장 및 조회 인터페이스
+
+    기록은 추가만 하며(append-only), 매 AI 호출마다 저장되므로 저렴해야 합니다.
+    """
+
+    @abstractmethod
+    def append(self, record: AICallRecord) -> None:
+        """
+        호출 기록 추가
+
+        Args:
+            record: 저장할 호출 기록
+        """
+        pass
+
+    @abstractmethod
+    def list_records(self, since: Optional[datetime] = None) -> List[AICallRecord]:
+        """
+        호출 기록 조회 (오래된 순)
+
+        Args:
+            since: 이 시각 이후의 기록만 조회 (None이면 전체)
+
+        Returns:
+            호출 기록 리스트
+        """
+        pass
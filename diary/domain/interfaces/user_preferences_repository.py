@@ -8,9 +8,10 @@ from abc import ABC, abstractmethod
 from typing import Optional
 
 from diary.domain.entities.user_preferences import UserPreferences
+from diary.domain.interfaces.user_scoped_repository import UserScopedRepository
 
 
-class UserPreferencesRepositoryInterface(ABC):
+class UserPreferencesRepositoryInterface(UserScopedRepository, ABC):
     """사용자 설정 저장/조회 인터페이스
 
     Domain은 이 인터페이스만 알고 있으며, 실제 구현체(파일, DB 등)는 모릅니다.
@@ -49,6 +50,35 @@ class UserPreferencesRepositoryInterface(ABC):
         """
         pass
 
+    def get_version(self) -> Optional[str]:
+        """저장된 설정의 버전 (바뀌었는지 확인용)
+
+        설정을 읽지 않고도 변경 여부를 알 수 있는 값(예: 파일 수정 시각+크기)입니다.
+        기본 구현은 None을 반환하며, 이 경우 서비스는 매번 설정을 다시 읽습니다.
+
+        Returns:
+            버전 문자열 또는 None (확인할 수 없음)
+        """
+        return None
+
+    def create_if_missing(self, preferences: UserPreferences) -> UserPreferences:
+        """저장된 설정이 없을 때만 preferences를 저장
+
+        기본 구현은 조회 후 저장하므로 동시에 호출되면 둘 다 저장할 수 있습니다.
+        여러 스레드/프로세스가 함께 쓰는 구현체는 잠금 안에서 확인하도록 재정의합니다.
+
+        Args:
+            preferences: 설정이 없을 때 저장할 설정 (기본 설정 등)
+
+        Returns:
+            이미 저장된 설정이 있으면 그 설정, 없으면 저장한 preferences
+        """
+        existing = self.get()
+        if existing is not None:
+            return existing
+        self.save(preferences)
+        return preferences
+
     @abstractmethod
     def delete(self) -> None:
         """사용자 설정 삭제
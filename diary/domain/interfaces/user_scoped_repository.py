@@ -0,0 +1,52 @@
+"""사용자별 저장소 공통 인터페이스
+
+저장소 인스턴스 하나는 사용자 한 명(user_id)의 데이터만 다룹니다.
+여러 사용자를 처리할 때는 for_user()로 같은 연결/경로 설정을 공유하는
+다른 사용자용 저장소를 얻습니다 (다른 사용자의 데이터는 조회 조건에 섞이지 않음).
+"""
+
+import re
+from typing import TypeVar
+
+
+# 사용자 구분이 없던 기존 데이터의 사용자 ID
+DEFAULT_USER_ID = "default"
+
+# 파일 경로/샤드 키로 그대로 쓸 수 있는 ID만 허용
+_USER_ID_PATTERN = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_.-]{0,63}$")
+
+RepositoryT = TypeVar("RepositoryT", bound="UserScopedRepository")
+
+
+def validate_user_id(user_id: str) -> str:
+    """
+    사용자 ID 검증
+
+    Returns:
+        검증된 사용자 ID
+
+    Raises:
+        ValueError: 영문/숫자로 시작하고 영문/숫자/_/./-로 이루어진 64자 이하가 아닌 경우
+    """
+    if not isinstance(user_id, str) or not _USER_ID_PATTERN.match(user_id):
+        raise ValueError(f"올바르지 않은 사용자 ID입니다: {user_id!r}")
+    return user_id
+
+
+class UserScopedRepository:
+    """사용자 한 명의 데이터만 다루는 저장소"""
+
+    user_id: str = DEFAULT_USER_ID
+
+    def for_user(self: RepositoryT, user_id: str) -> RepositoryT:
+        """
+        같은 설정(연결, 기본 경로)으로 다른 사용자의 데이터를 다루는 저장소 반환
+
+        Args:
+            user_id: 사용자 ID
+
+        Raises:
+            ValueError: 사용자 ID가 올바르지 않은 경우
+            NotImplementedError: 사용자별 저장을 지원하지 않는 구현체인 경우
+        """
+        raise NotImplementedError(f"{type(self).__name__}는 사용자별 저장소를 지원하지 않습니다.")
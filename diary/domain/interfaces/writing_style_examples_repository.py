@@ -5,11 +5,13 @@ Data Layer가 이 인터페이스를 구현합니다 (의존성 역전).
 """
 
 from abc import ABC, abstractmethod
+from typing import Optional
 
 from diary.domain.entities.writing_style import WritingStyle
+from diary.domain.interfaces.user_scoped_repository import UserScopedRepository
 
 
-class WritingStyleExamplesRepositoryInterface(ABC):
+class WritingStyleExamplesRepositoryInterface(UserScopedRepository, ABC):
     """일기 작성 스타일 예시 문장 저장소 인터페이스
 
     각 스타일별 예시 문장을 로드하는 기능을 제공합니다.
@@ -27,3 +29,33 @@ class WritingStyleExamplesRepositoryInterface(ABC):
             예시 문장 리스트 (비어있을 수 있음)
         """
         pass
+
+    def get_version(self, style: WritingStyle) -> Optional[str]:
+        """특정 스타일 예시 문장의 버전 (바뀌었는지 확인용)
+
+        예시를 읽지 않고도 변경 여부를 알 수 있는 값(예: 파일 수정 시각+크기)입니다.
+        기본 구현은 None을 반환하며, 이 경우 프롬프트를 캐시하지 않습니다.
+
+        Args:
+            style: 일기 작성 스타일
+
+        Returns:
+            버전 문자열 또는 None (확인할 수 없음)
+        """
+        return None
+
+    def find_similar_examples(self, style: WritingStyle, text: str, limit: int) -> list[str]:
+        """text(대화 내용)와 가장 비슷한 예시 문장 limit개 조회
+
+        예시가 아무리 많아도 프롬프트에는 limit개만 들어가도록 일기를 만들 때 사용합니다.
+        기본 구현은 비슷한 정도를 따지지 않고 앞에서부터 limit개를 반환합니다.
+
+        Args:
+            style: 일기 작성 스타일
+            text: 비교할 대화 내용
+            limit: 최대 예시 수
+
+        Returns:
+            비슷한 순서의 예시 문장 리스트
+        """
+        return self.get_examples(style)[:limit]
@@ -3,11 +3,22 @@
 from diary.domain.services.credential_service import CredentialService
 from diary.domain.services.user_preferences_service import UserPreferencesService
 from diary.domain.services.chat_service import ChatService
+from diary.domain.services.context_window import ContextWindowManager
+from diary.domain.services.telemetry_service import InstrumentedAIClient, TelemetryService
 from diary.domain.services.diary_service import DiaryService
+from diary.domain.services.bulk_diary_generation_service import BulkDiaryGenerationService
+from diary.domain.services.session_writer import WriteBehindSessionWriter
+from diary.domain.services.session_archive_service import SessionArchiveService
 
 __all__ = [
     "CredentialService",
     "UserPreferencesService",
     "ChatService",
+    "ContextWindowManager",
+    "InstrumentedAIClient",
+    "TelemetryService",
     "DiaryService",
+    "BulkDiaryGenerationService",
+    "WriteBehindSessionWriter",
+    "SessionArchiveService",
 ]
@@ -0,0 +1,419 @@
+"""일괄 일기 생성 작업 (오프라인 배치)
+
+일기로 만들지 못한 종료된 채팅 세션이나 붙여넣은 대화 기록을 한 번에 일기로 만듭니다.
+- 정해진 수의 워커 스레드로 동시에 생성 (AI 호출은 대부분 네트워크 대기)
+- 분당 요청 수 제한 + 요청 한도 초과(429) 시 모든 워커를 잠시 멈춘 뒤 재시도
+- 완료 항목을 체크포인트에 기록하여 중단 후 다시 실행하면 이어서 진행
+- 생성된 일기는 모아서 DiaryService로 한 번에 저장
+"""
+
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Callable, List, Optional, Tuple
+
+from diary.domain.entities.chat_message import ChatMessage, MessageRole
+from diary.domain.entities.chat_session import ChatSession
+from diary.domain.exceptions import PartialSaveError
+from diary.domain.interfaces.job_checkpoint_repository import JobCheckpointRepositoryInterface
+from diary.domain.services.chat_service import ChatService, DiaryGenerationSettings
+from diary.domain.services.diary_service import DiaryService
+from diary.domain.services.retry_policy import RetryPolicy, is_rate_limit_error
+
+
+# 대화 기록에서 화자를 구분하는 접두어 ("나: ...", "AI: ...")
+_USER_SPEAKERS = ("나", "사용자", "user", "you", "me")
+_ASSISTANT_SPEAKERS = ("ai", "assistant", "봇", "bot", "인터뷰어")
+_SPEAKER_PATTERN = re.compile(r"^\s*([^:：]{1,12})\s*[:：]\s?(.*)$")
+
+
+@dataclass
+class DiaryGenerationTask:
+    """일기 한 편을 만드는 작업 단위
+
+    Attributes:
+        task_id: 체크포인트에 기록할 고유 ID (세션 ID, 파일 경로 등)
+        diary_date: 만들 일기의 날짜
+        messages: 일기의 재료가 되는 대화 (시스템 메시지 제외)
+        source: 표시용 출처 설명
+    """
+    task_id: str
+    diary_date: date
+    messages: List[ChatMessage]
+    source: str = ""
+
+
+@dataclass
+class DiaryGenerationResult:
+    """작업 하나의 처리 결과
+
+    Attributes:
+        task_id: 작업 ID
+        diary_date: 일기 날짜
+        status: "created"(저장됨), "skipped"(이미 일기가 있음), "failed"(실패)
+        error: 실패/건너뜀 사유
+        attempts: AI 호출 시도 횟수
+    """
+    task_id: str
+    diary_date: date
+    status: str
+    error: Optional[str] = None
+    attempts: int = 0
+
+
+@dataclass
+class BulkGenerationSummary:
+    """일괄 생성 결과 요약"""
+    total: int = 0
+    created: int = 0
+    skipped: int = 0
+    failed: int = 0
+    resumed: int = 0
+    results: List[DiaryGenerationResult] = field(default_factory=list)
+
+    def add(self, result: DiaryGenerationResult) -> None:
+        """결과 하나 반영"""
+        self.results.append(result)
+        if result.status == "created":
+            self.created += 1
+        elif result.status == "skipped":
+            self.skipped += 1
+        else:
+            self.failed += 1
+
+
+def parse_transcript(text: str) -> List[ChatMessage]:
+    """
+    붙여넣은 대화 기록을 메시지 리스트로 변환
+
+    "나: ...", "AI: ..." 처럼 화자 접두어가 있는 줄에서 새 메시지가 시작되고,
+    접두어가 없는 줄은 직전 메시지에 이어 붙입니다.
+    화자 접두어가 하나도 없으면 전체를 사용자 메시지 하나로 봅니다.
+
+    Args:
+        text: 대화 기록 텍스트
+
+    Returns:
+        ChatMessage 리스트 (빈 텍스트면 빈 리스트)
+    """
+    now = datetime.now()
+    messages: List[ChatMessage] = []
+
+    for line in text.splitlines():
+        match = _SPEAKER_PATTERN.match(line)
+        speaker = match.group(1).strip().lower() if match else ""
+        if match and (speaker in _USER_SPEAKERS or speaker in _ASSISTANT_SPEAKERS):
+            role = MessageRole.USER if speaker in _USER_SPEAKERS else MessageRole.ASSISTANT
+            messages.append(ChatMessage(role=role, content=match.group(2).strip(), timestamp=now))
+        elif messages:
+            messages[-1].content = f"{messages[-1].content}\n{line}".strip()
+        elif line.strip():
+            # 화자 접두어 이전의 내용은 사용자 메시지로 취급
+            messages.append(ChatMessage(role=MessageRole.USER, content=line.strip(), timestamp=now))
+
+    messages = [m for m in messages if m.content]
+    if messages and not any(m.role != MessageRole.USER for m in messages):
+        # 화자 구분이 없는 글: 하나의 사용자 메시지로 합침
+        return [ChatMessage(role=MessageRole.USER, content=text.strip(), timestamp=now)]
+    return messages
+
+
+class RequestRateLimiter:
+    """분당 요청 수 제한 (여러 워커 스레드가 공유)
+
+    요청 시각을 일정 간격으로 배정하고, 요청 한도 초과 시 pause()로 모든 워커를 함께 멈춥니다.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Args:
+            requests_per_minute: 분당 최대 요청 수 (None 또는 0이면 제한 없음)
+            clock: 현재 시각 함수 (테스트에서 교체 가능)
+            sleep: 대기 함수 (테스트에서 교체 가능)
+        """
+        self.interval = 60.0 / requests_per_minute if requests_per_minute else 0.0
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+        self._paused_until = 0.0
+
+    def acquire(self) -> None:
+        """다음 요청 차례까지 대기"""
+        with self._lock:
+            now = self._clock()
+            start = max(now, self._next_slot, self._paused_until)
+            self._next_slot = start + self.interval
+
+        wait = start - now
+        if wait > 0:
+            self._sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """모든 워커의 다음 요청을 seconds초 뒤로 미룸"""
+        with self._lock:
+            self._paused_until = max(self._paused_until, self._clock() + seconds)
+
+
+class BulkDiaryGenerationService:
+    """일괄 일기 생성 작업 실행기
+
+    의존성:
+    - ChatService: 시스템 프롬프트/컨텍스트 예산을 그대로 사용한 일기 생성
+    - DiaryService: 생성된 일기 일괄 저장
+    - JobCheckpointRepositoryInterface: 완료 항목 기록
+    """
+
+    def __init__(
+        self,
+        chat_service: ChatService,
+        diary_service: DiaryService,
+        checkpoint_repo: JobCheckpointRepositoryInterface,
+        max_workers: int = 4,
+        requests_per_minute: Optional[int] = None,
+        batch_size: int = 10,
+        rate_limit_policy: Optional[RetryPolicy] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Args:
+            chat_service: 채팅 서비스
+            diary_service: 일기 서비스
+            checkpoint_repo: 체크포인트 저장소 (인터페이스)
+            max_workers: 동시에 실행할 워커 수
+            requests_per_minute: 분당 최대 AI 요청 수 (None이면 제한 없음)
+            batch_size: 한 번에 저장할 일기 수
+            rate_limit_policy: 요청 한도 초과 시 재시도 정책 (기본: 최대 3회, 5초부터 두 배씩)
+            sleep: 대기 함수 (테스트에서 교체 가능)
+
+        Raises:
+            ValueError: 워커 수나 배치 크기가 1보다 작은 경우
+        """
+        if max_workers < 1:
+            raise ValueError("워커 수는 1 이상이어야 합니다")
+        if batch_size < 1:
+            raise ValueError("배치 크기는 1 이상이어야 합니다")
+
+        self.chat_service = chat_service
+        self.diary_service = diary_service
+        self.checkpoint_repo = checkpoint_repo
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+        self.rate_limit_policy = rate_limit_policy or RetryPolicy(
+            max_retries=3, base_delay=5.0, max_delay=60.0
+        )
+        self.rate_limiter = RequestRateLimiter(requests_per_minute, sleep=sleep)
+
+    def tasks_from_sessions(self, sessions: List[ChatSession]) -> List[DiaryGenerationTask]:
+        """
+        채팅 세션 → 작업 목록 (세션 시작 날짜 기준, 같은 날짜는 하나로 합침)
+
+        Args:
+            sessions: 채팅 세션 리스트
+
+        Returns:
+            날짜순 작업 리스트 (사용자 메시지가 없는 세션은 제외)
+        """
+        tasks = [
+            DiaryGenerationTask(
+                task_id=session.session_id,
+                diary_date=session.created_at.date(),
+                messages=[m for m in session.messages if m.role != MessageRole.SYSTEM],
+                source=f"세션 {session.session_id[:8]}",
+            )
+            for session in sorted(sessions, key=lambda s: s.created_at)
+            if session.get_user_message_count() > 0
+        ]
+        return self.merge_tasks_by_date(tasks)
+
+    @staticmethod
+    def task_from_transcript(task_id: str, text: str, diary_date: date) -> DiaryGenerationTask:
+        """
+        붙여넣은 대화 기록 → 작업
+
+        Args:
+            task_id: 작업 ID (파일 경로 등)
+            text: 대화 기록 텍스트
+            diary_date: 일기 날짜
+
+        Returns:
+            DiaryGenerationTask
+        """
+        return DiaryGenerationTask(
+            task_id=task_id,
+            diary_date=diary_date,
+            messages=parse_transcript(text),
+            source=task_id,
+        )
+
+    @staticmethod
+    def merge_tasks_by_date(tasks: List[DiaryGenerationTask]) -> List[DiaryGenerationTask]:
+        """
+        같은 날짜의 작업을 하나로 합침 (하루에 하나의 일기만 작성 가능)
+
+        Args:
+            tasks: 작업 리스트
+
+        Returns:
+            날짜순으로 정렬된, 날짜별 하나의 작업 리스트
+        """
+        by_date: dict = {}
+        for task in tasks:
+            by_date.setdefault(task.diary_date, []).append(task)
+
+        merged = []
+        for diary_date in sorted(by_date):
+            group = by_date[diary_date]
+            if len(group) == 1:
+                merged.append(group[0])
+                continue
+            merged.append(DiaryGenerationTask(
+                task_id="+".join(sorted(t.task_id for t in group)),
+                diary_date=diary_date,
+                messages=[m for t in group for m in t.messages],
+                source=", ".join(t.source for t in group),
+            ))
+        return merged
+
+    def run(
+        self,
+        job_id: str,
+        tasks: List[DiaryGenerationTask],
+        on_result: Optional[Callable[[DiaryGenerationResult], None]] = None,
+    ) -> BulkGenerationSummary:
+        """
+        일괄 생성 실행
+
+        체크포인트에 완료로 기록된 작업과 이미 일기가 있는 날짜는 AI를 호출하지 않고 건너뜁니다.
+        실패한 작업은 체크포인트에 기록하지 않으므로 다시 실행하면 재시도됩니다.
+
+        Args:
+            job_id: 체크포인트 작업 ID
+            tasks: 작업 리스트
+            on_result: 작업 하나가 끝날 때마다 호출할 콜백 (진행 표시용)
+
+        Returns:
+            BulkGenerationSummary
+        """
+        summary = BulkGenerationSummary(total=len(tasks))
+        completed = self.checkpoint_repo.load_completed(job_id)
+
+        def report(result: DiaryGenerationResult) -> None:
+            summary.add(result)
+            if on_result:
+                on_result(result)
+
+        pending = []
+        skipped_ids = []
+        for task in tasks:
+            if task.task_id in completed:
+                summary.resumed += 1
+            elif self.diary_service.has_diary_on_date(task.diary_date):
+                skipped_ids.append(task.task_id)
+                report(DiaryGenerationResult(
+                    task.task_id, task.diary_date, "skipped", error="이미 일기가 있는 날짜"
+                ))
+            else:
+                pending.append(task)
+        self.checkpoint_repo.mark_completed(job_id, skipped_ids)
+
+        # 사용자 설정은 시작 전에 한 번만 읽어 모든 워커가 공유
+        settings = self.chat_service.prepare_diary_generation() if pending else None
+
+        buffer: List[Tuple[DiaryGenerationTask, str, int]] = []
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="diary-gen")
+        try:
+            futures = {executor.submit(self._generate, task, settings): task for task in pending}
+            for future in as_completed(futures):
+                task = futures[future]
+                try:
+                    content, attempts = future.result()
+                except Exception as e:
+                    report(DiaryGenerationResult(task.task_id, task.diary_date, "failed", error=str(e)))
+                    continue
+
+                buffer.append((task, content, attempts))
+                if len(buffer) >= self.batch_size:
+                    self._flush(job_id, buffer, report)
+                    buffer = []
+        finally:
+            # 중단(Ctrl+C 등)되어도 이미 생성한 일기는 저장하고 남은 작업은 취소
+            executor.shutdown(wait=False, cancel_futures=True)
+            self._flush(job_id, buffer, report)
+
+        return summary
+
+    def _generate(
+        self, task: DiaryGenerationTask, settings: Optional[DiaryGenerationSettings] = None
+    ) -> Tuple[str, int]:
+        """작업 하나 실행 (요청 한도 초과 시 모든 워커를 멈추고 재시도)
+
+        Returns:
+            (일기 본문, 시도 횟수)
+        """
+        attempt = 0
+        while True:
+            self.rate_limiter.acquire()
+            attempt += 1
+            try:
+                return self.chat_service.generate_diary_from_messages(task.messages, settings), attempt
+            except Exception as e:
+                if not is_rate_limit_error(e) or attempt > self.rate_limit_policy.max_retries:
+                    raise
+                self.rate_limiter.pause(self.rate_limit_policy.get_delay(attempt))
+
+    def _flush(
+        self,
+        job_id: str,
+        buffer: List[Tuple[DiaryGenerationTask, str, int]],
+        report: Callable[[DiaryGenerationResult], None],
+    ) -> None:
+        """모아둔 일기를 한 번에 저장하고 체크포인트 기록
+
+        일부만 저장되면 저장된 작업은 완료로 기록하고, 나머지만 실패로 남겨 다시 실행할 때 재시도합니다.
+        """
+        if not buffer:
+            return
+
+        failed_reasons = {}
+        try:
+            saved = self.diary_service.create_diaries(
+                [(task.diary_date, content) for task, content, _ in buffer]
+            )
+        except PartialSaveError as e:
+            saved = e.saved
+            failed_reasons = {diary.diary_date: reason for diary, reason in e.failed}
+        except Exception as e:
+            for task, _, attempts in buffer:
+                report(DiaryGenerationResult(
+                    task.task_id, task.diary_date, "failed", error=f"저장 실패: {e}", attempts=attempts
+                ))
+            return
+
+        saved_dates = {diary.diary_date for diary in saved}
+        completed_ids = []
+        for task, _, attempts in buffer:
+            if task.diary_date in failed_reasons:
+                report(DiaryGenerationResult(
+                    task.task_id, task.diary_date, "failed",
+                    error=f"저장 실패: {failed_reasons[task.diary_date]}", attempts=attempts,
+                ))
+                continue
+
+            completed_ids.append(task.task_id)
+            if task.diary_date in saved_dates:
+                report(DiaryGenerationResult(task.task_id, task.diary_date, "created", attempts=attempts))
+            else:
+                report(DiaryGenerationResult(
+                    task.task_id, task.diary_date, "skipped", error="이미 일기가 있는 날짜", attempts=attempts
+                ))
+
+        self.checkpoint_repo.mark_completed(job_id, completed_ids)
@@ -1,15 +1,71 @@
 """채팅 비즈니스 로직 서비스"""
 
-from typing import Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Callable, Dict, List, Optional
 import uuid
 
 from diary.domain.entities.chat_session import ChatSession
-from diary.domain.entities.chat_message import MessageRole
+from diary.domain.entities.chat_message import ChatMessage, MessageRole
+from diary.domain.entities.model_routing import RequestType
+from diary.domain.entities.token_usage import TokenUsage
+from diary.domain.entities.writing_style import WritingStyle
 from diary.domain.interfaces.chat_repository import ChatRepositoryInterface
 from diary.domain.interfaces.ai_client import AIClientInterface
+from diary.domain.services.context_window import SUMMARY_METADATA_KEY, ContextWindowManager
+from diary.domain.services.diary_speculation import DiaryDraftSpeculator, SpeculationStats, is_affirmative
+from diary.domain.services.session_merge import TOKEN_USAGE_METADATA_KEY, save_with_merge
+from diary.domain.services.session_writer import WriteBehindSessionWriter
+from diary.domain.services.system_prompt_builder import SystemPromptBuilder
+from diary.domain.services.telemetry_service import tag_request_type
+from diary.domain.services.token_estimator import TokenEstimator
 from diary.domain.services.user_preferences_service import UserPreferencesService
 
 
+# 시스템 프롬프트에서 AI가 일기 작성을 제안할 때 사용하는 문구
+DIARY_OFFER_PHRASE = "일기를 작성해드릴까요"
+
+# 저장된 대화로 일기를 만들 때(대화 없이 일괄 생성) 마지막에 붙이는 요청 문구
+DIARY_REQUEST_MESSAGE = "지금까지의 대화를 바탕으로 일기를 작성해주세요."
+
+# 일기 초안을 미리 만들 때 사용자 수락 대신 붙이는 메시지
+SPECULATIVE_ACCEPT_MESSAGE = "네, 일기를 작성해주세요."
+
+# 선작성 호출의 텔레메트리 요청 종류 (버려진 호출 비용을 따로 집계)
+SPECULATIVE_DIARY_REQUEST_TYPE = "diary_speculative"
+
+# 다른 스타일 비교용 초안 호출의 텔레메트리 요청 종류
+STYLE_DRAFT_REQUEST_TYPE = "diary_style_draft"
+
+DIARY_START_MARKER = "[DIARY_START]"
+DIARY_END_MARKER = "[DIARY_END]"
+
+# session.metadata에 세션 시작 시 사용한 시스템 프롬프트 해시를 저장하는 키
+PROMPT_HASH_METADATA_KEY = "system_prompt_hash"
+
+# 응답에 남겨둘 토큰 (AI 클라이언트의 max_tokens와 같은 값)
+RESPONSE_TOKEN_RESERVE = 1000
+
+# 이어하기 시 저장소에서 읽어올 최근 메시지 수 (나머지는 필요할 때만 읽음)
+RESUME_TAIL_MESSAGES = 20
+
+
+@dataclass(frozen=True)
+class DiaryGenerationSettings:
+    """저장된 대화로 일기를 만들 때 쓰는 설정 (여러 작업에 공유하도록 미리 한 번 읽어둠)
+
+    Attributes:
+        system_prompt: 현재 스타일의 시스템 프롬프트
+        style: 스타일 예시를 고를 스타일
+        diary_model: 일기 작성 모델 (None이면 AI 클라이언트 기본 모델)
+        summary_model: 대화 요약 모델 (None이면 AI 클라이언트 기본 모델)
+    """
+    system_prompt: str
+    style: WritingStyle
+    diary_model: Optional[str]
+    summary_model: Optional[str]
+
+
 class ChatService:
     """채팅 세션 관리 및 AI 대화 로직"""
 
@@ -17,17 +73,56 @@ class ChatService:
         self,
         chat_repo: ChatRepositoryInterface,
         ai_client: AIClientInterface,
-        preferences_service: UserPreferencesService
+        preferences_service: UserPreferencesService,
+        context_manager: Optional[ContextWindowManager] = None,
+        provider: Optional[str] = None,
+        session_token_budget: Optional[int] = None,
+        session_writer: Optional[WriteBehindSessionWriter] = None,
+        speculative_diary: bool = True,
+        resume_tail_size: int = RESUME_TAIL_MESSAGES,
     ):
         """
         Args:
             chat_repo: 채팅 저장소 (인터페이스)
             ai_client: AI 클라이언트 (인터페이스)
             preferences_service: 사용자 설정 서비스
+            context_manager: 토큰 예산 기반 컨텍스트 관리자 (None이면 전체 대화 전달)
+            provider: AI Provider 이름 (모델 라우팅용, None이면 항상 클라이언트 기본 모델)
+            session_token_budget: 세션 하나에서 쓸 수 있는 최대 토큰 수 (입력+출력, None이면 무제한)
+            session_writer: 백그라운드 세션 저장기 (None이면 매 턴 동기 저장)
+            speculative_diary: AI가 일기 작성을 제안하면 사용자 답변 전에 초안을 미리 생성
+            resume_tail_size: 이어하기 시 읽어올 최근 메시지 수
+
+        Raises:
+            ValueError: 세션 토큰 예산이 0 이하인 경우
         """
+        if session_token_budget is not None and session_token_budget <= 0:
+            raise ValueError("세션 토큰 예산은 0보다 커야 합니다")
+
         self.chat_repo = chat_repo
         self.ai_client = ai_client
         self.preferences_service = preferences_service
+        self.context_manager = context_manager
+        self.provider = provider
+        self.session_token_budget = session_token_budget
+        self.token_estimator = context_manager.estimator if context_manager else TokenEstimator()
+        # 마지막 send_message 요청의 추정 토큰 수 (표시용)
+        self.last_request_tokens: Optional[int] = None
+        self.session_writer = session_writer
+        self.resume_tail_size = resume_tail_size
+        self.prompt_builder = SystemPromptBuilder(preferences_service)
+        self.speculator = DiaryDraftSpeculator() if speculative_diary else None
+        # 마지막 send_message 응답이 미리 만든 초안이었는지 (표시용)
+        self.last_response_speculative = False
+        # 마지막 응답의 Provider 토큰 사용량 (AI 클라이언트는 호출한 스레드별로 기록하므로 여기 보관)
+        self._last_usage: Optional[TokenUsage] = None
+        # 마지막으로 작성된 일기의 스타일별 초안 (스타일 비교를 켠 경우, 현재 스타일이 첫 번째)
+        self.last_style_drafts: Dict[WritingStyle, str] = {}
+        # 스레드는 첫 요청 때 만들어짐
+        self._draft_executor = ThreadPoolExecutor(max_workers=len(WritingStyle), thread_name_prefix="style-draft")
+        # 처음 한 번만 저장소에서 읽고 이후에는 메모리의 활성 세션 사용
+        self._active_session: Optional[ChatSession] = None
+        self._active_session_loaded = False
 
     def start_new_session(self) -> ChatSession:
         """
@@ -36,30 +131,42 @@ class ChatService:
         Returns:
             생성된 ChatSession (AI 첫 인사 포함)
         """
+        self._discard_speculation()
         session_id = str(uuid.uuid4())
         session = ChatSession(session_id=session_id)
 
         # 시스템 프롬프트 추가 (AI의 역할 정의)
-        system_prompt = self._get_system_prompt()
-        session.add_message(MessageRole.SYSTEM, system_prompt)
+        system_prompt = self.prompt_builder.build()
+        session.add_message(MessageRole.SYSTEM, system_prompt.text)
+        session.metadata[PROMPT_HASH_METADATA_KEY] = system_prompt.prompt_hash
 
         # AI의 첫 인사 생성
         greeting = self._get_ai_greeting(session)
         # UTF-8 정제
         greeting = greeting.encode('utf-8', errors='ignore').decode('utf-8')
+        self._record_session_usage(
+            session,
+            self.token_estimator.count_history(session.get_conversation_history()),
+            greeting,
+            usage=self.ai_client.get_last_usage(),
+        )
         session.add_message(MessageRole.ASSISTANT, greeting)
 
         # 세션 저장
-        self.chat_repo.save_session(session)
+        self._set_active_session(session)
+        self._persist(session)
 
         return session
 
-    def send_message(self, user_message: str) -> tuple[str, bool]:
+    def send_message(
+        self, user_message: str, on_chunk: Optional[Callable[[str], None]] = None
+    ) -> tuple[str, bool]:
         """
         사용자 메시지 전송 → AI 응답 받기
 
         Args:
             user_message: 사용자 입력 메시지
+            on_chunk: 주어지면 AI 응답을 스트리밍으로 받아 조각마다 호출 (미리 만든 초안은 한 번에 전달)
 
         Returns:
             tuple[AI 응답 텍스트, 일기 생성 여부]
@@ -67,34 +174,78 @@ class ChatService:
             - (응답 내용, False): 일반 대화/질문
 
         Raises:
+            ValueError: 세션 토큰 예산을 모두 사용한 경우 (AI를 호출하지 않음)
             Exception: AI API 호출 실패 시
         """
         # UTF-8 인코딩 문제 방지: 서로게이트 문자 제거
         user_message = user_message.encode('utf-8', errors='ignore').decode('utf-8')
 
         # 활성 세션 가져오기 (없으면 새로 생성)
-        session = self.chat_repo.get_active_session()
+        session = self._load_active_session()
         if not session:
             session = self.start_new_session()
 
         # 사용자 메시지 추가
         session.add_message(MessageRole.USER, user_message)
 
-        # AI 응답 생성 (Full Context 전달)
-        conversation_history = session.get_conversation_history()
-        ai_response = self.ai_client.chat(conversation_history)
-
-        # AI 응답도 UTF-8 정제
-        ai_response = ai_response.encode('utf-8', errors='ignore').decode('utf-8')
+        try:
+            # 일기 작성 제안에 수락했으면 미리 만든 초안 사용, 대화를 이어가면 초안 버림
+            request_type = RequestType.DIARY if self._is_diary_request(session) else RequestType.SMALL_TALK
+            speculative = self._claim_speculation(session, user_message, request_type)
+            self.last_response_speculative = speculative is not None
+
+            style_drafts: Dict[WritingStyle, Future] = {}
+            if speculative:
+                ai_response, self.last_request_tokens, style_drafts, usage = speculative
+                if on_chunk:
+                    on_chunk(ai_response)
+            else:
+                # AI 응답 생성 (토큰 예산 내 컨텍스트 전달, 요청 종류에 맞는 모델 사용)
+                token_budget = self._get_remaining_request_budget(session)
+                conversation_history = self._build_conversation_history(session, token_budget=token_budget)
+                self.last_request_tokens = self.token_estimator.count_history(conversation_history)
+
+                # 스타일 비교를 켰으면 다른 스타일 초안을 같은 대화로 동시에 요청
+                if request_type == RequestType.DIARY and self.preferences_service.is_compare_styles_enabled():
+                    style_drafts = self._start_style_drafts(session.snapshot(), token_budget)
+
+                try:
+                    with tag_request_type(request_type.value):
+                        ai_response = self._request_reply(
+                            conversation_history, session.session_id, self._select_model(request_type), on_chunk
+                        )
+                except Exception:
+                    self._cancel_style_drafts(style_drafts)
+                    raise
+                usage = self.ai_client.get_last_usage()
+
+                # AI 응답도 UTF-8 정제
+                ai_response = ai_response.encode('utf-8', errors='ignore').decode('utf-8')
+        except Exception:
+            # 응답을 받지 못했으면 방금 추가한 사용자 메시지를 되돌림 (다시 보내도 사용자 메시지가 겹치지 않음)
+            session.remove_last_message()
+            raise
 
         # 일기 생성 여부 확인
         is_diary = self._is_diary_generated(ai_response)
 
         # AI 응답 저장
         session.add_message(MessageRole.ASSISTANT, ai_response)
+        self._record_session_usage(session, self.last_request_tokens, ai_response, usage=usage)
 
-        # 세션 저장
-        self.chat_repo.save_session(session)
+        # 다른 스타일 초안 모으기 (동시에 요청했으므로 가장 느린 호출만큼만 대기)
+        if is_diary:
+            self.last_style_drafts = self._collect_style_drafts(session, ai_response, style_drafts)
+        else:
+            self._cancel_style_drafts(style_drafts)
+            self.last_style_drafts = {}
+
+        # 세션 저장 (write-behind: 응답을 기다리게 하지 않음)
+        self._persist(session)
+
+        # 일기 작성을 제안했으면 사용자가 답하는 동안 초안 미리 생성
+        if not is_diary and DIARY_OFFER_PHRASE in ai_response:
+            self._start_speculation(session)
 
         return ai_response, is_diary
 
@@ -105,7 +256,135 @@ class ChatService:
         Returns:
             활성 세션 또는 None
         """
-        return self.chat_repo.get_active_session()
+        return self._load_active_session()
+
+    def list_ended_sessions(self, limit: int = 100) -> List[ChatSession]:
+        """
+        종료된 채팅 세션 목록 (최신순)
+
+        Args:
+            limit: 조회할 최대 세션 수 (활성 세션 포함 기준)
+
+        Returns:
+            종료된 세션 리스트
+        """
+        self.flush()
+        return [s for s in self.chat_repo.list_sessions(limit=limit) if not s.is_active]
+
+    def prepare_diary_generation(self) -> DiaryGenerationSettings:
+        """
+        generate_diary_from_messages에 넘길 설정을 지금의 사용자 설정으로 만듦
+
+        일괄 생성처럼 여러 스레드가 동시에 일기를 만들 때는 시작 전에 한 번 만들어 공유하면
+        작업마다 사용자 설정을 다시 읽지 않습니다.
+
+        Returns:
+            DiaryGenerationSettings
+        """
+        return DiaryGenerationSettings(
+            system_prompt=self._get_system_prompt(),
+            style=self.preferences_service.get_current_writing_style(),
+            diary_model=self._select_model(RequestType.DIARY),
+            summary_model=self._select_model(RequestType.SUMMARY),
+        )
+
+    def generate_diary_from_messages(
+        self,
+        messages: List[ChatMessage],
+        settings: Optional[DiaryGenerationSettings] = None,
+    ) -> str:
+        """
+        저장된 대화 내용만으로 일기 생성 (사용자와 주고받지 않는 일괄 생성용)
+
+        현재 스타일의 시스템 프롬프트와 컨텍스트 예산을 그대로 사용하고,
+        마지막에 일기 작성 요청을 덧붙여 한 번 호출합니다. 세션은 저장하지 않습니다.
+
+        Args:
+            messages: 대화 메시지 (시스템 메시지는 무시)
+            settings: prepare_diary_generation으로 미리 만든 설정 (None이면 지금 만듦)
+
+        Returns:
+            마커를 제거한 일기 본문
+
+        Raises:
+            ValueError: 대화에 사용자 메시지가 없거나 AI가 일기 형식으로 응답하지 않은 경우
+            Exception: AI API 호출 실패 시
+        """
+        conversation = [m for m in messages if m.role != MessageRole.SYSTEM]
+        if not any(m.role == MessageRole.USER for m in conversation):
+            raise ValueError("사용자 메시지가 없는 대화로는 일기를 만들 수 없습니다.")
+
+        settings = settings or self.prepare_diary_generation()
+
+        # 일회성 세션 (요약이 필요하면 이 세션의 metadata에만 기록됨)
+        session = ChatSession(session_id=str(uuid.uuid4()), messages=list(conversation))
+        session.messages.insert(0, ChatMessage(
+            role=MessageRole.SYSTEM,
+            content=settings.system_prompt,
+            timestamp=session.created_at,
+        ))
+        session.add_message(MessageRole.USER, DIARY_REQUEST_MESSAGE)
+
+        # 한 번만 호출하므로 세션별 채팅 객체를 만들지 않도록 session_id 없이 호출
+        conversation_history = self._build_conversation_history(
+            session, style=settings.style, summary_model=settings.summary_model
+        )
+        with tag_request_type(RequestType.DIARY.value):
+            ai_response = self.ai_client.chat(conversation_history, model=settings.diary_model)
+        ai_response = ai_response.encode('utf-8', errors='ignore').decode('utf-8')
+
+        if not self._is_diary_generated(ai_response):
+            raise ValueError("AI 응답이 일기 형식이 아닙니다.")
+
+        return self.extract_diary_content(ai_response)
+
+    @staticmethod
+    def extract_diary_content(ai_response: str) -> str:
+        """
+        AI 응답에서 [DIARY_START]/[DIARY_END] 사이의 일기 본문 추출
+
+        Args:
+            ai_response: AI 응답 텍스트
+
+        Returns:
+            일기 본문 (마커가 없으면 응답 전체)
+        """
+        if DIARY_START_MARKER in ai_response and DIARY_END_MARKER in ai_response:
+            start_idx = ai_response.find(DIARY_START_MARKER) + len(DIARY_START_MARKER)
+            end_idx = ai_response.find(DIARY_END_MARKER)
+            return ai_response[start_idx:end_idx].strip()
+        return ai_response.strip()
+
+    def get_session_token_usage(self, session: ChatSession) -> int:
+        """
+        세션에서 지금까지 사용한 토큰 수 (입력 + 출력)
+
+        Args:
+            session: 채팅 세션
+
+        Returns:
+            누적 토큰 수 (Provider가 보고한 값, 없으면 추정값)
+        """
+        usage = session.metadata.get(TOKEN_USAGE_METADATA_KEY) or {}
+        return usage.get("prompt_tokens", 0) + usage.get("completion_tokens", 0)
+
+    def get_system_prompt_hash(self) -> str:
+        """
+        현재 설정의 시스템 프롬프트 해시 (Provider 프롬프트 캐시 키용)
+
+        Returns:
+            SHA-256 hex 문자열
+        """
+        return self.prompt_builder.build().prompt_hash
+
+    def get_last_usage(self) -> Optional[TokenUsage]:
+        """
+        마지막 AI 호출의 토큰 사용량 (프롬프트 캐시 적중 포함)
+
+        Returns:
+            TokenUsage 또는 None (Provider가 제공하지 않는 경우)
+        """
+        return self._last_usage
 
     def end_current_session(self) -> bool:
         """
@@ -114,50 +393,394 @@ class ChatService:
         Returns:
             종료 성공 여부
         """
-        session = self.chat_repo.get_active_session()
+        session = self._load_active_session()
         if not session:
             return False
 
+        self._discard_speculation()
         session.end_session()
-        self.chat_repo.save_session(session)
+        self._persist(session)
+        self._set_active_session(None)
         return True
 
-    def _get_system_prompt(self) -> str:
+    def get_speculation_stats(self) -> Optional[SpeculationStats]:
         """
-        시스템 프롬프트 생성
-        AI를 "일기 작성을 위한 친절한 인터뷰어"로 설정
+        일기 초안 선작성 적중 통계
+
+        Returns:
+            SpeculationStats 또는 None (선작성을 사용하지 않는 경우)
+        """
+        return self.speculator.stats if self.speculator else None
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        예약된 세션 저장이 모두 끝날 때까지 대기
+
+        Args:
+            timeout: 최대 대기 시간 (초, None이면 끝날 때까지)
+
+        Returns:
+            모두 저장했으면 True (동기 저장 모드면 항상 True)
+        """
+        if self.session_writer is None:
+            return True
+        return self.session_writer.flush(timeout)
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """
+        남은 세션 저장을 끝내고 저장기 종료 (프로그램 종료 시 호출)
+
+        Args:
+            timeout: 최대 대기 시간 (초, None이면 끝날 때까지)
+
+        Returns:
+            모두 저장했으면 True
         """
-        # 사용자가 선택한 스타일의 상세한 설명 + 예시 문장 가져오기
-        style_instruction = self.preferences_service.get_style_prompt_instruction()
+        if self.speculator:
+            self.speculator.close()
+        self._draft_executor.shutdown(wait=False, cancel_futures=True)
+        if self.session_writer is None:
+            return True
+        return self.session_writer.close(timeout)
+
+    def _start_speculation(self, session: ChatSession) -> None:
+        """
+        일기 초안 선작성 시작
 
-        return f"""당신은 사용자의 하루를 듣고 일기를 작성하는 친절한 인터뷰어입니다.
+        세션 복사본에 수락 메시지를 붙여 백그라운드에서 일기를 요청합니다.
+        세션별 채팅 객체와 섞이지 않도록 session_id 없이 호출합니다.
+        """
+        if not self.speculator:
+            return
+
+        draft_session = session.snapshot()
+        draft_session.add_message(MessageRole.USER, SPECULATIVE_ACCEPT_MESSAGE)
+        try:
+            token_budget = self._get_remaining_request_budget(draft_session)
+        except ValueError:
+            return  # 세션 예산이 부족하면 미리 만들지 않음
+        compare_styles = self.preferences_service.is_compare_styles_enabled()
+
+        def generate() -> tuple:
+            style_drafts = self._start_style_drafts(draft_session, token_budget) if compare_styles else {}
+            try:
+                conversation_history = self._build_conversation_history(draft_session, token_budget=token_budget)
+                request_tokens = self.token_estimator.count_history(conversation_history)
+                with tag_request_type(SPECULATIVE_DIARY_REQUEST_TYPE):
+                    ai_response = self.ai_client.chat(
+                        conversation_history, model=self._select_model(RequestType.DIARY)
+                    )
+                usage = self.ai_client.get_last_usage()
+                ai_response = ai_response.encode('utf-8', errors='ignore').decode('utf-8')
+                if not self._is_diary_generated(ai_response):
+                    raise ValueError("AI 응답이 일기 형식이 아닙니다.")
+            except Exception:
+                self._cancel_style_drafts(style_drafts)
+                raise
+            return ai_response, request_tokens, style_drafts, usage
+
+        self.speculator.start(session.session_id, session.get_message_count(), generate)
+
+    def _claim_speculation(
+        self, session: ChatSession, user_message: str, request_type: RequestType
+    ) -> Optional[tuple]:
+        """
+        사용자가 일기 작성 제안에 바로 수락했으면 선작성한 초안 반환, 아니면 선작성 버림
 
-목표:
-1. 사용자와 자연스럽게 대화하며 하루 일과를 듣기
-2. 구체적인 사건, 감정, 생각을 파악하기
-3. 충분한 정보가 모이면 아래 스타일로 일기 초안 제안
+        Returns:
+            (AI 응답, 추정 요청 토큰 수, 스타일별 초안 Future, 토큰 사용량) 또는 None (새로 호출해야 함)
+        """
+        if not self.speculator:
+            return None
+
+        result = None
+        if request_type == RequestType.DIARY and is_affirmative(user_message):
+            # 사용자 메시지를 추가하기 전 메시지 수가 제안 직후와 같아야 함
+            result = self.speculator.claim(session.session_id, session.get_message_count() - 1)
+        self.speculator.discard()
+        return result
+
+    def _start_style_drafts(
+        self, draft_session: ChatSession, token_budget: Optional[int]
+    ) -> Dict[WritingStyle, Future]:
+        """
+        현재 스타일을 뺀 나머지 스타일의 일기 초안을 동시에 요청
 
-일기 작성 스타일:
-{style_instruction}
+        Args:
+            draft_session: 일기 요청까지 포함한 세션 복사본 (읽기만 함)
+            token_budget: 요청 하나의 토큰 예산
 
-대화 스타일:
-- 친근하고 공감적으로 대화
-- 짧고 자연스러운 질문 (긴 설명 X)
-- 사용자가 편하게 답변할 수 있도록 유도
-- "오늘 어땠어요?", "그때 기분이 어땠나요?" 등 자연스러운 질문
+        Returns:
+            스타일 → (일기 본문, 추정 요청 토큰 수) Future
+        """
+        current_style = self.preferences_service.get_current_writing_style()
+        return {
+            style: self._draft_executor.submit(self._generate_style_draft, draft_session, style, token_budget)
+            for style in WritingStyle
+            if style != current_style
+        }
+
+    def _generate_style_draft(
+        self, draft_session: ChatSession, style: WritingStyle, token_budget: Optional[int]
+    ) -> tuple[str, int]:
+        """시스템 프롬프트만 다른 스타일로 바꿔 일기 초안 생성 (세션별 채팅 객체 없이 호출)"""
+        session = draft_session.snapshot()
+        system_prompt = self.prompt_builder.build(style).text
+        if session.messages and session.messages[0].role == MessageRole.SYSTEM:
+            session.messages[0] = replace(
+                session.messages[0], content=system_prompt, token_count=None, token_estimator=None
+            )
+        else:
+            session.messages.insert(0, ChatMessage(
+                role=MessageRole.SYSTEM, content=system_prompt, timestamp=session.created_at
+            ))
+
+        conversation_history = self._build_conversation_history(session, token_budget=token_budget, style=style)
+        request_tokens = self.token_estimator.count_history(conversation_history)
+        with tag_request_type(STYLE_DRAFT_REQUEST_TYPE):
+            ai_response = self.ai_client.chat(
+                conversation_history, model=self._select_model(RequestType.DIARY)
+            )
+        ai_response = ai_response.encode('utf-8', errors='ignore').decode('utf-8')
+        if not self._is_diary_generated(ai_response):
+            raise ValueError("AI 응답이 일기 형식이 아닙니다.")
+        return self.extract_diary_content(ai_response), request_tokens
 
-중요:
-- 사용자가 충분히 이야기했다고 판단되면, "오늘 대화를 바탕으로 일기를 작성해드릴까요?"라고 물어보세요.
-- 사용자가 일기 작성을 요청하면, 반드시 다음 형식으로 응답하세요:
+    def _collect_style_drafts(
+        self, session: ChatSession, ai_response: str, style_drafts: Dict[WritingStyle, Future]
+    ) -> Dict[WritingStyle, str]:
+        """
+        스타일별 초안 모으기 (실패한 스타일은 빼고, 사용량은 추정값으로 세션에 기록)
 
-[DIARY_START]
-(여기에 작성된 일기 내용)
-[DIARY_END]
+        Returns:
+            스타일 → 일기 본문 (현재 스타일이 첫 번째, 비교를 끈 경우 빈 dict)
+        """
+        if not style_drafts:
+            return {}
+
+        drafts = {self.preferences_service.get_current_writing_style(): self.extract_diary_content(ai_response)}
+        for style, future in style_drafts.items():
+            try:
+                content, request_tokens = future.result()
+            except Exception:
+                continue
+            drafts[style] = content
+            self._record_session_usage(session, request_tokens, content, update_last_usage=False)
+        return drafts
+
+    def _cancel_style_drafts(self, style_drafts: Dict[WritingStyle, Future]) -> None:
+        """아직 시작하지 않은 스타일 초안 요청 취소"""
+        for future in style_drafts.values():
+            future.cancel()
+
+    def _discard_speculation(self) -> None:
+        """진행 중인 선작성 버리기"""
+        if self.speculator:
+            self.speculator.discard()
+
+    def _load_active_session(self) -> Optional[ChatSession]:
+        """활성 세션 (처음 한 번만 저장소에서 첫 메시지 + 최근 메시지만 읽음)"""
+        if not self._active_session_loaded:
+            self._set_active_session(self.chat_repo.get_active_session_tail(self.resume_tail_size))
+        return self._active_session
+
+    def _ensure_history_loaded(self, session: ChatSession) -> None:
+        """
+        AI 컨텍스트에 필요하면 읽지 않았던 중간 메시지를 저장소에서 채움
 
-- 일기가 아닌 일반 대화/질문은 위 형식을 사용하지 마세요.
-- 항상 한국어로 대화하세요.
-- 짧고 간결하게 한 번에 하나의 질문만 하세요.
-"""
+        요약이 생략된 메시지를 모두 덮고 있으면 읽지 않습니다.
+        """
+        if not session.is_partial:
+            return
+        if self.context_manager and self.context_manager.covers_omitted(session):
+            return
+        session.restore_omitted(
+            self.chat_repo.load_messages(session.session_id, 1, 1 + session.omitted_messages)
+        )
+
+    def _set_active_session(self, session: Optional[ChatSession]) -> None:
+        """메모리의 활성 세션 교체"""
+        self._active_session = session
+        self._active_session_loaded = True
+
+    def _persist(self, session: ChatSession) -> None:
+        """세션 저장 (저장기가 있으면 백그라운드, 없으면 즉시)
+
+        다른 곳에서 같은 세션을 먼저 저장했으면 최신 메시지 뒤에 이 세션에서 추가한 메시지를
+        다시 붙여 저장하고, 합친 메시지가 메모리의 활성 세션에도 반영됩니다.
+        """
+        if self.session_writer is None:
+            save_with_merge(self.chat_repo, session)
+        else:
+            self.session_writer.submit(session)
+
+    def _build_conversation_history(
+        self,
+        session: ChatSession,
+        token_budget: Optional[int] = None,
+        style: Optional[WritingStyle] = None,
+        summary_model: Optional[str] = None,
+    ) -> list[dict]:
+        """
+        AI 호출용 대화 히스토리 구성
+
+        context_manager가 있으면 오래된 대화를 요약으로 접어 예산을 맞추고,
+        일기 작성 요청으로 보이면 더 큰 예산을 사용합니다.
+        일기 작성 요청이면 대화와 비슷한 스타일 예시를 시스템 메시지들 뒤에 따로 붙입니다
+        (세션 내내 같은 시스템 프롬프트는 그대로 두어 Provider 프롬프트 캐시 유지).
+
+        Args:
+            session: 현재 세션 (마지막 메시지는 방금 추가한 사용자 메시지)
+            token_budget: 요청 예산보다 더 작게 제한할 토큰 수 (세션 예산의 남은 양)
+            style: 예시를 고를 스타일 (None이면 현재 선택된 스타일)
+            summary_model: 대화 요약 모델 (None이면 사용자 설정의 모델 라우팅으로 선택)
+
+        Returns:
+            [{"role": "...", "content": "..."}, ...] 형식
+        """
+        self._ensure_history_loaded(session)
+        for_diary = self._is_diary_request(session)
+        examples_prompt = self._get_style_examples_prompt(session, style) if for_diary else None
+
+        if not self.context_manager:
+            history = session.get_conversation_history()
+        else:
+            history = self.context_manager.build_history(
+                session,
+                for_diary=for_diary,
+                summary_model=summary_model or self._select_model(RequestType.SUMMARY),
+                token_budget=token_budget,
+                reserved_tokens=(
+                    self.token_estimator.count_text(examples_prompt) + self.token_estimator.message_overhead
+                    if examples_prompt else 0
+                ),
+            )
+
+        if examples_prompt:
+            position = 0
+            while position < len(history) and history[position]["role"] == MessageRole.SYSTEM.value:
+                position += 1
+            history.insert(position, {"role": MessageRole.SYSTEM.value, "content": examples_prompt})
+        return history
+
+    def _get_style_examples_prompt(self, session: ChatSession, style: Optional[WritingStyle]) -> Optional[str]:
+        """지금까지의 사용자 메시지(와 대화 요약)에 맞춰 고른 스타일 예시 안내"""
+        parts = [m.content for m in session.messages if m.role == MessageRole.USER]
+        summary = session.metadata.get(SUMMARY_METADATA_KEY) or {}
+        if summary.get("text"):
+            parts.append(summary["text"])
+        return self.preferences_service.get_style_examples_prompt("\n".join(parts), style)
+
+    def _get_remaining_request_budget(self, session: ChatSession) -> Optional[int]:
+        """
+        세션 예산 중 이번 요청에 쓸 수 있는 토큰 수
+
+        Returns:
+            요청 토큰 한도 (세션 예산이 없으면 None)
+
+        Raises:
+            ValueError: 시스템 프롬프트와 방금 보낸 메시지조차 보낼 수 없을 만큼 예산이 남지 않은 경우
+        """
+        if self.session_token_budget is None:
+            return None
+
+        remaining = (
+            self.session_token_budget
+            - self.get_session_token_usage(session)
+            - RESPONSE_TOKEN_RESERVE
+        )
+        minimum = sum(
+            self.token_estimator.count_message(m)
+            for m in session.messages
+            if m.role == MessageRole.SYSTEM
+        ) + self.token_estimator.count_message(session.messages[-1])
+
+        if remaining < minimum:
+            raise ValueError(
+                f"이 대화의 토큰 예산({self.session_token_budget:,})을 모두 사용했습니다. "
+                "일기를 작성하거나 새 대화를 시작해주세요."
+            )
+        return remaining
+
+    def _record_session_usage(
+        self,
+        session: ChatSession,
+        estimated_prompt_tokens: Optional[int],
+        ai_response: str,
+        usage: Optional[TokenUsage] = None,
+        update_last_usage: bool = True,
+    ) -> None:
+        """세션 누적 토큰 사용량 갱신 (Provider 사용량이 있으면 그 값, 없으면 추정값)
+
+        usage는 호출한 스레드에서 바로 읽어 전달합니다. 스타일 비교 초안처럼 사용량을
+        따로 받지 않는 호출은 추정값을 기록하고 표시용 마지막 사용량도 바꾸지 않습니다.
+        """
+        if update_last_usage:
+            self._last_usage = usage
+        if usage:
+            prompt_tokens, completion_tokens = usage.prompt_tokens, usage.completion_tokens
+        else:
+            prompt_tokens = estimated_prompt_tokens or 0
+            completion_tokens = self.token_estimator.count_text(ai_response)
+
+        totals = session.metadata.setdefault(TOKEN_USAGE_METADATA_KEY, {})
+        totals["prompt_tokens"] = totals.get("prompt_tokens", 0) + prompt_tokens
+        totals["completion_tokens"] = totals.get("completion_tokens", 0) + completion_tokens
+        totals["requests"] = totals.get("requests", 0) + 1
+
+    def _request_reply(
+        self,
+        conversation_history: List[dict],
+        session_id: str,
+        model: Optional[str],
+        on_chunk: Optional[Callable[[str], None]],
+    ) -> str:
+        """AI 응답 요청 (on_chunk가 있으면 스트리밍으로 받으며 조각마다 전달)"""
+        if not on_chunk:
+            return self.ai_client.chat(conversation_history, session_id=session_id, model=model)
+
+        chunks = []
+        for chunk in self.ai_client.chat_stream(conversation_history, session_id=session_id, model=model):
+            chunks.append(chunk)
+            on_chunk(chunk)
+        return "".join(chunks)
+
+    def _select_model(self, request_type: RequestType) -> Optional[str]:
+        """
+        요청 종류에 맞는 모델 선택 (사용자 설정의 모델 라우팅)
+
+        Returns:
+            모델 이름 (None이면 AI 클라이언트 기본 모델)
+        """
+        if not self.provider:
+            return None
+        return self.preferences_service.get_routed_model(self.provider, request_type)
+
+    def _is_diary_request(self, session: ChatSession) -> bool:
+        """
+        마지막 사용자 메시지가 일기 작성 요청인지 추정
+
+        직전 AI 응답이 일기 작성을 제안했거나, 사용자가 직접 일기를 요청한 경우 True
+        """
+        messages = session.messages
+        if not messages or messages[-1].role != MessageRole.USER:
+            return False
+
+        user_message = messages[-1].content
+        if "일기" in user_message and any(word in user_message for word in ("써", "작성")):
+            return True
+
+        for message in reversed(messages[:-1]):
+            if message.role == MessageRole.ASSISTANT:
+                return DIARY_OFFER_PHRASE in message.content
+        return False
+
+    def _get_system_prompt(self) -> str:
+        """
+        시스템 프롬프트 생성
+        AI를 "일기 작성을 위한 친절한 인터뷰어"로 설정 (스타일/예시가 그대로면 캐시 사용)
+        """
+        return self.prompt_builder.build().text
 
     def _get_ai_greeting(self, session: ChatSession) -> str:
         """
@@ -174,7 +797,8 @@ class ChatService:
             *conversation_history,
             {"role": "user", "content": "대화를 시작해줘. 간단하고 친근하게 인사하고 오늘 하루에 대해 물어봐줘."}
         ]
-        return self.ai_client.chat(greeting_prompt)
+        with tag_request_type(RequestType.GREETING.value):
+            return self.ai_client.chat(greeting_prompt, model=self._select_model(RequestType.GREETING))
 
     def _is_diary_generated(self, ai_response: str) -> bool:
         """
@@ -186,4 +810,4 @@ class ChatService:
         Returns:
             일기 생성 여부
         """
-        return "[DIARY_START]" in ai_response and "[DIARY_END]" in ai_response
+        return DIARY_START_MARKER in ai_response and DIARY_END_MARKER in ai_response
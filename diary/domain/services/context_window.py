@@ -0,0 +1,275 @@
+"""대화 컨텍스트 윈도우 관리 (토큰 예산 + 롤링 요약)
+
+긴 대화에서도 AI 요청 크기가 일정 수준을 넘지 않도록 관리합니다.
+- 최근 대화는 원문 그대로 유지
+- 오래된 대화는 롤링 요약으로 접어서 ChatSession.metadata에 저장
+- 요약은 새로 밀려난 메시지만 반영하여 점진적으로 갱신
+- 요약 후에도 예산을 넘으면(아주 긴 메시지 등) 보내기 전에 잘라서 Provider 오류를 피함
+"""
+
+from typing import List, Optional
+
+from diary.domain.entities.ai_credential import AIProvider
+from diary.domain.entities.chat_message import ChatMessage, MessageRole
+from diary.domain.entities.chat_session import ChatSession
+from diary.domain.entities.model_routing import RequestType
+from diary.domain.interfaces.ai_client import AIClientInterface
+from diary.domain.services.telemetry_service import tag_request_type
+from diary.domain.services.token_estimator import TokenEstimator
+
+
+# Provider별 기본 요청 토큰 예산 (시스템 프롬프트 + 요약 + 최근 대화)
+DEFAULT_REQUEST_TOKEN_BUDGETS = {
+    AIProvider.OPENAI: 12000,
+    AIProvider.ANTHROPIC: 12000,
+    AIProvider.GOOGLE: 16000,
+}
+
+# session.metadata에 롤링 요약을 저장하는 키
+SUMMARY_METADATA_KEY = "context_summary"
+
+SUMMARY_SYSTEM_PROMPT = """당신은 일기 작성을 위한 대화 기록을 요약하는 도우미입니다.
+
+규칙:
+- 기존 요약이 있으면 그 내용을 유지하면서 새 대화 내용을 덧붙여 하나의 요약으로 만드세요.
+- 나중에 이 요약만으로 일기를 쓸 수 있도록 구체적인 사건, 시간, 장소, 사람, 감정, 생각을 빠짐없이 남기세요.
+- 사용자가 직접 한 인상적인 표현은 가능한 한 그대로 인용하세요.
+- 인사말이나 AI의 질문 같은 군더더기는 생략하세요.
+- 항상 한국어로, 불릿 목록 형태로 작성하세요.
+"""
+
+
+# 긴 메시지를 자를 때 가운데에 넣는 표시
+TRUNCATION_MARKER = "\n…(중략)…\n"
+
+
+def estimate_tokens(text: str) -> int:
+    """텍스트의 대략적인 토큰 수 추정 (오프라인, 보수적)
+
+    한글 등 비 ASCII 문자는 글자당 약 1토큰, ASCII는 4글자당 약 1토큰으로 계산합니다.
+    Provider별 보정이 필요하면 TokenEstimator.for_provider()를 사용하세요.
+
+    Args:
+        text: 추정할 텍스트
+
+    Returns:
+        추정 토큰 수
+    """
+    return TokenEstimator().count_text(text)
+
+
+class ContextWindowManager:
+    """토큰 예산 기반 대화 컨텍스트 구성기
+
+    Attributes:
+        ai_client: 요약 생성에 사용할 AI 클라이언트
+        request_token_budget: 한 번의 요청에 허용하는 최대 토큰 수 (추정치)
+        diary_token_budget: 일기 생성 요청에 허용하는 최대 토큰 수
+        min_recent_messages: 요약으로 접지 않고 원문으로 유지할 최근 메시지 수
+        estimator: 토큰 수 추정기
+    """
+
+    # 요약 시 최근 대화를 예산의 이 비율까지만 남겨서, 매 턴마다 요약하지 않도록 함
+    FOLD_TARGET_RATIO = 0.6
+
+    def __init__(
+        self,
+        ai_client: AIClientInterface,
+        request_token_budget: int = 12000,
+        diary_token_budget: Optional[int] = None,
+        min_recent_messages: int = 6,
+        estimator: Optional[TokenEstimator] = None,
+    ):
+        """
+        Args:
+            ai_client: 요약 생성용 AI 클라이언트 (인터페이스)
+            request_token_budget: 요청당 토큰 예산
+            diary_token_budget: 일기 생성 요청 토큰 예산 (기본: 요청 예산의 2배)
+            min_recent_messages: 요약으로 접지 않고 원문으로 유지할 최근 메시지 수
+            estimator: 토큰 수 추정기 (기본: 보수적 기본 보정값)
+
+        Raises:
+            ValueError: 예산이 0 이하인 경우
+        """
+        if request_token_budget <= 0:
+            raise ValueError("토큰 예산은 0보다 커야 합니다")
+
+        self.ai_client = ai_client
+        self.request_token_budget = request_token_budget
+        self.diary_token_budget = diary_token_budget or request_token_budget * 2
+        self.min_recent_messages = min_recent_messages
+        self.estimator = estimator or TokenEstimator()
+
+    @classmethod
+    def for_provider(
+        cls,
+        provider: AIProvider,
+        ai_client: AIClientInterface,
+        request_token_budget: Optional[int] = None,
+    ) -> "ContextWindowManager":
+        """Provider 기본 예산과 토큰 추정 보정값으로 생성
+
+        Args:
+            provider: AI 서비스 제공자
+            ai_client: 요약 생성용 AI 클라이언트
+            request_token_budget: 기본값 대신 사용할 예산 (선택)
+
+        Returns:
+            ContextWindowManager 인스턴스
+        """
+        budget = request_token_budget or DEFAULT_REQUEST_TOKEN_BUDGETS.get(provider, 12000)
+        return cls(
+            ai_client=ai_client,
+            request_token_budget=budget,
+            estimator=TokenEstimator.for_provider(provider),
+        )
+
+    def covers_omitted(self, session: ChatSession) -> bool:
+        """
+        일부만 읽은 세션의 생략된 메시지가 모두 요약에 반영되어 있는지
+
+        True면 생략된 메시지를 읽지 않고도 build_history를 만들 수 있습니다.
+        """
+        summary = session.metadata.get(SUMMARY_METADATA_KEY) or {}
+        return summary.get("covered", 0) >= session.omitted_messages
+
+    def estimate_message_tokens(self, message: ChatMessage) -> int:
+        """메시지 하나의 토큰 수 추정 (메시지에 캐시된 값 재사용)"""
+        return self.estimator.count_message(message)
+
+    def build_history(
+        self,
+        session: ChatSession,
+        for_diary: bool = False,
+        summary_model: Optional[str] = None,
+        token_budget: Optional[int] = None,
+        reserved_tokens: int = 0,
+    ) -> List[dict]:
+        """
+        예산에 맞춘 AI 호출용 대화 히스토리 생성
+
+        예산을 넘는 오래된 메시지는 롤링 요약으로 접고, 요약은 session.metadata에 저장합니다.
+        요약 후에도 예산을 넘으면 오래된 최근 메시지부터 빼고, 마지막 메시지는 가운데를 잘라 보냅니다.
+        (세션 저장은 호출자가 담당)
+
+        Args:
+            session: 현재 채팅 세션
+            for_diary: 일기 생성 요청 여부 (True면 더 큰 예산 사용)
+            summary_model: 요약 생성에 사용할 모델 (None이면 클라이언트 기본 모델)
+            token_budget: 이번 요청에만 적용할 더 작은 예산 (예: 세션 예산의 남은 양)
+            reserved_tokens: 호출자가 히스토리에 따로 덧붙일 메시지의 토큰 수 (예산에서 뺌)
+
+        Returns:
+            [{"role": "system", "content": "..."}, ...] 형식
+        """
+        budget = self.diary_token_budget if for_diary else self.request_token_budget
+        if token_budget is not None:
+            budget = min(budget, token_budget)
+        budget -= reserved_tokens
+
+        system_messages, conversation = self._split_system_messages(session.messages)
+        summary = session.metadata.get(SUMMARY_METADATA_KEY) or {}
+        # 요약의 covered는 전체 대화 기준 위치 (일부만 읽은 세션이면 생략된 메시지 수만큼 당겨서 사용)
+        offset = session.omitted_messages
+        covered = min(max(summary.get("covered", 0) - offset, 0), len(conversation))
+        pending = conversation[covered:]
+
+        fixed_tokens = sum(self.estimate_message_tokens(m) for m in system_messages)
+        if summary.get("text"):
+            fixed_tokens += self.estimator.count_text(summary["text"]) + self.estimator.message_overhead
+
+        pending_tokens = sum(self.estimate_message_tokens(m) for m in pending)
+        if fixed_tokens + pending_tokens > budget and len(pending) > self.min_recent_messages:
+            # 예산 초과: 목표 비율까지 최근 대화만 남기고 나머지는 요약으로 접음
+            target = int(budget * self.FOLD_TARGET_RATIO) - fixed_tokens
+            keep = self._count_recent_within(pending, target)
+            to_fold = pending[: len(pending) - keep]
+            if to_fold:
+                summary = self._fold_into_summary(session, summary, to_fold, covered + offset, summary_model)
+                pending = pending[len(to_fold):]
+                fixed_tokens = sum(self.estimate_message_tokens(m) for m in system_messages)
+                fixed_tokens += self.estimator.count_text(summary["text"]) + self.estimator.message_overhead
+
+        history = [{"role": m.role.value, "content": m.content} for m in system_messages]
+        if summary.get("text"):
+            history.append({
+                "role": MessageRole.SYSTEM.value,
+                "content": f"지금까지의 대화 요약 (이전 대화는 생략됨):\n{summary['text']}",
+            })
+        history.extend(self._trim_to_budget(pending, budget - fixed_tokens))
+        return history
+
+    def _trim_to_budget(self, messages: List[ChatMessage], token_limit: int) -> List[dict]:
+        """
+        요약 후에도 한도를 넘는 최근 메시지 정리 (세션 원본은 건드리지 않음)
+
+        마지막 메시지(방금 받은 사용자 메시지)는 항상 남기고, 그 앞의 메시지를 오래된 것부터 뺍니다.
+        마지막 메시지 혼자서도 한도를 넘으면 앞뒤만 남기고 가운데를 잘라냅니다.
+        """
+        kept = list(messages)
+        total = sum(self.estimate_message_tokens(m) for m in kept)
+        while total > token_limit and len(kept) > 1:
+            total -= self.estimate_message_tokens(kept.pop(0))
+
+        history = [{"role": m.role.value, "content": m.content} for m in kept]
+        if history and total > token_limit:
+            last = kept[-1]
+            allowed = max(0, token_limit - self.estimator.message_overhead)
+            history[-1]["content"] = self._truncate_middle(last.content, allowed, last.token_count or 1)
+        return history
+
+    def _truncate_middle(self, text: str, token_limit: int, text_tokens: int) -> str:
+        """토큰 한도에 맞게 텍스트 앞뒤만 남기기 (글자 수 비율로 근사)"""
+        keep_chars = int(len(text) * token_limit / max(1, text_tokens) * 0.95) - len(TRUNCATION_MARKER)
+        if keep_chars <= 0:
+            return text[: max(1, token_limit)]
+        head = keep_chars // 2
+        return text[:head] + TRUNCATION_MARKER + text[len(text) - (keep_chars - head):]
+
+    def _split_system_messages(self, messages: List[ChatMessage]) -> tuple[List[ChatMessage], List[ChatMessage]]:
+        """앞쪽의 시스템 프롬프트와 나머지 대화를 분리"""
+        index = 0
+        while index < len(messages) and messages[index].role == MessageRole.SYSTEM:
+            index += 1
+        return messages[:index], messages[index:]
+
+    def _count_recent_within(self, messages: List[ChatMessage], token_limit: int) -> int:
+        """뒤에서부터 토큰 한도 안에 들어가는 메시지 수 (최소 min_recent_messages)"""
+        used = 0
+        count = 0
+        for message in reversed(messages):
+            used += self.estimate_message_tokens(message)
+            if used > token_limit and count >= self.min_recent_messages:
+                break
+            count += 1
+        return count
+
+    def _fold_into_summary(
+        self,
+        session: ChatSession,
+        summary: dict,
+        to_fold: List[ChatMessage],
+        covered: int,
+        summary_model: Optional[str] = None,
+    ) -> dict:
+        """기존 요약에 새로 밀려난 메시지를 반영하여 요약 갱신"""
+        transcript = "\n".join(
+            f"{'사용자' if m.role == MessageRole.USER else 'AI'}: {m.content}"
+            for m in to_fold
+        )
+        previous = summary.get("text") or "(없음)"
+        with tag_request_type(RequestType.SUMMARY.value):
+            summary_text = self.ai_client.chat([
+                {"role": "system", "content": SUMMARY_SYSTEM_PROMPT},
+                {
+                    "role": "user",
+                    "content": f"기존 요약:\n{previous}\n\n새 대화:\n{transcript}\n\n위 내용을 합쳐 갱신된 요약을 작성해주세요.",
+                },
+            ], model=summary_model)
+
+        new_summary = {
+            "text": summary_text.strip(),
+            "covered": covered + len(to_fold),
+        }
+        session.metadata[SUMMARY_METADATA_KEY] = new_summary
+        return new_summary
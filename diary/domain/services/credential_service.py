@@ -9,6 +9,8 @@ from diary.domain.interfaces.credential_repository import CredentialRepositoryIn
 class CredentialService:
     """AI 인증 정보 관리 서비스
 
+    여러 번 읽고 고치는 작업은 저장소의 batch() 안에서 한 번에 저장합니다.
+
     비즈니스 로직:
     - API 키 저장 시 기본 AI 자동 설정
     - 기본 AI 변경 시 기존 기본 AI 해제
@@ -44,29 +46,30 @@ class CredentialService:
         if not api_key or not api_key.strip():
             raise ValueError("API 키는 비어있을 수 없습니다")
 
-        # 기존 credential이 있는지 확인
-        existing = self.credential_repo.get_by_provider(provider)
-
-        if existing:
-            # 업데이트
-            existing.update_api_key(api_key)
-            if name:
-                existing.name = name
-            self.credential_repo.update(existing)
-            return existing
-        else:
-            # 신규 생성
-            all_credentials = self.credential_repo.get_all()
-            is_first = len(all_credentials) == 0
-
-            credential = AICredential(
-                provider=provider,
-                api_key=api_key.strip(),
-                is_default=is_first,  # 첫 번째면 기본 AI로 설정
-                name=name,
-            )
-            self.credential_repo.save(credential)
-            return credential
+        with self.credential_repo.batch():
+            # 기존 credential이 있는지 확인
+            existing = self.credential_repo.get_by_provider(provider)
+
+            if existing:
+                # 업데이트
+                existing.update_api_key(api_key)
+                if name:
+                    existing.name = name
+                self.credential_repo.update(existing)
+                return existing
+            else:
+                # 신규 생성
+                all_credentials = self.credential_repo.get_all()
+                is_first = len(all_credentials) == 0
+
+                credential = AICredential(
+                    provider=provider,
+                    api_key=api_key.strip(),
+                    is_default=is_first,  # 첫 번째면 기본 AI로 설정
+                    name=name,
+                )
+                self.credential_repo.save(credential)
+                return credential
 
     def set_default_provider(self, provider: AIProvider) -> AICredential:
         """기본 AI 변경
@@ -83,21 +86,22 @@ class CredentialService:
         Raises:
             ValueError: 해당 provider의 credential이 존재하지 않는 경우
         """
-        credential = self.credential_repo.get_by_provider(provider)
-        if not credential:
-            raise ValueError(f"{provider.value} 인증 정보가 존재하지 않습니다")
+        with self.credential_repo.batch():
+            credential = self.credential_repo.get_by_provider(provider)
+            if not credential:
+                raise ValueError(f"{provider.value} 인증 정보가 존재하지 않습니다")
 
-        # 기존 기본 AI 해제
-        current_default = self.credential_repo.get_default()
-        if current_default and current_default.provider != provider:
-            current_default.unset_as_default()
-            self.credential_repo.update(current_default)
+            # 기존 기본 AI 해제
+            current_default = self.credential_repo.get_default()
+            if current_default and current_default.provider != provider:
+                current_default.unset_as_default()
+                self.credential_repo.update(current_default)
 
-        # 새로운 기본 AI 설정
-        credential.set_as_default()
-        self.credential_repo.update(credential)
+            # 새로운 기본 AI 설정
+            credential.set_as_default()
+            self.credential_repo.update(credential)
 
-        return credential
+            return credential
 
     def get_default_credential(self) -> Optional[AICredential]:
         """기본 AI 인증 정보 조회
@@ -143,22 +147,23 @@ class CredentialService:
         Raises:
             ValueError: 해당 provider의 credential이 존재하지 않는 경우
         """
-        credential = self.credential_repo.get_by_provider(provider)
-        if not credential:
-            raise ValueError(f"{provider.value} 인증 정보가 존재하지 않습니다")
-
-        was_default = credential.is_default
-
-        # 삭제
-        self.credential_repo.delete(provider)
-
-        # 기본 AI였다면 다른 AI를 기본으로 설정
-        if was_default:
-            remaining = self.credential_repo.get_all()
-            if remaining:
-                first = remaining[0]
-                first.set_as_default()
-                self.credential_repo.update(first)
+        with self.credential_repo.batch():
+            credential = self.credential_repo.get_by_provider(provider)
+            if not credential:
+                raise ValueError(f"{provider.value} 인증 정보가 존재하지 않습니다")
+
+            was_default = credential.is_default
+
+            # 삭제
+            self.credential_repo.delete(provider)
+
+            # 기본 AI였다면 다른 AI를 기본으로 설정
+            if was_default:
+                remaining = self.credential_repo.get_all()
+                if remaining:
+                    first = remaining[0]
+                    first.set_as_default()
+                    self.credential_repo.update(first)
 
     def has_any_credential(self) -> bool:
         """등록된 AI 인증 정보가 있는지 확인
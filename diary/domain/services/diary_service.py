@@ -7,6 +7,7 @@ Domain Layer의 서비스로, 일기 관련 비즈니스 로직을 관리합니
 from datetime import date
 from typing import Optional, List, Tuple
 from diary.domain.entities.diary import Diary
+from diary.domain.exceptions import DiaryConflictError
 from diary.domain.interfaces.diary_repository import DiaryRepositoryInterface
 
 
@@ -54,24 +55,65 @@ class DiaryService:
         # 저장
         return self.diary_repo.save(diary)
 
-    def update_diary(self, diary_id: str, new_content: str) -> Diary:
+    def create_diaries(self, entries: List[Tuple[date, str]]) -> List[Diary]:
+        """
+        여러 날짜의 일기를 한 번에 작성 (일괄 생성용)
+
+        이미 일기가 있는 날짜는 건너뛰고, 나머지는 저장소에 한 번에 저장합니다.
+
+        Args:
+            entries: (일기 날짜, 내용) 리스트
+
+        Returns:
+            새로 저장된 일기 리스트 (건너뛴 날짜 제외)
+
+        Raises:
+            ValueError: 내용이 비어있거나 같은 날짜가 중복된 경우
+            PartialSaveError: 저장소가 일부만 저장한 경우
+        """
+        seen_dates = set()
+        for diary_date, content in entries:
+            if not content or not content.strip():
+                raise ValueError(f"{diary_date} 일기 내용은 비어있을 수 없습니다.")
+            if diary_date in seen_dates:
+                raise ValueError(f"{diary_date} 날짜가 중복되었습니다. 하루에 하나의 일기만 작성할 수 있습니다.")
+            seen_dates.add(diary_date)
+
+        diaries = [
+            Diary(diary_date=diary_date, content=content.strip())
+            for diary_date, content in entries
+            if not self.diary_repo.exists_on_date(diary_date)
+        ]
+        if not diaries:
+            return []
+
+        return self.diary_repo.save_many(diaries)
+
+    def update_diary(self, diary_id: str, new_content: str, expected_version: Optional[int] = None) -> Diary:
         """
         일기 수정
 
+        저장소는 읽어온 버전 그대로일 때만 저장하므로, 조회와 저장 사이에 다른 곳에서 수정하면
+        덮어쓰지 않고 DiaryConflictError가 발생합니다.
+
         Args:
             diary_id: 일기 ID
             new_content: 새로운 내용
+            expected_version: 수정 화면에 보여준 일기의 버전 (주어지면 그 버전일 때만 수정)
 
         Returns:
             수정된 일기
 
         Raises:
             ValueError: 일기가 존재하지 않거나 내용이 비어있는 경우
+            DiaryConflictError: 다른 곳에서 먼저 수정한 경우
         """
         # 일기 조회
         diary = self.diary_repo.get_by_id(diary_id)
         if not diary:
             raise ValueError(f"ID {diary_id}의 일기를 찾을 수 없습니다.")
+        if expected_version is not None and diary.version != expected_version:
+            raise DiaryConflictError(diary_id, expected_version, diary.version)
 
         # 엔티티의 비즈니스 로직 사용
         diary.update_content(new_content)
@@ -151,6 +193,25 @@ class DiaryService:
             cursor=cursor, limit=limit, start_date=start_date, end_date=end_date
         )
 
+    def search_diaries(self, keyword: str, limit: int = 30) -> List[Diary]:
+        """
+        내용으로 일기 검색
+
+        Args:
+            keyword: 검색어
+            limit: 최대 결과 수
+
+        Returns:
+            일기 리스트 (최신순)
+
+        Raises:
+            ValueError: 검색어가 비어있는 경우
+        """
+        if not keyword or not keyword.strip():
+            raise ValueError("검색어는 비어있을 수 없습니다.")
+
+        return self.diary_repo.search(keyword.strip(), limit=limit)
+
     def delete_diary(self, diary_id: str) -> bool:
         """
         일기 삭제
@@ -0,0 +1,164 @@
+"""일기 초안 선작성 (speculative generation)
+
+AI가 "일기를 작성해드릴까요?"라고 제안하면, 사용자가 답하기 전에 백그라운드에서 초안을 미리 만듭니다.
+사용자가 수락하면 미리 만든 초안을 바로 돌려주고, 대화를 계속하면 초안을 버립니다.
+"""
+
+import re
+import threading
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+
+# 그 자체로만 수락인 답변 (다른 단어의 첫 글자와 겹쳐서 접두어로 쓰지 않음)
+AFFIRMATIVE_WORDS = ("예", "어", "y")
+
+# 수락으로 볼 짧은 답변의 시작 표현 (공백/문장부호 제거 후 비교)
+AFFIRMATIVE_PREFIXES = (
+    "네", "넵", "응", "ㅇㅇ", "ㅇㅋ", "좋아", "좋습니다", "그래", "부탁",
+    "써줘", "써주세요", "작성해", "고마워", "감사", "yes", "yep", "ok", "sure",
+)
+
+# 수락처럼 시작해도 대화를 이어가려는 표현
+NON_AFFIRMATIVE_WORDS = (
+    "아니", "아뇨", "싫", "말고", "잠깐", "아직", "근데", "그런데", "하지만", "먼저", "더 ", "no",
+)
+
+# 이보다 긴 답변은 수락이 아니라 대화를 이어가는 것으로 봄
+MAX_AFFIRMATIVE_LENGTH = 20
+
+_STRIP_PATTERN = re.compile(r"[\s.,!?~^]+")
+
+
+def is_affirmative(text: str) -> bool:
+    """
+    일기 작성 제안에 대한 짧은 수락 답변인지 추정
+
+    Args:
+        text: 사용자 메시지
+
+    Returns:
+        수락으로 보이면 True
+    """
+    stripped = text.strip().lower()
+    if not stripped or len(stripped) > MAX_AFFIRMATIVE_LENGTH:
+        return False
+    if any(word in stripped + " " for word in NON_AFFIRMATIVE_WORDS):
+        return False
+    compact = _STRIP_PATTERN.sub("", stripped)
+    return compact in AFFIRMATIVE_WORDS or compact.startswith(AFFIRMATIVE_PREFIXES)
+
+
+@dataclass
+class SpeculationStats:
+    """선작성 적중 통계
+
+    Attributes:
+        started: 시작한 선작성 수
+        hits: 사용자가 수락해서 초안을 그대로 쓴 수
+        misses: 대화가 이어져 버린 수
+        failures: 수락했지만 초안 생성이 실패해 다시 호출한 수
+    """
+    started: int = 0
+    hits: int = 0
+    misses: int = 0
+    failures: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """결과가 정해진 선작성 중 적중 비율"""
+        resolved = self.hits + self.misses + self.failures
+        return self.hits / resolved if resolved else 0.0
+
+
+@dataclass
+class _PendingDraft:
+    """진행 중인 선작성"""
+    session_id: str
+    message_count: int  # 제안 응답까지 포함한 세션 메시지 수
+    future: Future
+
+
+class DiaryDraftSpeculator:
+    """일기 초안 선작성 관리 (세션당 하나만 진행)"""
+
+    def __init__(self):
+        self.stats = SpeculationStats()
+        self._pending: Optional[_PendingDraft] = None
+        self._lock = threading.Lock()
+        # 선작성은 한 번에 하나뿐이므로 워커 하나로 충분
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def start(
+        self,
+        session_id: str,
+        message_count: int,
+        generate: Callable[[], tuple],
+    ) -> None:
+        """
+        초안 선작성 시작 (진행 중인 선작성은 버림)
+
+        Args:
+            session_id: 세션 ID
+            message_count: 제안 응답까지 포함한 세션 메시지 수 (바로 다음 답변인지 확인용)
+            generate: 초안 생성 함수 → (AI 응답, 추정 요청 토큰 수, ...), 일기 형식이 아니면 예외
+        """
+        self.discard()
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="diary-draft")
+            future = self._executor.submit(generate)
+            self._pending = _PendingDraft(session_id, message_count, future)
+            self.stats.started += 1
+
+    def claim(self, session_id: str, message_count: int) -> Optional[tuple]:
+        """
+        사용자가 수락했을 때 선작성한 초안 가져오기 (아직 생성 중이면 끝날 때까지 대기)
+
+        Args:
+            session_id: 세션 ID
+            message_count: 사용자 답변을 추가하기 전 세션 메시지 수
+
+        Returns:
+            generate가 돌려준 값 또는 None (선작성이 없거나 실패)
+        """
+        with self._lock:
+            pending = self._pending
+            if not pending or pending.session_id != session_id or pending.message_count != message_count:
+                return None
+            self._pending = None
+
+        try:
+            result = pending.future.result()
+        except (Exception, CancelledError):
+            with self._lock:
+                self.stats.failures += 1
+            return None
+
+        with self._lock:
+            self.stats.hits += 1
+        return result
+
+    def discard(self) -> bool:
+        """
+        진행 중인 선작성 버리기 (시작 전이면 취소, 이미 호출 중이면 결과를 무시)
+
+        Returns:
+            버린 선작성이 있었으면 True
+        """
+        with self._lock:
+            pending, self._pending = self._pending, None
+            if not pending:
+                return False
+            pending.future.cancel()
+            self.stats.misses += 1
+            return True
+
+    def close(self) -> None:
+        """선작성 중단 및 워커 종료 (진행 중인 호출은 기다리지 않음)"""
+        self.discard()
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor:
+            executor.shutdown(wait=False, cancel_futures=True)
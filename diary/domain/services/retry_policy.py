@@ -0,0 +1,139 @@
+"""AI 호출 재시도 정책
+
+AI 클라이언트는 SDK 예외를 원인(__cause__)으로 연결해 다시 던지므로, 오류 체인에서 다음 순서로 판별합니다.
+1. HTTP 상태 코드 (openai/anthropic의 status_code, google.api_core의 code)
+   - 상태 코드가 있으면 그것만으로 결정 (400 등은 메시지에 숫자가 있어도 재시도하지 않음)
+2. SDK 예외 클래스 이름 (SDK를 import하지 않도록 이름으로 비교) / 내장 TimeoutError, ConnectionError
+3. 위 정보가 없는 오류(가짜 클라이언트 등)만 오류 메시지로 판별
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+RATE_LIMIT_STATUS_CODES = frozenset({429})
+TRANSIENT_STATUS_CODES = frozenset({408, 500, 502, 503, 504, 529})
+
+# SDK별 요청 한도 초과 / 일시적 오류 예외 클래스 이름 (상위 클래스 포함해서 비교)
+_RATE_LIMIT_ERROR_TYPES = frozenset({"RateLimitError", "ResourceExhausted", "TooManyRequests"})
+_TRANSIENT_ERROR_TYPES = frozenset({
+    "APITimeoutError",
+    "APIConnectionError",
+    "InternalServerError",
+    "ServiceUnavailable",
+    "DeadlineExceeded",
+    "TimeoutException",
+    "ConnectError",
+})
+
+# 상태 코드/예외 종류를 알 수 없을 때만 쓰는 메시지 패턴 (숫자는 단독으로 쓰인 경우만)
+_RATE_LIMIT_PATTERN = re.compile(r"\b429\b|rate[ _]limit|resource_exhausted|quota")
+_TRANSIENT_PATTERN = re.compile(
+    r"\b(?:500|502|503|504|529)\b|timeout|timed out|overloaded|unavailable"
+    r"|connection (?:error|reset|refused|aborted)"
+)
+
+_RATE_LIMIT = "rate_limit"
+_TRANSIENT = "transient"
+
+# 오류 체인을 따라갈 최대 깊이
+_MAX_CHAIN_DEPTH = 8
+
+
+def _error_chain(error: BaseException) -> Iterator[BaseException]:
+    """오류와 그 원인들 (raise ... from e / 처리 중 발생한 오류)"""
+    seen = set()
+    current: Optional[BaseException] = error
+    while current is not None and id(current) not in seen and len(seen) < _MAX_CHAIN_DEPTH:
+        seen.add(id(current))
+        yield current
+        current = current.__cause__ or current.__context__
+
+
+def _status_code(error: BaseException) -> Optional[int]:
+    """오류 체인에서 찾은 첫 HTTP 상태 코드"""
+    for err in _error_chain(error):
+        for attribute in ("status_code", "code"):
+            code = getattr(err, attribute, None)
+            if isinstance(code, int) and not isinstance(code, bool) and 100 <= code < 600:
+                return code
+    return None
+
+
+def _classify(error: BaseException) -> Optional[str]:
+    """오류 종류 ("rate_limit", "transient", 재시도하지 않을 오류면 None)"""
+    status = _status_code(error)
+    if status is not None:
+        if status in RATE_LIMIT_STATUS_CODES:
+            return _RATE_LIMIT
+        return _TRANSIENT if status in TRANSIENT_STATUS_CODES else None
+
+    chain = list(_error_chain(error))
+    type_names = {cls.__name__ for err in chain for cls in type(err).__mro__}
+    if type_names & _RATE_LIMIT_ERROR_TYPES:
+        return _RATE_LIMIT
+    if type_names & _TRANSIENT_ERROR_TYPES or any(isinstance(err, (TimeoutError, ConnectionError)) for err in chain):
+        return _TRANSIENT
+
+    message = str(error).lower()
+    if _RATE_LIMIT_PATTERN.search(message):
+        return _RATE_LIMIT
+    if _TRANSIENT_PATTERN.search(message):
+        return _TRANSIENT
+    return None
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """Provider 요청 한도 초과 오류인지 확인"""
+    return _classify(error) == _RATE_LIMIT
+
+
+def is_retryable_error(error: Exception) -> bool:
+    """재시도할 만한 일시적 오류인지 확인 (요청 한도 초과 포함)"""
+    return _classify(error) is not None
+
+
+@dataclass
+class RetryPolicy:
+    """지수 백오프 재시도 정책
+
+    Attributes:
+        max_retries: 최대 재시도 횟수 (0이면 재시도 안 함)
+        base_delay: 첫 재시도 대기 시간 (초)
+        max_delay: 최대 대기 시간 (초)
+        retry_rate_limits: 요청 한도 초과(429)도 재시도할지 여부
+            (호출한 쪽이 요청 속도를 직접 조절하며 재시도하면 False로 두어 재시도가 겹치지 않게 함)
+    """
+
+    max_retries: int = 2
+    base_delay: float = 0.5
+    max_delay: float = 8.0
+    retry_rate_limits: bool = True
+
+    def get_delay(self, attempt: int) -> float:
+        """
+        재시도 대기 시간
+
+        Args:
+            attempt: 재시도 차수 (1부터 시작)
+
+        Returns:
+            대기 시간 (초)
+        """
+        return min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+
+    def should_retry(self, error: Exception, attempt: int) -> bool:
+        """
+        재시도 여부 판단
+
+        Args:
+            error: 발생한 오류
+            attempt: 이번이 몇 번째 재시도인지 (1부터 시작)
+
+        Returns:
+            재시도해야 하면 True
+        """
+        if attempt > self.max_retries:
+            return False
+        kind = _classify(error)
+        return kind == _TRANSIENT or (kind == _RATE_LIMIT and self.retry_rate_limits)
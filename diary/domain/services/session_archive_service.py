@@ -0,0 +1,87 @@
+"""종료된 채팅 세션 보관 정책
+
+오래된 종료 세션은 저장소의 압축 보관 계층으로 옮겨 활성 저장소(인덱스, 작업 데이터)가
+계속 커지지 않게 하고, 보관 기간이 지나면 삭제합니다.
+보관된 세션도 ChatRepositoryInterface.get_session으로 그대로 읽을 수 있습니다.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Optional
+
+from diary.domain.interfaces.chat_repository import ChatRepositoryInterface
+
+
+# 마지막 대화 후 이 기간이 지난 종료 세션을 보관 (일)
+DEFAULT_ARCHIVE_AFTER_DAYS = 30
+
+
+@dataclass
+class ArchiveResult:
+    """보관 작업 결과
+
+    Attributes:
+        archived: 보관 계층으로 옮긴 세션 수
+        expired: 보관 기간이 지나 삭제한 세션 수
+        archive_cutoff: 이 시각 이전에 마지막으로 수정된 종료 세션을 보관
+        expire_cutoff: 이 시각 이전에 마지막으로 수정된 보관 세션을 삭제 (None이면 삭제하지 않음)
+    """
+    archived: int
+    expired: int
+    archive_cutoff: datetime
+    expire_cutoff: Optional[datetime] = None
+
+
+class SessionArchiveService:
+    """나이 기준으로 종료 세션을 보관하고, 보관 기간이 지나면 삭제하는 서비스"""
+
+    def __init__(
+        self,
+        chat_repo: ChatRepositoryInterface,
+        archive_after_days: int = DEFAULT_ARCHIVE_AFTER_DAYS,
+        retention_days: Optional[int] = None,
+    ):
+        """
+        Args:
+            chat_repo: 채팅 저장소 (보관 계층을 지원하지 않으면 아무것도 하지 않음)
+            archive_after_days: 마지막 대화 후 보관까지의 기간 (일)
+            retention_days: 마지막 대화 후 삭제까지의 기간 (일, None이면 영구 보관)
+
+        Raises:
+            ValueError: 기간이 1일 미만이거나 보관 기간이 보관 시작 기간보다 짧은 경우
+        """
+        if archive_after_days < 1:
+            raise ValueError("보관 시작 기간은 1일 이상이어야 합니다.")
+        if retention_days is not None and retention_days < archive_after_days:
+            raise ValueError("보관 기간은 보관 시작 기간보다 짧을 수 없습니다.")
+
+        self.chat_repo = chat_repo
+        self.archive_after_days = archive_after_days
+        self.retention_days = retention_days
+
+    def run(self, now: Optional[datetime] = None) -> ArchiveResult:
+        """
+        보관 정책 실행 (오래된 종료 세션 보관 → 보관 기간 지난 세션 삭제)
+
+        Args:
+            now: 기준 시각 (None이면 현재 시각)
+
+        Returns:
+            ArchiveResult
+        """
+        now = now or datetime.now()
+        archive_cutoff = now - timedelta(days=self.archive_after_days)
+        archived = self.chat_repo.archive_sessions(archive_cutoff)
+
+        expired = 0
+        expire_cutoff = None
+        if self.retention_days is not None:
+            expire_cutoff = now - timedelta(days=self.retention_days)
+            expired = self.chat_repo.expire_archived_sessions(expire_cutoff)
+
+        return ArchiveResult(
+            archived=archived,
+            expired=expired,
+            archive_cutoff=archive_cutoff,
+            expire_cutoff=expire_cutoff,
+        )
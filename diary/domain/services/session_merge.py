@@ -0,0 +1,97 @@
+"""채팅 세션 저장 충돌 합치기 (낙관적 동시성 제어)
+
+저장소는 세션을 읽어온 버전 그대로일 때만 저장합니다 (compare-and-set).
+다른 CLI 인스턴스나 서버 워커가 먼저 저장해서 충돌하면, 최신 세션을 다시 읽고
+이쪽에서 추가한 메시지만 그 뒤에 다시 붙여 저장합니다.
+대화는 메시지를 덧붙이기만 하므로 전역 잠금 없이도 양쪽 메시지를 모두 남길 수 있습니다.
+metadata의 누적 토큰 사용량은 양쪽이 늘린 양을 더하고, 대화 요약은 더 많이 덮는 쪽을 남깁니다.
+"""
+
+import copy
+
+from diary.domain.entities.chat_session import ChatSession
+from diary.domain.exceptions import SessionConflictError
+from diary.domain.interfaces.chat_repository import ChatRepositoryInterface
+from diary.domain.services.context_window import SUMMARY_METADATA_KEY
+
+
+# 충돌 시 최신 세션에 다시 붙여 저장을 시도하는 최대 횟수
+DEFAULT_MERGE_ATTEMPTS = 5
+
+# session.metadata에 세션 누적 토큰 사용량을 저장하는 키
+TOKEN_USAGE_METADATA_KEY = "token_usage"
+
+
+def merge_metadata(session: ChatSession, latest: ChatSession) -> dict:
+    """
+    최신 세션의 metadata 위에 이 세션의 metadata 합치기
+
+    - 누적 토큰 사용량: 최신 값 + 이 세션이 읽은(저장한) 버전 이후 늘린 양
+    - 대화 요약: covered(요약이 덮는 메시지 수)가 더 큰 쪽
+    - 나머지 키: 이 세션의 값
+
+    Args:
+        session: 저장하려던 세션
+        latest: 저장소의 최신 세션
+
+    Returns:
+        합친 metadata
+    """
+    merged = {**copy.deepcopy(latest.metadata), **copy.deepcopy(session.metadata)}
+
+    mine = session.metadata.get(TOKEN_USAGE_METADATA_KEY)
+    theirs = latest.metadata.get(TOKEN_USAGE_METADATA_KEY)
+    if mine and theirs:
+        base = session.base_metadata.get(TOKEN_USAGE_METADATA_KEY) or {}
+        merged[TOKEN_USAGE_METADATA_KEY] = {
+            key: theirs.get(key, 0) + mine.get(key, 0) - base.get(key, 0)
+            for key in {**theirs, **mine}
+        }
+
+    my_summary = session.metadata.get(SUMMARY_METADATA_KEY) or {}
+    their_summary = latest.metadata.get(SUMMARY_METADATA_KEY) or {}
+    if their_summary.get("covered", 0) > my_summary.get("covered", 0):
+        merged[SUMMARY_METADATA_KEY] = copy.deepcopy(their_summary)
+    return merged
+
+
+def rebase_session(session: ChatSession, latest: ChatSession) -> None:
+    """최신 세션 위에 이 세션에서 추가한 메시지를 다시 붙이고 metadata 합치기"""
+    session.rebase(latest, metadata=merge_metadata(session, latest))
+
+
+def save_with_merge(
+    chat_repo: ChatRepositoryInterface,
+    session: ChatSession,
+    max_attempts: int = DEFAULT_MERGE_ATTEMPTS,
+) -> bool:
+    """
+    세션 저장 (충돌하면 최신 세션 위에 추가한 메시지를 다시 붙여 재시도)
+
+    합친 결과는 session에 그대로 반영됩니다 (rebase_session).
+
+    Args:
+        chat_repo: 채팅 저장소
+        session: 저장할 세션
+        max_attempts: 최대 저장 시도 횟수
+
+    Returns:
+        다른 곳에서 저장한 내용과 합쳤으면 True
+
+    Raises:
+        SessionConflictError: 모든 시도가 충돌했거나 다른 곳에서 세션을 삭제한 경우
+    """
+    merged = False
+    for attempt in range(max_attempts):
+        try:
+            chat_repo.save_session(session)
+            return merged
+        except SessionConflictError as e:
+            if e.actual_version is None or attempt == max_attempts - 1:
+                raise
+            latest = chat_repo.get_session(session.session_id)
+            if latest is None:
+                raise
+            rebase_session(session, latest)
+            merged = True
+    return merged
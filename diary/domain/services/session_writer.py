@@ -0,0 +1,189 @@
+"""채팅 세션 write-behind 저장기
+
+대화 턴마다 저장소(MongoDB/JSON 파일)에 동기적으로 쓰지 않고, 세션 스냅샷을 큐에 넣은 뒤
+백그라운드 스레드가 순서대로 저장합니다.
+
+- 같은 세션을 저장 전에 여러 번 넣으면 마지막 스냅샷 하나만 저장합니다 (coalesce).
+- 저장 순서는 마지막으로 넣은 순서를 따릅니다 (세션 종료 → 새 세션 시작 순서 보장).
+- 저장에 실패하면 더 새로운 스냅샷이 없을 때만 다시 큐에 넣고 잠시 뒤 재시도합니다.
+- 프로그램 종료 전에 flush()/close()로 남은 저장을 모두 끝냅니다.
+- 저장소의 세션 버전은 저장기가 추적합니다. 다른 곳에서 먼저 저장해서 충돌하면
+  최신 세션에 새로 추가한 메시지만 다시 붙여 저장하고(save_with_merge),
+  그 뒤로는 저장할 때마다 최신 세션을 읽어 합칩니다 (메모리의 세션에는 다른 곳의 메시지가 없으므로).
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+from diary.domain.entities.chat_session import ChatSession
+from diary.domain.interfaces.chat_repository import ChatRepositoryInterface
+from diary.domain.services.session_merge import rebase_session, save_with_merge
+
+
+@dataclass
+class _SavedState:
+    """저장기가 마지막으로 저장한 세션 상태
+
+    Attributes:
+        version: 저장 후 저장소 버전
+        message_count: 저장한 스냅샷의 메시지 수 (합치기 전, 메모리 세션 기준)
+        diverged: 다른 곳의 메시지와 합쳐서 저장소와 메모리 세션의 메시지가 다름
+        metadata: 저장한 스냅샷의 metadata (합치기 전, 메모리 세션 기준)
+    """
+    version: int
+    message_count: int
+    diverged: bool = False
+    metadata: dict = field(default_factory=dict)
+
+
+class WriteBehindSessionWriter:
+    """백그라운드 스레드로 채팅 세션을 저장하는 write-behind 큐"""
+
+    def __init__(self, chat_repo: ChatRepositoryInterface, retry_delay: float = 1.0):
+        """
+        Args:
+            chat_repo: 채팅 저장소 (인터페이스)
+            retry_delay: 저장 실패 후 재시도까지 대기 시간 (초)
+        """
+        self.chat_repo = chat_repo
+        self.retry_delay = retry_delay
+        self.last_error: Optional[Exception] = None
+
+        self._pending: "OrderedDict[str, ChatSession]" = OrderedDict()
+        self._saved: Dict[str, _SavedState] = {}
+        self._saving = False
+        self._closed = False
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="session-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, session: ChatSession) -> None:
+        """
+        세션 저장 예약 (즉시 반환)
+
+        호출 시점의 스냅샷을 저장하므로, 이후 세션을 계속 수정해도 됩니다.
+
+        Args:
+            session: 저장할 세션
+
+        Raises:
+            RuntimeError: close() 이후 호출한 경우
+        """
+        snapshot = session.snapshot()
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("세션 저장기가 이미 닫혔습니다.")
+            self._pending[snapshot.session_id] = snapshot
+            self._pending.move_to_end(snapshot.session_id)
+            self._condition.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        예약된 저장이 모두 끝날 때까지 대기
+
+        Args:
+            timeout: 최대 대기 시간 (초, None이면 끝날 때까지)
+
+        Returns:
+            모두 저장했으면 True, 시간 초과면 False
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while self._pending or self._saving:
+                if not self._thread.is_alive():
+                    # 저장 스레드가 없으면 호출한 스레드에서 직접 저장
+                    self._drain_in_caller()
+                    break
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+            return not self._pending
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """
+        남은 저장을 모두 끝내고 저장 스레드 종료
+
+        Args:
+            timeout: 최대 대기 시간 (초, None이면 끝날 때까지)
+
+        Returns:
+            모두 저장했으면 True
+        """
+        flushed = self.flush(timeout)
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join(timeout)
+        return flushed
+
+    @property
+    def pending_count(self) -> int:
+        """저장 대기 중인 세션 수"""
+        with self._condition:
+            return len(self._pending)
+
+    def _run(self) -> None:
+        """저장 스레드 본체"""
+        while True:
+            with self._condition:
+                while not self._pending and not self._closed:
+                    self._condition.wait()
+                if not self._pending:
+                    return
+                session_id, snapshot = self._pending.popitem(last=False)
+                self._saving = True
+
+            saved = self._save(snapshot)
+
+            with self._condition:
+                self._saving = False
+                if not saved and session_id not in self._pending:
+                    # 더 새로운 스냅샷이 없을 때만 같은 순서로 다시 저장
+                    self._pending[session_id] = snapshot
+                    self._pending.move_to_end(session_id, last=False)
+                self._condition.notify_all()
+                if not saved and not self._closed:
+                    self._condition.wait(self.retry_delay)
+                elif not saved:
+                    # 종료 중에는 재시도하지 않음 (flush가 무한 대기하지 않도록)
+                    self._pending.pop(session_id, None)
+                    self._condition.notify_all()
+
+    def _save(self, snapshot: ChatSession) -> bool:
+        """저장소에 저장 (실패하면 last_error에 기록)"""
+        message_count = snapshot.get_message_count()
+        metadata = copy.deepcopy(snapshot.metadata)
+        state = self._saved.get(snapshot.session_id)
+        try:
+            if state and state.version > snapshot.version:
+                # 메모리 세션은 이 저장기가 올린 버전을 모르므로 마지막 저장 이후 추가분만 새 메시지로
+                snapshot.version = state.version
+                snapshot.unsaved_count = max(0, message_count - state.message_count)
+                snapshot.base_metadata = copy.deepcopy(state.metadata)
+                if state.diverged:
+                    latest = self.chat_repo.get_session(snapshot.session_id)
+                    if latest is not None:
+                        rebase_session(snapshot, latest)
+            merged = save_with_merge(self.chat_repo, snapshot)
+        except Exception as e:
+            self.last_error = e
+            return False
+
+        self._saved[snapshot.session_id] = _SavedState(
+            version=snapshot.version,
+            message_count=message_count,
+            diverged=merged or bool(state and state.diverged),
+            metadata=metadata,
+        )
+        return True
+
+    def _drain_in_caller(self) -> None:
+        """남은 스냅샷을 호출한 스레드에서 순서대로 저장 (조건 변수 잠금 상태에서 호출)"""
+        while self._pending:
+            _, snapshot = self._pending.popitem(last=False)
+            self._save(snapshot)
@@ -0,0 +1,113 @@
+"""시스템 프롬프트 조립기
+
+새 세션마다 프롬프트를 다시 만들지 않도록 (스타일, 템플릿 버전)이 같으면 조립한 프롬프트를 재사용합니다.
+PreferencesUI에서 스타일을 바꾸면 키가 달라져 자동으로 다시 만듭니다.
+예시 문장은 대화마다 다르게 고르므로 시스템 프롬프트에 넣지 않고, 일기를 만들 때 뒤에 따로 붙입니다
+(Provider 프롬프트 캐시가 적용되는 앞부분은 그대로 유지).
+"""
+
+import hashlib
+import threading
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from diary.domain.entities.writing_style import WritingStyle
+from diary.domain.services.user_preferences_service import UserPreferencesService
+
+
+# 프롬프트 템플릿을 고치면 올려서 기존 캐시/Provider 캐시 키를 무효화
+TEMPLATE_VERSION = 2
+
+SYSTEM_PROMPT_TEMPLATE = """당신은 사용자의 하루를 듣고 일기를 작성하는 친절한 인터뷰어입니다.
+
+목표:
+1. 사용자와 자연스럽게 대화하며 하루 일과를 듣기
+2. 구체적인 사건, 감정, 생각을 파악하기
+3. 충분한 정보가 모이면 아래 스타일로 일기 초안 제안
+
+일기 작성 스타일:
+{style_instruction}
+
+대화 스타일:
+- 친근하고 공감적으로 대화
+- 짧고 자연스러운 질문 (긴 설명 X)
+- 사용자가 편하게 답변할 수 있도록 유도
+- "오늘 어땠어요?", "그때 기분이 어땠나요?" 등 자연스러운 질문
+
+중요:
+- 사용자가 충분히 이야기했다고 판단되면, "오늘 대화를 바탕으로 일기를 작성해드릴까요?"라고 물어보세요.
+- 사용자가 일기 작성을 요청하면, 반드시 다음 형식으로 응답하세요:
+
+[DIARY_START]
+(여기에 작성된 일기 내용)
+[DIARY_END]
+
+- 일기가 아닌 일반 대화/질문은 위 형식을 사용하지 마세요.
+- 항상 한국어로 대화하세요.
+- 짧고 간결하게 한 번에 하나의 질문만 하세요.
+"""
+
+
+@dataclass(frozen=True)
+class SystemPrompt:
+    """조립된 시스템 프롬프트
+
+    Attributes:
+        text: 프롬프트 본문
+        prompt_hash: 본문의 SHA-256 (Provider 프롬프트 캐시 키, 세션 metadata 기록용)
+        style: 프롬프트를 만든 일기 작성 스타일
+    """
+    text: str
+    prompt_hash: str
+    style: WritingStyle
+
+
+def compute_prompt_hash(text: str) -> str:
+    """프롬프트 본문의 SHA-256 hex"""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class SystemPromptBuilder:
+    """(스타일, 템플릿 버전) 기준으로 시스템 프롬프트를 캐시하는 조립기"""
+
+    def __init__(self, preferences_service: UserPreferencesService):
+        """
+        Args:
+            preferences_service: 사용자 설정 서비스 (스타일 조회)
+        """
+        self.preferences_service = preferences_service
+        # 스타일 → (캐시 키, 프롬프트)
+        self._cache: Dict[WritingStyle, Tuple[tuple, SystemPrompt]] = {}
+        self._lock = threading.Lock()
+
+    def build(self, style: Optional[WritingStyle] = None) -> SystemPrompt:
+        """
+        시스템 프롬프트 (바뀐 것이 없으면 캐시 사용)
+
+        Args:
+            style: 프롬프트를 만들 스타일 (None이면 현재 선택된 스타일)
+
+        Returns:
+            SystemPrompt
+        """
+        style = style or self.preferences_service.get_current_writing_style()
+        key = (style.value, TEMPLATE_VERSION)
+
+        with self._lock:
+            cached = self._cache.get(style)
+            if cached and cached[0] == key:
+                return cached[1]
+
+        text = SYSTEM_PROMPT_TEMPLATE.format(
+            style_instruction=self.preferences_service.get_style_prompt_instruction(style)
+        )
+        prompt = SystemPrompt(text=text, prompt_hash=compute_prompt_hash(text), style=style)
+
+        with self._lock:
+            self._cache[style] = (key, prompt)
+        return prompt
+
+    def invalidate(self) -> None:
+        """캐시된 프롬프트 모두 삭제"""
+        with self._lock:
+            self._cache.clear()
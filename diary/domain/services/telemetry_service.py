@@ -0,0 +1,273 @@
+"""AI 호출 텔레메트리 (사용량/지연시간 기록 및 통계)
+
+- InstrumentedAIClient: 모든 AI 호출을 감싸서 토큰 사용량, 지연시간, 재시도, 결과를 기록
+- TelemetryService: 기록을 provider/일자/세션별로 집계 (p50/p95 지연시간, 토큰 합계)
+"""
+
+import math
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable, Iterator, List, Optional
+
+from diary.domain.entities.ai_call_record import AICallRecord
+from diary.domain.entities.token_usage import TokenUsage
+from diary.domain.interfaces.ai_client import AIClientInterface
+from diary.domain.interfaces.telemetry_repository import TelemetryRepositoryInterface
+from diary.domain.services.retry_policy import RetryPolicy
+
+
+# 현재 AI 요청의 종류 (ChatService가 지정하고 InstrumentedAIClient가 기록)
+_current_request_type: ContextVar[Optional[str]] = ContextVar("ai_request_type", default=None)
+
+
+@contextmanager
+def tag_request_type(request_type: str) -> Iterator[None]:
+    """
+    블록 안의 AI 호출 기록에 요청 종류를 남김 (같은 스레드에서 시작한 호출만 해당)
+
+    Args:
+        request_type: 요청 종류 (예: "small_talk", "diary")
+    """
+    token = _current_request_type.set(request_type)
+    try:
+        yield
+    finally:
+        _current_request_type.reset(token)
+
+
+class InstrumentedAIClient(AIClientInterface):
+    """호출마다 AICallRecord를 남기는 AI 클라이언트 데코레이터
+
+    재시도도 이 계층에서 수행하여 재시도 횟수를 기록합니다.
+    텔레메트리 저장 실패는 AI 호출 결과에 영향을 주지 않습니다.
+    """
+
+    def __init__(
+        self,
+        inner: AIClientInterface,
+        telemetry_repo: TelemetryRepositoryInterface,
+        provider: str,
+        retry_policy: Optional[RetryPolicy] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Args:
+            inner: 실제 AI 클라이언트
+            telemetry_repo: 호출 기록 저장소 (인터페이스)
+            provider: Provider 이름 (예: "openai")
+            retry_policy: 재시도 정책 (기본: 최대 2회 지수 백오프)
+            sleep: 대기 함수 (테스트에서 교체 가능)
+        """
+        self.inner = inner
+        self.telemetry_repo = telemetry_repo
+        self.provider = provider
+        self.retry_policy = retry_policy or RetryPolicy()
+        self._sleep = sleep
+
+    def chat(
+        self, messages: List[dict], session_id: Optional[str] = None, model: Optional[str] = None
+    ) -> str:
+        """AI 호출 + 기록 (일시적 오류는 재시도)"""
+        started = time.perf_counter()
+        record = self._new_record(session_id, model)
+        attempt = 0
+
+        while True:
+            try:
+                response = self.inner.chat(messages, session_id=session_id, model=model)
+                break
+            except Exception as e:
+                attempt += 1
+                if not self.retry_policy.should_retry(e, attempt):
+                    self._finish(record, started, error=e, retries=attempt - 1)
+                    raise
+                self._sleep(self.retry_policy.get_delay(attempt))
+
+        self._finish(record, started, retries=attempt)
+        return response
+
+    def chat_stream(
+        self, messages: List[dict], session_id: Optional[str] = None, model: Optional[str] = None
+    ) -> Iterator[str]:
+        """스트리밍 AI 호출 + 기록 (첫 조각 수신 전 오류만 재시도)"""
+        started = time.perf_counter()
+        record = self._new_record(session_id, model)
+        attempt = 0
+
+        while True:
+            received = False
+            try:
+                for chunk in self.inner.chat_stream(messages, session_id=session_id, model=model):
+                    if not received:
+                        received = True
+                        record.ttft_ms = (time.perf_counter() - started) * 1000
+                    yield chunk
+                break
+            except Exception as e:
+                attempt += 1
+                if received or not self.retry_policy.should_retry(e, attempt):
+                    self._finish(record, started, error=e, retries=attempt - 1)
+                    raise
+                self._sleep(self.retry_policy.get_delay(attempt))
+
+        self._finish(record, started, retries=attempt)
+
+    def get_last_usage(self) -> Optional[TokenUsage]:
+        """내부 클라이언트의 마지막 토큰 사용량"""
+        return self.inner.get_last_usage()
+
+    def get_model_name(self) -> Optional[str]:
+        """내부 클라이언트의 모델 이름"""
+        return self.inner.get_model_name()
+
+    def _new_record(self, session_id: Optional[str], model: Optional[str]) -> AICallRecord:
+        """호출 시작 시점의 기록 생성 (요청한 모델, 요청 종류 포함)"""
+        return AICallRecord(
+            provider=self.provider,
+            model=model or self.inner.get_model_name(),
+            session_id=session_id,
+            request_type=_current_request_type.get(),
+        )
+
+    def _finish(
+        self,
+        record: AICallRecord,
+        started: float,
+        error: Optional[Exception] = None,
+        retries: int = 0,
+    ) -> None:
+        """호출 결과를 기록에 채우고 저장"""
+        record.latency_ms = (time.perf_counter() - started) * 1000
+        record.retries = retries
+
+        if error is not None:
+            record.outcome = "error"
+            record.error = str(error)[:500]
+        else:
+            usage = self.inner.get_last_usage()
+            if usage:
+                record.model = usage.model or record.model
+                record.prompt_tokens = usage.prompt_tokens
+                record.completion_tokens = usage.completion_tokens
+                record.cached_tokens = usage.cached_tokens
+
+        try:
+            self.telemetry_repo.append(record)
+        except Exception:
+            # 텔레메트리 저장 실패는 무시 (AI 응답이 우선)
+            pass
+
+
+@dataclass
+class UsageStats:
+    """집계 단위(provider/일자/세션)별 사용량 통계
+
+    Attributes:
+        key: 집계 키 (예: "openai", "2024-02-18", 세션 ID)
+        calls: 호출 수
+        errors: 실패한 호출 수
+        retries: 재시도 횟수 합계
+        latency_p50_ms: 지연시간 중앙값
+        latency_p95_ms: 지연시간 95 백분위
+        ttft_p50_ms: 첫 토큰 지연 중앙값 (스트리밍 호출이 없으면 None)
+        prompt_tokens: 입력 토큰 합계
+        completion_tokens: 출력 토큰 합계
+        cached_tokens: 캐시 적중 토큰 합계
+    """
+
+    key: str
+    calls: int
+    errors: int
+    retries: int
+    latency_p50_ms: float
+    latency_p95_ms: float
+    ttft_p50_ms: Optional[float]
+    prompt_tokens: int
+    completion_tokens: int
+    cached_tokens: int
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """
+    백분위 값 계산 (nearest-rank)
+
+    Args:
+        values: 값 리스트
+        pct: 백분위 (0 ~ 100)
+
+    Returns:
+        백분위 값 (빈 리스트면 0.0)
+    """
+    if not values:
+        return 0.0
+
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+class TelemetryService:
+    """AI 호출 기록 집계 서비스"""
+
+    GROUP_KEYS = {
+        "provider": lambda r: r.provider,
+        "model": lambda r: r.model or "-",
+        "day": lambda r: r.timestamp.date().isoformat(),
+        "session": lambda r: r.session_id,
+        "request_type": lambda r: r.request_type,
+    }
+
+    def __init__(self, telemetry_repo: TelemetryRepositoryInterface):
+        """
+        Args:
+            telemetry_repo: 호출 기록 저장소 (인터페이스)
+        """
+        self.telemetry_repo = telemetry_repo
+
+    def get_stats(self, group_by: str = "provider", days: Optional[int] = None) -> List[UsageStats]:
+        """
+        사용량 통계 조회
+
+        Args:
+            group_by: 집계 기준 ("provider", "model", "day", "session", "request_type")
+            days: 최근 며칠간의 기록만 집계 (None이면 전체)
+
+        Returns:
+            집계 키 순으로 정렬된 통계 리스트 (세션/요청 종류 집계는 값이 없는 호출 제외)
+
+        Raises:
+            ValueError: 지원하지 않는 집계 기준인 경우
+        """
+        key_fn = self.GROUP_KEYS.get(group_by)
+        if key_fn is None:
+            raise ValueError(f"지원하지 않는 집계 기준입니다: {group_by}")
+
+        since = datetime.now() - timedelta(days=days) if days else None
+        groups: dict = {}
+        for record in self.telemetry_repo.list_records(since=since):
+            key = key_fn(record)
+            if key is None:
+                continue
+            groups.setdefault(key, []).append(record)
+
+        return [self._aggregate(key, records) for key, records in sorted(groups.items())]
+
+    def _aggregate(self, key: str, records: List[AICallRecord]) -> UsageStats:
+        """기록 묶음을 통계로 변환"""
+        latencies = [r.latency_ms for r in records]
+        ttfts = [r.ttft_ms for r in records if r.ttft_ms is not None]
+        return UsageStats(
+            key=key,
+            calls=len(records),
+            errors=sum(1 for r in records if not r.is_success()),
+            retries=sum(r.retries for r in records),
+            latency_p50_ms=percentile(latencies, 50),
+            latency_p95_ms=percentile(latencies, 95),
+            ttft_p50_ms=percentile(ttfts, 50) if ttfts else None,
+            prompt_tokens=sum(r.prompt_tokens for r in records),
+            completion_tokens=sum(r.completion_tokens for r in records),
+            cached_tokens=sum(r.cached_tokens for r in records),
+        )
@@ -0,0 +1,144 @@
+"""오프라인 토큰 수 추정기
+
+tiktoken 등 토크나이저 파일을 내려받지 않고, 글자 종류별 비율로 토큰 수를 추정합니다.
+한글은 Provider 토크나이저마다 음절당 토큰 수가 크게 달라서 Provider별 보정값을 사용합니다.
+추정치는 예산 판단용이므로 실제보다 약간 크게 잡습니다.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Optional
+
+from diary.domain.entities.ai_credential import AIProvider
+from diary.domain.entities.chat_message import ChatMessage
+
+
+@dataclass(frozen=True)
+class TokenCalibration:
+    """글자 종류별 토큰 비율
+
+    Attributes:
+        name: 보정값 이름 (ChatMessage에 캐시한 토큰 수가 어떤 기준인지 구분)
+        hangul_tokens_per_char: 한글 음절/자모 한 글자당 토큰 수
+        other_tokens_per_char: 그 밖의 비 ASCII 문자(한자, 이모지 등) 한 글자당 토큰 수
+        ascii_chars_per_token: ASCII 몇 글자가 토큰 하나인지
+        message_overhead: 메시지 하나당 role/구분자 토큰 수
+    """
+    name: str
+    hangul_tokens_per_char: float = 1.0
+    other_tokens_per_char: float = 1.0
+    ascii_chars_per_token: float = 4.0
+    message_overhead: int = 4
+
+
+# 기본값: 보수적 (한글 한 글자 = 1토큰)
+DEFAULT_CALIBRATION = TokenCalibration(name="default")
+
+# Provider별 보정값 (한국어 대화 샘플을 각 Provider usage와 비교해 약간 크게 잡은 값)
+PROVIDER_CALIBRATIONS = {
+    # gpt-4o 계열 o200k 토크나이저는 한글을 음절 1~2개 단위로 묶음
+    AIProvider.OPENAI: TokenCalibration(
+        name="openai", hangul_tokens_per_char=0.75, ascii_chars_per_token=4.0, message_overhead=4
+    ),
+    # Claude 토크나이저는 한글 음절 대부분이 1토큰
+    AIProvider.ANTHROPIC: TokenCalibration(
+        name="anthropic", hangul_tokens_per_char=1.05, ascii_chars_per_token=3.5, message_overhead=5
+    ),
+    # Gemini SentencePiece는 자주 쓰는 한글 단어를 한 토큰으로 묶지만 단어마다 편차가 커서
+    # 예산을 넘지 않도록 OpenAI보다 약간 크게 잡음
+    AIProvider.GOOGLE: TokenCalibration(
+        name="google", hangul_tokens_per_char=0.8, ascii_chars_per_token=4.0, message_overhead=4
+    ),
+}
+
+
+def _is_hangul(ch: str) -> bool:
+    """한글 음절 또는 자모인지 확인"""
+    code = ord(ch)
+    return 0xAC00 <= code <= 0xD7A3 or 0x1100 <= code <= 0x11FF or 0x3130 <= code <= 0x318F
+
+
+class TokenEstimator:
+    """글자 종류별 비율 기반 토큰 수 추정기"""
+
+    def __init__(self, calibration: TokenCalibration = DEFAULT_CALIBRATION):
+        """
+        Args:
+            calibration: 글자 종류별 토큰 비율 (기본: 보수적 기본값)
+        """
+        self.calibration = calibration
+
+    @classmethod
+    def for_provider(cls, provider: Optional[AIProvider]) -> "TokenEstimator":
+        """
+        Provider 보정값으로 생성
+
+        Args:
+            provider: AI 서비스 제공자 (None이거나 보정값이 없으면 기본값)
+
+        Returns:
+            TokenEstimator 인스턴스
+        """
+        if provider is None:
+            return cls()
+        return cls(PROVIDER_CALIBRATIONS.get(provider, DEFAULT_CALIBRATION))
+
+    @property
+    def message_overhead(self) -> int:
+        """메시지 하나당 추가 토큰 수"""
+        return self.calibration.message_overhead
+
+    def count_text(self, text: str) -> int:
+        """
+        텍스트의 토큰 수 추정
+
+        Args:
+            text: 추정할 텍스트
+
+        Returns:
+            추정 토큰 수 (올림)
+        """
+        hangul = other = ascii_count = 0
+        for ch in text:
+            if ord(ch) < 128:
+                ascii_count += 1
+            elif _is_hangul(ch):
+                hangul += 1
+            else:
+                other += 1
+
+        calibration = self.calibration
+        return math.ceil(
+            hangul * calibration.hangul_tokens_per_char
+            + other * calibration.other_tokens_per_char
+            + ascii_count / calibration.ascii_chars_per_token
+        )
+
+    def count_message(self, message: ChatMessage) -> int:
+        """
+        메시지의 토큰 수 (role 오버헤드 포함)
+
+        계산한 값은 메시지에 캐시하여, 같은 기준이면 다시 계산하지 않습니다.
+
+        Args:
+            message: 채팅 메시지
+
+        Returns:
+            추정 토큰 수
+        """
+        if message.token_count is None or message.token_estimator != self.calibration.name:
+            message.token_count = self.count_text(message.content)
+            message.token_estimator = self.calibration.name
+        return message.token_count + self.message_overhead
+
+    def count_history(self, history: list) -> int:
+        """
+        AI 호출용 히스토리([{"role", "content"}, ...])의 토큰 수
+
+        Args:
+            history: 대화 히스토리
+
+        Returns:
+            추정 토큰 수
+        """
+        return sum(self.count_text(m["content"]) + self.message_overhead for m in history)
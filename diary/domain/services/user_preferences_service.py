@@ -5,6 +5,7 @@
 
 from typing import Optional
 
+from diary.domain.entities.model_routing import ModelRouting, RequestType
 from diary.domain.entities.user_preferences import UserPreferences
 from diary.domain.entities.writing_style import WritingStyle, WritingStyleInfo
 from diary.domain.interfaces.user_preferences_repository import (
@@ -15,6 +16,10 @@ from diary.domain.interfaces.writing_style_examples_repository import (
 )
 
 
+# 일기를 만들 때 프롬프트에 넣는 최대 예시 문장 수
+STYLE_EXAMPLES_LIMIT = 5
+
+
 class UserPreferencesService:
     """사용자 설정 관리 서비스
 
@@ -39,6 +44,9 @@ class UserPreferencesService:
         """
         self.preferences_repo = preferences_repo
         self.examples_repo = examples_repo
+        # 마지막으로 읽은 설정 (저장소 버전이 같으면 다시 읽지 않음)
+        self._cached_preferences: Optional[UserPreferences] = None
+        self._cached_version: Optional[str] = None
 
     def get_preferences(self) -> UserPreferences:
         """사용자 설정 조회
@@ -48,15 +56,29 @@ class UserPreferencesService:
         Returns:
             사용자 설정 객체
         """
+        version = self.preferences_repo.get_version()
+        if self._cached_preferences is not None and version is not None and version == self._cached_version:
+            return self._cached_preferences
+
         preferences = self.preferences_repo.get()
 
         if preferences is None:
-            # 설정이 없으면 기본 설정 생성 및 저장
-            preferences = UserPreferences.create_default()
-            self.preferences_repo.save(preferences)
+            # 설정이 없으면 기본 설정 생성 및 저장 (동시에 만들면 먼저 저장된 설정 사용)
+            preferences = self.preferences_repo.create_if_missing(UserPreferences.create_default())
+            self._cached_preferences = preferences
+            self._cached_version = self.preferences_repo.get_version()
+        else:
+            self._cached_preferences = preferences
+            self._cached_version = version
 
         return preferences
 
+    def _save(self, preferences: UserPreferences) -> None:
+        """설정 저장 + 캐시 갱신"""
+        self.preferences_repo.save(preferences)
+        self._cached_preferences = preferences
+        self._cached_version = self.preferences_repo.get_version()
+
     def update_writing_style(self, new_style: WritingStyle) -> UserPreferences:
         """일기 작성 스타일 변경
 
@@ -71,7 +93,7 @@ class UserPreferencesService:
         """
         preferences = self.get_preferences()
         preferences.change_writing_style(new_style)
-        self.preferences_repo.save(preferences)
+        self._save(preferences)
         return preferences
 
     def get_current_writing_style(self) -> WritingStyle:
@@ -83,25 +105,126 @@ class UserPreferencesService:
         preferences = self.get_preferences()
         return preferences.writing_style
 
-    def get_style_prompt_instruction(self) -> str:
-        """현재 스타일의 AI 프롬프트 지시사항 반환
+    def get_style_prompt_instruction(self, style: Optional[WritingStyle] = None) -> str:
+        """스타일의 AI 프롬프트 지시사항 반환
 
         AI에게 일기를 작성하도록 요청할 때 사용할 지시사항입니다.
-        EMOTIONAL_LITERARY 스타일인 경우, 예시 문장을 포함한 강화된 프롬프트를 생성합니다.
+        세션 내내 바뀌지 않는 시스템 프롬프트에 들어가므로 예시 문장은 넣지 않습니다
+        (일기를 만들 때 get_style_examples_prompt로 대화에 맞는 예시만 따로 붙임).
+
+        Args:
+            style: 지시사항을 만들 스타일 (None이면 현재 선택된 스타일)
 
         Returns:
             프롬프트 지시사항
         """
+        current_style = style or self.get_current_writing_style()
+        return current_style.get_prompt_instruction()
+
+    def get_style_examples_prompt(
+        self,
+        conversation_text: str,
+        style: Optional[WritingStyle] = None,
+        limit: int = STYLE_EXAMPLES_LIMIT,
+    ) -> Optional[str]:
+        """대화 내용과 가장 비슷한 예시 문장으로 만든 예시 안내
+
+        예시 파일이 아무리 커져도 프롬프트에는 limit개만 들어갑니다.
+
+        Args:
+            conversation_text: 일기로 만들 대화 내용
+            style: 예시를 고를 스타일 (None이면 현재 선택된 스타일)
+            limit: 최대 예시 수
+
+        Returns:
+            예시 안내 문구 (예시를 쓰지 않는 스타일이거나 예시가 없으면 None)
+        """
+        current_style = style or self.get_current_writing_style()
+        if not self.examples_repo or not current_style.uses_examples():
+            return None
+
+        examples = self.examples_repo.find_similar_examples(current_style, conversation_text, limit)
+        return current_style.get_examples_instruction(examples)
+
+    def is_compare_styles_enabled(self) -> bool:
+        """스타일별 초안 비교 사용 여부
+
+        Returns:
+            켜져 있으면 True
+        """
+        return self.get_preferences().compare_styles
+
+    def set_compare_styles(self, enabled: bool) -> UserPreferences:
+        """스타일별 초안 비교 켜기/끄기
+
+        Args:
+            enabled: 비교 사용 여부
+
+        Returns:
+            업데이트된 사용자 설정
+        """
         preferences = self.get_preferences()
-        current_style = preferences.writing_style
+        preferences.set_compare_styles(enabled)
+        self._save(preferences)
+        return preferences
 
-        # 예시 문장 저장소가 있으면 예시를 로드
-        examples = []
-        if self.examples_repo:
-            examples = self.examples_repo.get_examples(current_style)
+    def get_model_routing(self) -> ModelRouting:
+        """요청 종류별 모델 라우팅 설정 조회
 
-        # 스타일의 프롬프트 지시사항 생성 (예시 포함)
-        return current_style.get_prompt_instruction(examples)
+        Returns:
+            모델 라우팅 설정
+        """
+        return self.get_preferences().model_routing
+
+    def get_routed_model(self, provider: str, request_type: RequestType) -> Optional[str]:
+        """요청 종류에 맞는 모델 선택
+
+        Args:
+            provider: Provider 이름 (예: "openai")
+            request_type: 요청 종류
+
+        Returns:
+            모델 이름 (None이면 AI 클라이언트 기본 모델 사용)
+        """
+        return self.get_model_routing().get_model(provider, request_type)
+
+    def set_model_routing_enabled(self, enabled: bool) -> UserPreferences:
+        """모델 라우팅 켜기/끄기
+
+        Args:
+            enabled: 라우팅 사용 여부
+
+        Returns:
+            업데이트된 사용자 설정
+        """
+        preferences = self.get_preferences()
+        preferences.set_model_routing_enabled(enabled)
+        self._save(preferences)
+        return preferences
+
+    def update_routing_models(
+        self,
+        provider: str,
+        fast_model: Optional[str] = None,
+        strong_model: Optional[str] = None,
+    ) -> UserPreferences:
+        """Provider의 라우팅 모델 변경
+
+        Args:
+            provider: Provider 이름 (예: "openai")
+            fast_model: 인사/대화/요약용 모델 (None이면 유지)
+            strong_model: 일기 작성용 모델 (None이면 유지)
+
+        Returns:
+            업데이트된 사용자 설정
+
+        Raises:
+            ValueError: 모델 이름이 비어있는 경우
+        """
+        preferences = self.get_preferences()
+        preferences.set_routing_models(provider, fast_model=fast_model, strong_model=strong_model)
+        self._save(preferences)
+        return preferences
 
     def get_all_available_styles(self) -> list[WritingStyleInfo]:
         """사용 가능한 모든 스타일 정보 반환
@@ -120,7 +243,7 @@ class UserPreferencesService:
             초기화된 사용자 설정
         """
         preferences = UserPreferences.create_default()
-        self.preferences_repo.save(preferences)
+        self._save(preferences)
         return preferences
 
     def has_preferences(self) -> bool:
@@ -4,10 +4,16 @@ from diary.presentation.cli import DiaryApp
 from diary.presentation.api_key_ui import ApiKeyUI
 from diary.presentation.preferences_ui import PreferencesUI
 from diary.presentation.diary_ui import DiaryUI
+from diary.presentation.stats_ui import StatsUI
+from diary.presentation.generate_ui import GenerateUI
+from diary.presentation.http_server import DiaryHTTPServer
 
 __all__ = [
     "DiaryApp",
     "ApiKeyUI",
     "PreferencesUI",
     "DiaryUI",
+    "StatsUI",
+    "GenerateUI",
+    "DiaryHTTPServer",
 ]
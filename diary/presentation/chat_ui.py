@@ -1,12 +1,14 @@
 """채팅 UI 컴포넌트"""
 
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Optional
+from rich.columns import Columns
 from rich.console import Console
 from rich.panel import Panel
 from rich.markdown import Markdown
 from rich.prompt import Prompt
 
+from diary.domain.entities.writing_style import WritingStyle
 from diary.domain.services.chat_service import ChatService
 from diary.domain.services.diary_service import DiaryService
 from diary.presentation.diary_ui import DiaryUI
@@ -16,17 +18,23 @@ class ChatUI:
     """채팅 대화 UI - 단일 책임 원칙 적용"""
 
     def __init__(
-        self, chat_service: ChatService, console: Console, diary_service: DiaryService
+        self,
+        chat_service: ChatService,
+        console: Console,
+        diary_service: DiaryService,
+        show_usage: bool = False,
     ):
         """
         Args:
             chat_service: 채팅 비즈니스 로직
             console: Rich Console 객체
             diary_service: 일기 비즈니스 로직
+            show_usage: AI 응답마다 토큰 사용량(캐시 적중 포함) 표시 여부
         """
         self.chat_service = chat_service
         self.console = console
         self.diary_service = diary_service
+        self.show_usage = show_usage
         self.diary_ui = DiaryUI(diary_service, console)
 
     def start_chat(self, on_back_callback):
@@ -94,6 +102,7 @@ class ChatUI:
                     self._display_diary(ai_response)
                 else:
                     self._display_ai_message(ai_response)
+                    self._display_usage()
 
             except Exception as e:
                 self.console.print(f"\n[red]오류 발생: {str(e)}[/red]")
@@ -111,14 +120,40 @@ class ChatUI:
             )
         )
 
+    def _display_usage(self):
+        """마지막 AI 호출의 토큰 사용량 표시 (show_usage가 켜진 경우만)"""
+        if not self.show_usage:
+            return
+
+        usage = self.chat_service.get_last_usage()
+        if not usage:
+            return
+
+        estimate = self.chat_service.last_request_tokens
+        self.console.print(
+            f"[dim]tokens: prompt {usage.prompt_tokens} "
+            f"{f'(est {estimate}) ' if estimate is not None else ''}"
+            f"(cached {usage.cached_tokens}, {usage.get_cache_hit_ratio():.0%}) "
+            f"/ completion {usage.completion_tokens}[/dim]"
+        )
+
+        stats = self.chat_service.get_speculation_stats()
+        if self.chat_service.last_response_speculative and stats:
+            self.console.print(
+                f"[dim]미리 작성한 초안 사용 (적중 {stats.hits}/{stats.hits + stats.misses + stats.failures}, "
+                f"{stats.hit_rate:.0%})[/dim]"
+            )
+
     def _display_diary(self, content: str):
         """일기 생성 시 특별하게 표시"""
+        # 스타일 비교를 켰으면 스타일별 초안을 나란히 보여주고 선택
+        drafts = self.chat_service.last_style_drafts
+        if len(drafts) > 1:
+            self._display_style_drafts(drafts)
+            return
+
         # [DIARY_START]와 [DIARY_END] 마커 제거
-        diary_content = content
-        if "[DIARY_START]" in content and "[DIARY_END]" in content:
-            start_idx = content.find("[DIARY_START]") + len("[DIARY_START]")
-            end_idx = content.find("[DIARY_END]")
-            diary_content = content[start_idx:end_idx].strip()
+        diary_content = ChatService.extract_diary_content(content)
 
         self.console.print()
         self.console.print(
@@ -129,6 +164,7 @@ class ChatUI:
                 padding=(1, 2),
             )
         )
+        self._display_usage()
         self.console.print("\n[green]✓ 일기 초안이 완성되었습니다![/green]")
         choice = Prompt.ask(
             "[yellow]이대로 일기를 작성할까요?[/yellow]",
@@ -142,6 +178,38 @@ class ChatUI:
         else:
             self.console.print("[dim]계속 대화하거나 'quit'로 종료하세요.[/dim]")
 
+    def _display_style_drafts(self, drafts: Dict[WritingStyle, str]):
+        """스타일별 일기 초안을 나란히 표시하고 저장할 초안 선택"""
+        styles = list(drafts)
+        panels = [
+            Panel(
+                Markdown(drafts[style]),
+                title=f"[bold yellow]{i}. {style.get_display_name()}[/bold yellow]"
+                + (" ⭐" if i == 1 else ""),
+                border_style="yellow",
+                padding=(1, 1),
+            )
+            for i, style in enumerate(styles, 1)
+        ]
+
+        self.console.print()
+        self.console.print("[bold yellow]📖 스타일별 일기 초안이 작성되었습니다![/bold yellow]")
+        self.console.print(Columns(panels, equal=True, expand=True))
+        self._display_usage()
+
+        numbers = [str(i) for i in range(1, len(styles) + 1)]
+        choice = Prompt.ask(
+            "[yellow]저장할 초안 번호를 선택하세요 (n: 계속 대화)[/yellow]",
+            choices=[*numbers, "n"],
+            default="1",
+        )
+
+        if choice != "n":
+            if self.on_back_callback:
+                self._end_chat_session(self.on_back_callback, drafts[styles[int(choice) - 1]])
+        else:
+            self.console.print("[dim]계속 대화하거나 'quit'로 종료하세요.[/dim]")
+
     def _display_recent_messages(self, session, count: int = 3):
         """최근 메시지 몇 개 표시"""
         recent_messages = (
@@ -26,12 +26,14 @@ class DiaryApp:
         preferences_service: UserPreferencesService,
         diary_service: DiaryService,
         chat_service: Optional[ChatService] = None,
+        show_usage: bool = False,
     ):
         """
         Args:
             credential_service: AI 인증 정보 관리 서비스 (Domain Layer)
             preferences_service: 사용자 설정 관리 서비스 (Domain Layer)
             chat_service: 채팅 비즈니스 로직 서비스 (Domain Layer, 선택적)
+            show_usage: 채팅 중 토큰 사용량 표시 여부
         """
         self.credential_service = credential_service
         self.preferences_service = preferences_service
@@ -46,14 +48,16 @@ class DiaryApp:
 
         # ChatUI는 chat_service가 있을 때만 초기화
         if chat_service:
-            self.chat_ui = ChatUI(chat_service, self.console, self.diary_service)
+            self.chat_ui = ChatUI(
+                chat_service, self.console, self.diary_service, show_usage=show_usage
+            )
         else:
             self.chat_ui = None
 
     def run(self):
         """애플리케이션 실행"""
-        # API 키 확인 - 없으면 등록 플로우로 이동
-        if not self.credential_service.has_any_credential():
+        # API 키 확인 - 없으면 등록 플로우로 이동 (가짜 AI 등으로 채팅이 준비된 경우 제외)
+        if not self.chat_service and not self.credential_service.has_any_credential():
             self.console.print(
                 Panel.fit(
                     "[bold yellow]⚠️  There is not registered API Key[/bold yellow]\n\n"
@@ -228,8 +228,9 @@ class DiaryUI:
 
         try:
             if diary.diary_id:
+                # 수정하는 동안 다른 곳에서 바꿨으면 덮어쓰지 않음
                 updated_diary = self.diary_service.update_diary(
-                    diary.diary_id, new_content
+                    diary.diary_id, new_content, expected_version=diary.version
                 )
                 self.console.print(
                     f"\n[green]✓ 일기가 수정되었습니다.[/green]\n"
@@ -0,0 +1,161 @@
+"""일괄 일기 생성 UI"""
+
+import re
+from datetime import date, datetime
+from pathlib import Path
+from typing import List
+
+from rich.console import Console
+from rich.progress import BarColumn, MofNCompleteColumn, Progress, TextColumn, TimeElapsedColumn
+from rich.table import Table
+
+from diary.domain.services.bulk_diary_generation_service import (
+    BulkDiaryGenerationService,
+    BulkGenerationSummary,
+    DiaryGenerationResult,
+    DiaryGenerationTask,
+)
+from diary.domain.services.chat_service import ChatService
+
+
+# 대화 기록 파일 이름에서 날짜 추출 (예: 2024-02-17.txt, chat_2024-02-17.md)
+_DATE_IN_NAME = re.compile(r"(\d{4})-(\d{2})-(\d{2})")
+
+# 디렉토리를 넘겼을 때 읽을 대화 기록 파일 확장자
+TRANSCRIPT_SUFFIXES = (".txt", ".md")
+
+
+class GenerateUI:
+    """종료된 세션/대화 기록 파일로 일기를 일괄 생성하는 UI"""
+
+    def __init__(
+        self,
+        bulk_service: BulkDiaryGenerationService,
+        chat_service: ChatService,
+        console: Console,
+    ):
+        """
+        Args:
+            bulk_service: 일괄 생성 서비스 (Domain Layer)
+            chat_service: 채팅 서비스 (종료된 세션 조회용)
+            console: Rich Console 인스턴스
+        """
+        self.bulk_service = bulk_service
+        self.chat_service = chat_service
+        self.console = console
+
+    def generate_from_sessions(self, job_id: str, limit: int = 100) -> BulkGenerationSummary:
+        """
+        종료된 채팅 세션으로 일기 일괄 생성
+
+        Args:
+            job_id: 체크포인트 작업 ID
+            limit: 조회할 최대 세션 수
+
+        Returns:
+            BulkGenerationSummary
+        """
+        sessions = self.chat_service.list_ended_sessions(limit=limit)
+        tasks = self.bulk_service.tasks_from_sessions(sessions)
+        return self._run(job_id, tasks)
+
+    def generate_from_files(self, job_id: str, paths: List[Path]) -> BulkGenerationSummary:
+        """
+        대화 기록 파일로 일기 일괄 생성
+
+        파일 이름에 YYYY-MM-DD가 있으면 그 날짜, 없으면 파일 수정 날짜로 일기를 작성합니다.
+
+        Args:
+            job_id: 체크포인트 작업 ID
+            paths: 파일 또는 디렉토리 경로 리스트
+
+        Returns:
+            BulkGenerationSummary
+        """
+        tasks = []
+        for file_path in self._collect_files(paths):
+            try:
+                text = file_path.read_text(encoding="utf-8")
+            except (OSError, UnicodeDecodeError) as e:
+                self.console.print(f"[yellow]⚠ {file_path} 읽기 실패: {e}[/yellow]")
+                continue
+            if not text.strip():
+                continue
+            tasks.append(self.bulk_service.task_from_transcript(
+                str(file_path.resolve()), text, self._date_for_file(file_path)
+            ))
+
+        tasks = self.bulk_service.merge_tasks_by_date(tasks)
+        return self._run(job_id, tasks)
+
+    def _run(self, job_id: str, tasks: List[DiaryGenerationTask]) -> BulkGenerationSummary:
+        """진행 표시와 함께 실행하고 결과 요약 출력"""
+        if not tasks:
+            self.console.print("[yellow]일기로 만들 대화가 없습니다.[/yellow]")
+            return BulkGenerationSummary()
+
+        self.console.print(
+            f"[cyan]📝 {len(tasks)}개 날짜의 일기를 생성합니다 "
+            f"(워커 {self.bulk_service.max_workers}개, 작업 ID: {job_id})[/cyan]"
+        )
+
+        progress = Progress(
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            TimeElapsedColumn(),
+            console=self.console,
+        )
+        with progress:
+            bar = progress.add_task("일기 생성 중", total=len(tasks))
+
+            def on_result(result: DiaryGenerationResult) -> None:
+                if result.status == "failed":
+                    progress.console.print(f"[red]✗ {result.diary_date}: {result.error}[/red]")
+                progress.advance(bar)
+
+            summary = self.bulk_service.run(job_id, tasks, on_result=on_result)
+            progress.update(bar, completed=len(tasks))
+
+        self._display_summary(summary)
+        return summary
+
+    def _display_summary(self, summary: BulkGenerationSummary) -> None:
+        """결과 요약 표 출력"""
+        table = Table(title="일괄 생성 결과", title_style="bold cyan")
+        table.add_column("항목")
+        table.add_column("개수", justify="right")
+        table.add_row("[green]생성됨[/green]", str(summary.created))
+        table.add_row("[dim]이미 일기가 있음[/dim]", str(summary.skipped))
+        table.add_row("[dim]이전 실행에서 완료[/dim]", str(summary.resumed))
+        table.add_row("[red]실패[/red]", str(summary.failed))
+
+        self.console.print()
+        self.console.print(table)
+        if summary.failed:
+            self.console.print("[yellow]실패한 항목은 같은 명령을 다시 실행하면 재시도합니다.[/yellow]")
+
+    def _collect_files(self, paths: List[Path]) -> List[Path]:
+        """파일/디렉토리 경로 → 대화 기록 파일 목록 (이름순)"""
+        files = []
+        for path in paths:
+            if path.is_dir():
+                files.extend(
+                    p for p in sorted(path.iterdir())
+                    if p.is_file() and p.suffix.lower() in TRANSCRIPT_SUFFIXES
+                )
+            elif path.is_file():
+                files.append(path)
+            else:
+                self.console.print(f"[yellow]⚠ {path} 파일을 찾을 수 없습니다.[/yellow]")
+        return files
+
+    def _date_for_file(self, file_path: Path) -> date:
+        """파일 이름의 YYYY-MM-DD, 없으면 파일 수정 날짜"""
+        match = _DATE_IN_NAME.search(file_path.name)
+        if match:
+            try:
+                return date(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+            except ValueError:
+                pass
+        return datetime.fromtimestamp(file_path.stat().st_mtime).date()
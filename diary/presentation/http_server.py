@@ -0,0 +1,537 @@
+"""HTTP API 서버 (daily serve)
+
+일기 CRUD/목록/검색과 채팅 턴을 HTTP(JSON)로 제공합니다.
+- 연결은 asyncio로 받고, 저장소·AI 호출처럼 블로킹되는 도메인 서비스 호출은 스레드 풀에서 실행
+- 사용자는 X-User-Id 헤더로 구분 (없으면 기본 사용자)
+- 채팅은 사용자별 ChatService를 만들어 두고 재사용 (활성 세션을 메모리에 유지),
+  같은 사용자의 턴은 한 번에 하나씩 처리
+- 채팅 응답은 Accept: text/event-stream (또는 "stream": true)이면 SSE로 조각마다 전송
+
+CLI와 같은 Domain 서비스만 사용하므로 비즈니스 규칙은 그대로 적용됩니다.
+"""
+
+import asyncio
+import json
+import re
+import traceback
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import date
+from http import HTTPStatus
+from typing import AsyncGenerator, AsyncIterator, Callable, Dict, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from diary.domain.entities import ChatSession, MessageRole
+from diary.domain.exceptions import ConcurrentModificationError
+from diary.domain.interfaces import DEFAULT_USER_ID, validate_user_id
+from diary.domain.services import ChatService
+from diary.domain.services.diary_service import DiaryService
+
+
+# 요청 헤더/본문 최대 크기
+MAX_HEADER_BYTES = 64 * 1024
+MAX_BODY_BYTES = 1024 * 1024
+
+# 요청 없이 열려 있는 keep-alive 연결을 닫기까지의 시간 (초)
+KEEP_ALIVE_TIMEOUT = 30.0
+
+# 목록/검색 한 번에 돌려주는 최대 일기 수
+MAX_PAGE_SIZE = 100
+
+USER_ID_HEADER = "x-user-id"
+
+_DATE_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+
+class HTTPError(Exception):
+    """HTTP 상태 코드와 함께 돌려줄 오류"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+@dataclass
+class HTTPRequest:
+    """파싱한 HTTP 요청"""
+    method: str
+    path: str
+    query: Dict[str, str]
+    headers: Dict[str, str]
+    body: bytes = b""
+    version: str = "HTTP/1.1"
+
+    @property
+    def keep_alive(self) -> bool:
+        """응답 후 연결을 유지할지 (HTTP/1.1 기본 유지, HTTP/1.0 기본 종료)"""
+        connection = self.headers.get("connection", "").lower()
+        if self.version == "HTTP/1.0":
+            return connection == "keep-alive"
+        return connection != "close"
+
+    def json(self) -> dict:
+        """본문을 JSON 객체로 파싱"""
+        if not self.body:
+            return {}
+        try:
+            data = json.loads(self.body.decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            raise HTTPError(400, "요청 본문이 올바른 JSON이 아닙니다.")
+        if not isinstance(data, dict):
+            raise HTTPError(400, "요청 본문은 JSON 객체여야 합니다.")
+        return data
+
+
+@dataclass
+class _EventStream:
+    """SSE로 보낼 이벤트 (첫 이벤트는 응답 헤더를 보내기 전에 미리 받아 둠)"""
+    first: Tuple[str, dict]
+    rest: AsyncGenerator[Tuple[str, dict], None]
+
+
+@dataclass
+class _ChatSlot:
+    """사용자 하나의 ChatService와 턴 직렬화용 잠금"""
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    service: Optional[ChatService] = None
+    users: int = 0  # 잠금을 기다리거나 잡고 있는 요청 수 (0일 때만 정리 대상)
+
+
+class DiaryHTTPServer:
+    """일기/채팅 HTTP API 서버
+
+    의존성:
+    - diary_service_factory: user_id → DiaryService (요청마다 호출, 연결 공유 권장)
+    - chat_service_factory: user_id → ChatService (사용할 AI가 없으면 None)
+    """
+
+    def __init__(
+        self,
+        diary_service_factory: Callable[[str], DiaryService],
+        chat_service_factory: Callable[[str], Optional[ChatService]],
+        host: str = "127.0.0.1",
+        port: int = 8080,
+        max_workers: int = 32,
+        max_chat_services: int = 1000,
+    ):
+        """
+        Args:
+            diary_service_factory: 사용자별 DiaryService 생성 함수
+            chat_service_factory: 사용자별 ChatService 생성 함수
+            host: 바인드할 주소 (기본: 로컬에서만 접속)
+            port: 포트 (0이면 빈 포트를 골라 start() 후 self.port에 기록)
+            max_workers: 도메인 서비스 호출을 실행할 스레드 수 (동시에 진행되는 AI 호출 수 상한)
+            max_chat_services: 메모리에 유지할 사용자별 ChatService 수 (넘으면 오래 쓰지 않은 것부터 정리)
+        """
+        if max_workers < 1 or max_chat_services < 1:
+            raise ValueError("max_workers와 max_chat_services는 1 이상이어야 합니다.")
+
+        self.diary_service_factory = diary_service_factory
+        self.chat_service_factory = chat_service_factory
+        self.host = host
+        self.port = port
+        self.max_chat_services = max_chat_services
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="http-worker")
+        self._chat_slots: "OrderedDict[str, _ChatSlot]" = OrderedDict()
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._routes = [
+            ("GET", re.compile(r"^/health$"), self._health),
+            ("GET", re.compile(r"^/diaries$"), self._list_diaries),
+            ("POST", re.compile(r"^/diaries$"), self._create_diary),
+            ("GET", re.compile(r"^/diaries/search$"), self._search_diaries),
+            ("GET", re.compile(r"^/diaries/(?P<key>[^/]+)$"), self._get_diary),
+            ("PUT", re.compile(r"^/diaries/(?P<key>[^/]+)$"), self._update_diary),
+            ("DELETE", re.compile(r"^/diaries/(?P<key>[^/]+)$"), self._delete_diary),
+            ("GET", re.compile(r"^/chat/session$"), self._get_chat_session),
+            ("POST", re.compile(r"^/chat/session$"), self._start_chat_session),
+            ("DELETE", re.compile(r"^/chat/session$"), self._end_chat_session),
+            ("POST", re.compile(r"^/chat/messages$"), self._send_chat_message),
+        ]
+
+    # ==================== 서버 수명 ====================
+
+    async def start(self) -> asyncio.AbstractServer:
+        """연결 받기 시작 (시작한 서버 반환)"""
+        server = await asyncio.start_server(
+            self._handle_connection, self.host, self.port, limit=MAX_HEADER_BYTES
+        )
+        self._server = server
+        self.port = server.sockets[0].getsockname()[1]
+        return server
+
+    async def serve_forever(self) -> None:
+        """서버 시작 후 종료될 때까지 실행"""
+        server = self._server or await self.start()
+        async with server:
+            await server.serve_forever()
+
+    async def close(self) -> None:
+        """연결 받기를 멈추고 사용자별 ChatService 정리 (남은 세션 저장)"""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        services = [slot.service for slot in self._chat_slots.values() if slot.service]
+        self._chat_slots.clear()
+        for service in services:
+            await self._run(service.close)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    # ==================== HTTP 처리 ====================
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """연결 하나의 요청을 차례로 처리 (keep-alive)"""
+        try:
+            while True:
+                try:
+                    request = await asyncio.wait_for(self._read_request(reader), KEEP_ALIVE_TIMEOUT)
+                except HTTPError as e:
+                    await self._write_json(writer, e.status, {"error": e.message}, keep_alive=False)
+                    return
+                if request is None:
+                    return
+
+                keep_alive = request.keep_alive
+                try:
+                    status, payload = await self._dispatch(request)
+                except Exception as e:
+                    status, payload = self._error_response(e)
+
+                if isinstance(payload, _EventStream):
+                    await self._write_event_stream(writer, payload, keep_alive)
+                else:
+                    await self._write_json(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    return
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> Optional[HTTPRequest]:
+        """요청 하나 읽기 (연결이 닫혔으면 None)"""
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except asyncio.IncompleteReadError as e:
+            if not e.partial.strip():
+                return None
+            raise
+        except asyncio.LimitOverrunError:
+            raise HTTPError(431, "요청 헤더가 너무 큽니다.")
+
+        lines = head.decode("latin-1").split("\r\n")
+        try:
+            method, target, version = lines[0].split(" ", 2)
+        except ValueError:
+            raise HTTPError(400, "잘못된 요청입니다.")
+
+        headers = {}
+        for line in lines[1:]:
+            if ":" in line:
+                name, value = line.split(":", 1)
+                headers[name.strip().lower()] = value.strip()
+
+        if "chunked" in headers.get("transfer-encoding", "").lower():
+            raise HTTPError(411, "Content-Length가 필요합니다.")
+        try:
+            length = int(headers.get("content-length", "0"))
+        except ValueError:
+            raise HTTPError(400, "Content-Length가 올바르지 않습니다.")
+        if length < 0 or length > MAX_BODY_BYTES:
+            raise HTTPError(413, "요청 본문이 너무 큽니다.")
+        body = await reader.readexactly(length) if length else b""
+
+        url = urlsplit(target)
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        return HTTPRequest(
+            method=method.upper(),
+            path=unquote(url.path),
+            query=query,
+            headers=headers,
+            body=body,
+            version=version.strip(),
+        )
+
+    async def _dispatch(self, request: HTTPRequest) -> tuple:
+        """경로에 맞는 핸들러 실행 → (상태 코드, 응답 본문)"""
+        path_matched = False
+        for method, pattern, handler in self._routes:
+            match = pattern.match(request.path)
+            if not match:
+                continue
+            path_matched = True
+            if method == request.method:
+                user_id = validate_user_id(request.headers.get(USER_ID_HEADER) or DEFAULT_USER_ID)
+                return await handler(request, user_id, **match.groupdict())
+
+        if path_matched:
+            raise HTTPError(405, f"{request.method} 메서드는 지원하지 않습니다.")
+        raise HTTPError(404, f"{request.path} 경로를 찾을 수 없습니다.")
+
+    @staticmethod
+    def _error_response(error: Exception) -> Tuple[int, dict]:
+        """예외 → (상태 코드, 오류 본문)"""
+        if isinstance(error, HTTPError):
+            return error.status, {"error": error.message}
+        if isinstance(error, ConcurrentModificationError):
+            # 다른 요청이 먼저 수정함 (최신 내용을 다시 읽고 재시도)
+            return 409, {"error": str(error), "version": error.actual_version}
+        if isinstance(error, ValueError):
+            # 도메인 서비스의 비즈니스 규칙 위반
+            return 400, {"error": str(error)}
+        traceback.print_exc()
+        return 500, {"error": "서버 오류가 발생했습니다."}
+
+    @staticmethod
+    def _status_line(status: int) -> bytes:
+        return f"HTTP/1.1 {status} {HTTPStatus(status).phrase}\r\n".encode("latin-1")
+
+    async def _write_json(self, writer: asyncio.StreamWriter, status: int, payload, keep_alive: bool) -> None:
+        """JSON 응답 쓰기"""
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        head = (
+            "Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        writer.write(self._status_line(status) + head.encode("latin-1") + body)
+        await writer.drain()
+
+    async def _write_event_stream(self, writer: asyncio.StreamWriter, stream: _EventStream, keep_alive: bool) -> None:
+        """SSE 응답 쓰기 (chunked 전송, 이벤트마다 바로 전송)"""
+        head = (
+            "Content-Type: text/event-stream; charset=utf-8\r\n"
+            "Cache-Control: no-cache\r\n"
+            "Transfer-Encoding: chunked\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        writer.write(self._status_line(200) + head.encode("latin-1"))
+
+        async def send(event: str, data: dict) -> None:
+            frame = f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n".encode("utf-8")
+            writer.write(f"{len(frame):x}\r\n".encode("latin-1") + frame + b"\r\n")
+            await writer.drain()
+
+        try:
+            await send(*stream.first)
+            async for event, data in stream.rest:
+                await send(event, data)
+        finally:
+            # 클라이언트가 끊어도 진행 중인 턴은 끝까지 저장되도록 기다림
+            await stream.rest.aclose()
+        writer.write(b"0\r\n\r\n")
+        await writer.drain()
+
+    async def _run(self, func: Callable, *args):
+        """블로킹 호출을 스레드 풀에서 실행"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    # ==================== 일기 ====================
+
+    async def _health(self, request: HTTPRequest, user_id: str) -> tuple:
+        return 200, {"status": "ok", "chat_sessions": len(self._chat_slots)}
+
+    async def _list_diaries(self, request: HTTPRequest, user_id: str) -> tuple:
+        diary_service = self.diary_service_factory(user_id)
+        limit = self._parse_limit(request.query.get("limit"))
+        start_date = self._parse_date(request.query["start"]) if "start" in request.query else None
+        end_date = self._parse_date(request.query["end"]) if "end" in request.query else None
+
+        diaries, next_cursor = await self._run(
+            diary_service.list_diaries, request.query.get("cursor"), limit, start_date, end_date
+        )
+        return 200, {"items": [d.to_dict() for d in diaries], "next_cursor": next_cursor}
+
+    async def _search_diaries(self, request: HTTPRequest, user_id: str) -> tuple:
+        diary_service = self.diary_service_factory(user_id)
+        limit = self._parse_limit(request.query.get("limit"))
+        diaries = await self._run(diary_service.search_diaries, request.query.get("q", ""), limit)
+        return 200, {"items": [d.to_dict() for d in diaries]}
+
+    async def _get_diary(self, request: HTTPRequest, user_id: str, key: str) -> tuple:
+        diary = await self._find_diary(self.diary_service_factory(user_id), key)
+        return 200, diary.to_dict()
+
+    async def _create_diary(self, request: HTTPRequest, user_id: str) -> tuple:
+        diary_service = self.diary_service_factory(user_id)
+        body = request.json()
+        diary_date = self._parse_date(body["date"]) if body.get("date") else date.today()
+        content = body.get("content")
+        if not isinstance(content, str):
+            raise HTTPError(400, "content가 필요합니다.")
+
+        if await self._run(diary_service.has_diary_on_date, diary_date):
+            raise HTTPError(409, f"{diary_date} 날짜의 일기가 이미 존재합니다.")
+        diary = await self._run(diary_service.create_diary, diary_date, content)
+        return 201, diary.to_dict()
+
+    async def _update_diary(self, request: HTTPRequest, user_id: str, key: str) -> tuple:
+        diary_service = self.diary_service_factory(user_id)
+        body = request.json()
+        content = body.get("content")
+        if not isinstance(content, str):
+            raise HTTPError(400, "content가 필요합니다.")
+        expected_version = body.get("version")
+        if expected_version is not None and not isinstance(expected_version, int):
+            raise HTTPError(400, "version은 정수여야 합니다.")
+
+        diary = await self._find_diary(diary_service, key)
+        updated = await self._run(diary_service.update_diary, diary.diary_id, content, expected_version)
+        return 200, updated.to_dict()
+
+    async def _delete_diary(self, request: HTTPRequest, user_id: str, key: str) -> tuple:
+        diary_service = self.diary_service_factory(user_id)
+        diary = await self._find_diary(diary_service, key)
+        deleted = await self._run(diary_service.delete_diary, diary.diary_id)
+        return 200, {"deleted": deleted}
+
+    async def _find_diary(self, diary_service: DiaryService, key: str):
+        """ID 또는 날짜(YYYY-MM-DD)로 일기 조회 (없으면 404)"""
+        if _DATE_PATTERN.match(key):
+            diary = await self._run(diary_service.get_diary_by_date, self._parse_date(key))
+        else:
+            diary = await self._run(diary_service.get_diary_by_id, key)
+        if diary is None:
+            raise HTTPError(404, f"{key} 일기를 찾을 수 없습니다.")
+        return diary
+
+    @staticmethod
+    def _parse_date(value: str) -> date:
+        try:
+            return date.fromisoformat(value)
+        except (TypeError, ValueError):
+            raise HTTPError(400, f"날짜 형식이 올바르지 않습니다: {value} (YYYY-MM-DD)")
+
+    @staticmethod
+    def _parse_limit(value: Optional[str]) -> int:
+        if value is None:
+            return 30
+        try:
+            limit = int(value)
+        except ValueError:
+            raise HTTPError(400, f"limit는 숫자여야 합니다: {value}")
+        return max(1, min(limit, MAX_PAGE_SIZE))
+
+    # ==================== 채팅 ====================
+
+    @asynccontextmanager
+    async def _chat_service(self, user_id: str) -> AsyncIterator[ChatService]:
+        """사용자의 ChatService를 잠그고 사용 (같은 사용자의 턴은 한 번에 하나씩)"""
+        slot = self._chat_slots.get(user_id)
+        if slot is None:
+            slot = self._chat_slots[user_id] = _ChatSlot()
+        self._chat_slots.move_to_end(user_id)
+
+        slot.users += 1
+        try:
+            async with slot.lock:
+                if slot.service is None:
+                    slot.service = await self._run(self.chat_service_factory, user_id)
+                    if slot.service is None:
+                        raise HTTPError(503, "사용할 AI가 없습니다. API 키를 등록하거나 DAILY_AI_PROVIDER=fake를 사용하세요.")
+                yield slot.service
+        finally:
+            slot.users -= 1
+            self._evict_idle_chat_services()
+
+    def _evict_idle_chat_services(self) -> None:
+        """유지 개수를 넘으면 오래 쓰지 않은 사용자의 ChatService부터 정리"""
+        while len(self._chat_slots) > self.max_chat_services:
+            idle_user = next((uid for uid, slot in self._chat_slots.items() if slot.users == 0), None)
+            if idle_user is None:
+                return
+            slot = self._chat_slots.pop(idle_user)
+            if slot.service:
+                self._executor.submit(slot.service.close)
+
+    async def _get_chat_session(self, request: HTTPRequest, user_id: str) -> tuple:
+        async with self._chat_service(user_id) as chat_service:
+            session = await self._run(chat_service.get_current_session)
+            if session is None:
+                raise HTTPError(404, "진행 중인 대화가 없습니다.")
+            return 200, self._session_payload(session)
+
+    async def _start_chat_session(self, request: HTTPRequest, user_id: str) -> tuple:
+        async with self._chat_service(user_id) as chat_service:
+            session = await self._run(chat_service.start_new_session)
+            return 201, self._session_payload(session)
+
+    async def _end_chat_session(self, request: HTTPRequest, user_id: str) -> tuple:
+        async with self._chat_service(user_id) as chat_service:
+            ended = await self._run(chat_service.end_current_session)
+            return 200, {"ended": ended}
+
+    async def _send_chat_message(self, request: HTTPRequest, user_id: str) -> tuple:
+        body = request.json()
+        message = body.get("message")
+        if not isinstance(message, str) or not message.strip():
+            raise HTTPError(400, "message가 필요합니다.")
+
+        if body.get("stream") or "text/event-stream" in request.headers.get("accept", ""):
+            events = self._chat_events(user_id, message)
+            # 첫 이벤트 전에 실패하면 (AI 없음, 토큰 예산 초과 등) 일반 JSON 오류로 응답
+            first = await events.__anext__()
+            return 200, _EventStream(first=first, rest=events)
+
+        async with self._chat_service(user_id) as chat_service:
+            reply, is_diary = await self._run(chat_service.send_message, message)
+            return 200, self._reply_payload(chat_service, reply, is_diary)
+
+    async def _chat_events(self, user_id: str, message: str) -> AsyncGenerator[Tuple[str, dict], None]:
+        """채팅 턴 하나를 실행하며 응답 조각(chunk)과 완료(done) 이벤트 생성"""
+        async with self._chat_service(user_id) as chat_service:
+            loop = asyncio.get_running_loop()
+            chunks: asyncio.Queue = asyncio.Queue()
+
+            def on_chunk(text: str) -> None:
+                loop.call_soon_threadsafe(chunks.put_nowait, text)
+
+            turn = loop.run_in_executor(self._executor, chat_service.send_message, message, on_chunk)
+            turn.add_done_callback(lambda _: chunks.put_nowait(None))
+
+            started = False
+            try:
+                while (text := await chunks.get()) is not None:
+                    started = True
+                    yield "chunk", {"text": text}
+                try:
+                    reply, is_diary = turn.result()
+                except Exception as e:
+                    if not started:
+                        raise
+                    status, payload = self._error_response(e)
+                    yield "error", {"status": status, **payload}
+                    return
+                yield "done", self._reply_payload(chat_service, reply, is_diary)
+            finally:
+                if not turn.done():
+                    await asyncio.wait([turn])
+
+    @staticmethod
+    def _reply_payload(chat_service: ChatService, reply: str, is_diary: bool) -> dict:
+        session = chat_service.get_current_session()
+        payload = {
+            "reply": reply,
+            "is_diary": is_diary,
+            "session_id": session.session_id if session else None,
+        }
+        if is_diary:
+            payload["diary_content"] = chat_service.extract_diary_content(reply)
+        return payload
+
+    @staticmethod
+    def _session_payload(session: ChatSession) -> dict:
+        """시스템 프롬프트를 뺀 세션 정보 (tail만 읽은 세션이면 최근 메시지만)"""
+        return {
+            "session_id": session.session_id,
+            "is_active": session.is_active,
+            "message_count": session.get_message_count(),
+            "messages": [
+                {"role": m.role.value, "content": m.content, "timestamp": m.timestamp.isoformat()}
+                for m in session.messages
+                if m.role != MessageRole.SYSTEM
+            ],
+        }
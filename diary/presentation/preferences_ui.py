@@ -49,6 +49,16 @@ class PreferencesUI:
             f"[green]{current_style.get_display_name()}[/green]"
         )
         self.console.print(f"[dim]  Example: {current_style.get_description()}[/dim]")
+        routing = self.preferences_service.get_model_routing()
+        self.console.print(
+            f"[bold]Model Routing:[/bold] "
+            f"{'[green]ON[/green]' if routing.enabled else '[dim]OFF[/dim]'}"
+        )
+        compare_styles = self.preferences_service.is_compare_styles_enabled()
+        self.console.print(
+            f"[bold]Compare All Styles:[/bold] "
+            f"{'[green]ON[/green]' if compare_styles else '[dim]OFF[/dim]'}"
+        )
         self.console.print()
 
         # 모든 사용 가능한 스타일 표시
@@ -66,17 +76,23 @@ class PreferencesUI:
         # 옵션 메뉴
         self.console.print("[bold]Options:[/bold]")
         self.console.print("  1. Change writing style")
-        self.console.print("  2. Reset to default")
-        self.console.print("  3. Back to main menu")
+        self.console.print("  2. Configure model routing")
+        self.console.print("  3. Turn style comparison " + ("OFF" if compare_styles else "ON"))
+        self.console.print("  4. Reset to default")
+        self.console.print("  5. Back to main menu")
         self.console.print()
 
-        choice = Prompt.ask("Choice", choices=["1", "2", "3"], default="3")
+        choice = Prompt.ask("Choice", choices=["1", "2", "3", "4", "5"], default="5")
 
         if choice == "1":
             self.change_writing_style()
         elif choice == "2":
-            self.reset_preferences()
+            self.configure_model_routing()
         elif choice == "3":
+            self.toggle_compare_styles()
+        elif choice == "4":
+            self.reset_preferences()
+        elif choice == "5":
             if self._on_back_callback:
                 self._on_back_callback()
 
@@ -114,6 +130,62 @@ class PreferencesUI:
         except ValueError as e:
             self.console.print(f"[red]✗[/red] Error: {e}")
 
+    def configure_model_routing(self):
+        """요청 종류별 모델 라우팅 설정
+
+        인사/대화/요약은 빠른 모델, 일기 작성은 상위 모델로 보냅니다.
+        """
+        routing = self.preferences_service.get_model_routing()
+
+        self.console.print()
+        self.console.print("[bold]Model Routing[/bold] [dim](greeting/small talk/summary → fast, diary → strong)[/dim]")
+        for provider in sorted(set(routing.fast_models) | set(routing.strong_models)):
+            self.console.print(
+                f"  [cyan]{provider}[/cyan]: fast [green]{routing.fast_models.get(provider, '-')}[/green]"
+                f" / strong [yellow]{routing.strong_models.get(provider, '-')}[/yellow]"
+            )
+        self.console.print()
+        self.console.print("  1. Turn routing " + ("OFF" if routing.enabled else "ON"))
+        self.console.print("  2. Change models for a provider")
+        self.console.print("  3. Back")
+        self.console.print()
+
+        choice = Prompt.ask("Choice", choices=["1", "2", "3"], default="3")
+
+        try:
+            if choice == "1":
+                self.preferences_service.set_model_routing_enabled(not routing.enabled)
+                self.console.print(
+                    f"[green]✓[/green] Model routing {'disabled' if routing.enabled else 'enabled'}"
+                )
+            elif choice == "2":
+                providers = sorted(set(routing.fast_models) | set(routing.strong_models))
+                provider = Prompt.ask("Provider", choices=providers)
+                fast_model = Prompt.ask("Fast model", default=routing.fast_models.get(provider, ""))
+                strong_model = Prompt.ask("Strong model", default=routing.strong_models.get(provider, ""))
+                self.preferences_service.update_routing_models(
+                    provider, fast_model=fast_model, strong_model=strong_model
+                )
+                self.console.print(f"[green]✓[/green] Routing models updated for [cyan]{provider}[/cyan]")
+        except ValueError as e:
+            self.console.print(f"[red]✗[/red] Error: {e}")
+
+        self.console.print()
+        self.show_preferences_menu()
+
+    def toggle_compare_styles(self):
+        """스타일별 초안 비교 켜기/끄기
+
+        켜면 일기 작성 시 세 가지 스타일의 초안을 동시에 만들어 나란히 보여줍니다.
+        """
+        enabled = not self.preferences_service.is_compare_styles_enabled()
+        self.preferences_service.set_compare_styles(enabled)
+        self.console.print(
+            f"[green]✓[/green] Style comparison {'enabled' if enabled else 'disabled'}"
+        )
+        self.console.print()
+        self.show_preferences_menu()
+
     def reset_preferences(self):
         """사용자 설정 초기화"""
         self.console.print()
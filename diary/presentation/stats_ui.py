@@ -0,0 +1,77 @@
+"""AI 사용량/지연시간 통계 UI"""
+
+from typing import Optional
+from rich.console import Console
+from rich.table import Table
+
+from diary.domain.services.telemetry_service import TelemetryService, UsageStats
+
+
+class StatsUI:
+    """AI 호출 텔레메트리 통계 표시 UI"""
+
+    GROUP_TITLES = {
+        "provider": "Provider",
+        "model": "Model",
+        "day": "Day",
+        "session": "Session",
+        "request_type": "Request Type",
+    }
+
+    def __init__(self, telemetry_service: TelemetryService, console: Console):
+        """
+        Args:
+            telemetry_service: 텔레메트리 집계 서비스 (Domain Layer)
+            console: Rich Console 인스턴스
+        """
+        self.telemetry_service = telemetry_service
+        self.console = console
+
+    def show_stats(self, group_by: Optional[str] = None, days: Optional[int] = None):
+        """
+        통계 표 출력
+
+        Args:
+            group_by: 집계 기준 (None이면 provider/day/session 모두 표시)
+            days: 최근 며칠간의 기록만 집계 (None이면 전체)
+        """
+        groups = [group_by] if group_by else ["provider", "day", "session"]
+
+        for group in groups:
+            stats = self.telemetry_service.get_stats(group_by=group, days=days)
+            if not stats:
+                self.console.print(f"[dim]{self.GROUP_TITLES.get(group, group)}: 기록이 없습니다.[/dim]")
+                continue
+            self.console.print(self._build_table(group, stats))
+            self.console.print()
+
+    def _build_table(self, group: str, stats: list[UsageStats]) -> Table:
+        """통계 표 생성"""
+        title = self.GROUP_TITLES.get(group, group)
+        table = Table(title=f"AI Usage by {title}", title_style="bold cyan")
+        table.add_column(title, style="cyan", overflow="fold")
+        table.add_column("Calls", justify="right")
+        table.add_column("Errors", justify="right")
+        table.add_column("Retries", justify="right")
+        table.add_column("p50 ms", justify="right")
+        table.add_column("p95 ms", justify="right")
+        table.add_column("TTFT p50", justify="right")
+        table.add_column("Prompt", justify="right")
+        table.add_column("Cached", justify="right")
+        table.add_column("Completion", justify="right")
+
+        for row in stats:
+            table.add_row(
+                row.key,
+                str(row.calls),
+                f"[red]{row.errors}[/red]" if row.errors else "0",
+                str(row.retries),
+                f"{row.latency_p50_ms:.0f}",
+                f"{row.latency_p95_ms:.0f}",
+                f"{row.ttft_p50_ms:.0f}" if row.ttft_p50_ms is not None else "-",
+                f"{row.prompt_tokens:,}",
+                f"{row.cached_tokens:,}",
+                f"{row.completion_tokens:,}",
+            )
+
+        return table
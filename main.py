@@ -4,25 +4,224 @@
 이 파일만 모든 레이어를 알고 있습니다.
 """
 
+import os
+import signal
+from pathlib import Path
+from typing import List, Optional
+
 import typer
+from rich.console import Console
 
 from diary.data.repositories import (
     FileSystemCredentialRepository,
     FileSystemUserPreferencesRepository,
     FileSystemWritingStyleExamplesRepository,
-    OpenAIClient,
-    AnthropicClient,
-    GoogleAIClient,
+    JsonlTelemetryRepository,
+    FileSystemJobCheckpointRepository,
+    FakeAIClient,
+    FakeAIBehavior,
+    ai_client_registry,
+)
+from diary.domain.services import (
+    CredentialService,
+    UserPreferencesService,
+    ChatService,
+    ContextWindowManager,
+    InstrumentedAIClient,
+    TelemetryService,
+    BulkDiaryGenerationService,
+    WriteBehindSessionWriter,
+    SessionArchiveService,
 )
-from diary.data.repositories.mongodb_chat_repository import MongoDBChatRepository
-from diary.data.repositories.mongodb_diary_repository import MongoDBDiaryRepository
-from diary.domain.services import CredentialService, UserPreferencesService, ChatService
 from diary.domain.entities import AIProvider
+from diary.domain.interfaces import DEFAULT_USER_ID
 from diary.domain.services.diary_service import DiaryService
+from diary.domain.services.retry_policy import RetryPolicy
 from diary.presentation.cli import DiaryApp
+from diary.presentation.stats_ui import StatsUI
+from diary.presentation.generate_ui import GenerateUI
 
 app = typer.Typer()
 
+# 종료 시 남은 세션 저장을 기다리는 최대 시간 (초)
+SESSION_FLUSH_TIMEOUT = 10.0
+
+# 일기/채팅 저장소 종류 (DAILY_STORAGE)
+STORAGE_MONGODB = "mongodb"
+STORAGE_SQLITE = "sqlite"
+STORAGE_BACKENDS = (STORAGE_MONGODB, STORAGE_SQLITE)
+
+
+def _current_user_id() -> str:
+    """CLI를 사용하는 사용자 ID (DAILY_USER_ID, 기본: 사용자 구분 없던 기존 데이터)"""
+    return os.getenv("DAILY_USER_ID", DEFAULT_USER_ID)
+
+
+def _int_env(name: str, default: Optional[int] = None, minimum: Optional[int] = 1) -> Optional[int]:
+    """정수 환경 변수 (설정하지 않았으면 default)
+
+    Args:
+        name: 환경 변수 이름
+        default: 설정하지 않았을 때의 값
+        minimum: 허용하는 최솟값 (None이면 범위는 호출한 쪽에서 확인)
+
+    Raises:
+        ValueError: 정수가 아니거나 minimum보다 작은 경우
+    """
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        number = int(value)
+    except ValueError:
+        raise ValueError(f"{name}은(는) 정수여야 합니다: {value}") from None
+    if minimum is not None and number < minimum:
+        raise ValueError(f"{name}은(는) {minimum} 이상이어야 합니다: {value}")
+    return number
+
+
+def _storage_backend() -> str:
+    """일기/채팅 저장소 종류 (DAILY_STORAGE, 기본: mongodb)
+
+    sqlite면 MongoDB 없이 DAILY_SQLITE_PATH(기본: data/daily.db) 파일 하나에 저장합니다.
+    """
+    storage = os.getenv("DAILY_STORAGE", STORAGE_MONGODB)
+    if storage not in STORAGE_BACKENDS:
+        typer.echo(f"오류: 지원하지 않는 DAILY_STORAGE입니다: {storage} (사용 가능: {', '.join(STORAGE_BACKENDS)})", err=True)
+        raise typer.Exit(1)
+    return storage
+
+
+def _sqlite_path() -> Path:
+    """SQLite 데이터베이스 파일 경로 (DAILY_SQLITE_PATH)"""
+    return Path(os.getenv("DAILY_SQLITE_PATH", "data/daily.db"))
+
+
+def _create_diary_repository(user_id: str = DEFAULT_USER_ID):
+    """설정한 저장소 종류의 일기 저장소 (pymongo는 mongodb일 때만 import)"""
+    if _storage_backend() == STORAGE_SQLITE:
+        from diary.data.repositories import SQLiteDiaryRepository
+
+        return SQLiteDiaryRepository(_sqlite_path(), user_id=user_id)
+
+    from diary.data.repositories import MongoDBDiaryRepository
+
+    return MongoDBDiaryRepository(user_id=user_id)
+
+
+def _create_chat_repository(user_id: str = DEFAULT_USER_ID):
+    """설정한 저장소 종류의 채팅 저장소 (pymongo는 mongodb일 때만 import)"""
+    if _storage_backend() == STORAGE_SQLITE:
+        from diary.data.repositories import SQLiteChatRepository
+
+        return SQLiteChatRepository(_sqlite_path(), user_id=user_id)
+
+    from diary.data.repositories import MongoDBChatRepository
+
+    return MongoDBChatRepository(user_id=user_id)
+
+
+def _create_ai_backend(
+    credential_service: CredentialService, retry_policy: Optional[RetryPolicy] = None
+) -> Optional[tuple]:
+    """기본 AI 클라이언트와 컨텍스트 관리자 조립 (AI를 사용할 수 없으면 None)
+
+    DAILY_AI_PROVIDER=fake면 API 키 없이 동작하는 오프라인 가짜 AI를 사용합니다.
+
+    Args:
+        credential_service: 인증 정보 서비스
+        retry_policy: AI 호출 재시도 정책 (기본: RetryPolicy())
+
+    Returns:
+        (AI 클라이언트, provider 이름, ContextWindowManager, 세션 토큰 예산) 또는 None
+    """
+    default_ai = credential_service.get_default_credential()
+    ai_client = None
+    provider_name = None
+
+    if os.getenv("DAILY_AI_PROVIDER") == "fake":
+        ai_client = FakeAIClient(FakeAIBehavior.from_env())
+        provider_name = "fake"
+    elif default_ai and ai_client_registry.is_registered(default_ai.provider):
+        # 선택된 Provider의 SDK만 이 시점에 import됨
+        provider_name = default_ai.provider.value
+        ai_client = ai_client_registry.create(default_ai.provider, api_key=default_ai.api_key)
+
+    if not ai_client or not provider_name:
+        return None
+
+    # 모든 AI 호출의 사용량/지연시간 기록 (daily stats로 조회)
+    ai_client = InstrumentedAIClient(
+        ai_client, JsonlTelemetryRepository(), provider=provider_name, retry_policy=retry_policy
+    )
+
+    # 요청 토큰 예산 (환경 변수로 provider별 조정 가능),
+    # 세션당 토큰 예산 (입력+출력 누적, 설정하지 않으면 무제한) - 채팅을 시작하기 전에 한 번만 확인
+    try:
+        budget = _int_env(f"DAILY_CONTEXT_BUDGET_{provider_name.upper()}")
+        session_budget = _int_env("DAILY_SESSION_TOKEN_BUDGET")
+    except ValueError as e:
+        typer.echo(f"오류: {e}", err=True)
+        raise typer.Exit(1)
+    if provider_name == "fake":
+        context_manager = ContextWindowManager(ai_client, request_token_budget=budget or 12000)
+    else:
+        context_manager = ContextWindowManager.for_provider(
+            AIProvider(provider_name), ai_client, request_token_budget=budget
+        )
+
+    return ai_client, provider_name, context_manager, session_budget
+
+
+def _build_chat_service(
+    chat_repo,
+    preferences_service: UserPreferencesService,
+    ai_backend: tuple,
+    session_writer: Optional[WriteBehindSessionWriter],
+) -> ChatService:
+    """AI 백엔드와 저장소로 Chat Service 조립"""
+    ai_client, provider_name, context_manager, session_budget = ai_backend
+
+    return ChatService(
+        chat_repo=chat_repo,
+        ai_client=ai_client,
+        preferences_service=preferences_service,
+        context_manager=context_manager,
+        provider=provider_name,
+        session_token_budget=session_budget,
+        session_writer=session_writer,
+        # AI가 일기 작성을 제안하면 답변을 기다리는 동안 초안을 미리 생성 (0이면 끔)
+        speculative_diary=os.getenv("DAILY_SPECULATIVE_DIARY", "1") != "0",
+    )
+
+
+def _create_chat_service(
+    credential_service: CredentialService,
+    preferences_service: UserPreferencesService,
+    retry_policy: Optional[RetryPolicy] = None,
+) -> Optional[ChatService]:
+    """기본 AI로 Chat Service 조립 (AI를 사용할 수 없으면 None)"""
+    ai_backend = _create_ai_backend(credential_service, retry_policy)
+    if not ai_backend:
+        return None
+
+    # 저장소 드라이버는 실제로 채팅할 때만 로드 (--help, stats 등은 제외)
+    chat_repo = _create_chat_repository(_current_user_id())
+
+    # 세션 저장은 백그라운드로 (매 턴 응답이 저장소 쓰기를 기다리지 않음)
+    return _build_chat_service(chat_repo, preferences_service, ai_backend, WriteBehindSessionWriter(chat_repo))
+
+
+def _close_chat_service(chat_service: Optional[ChatService]) -> None:
+    """남은 세션 저장을 끝내고 종료 (저장하지 못한 세션이 있으면 경고)"""
+    if chat_service and not chat_service.close(timeout=SESSION_FLUSH_TIMEOUT):
+        typer.echo("경고: 일부 대화 내용을 저장하지 못했습니다.", err=True)
+
+
+def _raise_system_exit(signum, frame) -> None:
+    """SIGTERM도 Ctrl+C처럼 finally 블록(세션 저장)을 거쳐 종료"""
+    raise SystemExit(128 + signum)
+
 
 @app.callback(invoke_without_command=True)
 def main(ctx: typer.Context):
@@ -36,46 +235,216 @@ def main(ctx: typer.Context):
     if ctx.invoked_subcommand is None:
         # 의존성 조립 (Dependency Assembly)
         # Data Layer - Repository 구현체
-        credential_repo = FileSystemCredentialRepository()
-        preferences_repo = FileSystemUserPreferencesRepository()
-        examples_repo = FileSystemWritingStyleExamplesRepository()
-        diary_repo = MongoDBDiaryRepository()
+        user_id = _current_user_id()
+        credential_repo = FileSystemCredentialRepository(user_id=user_id)
+        preferences_repo = FileSystemUserPreferencesRepository(user_id=user_id)
+        examples_repo = FileSystemWritingStyleExamplesRepository(user_id=user_id)
+        diary_repo = _create_diary_repository(user_id)
 
         # Domain Layer - Business Logic (인터페이스에만 의존)
         credential_service = CredentialService(credential_repo)
         preferences_service = UserPreferencesService(preferences_repo, examples_repo)
         diary_service = DiaryService(diary_repo)
 
-        # AI Client 선택 (기본 AI 기준)
-        default_ai = credential_service.get_default_credential()
-        chat_service = None
-
-        if default_ai:
-            ai_client = None
-            if default_ai.provider == AIProvider.OPENAI:
-                ai_client = OpenAIClient(api_key=default_ai.api_key)
-            elif default_ai.provider == AIProvider.ANTHROPIC:
-                ai_client = AnthropicClient(api_key=default_ai.api_key)
-            elif default_ai.provider == AIProvider.GOOGLE:
-                ai_client = GoogleAIClient(api_key=default_ai.api_key)
-
-            # ai_client가 성공적으로 생성된 경우에만 Chat Service 생성
-            if ai_client:
-                chat_repo = MongoDBChatRepository()
-                # chat_repo = FileSystemChatRepository()
-                chat_service = ChatService(
-                    chat_repo=chat_repo,
-                    ai_client=ai_client,
-                    preferences_service=preferences_service,
-                )
+        # AI Client가 성공적으로 생성된 경우에만 Chat Service 생성 (기본 AI 기준)
+        chat_service = _create_chat_service(credential_service, preferences_service)
 
         # Presentation Layer - CLI (Domain에만 의존)
         diary_app = DiaryApp(
-            credential_service, preferences_service, diary_service, chat_service
+            credential_service,
+            preferences_service,
+            diary_service,
+            chat_service,
+            show_usage=os.getenv("DAILY_SHOW_USAGE") == "1",
+        )
+
+        # 실행 (종료/Ctrl+C/SIGTERM 시에도 남은 세션 저장)
+        signal.signal(signal.SIGTERM, _raise_system_exit)
+        try:
+            diary_app.run()
+        finally:
+            _close_chat_service(chat_service)
+
+
+@app.command()
+def generate(
+    from_sessions: bool = typer.Option(False, "--from-sessions", help="종료된 채팅 세션으로 일기 생성"),
+    from_files: Optional[List[Path]] = typer.Option(
+        None, "--from-files", help="대화 기록 파일/디렉토리 (여러 번 지정 가능, 파일 이름의 YYYY-MM-DD를 날짜로 사용)"
+    ),
+    workers: int = typer.Option(4, "--workers", help="동시에 실행할 워커 수"),
+    rpm: Optional[int] = typer.Option(None, "--rpm", help="분당 최대 AI 요청 수 (기본: 제한 없음)"),
+    batch_size: int = typer.Option(10, "--batch-size", help="한 번에 저장할 일기 수"),
+    limit: int = typer.Option(100, "--limit", help="조회할 최대 세션 수 (--from-sessions)"),
+    job_id: Optional[str] = typer.Option(None, "--job-id", help="체크포인트 작업 ID (기본: sessions / files)"),
+    restart: bool = typer.Option(False, "--restart", help="체크포인트를 지우고 처음부터 실행"),
+):
+    """일기가 없는 날의 대화로 일기 일괄 생성 (중단 후 다시 실행하면 이어서 진행)"""
+    if from_sessions == bool(from_files):
+        typer.echo("오류: --from-sessions 또는 --from-files 중 하나를 지정하세요.", err=True)
+        raise typer.Exit(1)
+
+    console = Console()
+    user_id = _current_user_id()
+    credential_service = CredentialService(FileSystemCredentialRepository(user_id=user_id))
+    preferences_service = UserPreferencesService(
+        FileSystemUserPreferencesRepository(user_id=user_id),
+        FileSystemWritingStyleExamplesRepository(user_id=user_id),
+    )
+    # 요청 한도 초과는 일괄 생성 작업이 모든 워커를 멈추고 재시도하므로 클라이언트에서는 재시도하지 않음
+    chat_service = _create_chat_service(
+        credential_service, preferences_service, retry_policy=RetryPolicy(retry_rate_limits=False)
+    )
+    if not chat_service:
+        typer.echo("오류: 사용할 AI가 없습니다. API 키를 등록하거나 DAILY_AI_PROVIDER=fake를 사용하세요.", err=True)
+        raise typer.Exit(1)
+
+    checkpoint_repo = FileSystemJobCheckpointRepository()
+    job_id = job_id or ("sessions" if from_sessions else "files")
+    if restart:
+        checkpoint_repo.clear(job_id)
+
+    try:
+        bulk_service = BulkDiaryGenerationService(
+            chat_service,
+            DiaryService(_create_diary_repository(user_id)),
+            checkpoint_repo,
+            max_workers=workers,
+            requests_per_minute=rpm,
+            batch_size=batch_size,
+        )
+    except ValueError as e:
+        typer.echo(f"오류: {e}", err=True)
+        raise typer.Exit(1)
+
+    generate_ui = GenerateUI(bulk_service, chat_service, console)
+    try:
+        if from_files:
+            summary = generate_ui.generate_from_files(job_id, from_files)
+        else:
+            summary = generate_ui.generate_from_sessions(job_id, limit=limit)
+    finally:
+        _close_chat_service(chat_service)
+
+    if summary.failed:
+        raise typer.Exit(1)
+
+
+@app.command()
+def stats(
+    by: Optional[str] = typer.Option(
+        None, "--by", help="집계 기준: provider, model, day, session, request_type (기본: provider/day/session 모두)"
+    ),
+    days: Optional[int] = typer.Option(None, "--days", help="최근 N일간의 기록만 집계"),
+):
+    """AI 호출 사용량/지연시간 통계 (p50/p95 지연시간, 토큰 합계)"""
+    telemetry_service = TelemetryService(JsonlTelemetryRepository())
+    stats_ui = StatsUI(telemetry_service, Console())
+
+    try:
+        stats_ui.show_stats(group_by=by, days=days)
+    except ValueError as e:
+        typer.echo(f"오류: {e}", err=True)
+        raise typer.Exit(1)
+
+
+@app.command()
+def archive(
+    after_days: Optional[int] = typer.Option(
+        None, "--after-days", help="마지막 대화 후 N일이 지난 종료 세션을 보관 (기본: DAILY_ARCHIVE_AFTER_DAYS 또는 30)"
+    ),
+    retention_days: Optional[int] = typer.Option(
+        None, "--retention-days", help="마지막 대화 후 N일이 지난 보관 세션 삭제 (기본: DAILY_ARCHIVE_RETENTION_DAYS, 없으면 영구 보관)"
+    ),
+):
+    """오래된 종료 세션을 압축 보관하고, 보관 기간이 지난 세션 삭제"""
+    try:
+        # 옵션을 지정하지 않았을 때만 환경 변수 사용 (기간 범위는 서비스가 확인)
+        if after_days is None:
+            after_days = _int_env("DAILY_ARCHIVE_AFTER_DAYS", minimum=None)
+        if after_days is None:
+            after_days = 30
+        if retention_days is None:
+            retention_days = _int_env("DAILY_ARCHIVE_RETENTION_DAYS", minimum=None)
+
+        archive_service = SessionArchiveService(
+            _create_chat_repository(_current_user_id()),
+            archive_after_days=after_days,
+            retention_days=retention_days,
         )
+    except ValueError as e:
+        typer.echo(f"오류: {e}", err=True)
+        raise typer.Exit(1)
+
+    result = archive_service.run()
+    typer.echo(f"보관: {result.archived}개 세션 ({result.archive_cutoff:%Y-%m-%d} 이전 대화)")
+    if result.expire_cutoff:
+        typer.echo(f"삭제: {result.expired}개 세션 ({result.expire_cutoff:%Y-%m-%d} 이전 대화)")
+
+
+@app.command()
+def serve(
+    host: str = typer.Option("127.0.0.1", "--host", help="바인드할 주소 (외부에 열려면 0.0.0.0)"),
+    port: int = typer.Option(8080, "--port", help="포트"),
+    workers: int = typer.Option(32, "--workers", help="저장소/AI 호출을 실행할 스레드 수"),
+    max_chat_sessions: int = typer.Option(
+        1000, "--max-chat-sessions", help="메모리에 유지할 사용자별 채팅 수 (넘으면 오래 쓰지 않은 것부터 정리)"
+    ),
+):
+    """일기/채팅 HTTP API 서버 실행 (사용자는 X-User-Id 헤더로 구분)"""
+    import asyncio
+
+    from diary.presentation.http_server import DiaryHTTPServer
+
+    # 연결 풀과 AI 클라이언트는 모든 사용자가 공유 (사용자별 저장소는 for_user로 범위만 바꿈)
+    diary_repo = _create_diary_repository()
+    chat_repo = _create_chat_repository()
+    ai_backend = _create_ai_backend(CredentialService(FileSystemCredentialRepository(user_id=_current_user_id())))
+    if not ai_backend:
+        typer.echo("경고: 사용할 AI가 없어 채팅 API는 503을 응답합니다.", err=True)
+
+    def diary_service_factory(user_id: str) -> DiaryService:
+        return DiaryService(diary_repo.for_user(user_id))
+
+    def chat_service_factory(user_id: str) -> Optional[ChatService]:
+        if not ai_backend:
+            return None
+        preferences_service = UserPreferencesService(
+            FileSystemUserPreferencesRepository(user_id=user_id),
+            FileSystemWritingStyleExamplesRepository(user_id=user_id),
+        )
+        # 요청을 처리하는 스레드에서 바로 저장 (턴마다 사용자별 잠금 안에서 실행)
+        return _build_chat_service(chat_repo.for_user(user_id), preferences_service, ai_backend, None)
+
+    try:
+        server = DiaryHTTPServer(
+            diary_service_factory,
+            chat_service_factory,
+            host=host,
+            port=port,
+            max_workers=workers,
+            max_chat_services=max_chat_sessions,
+        )
+    except ValueError as e:
+        typer.echo(f"오류: {e}", err=True)
+        raise typer.Exit(1)
+
+    async def run() -> None:
+        await server.start()
+        typer.echo(f"Daily API 서버 실행 중: http://{host}:{server.port}")
+        try:
+            await server.serve_forever()
+        finally:
+            await server.close()
 
-        # 실행
-        diary_app.run()
+    signal.signal(signal.SIGTERM, _raise_system_exit)
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        chat_repo.close()
+        diary_repo.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+긴 채팅 세션의 저장/조회 처리량 벤치마크 (파일 저장소)
+
+저장 구조(스냅샷: FileSystemChatRepository, 스냅샷 + 로그: FileSystemLogChatRepository),
+코덱(json, msgpack), fsync 정책별로 메시지를 하나 추가하고 저장하는 턴 시간과 get_session 시간을 재고,
+비교를 위해 이전 방식(indent=2 JSON을 세션 파일에 바로 쓰기)도 함께 잽니다.
+msgpack은 설치되어 있을 때만 측정합니다.
+
+사용법:
+    python scripts/benchmark_session_storage.py
+    python scripts/benchmark_session_storage.py --messages 5000 --rounds 10
+    python scripts/benchmark_session_storage.py --fsync none file
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+import unicodedata
+from pathlib import Path
+from typing import Callable, Tuple
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from diary.data.repositories import FileSystemChatRepository, FileSystemLogChatRepository
+from diary.data.repositories.atomic_file import FSYNC_POLICIES
+from diary.data.repositories.file_chat_repository import LOCK_SUFFIX, TAIL_INDEX_SUFFIX
+from diary.data.repositories.session_codec import available_codecs
+from diary.domain.entities import ChatSession, MessageRole
+
+
+def build_session(message_count: int) -> ChatSession:
+    """시스템 프롬프트 + 사용자/AI 메시지가 번갈아 있는 긴 세션"""
+    session = ChatSession(session_id="benchmark")
+    session.add_message(MessageRole.SYSTEM, "당신은 사용자의 하루를 들어주는 일기 작성 도우미입니다. " * 20)
+    for i in range(message_count):
+        if i % 2 == 0:
+            session.add_message(MessageRole.USER, f"오늘 {i}번째로 있었던 일은 회의가 길어져서 점심을 늦게 먹은 것이다. " * 3)
+        else:
+            session.add_message(MessageRole.ASSISTANT, f"그랬군요. {i}번째 이야기에서 가장 기억에 남는 순간은 무엇이었나요? " * 2)
+    return session
+
+
+def _timed(func: Callable[[], object], rounds: int) -> float:
+    """rounds번 실행한 평균 시간 (ms)"""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    return (time.perf_counter() - start) / rounds * 1000
+
+
+def _add_turn(session: ChatSession) -> None:
+    session.add_message(MessageRole.USER, "그리고 저녁에는 친구를 만나서 오랜만에 이야기를 나눴다.")
+
+
+def bench_repository(chat_repo: FileSystemChatRepository, session: ChatSession, rounds: int) -> Tuple[int, float, float]:
+    """저장소로 턴 저장/조회 → (세션 파일 + 로그 크기, 턴 저장 ms, 조회 ms), session은 새로 만든 세션이어야 함"""
+    chat_repo.save_session(session)
+
+    def save_turn():
+        _add_turn(session)
+        chat_repo.save_session(session)
+
+    save_ms = _timed(save_turn, rounds)
+    load_ms = _timed(lambda: chat_repo.get_session(session.session_id), rounds)
+    size = sum(
+        path.stat().st_size for path in chat_repo.data_dir.glob(f"{session.session_id}.*")
+        if not path.name.endswith((TAIL_INDEX_SUFFIX, LOCK_SUFFIX))
+    )
+    return size, save_ms, load_ms
+
+
+def bench_legacy(data_dir: Path, session: ChatSession, rounds: int) -> Tuple[int, float, float]:
+    """이전 방식: indent=2 JSON을 세션 파일에 바로 쓰고 읽음 (프롬프트 저장소, tail 인덱스 제외)"""
+    data_dir.mkdir(parents=True, exist_ok=True)
+    session_file = data_dir / f"{session.session_id}.json"
+
+    def save():
+        _add_turn(session)
+        with open(session_file, "w", encoding="utf-8") as f:
+            json.dump(session.to_dict(), f, indent=2, ensure_ascii=False)
+
+    def load():
+        with open(session_file, "r", encoding="utf-8") as f:
+            ChatSession.from_dict(json.load(f))
+
+    with open(session_file, "w", encoding="utf-8") as f:
+        json.dump(session.to_dict(), f, indent=2, ensure_ascii=False)
+    save_ms = _timed(save, rounds)
+    load_ms = _timed(load, rounds)
+    return session_file.stat().st_size, save_ms, load_ms
+
+
+def _throughput(size: int, ms: float) -> str:
+    return f"{size / 1024 / 1024 / (ms / 1000):.1f}MB/s" if ms else "-"
+
+
+def _row(cells, widths) -> str:
+    """표 한 줄 (한글은 두 칸으로 계산, 첫 열은 왼쪽 정렬)"""
+    padded = []
+    for i, (cell, width) in enumerate(zip(cells, widths)):
+        display = sum(2 if unicodedata.east_asian_width(ch) in "WF" else 1 for ch in cell)
+        padding = " " * max(0, width - display)
+        padded.append(cell + padding if i == 0 else padding + cell)
+    return "".join(padded)
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="세션 저장/조회 처리량 벤치마크")
+    parser.add_argument("--messages", type=int, default=2000, help="세션 메시지 수 (기본: 2000)")
+    parser.add_argument("--rounds", type=int, default=20, help="측정 반복 횟수 (기본: 20)")
+    parser.add_argument("--fsync", nargs="+", choices=FSYNC_POLICIES, default=list(FSYNC_POLICIES), help="측정할 fsync 정책")
+    args = parser.parse_args()
+
+    print(f"세션 메시지 {args.messages + 1}개, {args.rounds}회 평균\n")
+    widths = (32, 10, 12, 12, 14, 14)
+    print(_row(("방식", "파일 크기", "턴 저장", "조회", "초당 턴", "조회 처리량"), widths))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        rows = [("json indent=2 (이전 방식)", bench_legacy(Path(tmp) / "legacy", build_session(args.messages), args.rounds))]
+        for layout, repo_class in [("snapshot", FileSystemChatRepository), ("log", FileSystemLogChatRepository)]:
+            for codec in available_codecs():
+                for fsync in args.fsync:
+                    chat_repo = repo_class(Path(tmp) / f"{layout}-{codec}-{fsync}", codec=codec, fsync=fsync)
+                    result = bench_repository(chat_repo, build_session(args.messages), args.rounds)
+                    rows.append((f"{layout} {codec} (fsync={fsync})", result))
+
+        for label, (size, save_ms, load_ms) in rows:
+            cells = (
+                label, f"{size / 1024:.0f}KB", f"{save_ms:.2f}ms", f"{load_ms:.2f}ms",
+                f"{1000 / save_ms:.0f}", _throughput(size, load_ms),
+            )
+            print(_row(cells, widths))
+
+
+if __name__ == "__main__":
+    main()
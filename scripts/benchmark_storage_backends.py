@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+일기/채팅 저장소 백엔드 벤치마크 (SQLite vs MongoDB)
+
+일기: 일괄 저장, 전체 페이지 순회(list_diaries), 검색(3글자 이상 / 2글자), 날짜 조회
+채팅: 긴 세션에 메시지를 하나 추가하고 저장하는 턴, 이어하기(첫 메시지 + 최근 20개), 전체 조회
+
+SQLite는 fsync 정책별로, 채팅은 비교를 위해 파일 저장소도 함께 잽니다.
+--mongodb를 주면 실행 중인 MongoDB(MONGODB_* 환경 변수)도 측정합니다
+(벤치마크용 사용자 ID로만 쓰고 끝나면 지움).
+
+사용법:
+    python scripts/benchmark_storage_backends.py
+    python scripts/benchmark_storage_backends.py --diaries 5000 --messages 2000
+    python scripts/benchmark_storage_backends.py --mongodb
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+import unicodedata
+from contextlib import ExitStack
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List
+from uuid import uuid4
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from diary.data.repositories import (
+    FileSystemChatRepository,
+    FileSystemLogChatRepository,
+    SQLiteChatRepository,
+    SQLiteDiaryRepository,
+)
+from diary.domain.entities import ChatSession, Diary, MessageRole
+
+START = date(2000, 1, 1)
+
+# 이어하기 때 읽는 최근 메시지 수
+TAIL_SIZE = 20
+
+
+def _timed(func: Callable[[], None], rounds: int) -> float:
+    """rounds번 실행한 평균 시간 (ms)"""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    return (time.perf_counter() - start) / rounds * 1000
+
+
+def _row(cells, widths) -> str:
+    """표 한 줄 (한글은 두 칸으로 계산, 첫 열은 왼쪽 정렬)"""
+    padded = []
+    for i, (cell, width) in enumerate(zip(cells, widths)):
+        display = sum(2 if unicodedata.east_asian_width(ch) in "WF" else 1 for ch in cell)
+        padding = " " * max(0, width - display)
+        padded.append(cell + padding if i == 0 else padding + cell)
+    return "".join(padded)
+
+
+def _diary_content(i: int) -> str:
+    weather = "비가 와서 우산을 챙겼다" if i % 10 == 0 else "날씨가 맑았다"
+    return f"{i}번째 날. 아침에 {weather}. 점심에는 동료와 산책을 하고 저녁에는 책을 읽었다. " * 4
+
+
+def bench_diaries(diary_repo, count: int, rounds: int) -> Dict[str, float]:
+    """일기 저장소 측정 → {항목: ms}"""
+    diaries = [Diary(diary_date=START + timedelta(days=i), content=_diary_content(i)) for i in range(count)]
+    start = time.perf_counter()
+    for batch in range(0, count, 100):
+        diary_repo.save_many(diaries[batch:batch + 100])
+    save_ms = (time.perf_counter() - start) * 1000
+
+    def list_all():
+        cursor = None
+        while True:
+            _, cursor = diary_repo.list_diaries(cursor=cursor, limit=30)
+            if not cursor:
+                break
+
+    return {
+        "일괄 저장": save_ms,
+        "전체 목록": _timed(list_all, rounds),
+        "검색(우산을)": _timed(lambda: diary_repo.search("우산을 챙겼다"), rounds),
+        "검색(우산)": _timed(lambda: diary_repo.search("우산"), rounds),
+        "날짜 조회": _timed(lambda: diary_repo.get_by_date(START + timedelta(days=count // 2)), rounds),
+    }
+
+
+def build_session(message_count: int) -> ChatSession:
+    """시스템 프롬프트 + 사용자/AI 메시지가 번갈아 있는 긴 세션"""
+    session = ChatSession(session_id=f"benchmark-{uuid4().hex[:8]}")
+    session.add_message(MessageRole.SYSTEM, "당신은 사용자의 하루를 들어주는 일기 작성 도우미입니다. " * 20)
+    for i in range(message_count):
+        role = MessageRole.USER if i % 2 == 0 else MessageRole.ASSISTANT
+        session.add_message(role, f"{i}번째 메시지: 오늘은 회의가 길어져서 점심을 늦게 먹었다. " * 3)
+    return session
+
+
+def bench_chat(chat_repo, message_count: int, rounds: int) -> Dict[str, float]:
+    """채팅 저장소 측정 → {항목: ms}"""
+    session = build_session(message_count)
+    chat_repo.save_session(session)
+
+    def save_turn():
+        session.add_message(MessageRole.USER, "그리고 저녁에는 친구를 만나서 오랜만에 이야기를 나눴다.")
+        chat_repo.save_session(session)
+
+    return {
+        "턴 저장": _timed(save_turn, rounds),
+        "이어하기": _timed(lambda: chat_repo.get_active_session_tail(TAIL_SIZE), rounds),
+        "전체 조회": _timed(lambda: chat_repo.get_session(session.session_id), rounds),
+    }
+
+
+def _print_table(title: str, results: Dict[str, Dict[str, float]]) -> None:
+    columns: List[str] = list(next(iter(results.values())))
+    widths = (24,) + (14,) * len(columns)
+    print(title)
+    print(_row(("백엔드", *columns), widths))
+    for backend, values in results.items():
+        print(_row((backend, *(f"{values[c]:.2f}ms" for c in columns)), widths))
+    print()
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="SQLite/MongoDB 저장소 벤치마크")
+    parser.add_argument("--diaries", type=int, default=2000, help="저장할 일기 수 (기본: 2000)")
+    parser.add_argument("--messages", type=int, default=1000, help="채팅 세션 메시지 수 (기본: 1000)")
+    parser.add_argument("--rounds", type=int, default=20, help="측정 반복 횟수 (기본: 20)")
+    parser.add_argument("--mongodb", action="store_true", help="실행 중인 MongoDB도 측정")
+    args = parser.parse_args()
+
+    print(f"일기 {args.diaries}개, 채팅 세션 메시지 {args.messages + 1}개, {args.rounds}회 평균\n")
+    diary_results: Dict[str, Dict[str, float]] = {}
+    chat_results: Dict[str, Dict[str, float]] = {}
+
+    with tempfile.TemporaryDirectory() as tmp, ExitStack() as stack:
+        tmp_dir = Path(tmp)
+        for fsync in ("none", "file"):
+            diary_repo = stack.enter_context(SQLiteDiaryRepository(tmp_dir / f"diary-{fsync}.db", fsync=fsync))
+            diary_results[f"sqlite (fsync={fsync})"] = bench_diaries(diary_repo, args.diaries, args.rounds)
+            chat_repo = stack.enter_context(SQLiteChatRepository(tmp_dir / f"chat-{fsync}.db", fsync=fsync))
+            chat_results[f"sqlite (fsync={fsync})"] = bench_chat(chat_repo, args.messages, args.rounds)
+
+        chat_results["file (fsync=file)"] = bench_chat(
+            FileSystemChatRepository(tmp_dir / "file-chats"), args.messages, args.rounds
+        )
+        chat_results["file-log (fsync=file)"] = bench_chat(
+            FileSystemLogChatRepository(tmp_dir / "log-chats"), args.messages, args.rounds
+        )
+
+        if args.mongodb:
+            from diary.data.repositories import MongoDBChatRepository, MongoDBDiaryRepository
+
+            user_id = f"benchmark-{uuid4().hex[:12]}"
+            diary_repo = stack.enter_context(MongoDBDiaryRepository(user_id=user_id))
+            chat_repo = stack.enter_context(MongoDBChatRepository(user_id=user_id))
+            try:
+                diary_results["mongodb"] = bench_diaries(diary_repo, args.diaries, args.rounds)
+                chat_results["mongodb"] = bench_chat(chat_repo, args.messages, args.rounds)
+            finally:
+                diary_repo.diaries.delete_many({"user_id": user_id})
+                for collection in (chat_repo.sessions, chat_repo.active_session):
+                    collection.delete_many({"user_id": user_id})
+
+    _print_table("[일기]", diary_results)
+    _print_table("[채팅]", chat_results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+기존 채팅 세션의 시스템 프롬프트를 프롬프트 저장소로 옮기는 마이그레이션 스크립트
+
+세션마다 통째로 들어 있던 시스템 프롬프트 본문을 해시 기준으로 한 번만 저장하고,
+세션에는 해시(prompt_ref)만 남긴 뒤 절약한 공간을 보고합니다.
+새로 저장되는 세션은 자동으로 이 형식으로 저장됩니다.
+
+사용법:
+    python scripts/compact_system_prompts.py              # 파일 저장소 (data/chats)
+    python scripts/compact_system_prompts.py --mongodb    # MongoDB 저장소
+    python scripts/compact_system_prompts.py --dry-run    # 바꾸지 않고 절약될 크기만 계산
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from diary.data.repositories.prompt_store import PromptCompactionReport
+
+
+def _format_bytes(size: int) -> str:
+    """바이트 수를 읽기 쉬운 단위로"""
+    if abs(size) < 1024:
+        return f"{size}B"
+    if abs(size) < 1024 * 1024:
+        return f"{size / 1024:.1f}KB"
+    return f"{size / 1024 / 1024:.1f}MB"
+
+
+def print_report(report: PromptCompactionReport) -> None:
+    """압축 결과 출력"""
+    title = "압축 예상 결과 (dry run)" if report.dry_run else "압축 완료"
+    print(f"\n=== {title} ===")
+    print(f"확인한 세션: {report.sessions_scanned}개")
+    print(f"압축한 세션: {report.sessions_compacted}개")
+    print(f"세션 크기: {_format_bytes(report.bytes_before)} → {_format_bytes(report.bytes_after)}")
+    print(f"새로 저장한 프롬프트: {_format_bytes(report.prompt_bytes)}")
+    print(f"절약한 공간: {_format_bytes(report.reclaimed_bytes)}")
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="시스템 프롬프트 중복 저장 정리")
+    parser.add_argument("--mongodb", action="store_true", help="MongoDB 저장소를 압축")
+    parser.add_argument("--data-dir", default="data/chats", help="파일 저장소 경로 (기본: data/chats)")
+    parser.add_argument("--dry-run", action="store_true", help="바꾸지 않고 절약될 크기만 계산")
+    args = parser.parse_args()
+
+    print("Daily CLI - 시스템 프롬프트 압축 도구\n")
+
+    try:
+        if args.mongodb:
+            from diary.data.repositories import MongoDBChatRepository
+
+            with MongoDBChatRepository() as chat_repo:
+                print("✓ MongoDB 연결 완료")
+                report = chat_repo.compact_stored_prompts(dry_run=args.dry_run)
+        else:
+            from diary.data.repositories import FileSystemChatRepository
+
+            chat_repo = FileSystemChatRepository(Path(args.data_dir))
+            print(f"✓ 파일 저장소: {args.data_dir}")
+            report = chat_repo.compact_stored_prompts(dry_run=args.dry_run)
+        print_report(report)
+    except KeyboardInterrupt:
+        print("\n\n압축이 중단되었습니다.")
+    except Exception as e:
+        print(f"\n예상치 못한 오류 발생: {e}")
+        import traceback
+        traceback.print_exc()
+
+
+if __name__ == "__main__":
+    main()
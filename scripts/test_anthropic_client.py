@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Anthropic 클라이언트 테스트 (프롬프트 캐시 사용량 변환, 네트워크 없이 SDK 응답 객체 사용)
+
+사용법:
+    python scripts/test_anthropic_client.py
+    uv run pytest scripts/test_anthropic_client.py
+"""
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from anthropic.types import Message, TextBlock, Usage
+
+from diary.data.repositories.anthropic_client import AnthropicClient
+from diary.domain.entities import TokenUsage
+
+
+def _message(usage: Usage, text: str = "안녕하세요", model: str = "claude-haiku-4-5") -> Message:
+    """Messages API 응답과 같은 SDK 객체"""
+    return Message(
+        id="msg_test",
+        type="message",
+        role="assistant",
+        model=model,
+        content=[TextBlock(type="text", text=text)],
+        stop_reason="end_turn",
+        stop_sequence=None,
+        usage=usage,
+    )
+
+
+def test_parse_usage_counts_cache_reads_and_writes_as_prompt():
+    """Anthropic의 input_tokens는 캐시분을 빼고 세므로, 캐시 읽기/기록을 더해서 입력 토큰으로 봄"""
+    client = AnthropicClient(api_key="test-key")
+
+    cache_hit = client._parse_usage(_message(Usage(
+        input_tokens=12, output_tokens=40, cache_read_input_tokens=1800, cache_creation_input_tokens=0,
+    )))
+    assert cache_hit == TokenUsage(
+        model="claude-haiku-4-5", prompt_tokens=1812, completion_tokens=40, cached_tokens=1800,
+    )
+    assert cache_hit is not None and cache_hit.get_cache_hit_ratio() > 0.99
+
+    cache_write = client._parse_usage(_message(Usage(
+        input_tokens=12, output_tokens=40, cache_read_input_tokens=None, cache_creation_input_tokens=1800,
+    )))
+    assert cache_write is not None
+    assert (cache_write.prompt_tokens, cache_write.cached_tokens, cache_write.cache_creation_tokens) == (1812, 0, 1800)
+
+    # 캐시 필드가 없는 응답 (캐시를 쓰지 않은 모델 등)
+    plain = client._parse_usage(_message(Usage(input_tokens=30, output_tokens=5)))
+    assert plain is not None
+    assert (plain.prompt_tokens, plain.cached_tokens, plain.cache_creation_tokens) == (30, 0, 0)
+
+    assert client._parse_usage(object()) is None
+
+
+def test_chat_sends_cached_system_block_and_records_usage():
+    """첫 시스템 블록에만 cache_control을 붙이고, 응답의 사용량을 마지막 사용량으로 기록"""
+    client = AnthropicClient(api_key="test-key")
+    requests = []
+
+    def create(**kwargs):
+        requests.append(kwargs)
+        return _message(Usage(input_tokens=7, output_tokens=3, cache_read_input_tokens=500), model=kwargs["model"])
+
+    client.client.messages.create = create
+    reply = client.chat([
+        {"role": "system", "content": "시스템 프롬프트"},
+        {"role": "system", "content": "지금까지의 대화 요약"},
+        {"role": "user", "content": "안녕"},
+    ], model="claude-haiku-4-5")
+
+    assert reply == "안녕하세요"
+    system = requests[0]["system"]
+    assert system[0]["cache_control"] == {"type": "ephemeral"} and "cache_control" not in system[1]
+    assert requests[0]["messages"] == [{"role": "user", "content": "안녕"}]
+    assert client.get_last_usage() == TokenUsage(
+        model="claude-haiku-4-5", prompt_tokens=507, completion_tokens=3, cached_tokens=500,
+    )
+
+
+if __name__ == "__main__":
+    print("=== Anthropic 클라이언트 테스트 ===\n")
+    test_parse_usage_counts_cache_reads_and_writes_as_prompt()
+    print("✓ 캐시 읽기/기록 토큰 변환")
+    test_chat_sends_cached_system_block_and_records_usage()
+    print("✓ 시스템 블록 캐시 지정 + 사용량 기록")
@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+일괄 일기 생성 테스트 (오프라인, FakeAIClient 사용)
+
+사용법:
+    python scripts/test_bulk_diary_generation.py
+    uv run pytest scripts/test_bulk_diary_generation.py
+"""
+
+import sys
+import tempfile
+import threading
+from datetime import date
+from pathlib import Path
+from typing import List, Optional
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from diary.data.repositories import (
+    FakeAIClient,
+    FileSystemChatRepository,
+    FileSystemJobCheckpointRepository,
+    JsonlTelemetryRepository,
+    FileSystemUserPreferencesRepository,
+    FileSystemWritingStyleExamplesRepository,
+)
+from diary.domain.entities import Diary, MessageRole
+from diary.domain.exceptions import PartialSaveError
+from diary.domain.interfaces import DiaryRepositoryInterface
+from diary.domain.services import (
+    BulkDiaryGenerationService,
+    ChatService,
+    DiaryService,
+    InstrumentedAIClient,
+    UserPreferencesService,
+)
+from diary.domain.services.bulk_diary_generation_service import parse_transcript
+from diary.domain.services.retry_policy import RetryPolicy
+
+
+class InMemoryDiaryRepository(DiaryRepositoryInterface):
+    """테스트용 메모리 일기 저장소 (save_many 호출 횟수 기록)"""
+
+    def __init__(self):
+        self.diaries = {}
+        self.save_many_calls = 0
+
+    def save(self, diary: Diary) -> Diary:
+        diary.diary_id = diary.diary_id or str(diary.diary_date)
+        self.diaries[diary.diary_date] = diary
+        return diary
+
+    def save_many(self, diaries: List[Diary]) -> List[Diary]:
+        self.save_many_calls += 1
+        return super().save_many(diaries)
+
+    def get_by_date(self, diary_date: date) -> Optional[Diary]:
+        return self.diaries.get(diary_date)
+
+    def get_by_id(self, diary_id: str) -> Optional[Diary]:
+        return next((d for d in self.diaries.values() if d.diary_id == diary_id), None)
+
+    def list_diaries(self, cursor=None, limit=30, start_date=None, end_date=None):
+        return sorted(self.diaries.values(), key=lambda d: d.diary_date, reverse=True)[:limit], None
+
+    def delete(self, diary_id: str) -> bool:
+        return False
+
+    def exists_on_date(self, diary_date: date) -> bool:
+        return diary_date in self.diaries
+
+
+class PartiallyFailingDiaryRepository(InMemoryDiaryRepository):
+    """지정한 날짜만 저장하지 못하는 저장소 (순서 없는 bulk_write의 일부 실패 재현)"""
+
+    def __init__(self, failing_dates):
+        super().__init__()
+        self.failing_dates = set(failing_dates)
+
+    def save_many(self, diaries: List[Diary]) -> List[Diary]:
+        self.save_many_calls += 1
+        saved = [self.save(d) for d in diaries if d.diary_date not in self.failing_dates]
+        failed = [(d, "E11000 duplicate key") for d in diaries if d.diary_date in self.failing_dates]
+        if failed:
+            raise PartialSaveError(saved, failed)
+        return saved
+
+
+class RateLimitedAIClient(FakeAIClient):
+    """처음 몇 번은 429 오류를 내는 가짜 AI"""
+
+    def __init__(self, failures: int):
+        super().__init__()
+        self.failures = failures
+
+    def chat(self, messages, session_id=None, model=None):
+        if self.failures > 0:
+            self.failures -= 1
+            raise Exception("Fake API 호출 실패: 429 rate limit exceeded")
+        return super().chat(messages, session_id=session_id, model=model)
+
+
+def _build(tmp_dir: Path, ai_client, diary_repo: Optional[InMemoryDiaryRepository] = None, **kwargs):
+    """테스트용 서비스 조립"""
+    preferences_service = UserPreferencesService(
+        FileSystemUserPreferencesRepository(str(tmp_dir / "prefs.json")),
+        FileSystemWritingStyleExamplesRepository(tmp_dir / "examples"),
+    )
+    chat_service = ChatService(
+        chat_repo=FileSystemChatRepository(tmp_dir / "chats"),
+        ai_client=ai_client,
+        preferences_service=preferences_service,
+    )
+    diary_repo = diary_repo or InMemoryDiaryRepository()
+    sleeps = []
+    bulk_service = BulkDiaryGenerationService(
+        chat_service,
+        DiaryService(diary_repo),
+        FileSystemJobCheckpointRepository(str(tmp_dir / "jobs")),
+        sleep=sleeps.append,
+        **kwargs,
+    )
+    return bulk_service, diary_repo, sleeps
+
+
+def _transcript_tasks(bulk_service, count: int):
+    return [
+        bulk_service.task_from_transcript(
+            f"day-{i}", f"나: {i}일에는 산책을 했다\nAI: 기분이 어땠나요?\n나: 상쾌했다", date(2024, 3, i + 1)
+        )
+        for i in range(count)
+    ]
+
+
+def test_parse_transcript():
+    """화자 접두어로 메시지를 나누고, 접두어가 없으면 전체를 사용자 메시지로 봄"""
+    messages = parse_transcript("나: 오늘 회의가 길었다\n12시에 끝났다\nAI: 힘드셨겠어요")
+    assert [m.role for m in messages] == [MessageRole.USER, MessageRole.ASSISTANT]
+    assert messages[0].content == "오늘 회의가 길었다\n12시에 끝났다"
+
+    plain = parse_transcript("오늘은 비가 왔다.\n집에서 책을 읽었다.")
+    assert len(plain) == 1 and plain[0].role == MessageRole.USER
+
+
+def test_generates_in_batches_and_resumes_from_checkpoint():
+    """배치 단위로 저장하고, 다시 실행하면 완료된 작업은 AI를 호출하지 않음"""
+    with tempfile.TemporaryDirectory() as tmp:
+        ai_client = FakeAIClient()
+        bulk_service, diary_repo, _ = _build(Path(tmp), ai_client, max_workers=3, batch_size=2)
+        tasks = _transcript_tasks(bulk_service, 5)
+
+        summary = bulk_service.run("test", tasks)
+        assert (summary.created, summary.failed) == (5, 0)
+        assert len(diary_repo.diaries) == 5
+        assert diary_repo.save_many_calls == 3  # 2 + 2 + 1
+
+        calls = ai_client.call_count
+        again = bulk_service.run("test", tasks)
+        assert again.resumed == 5
+        assert ai_client.call_count == calls
+
+
+def test_skips_dates_with_existing_diary():
+    """이미 일기가 있는 날짜는 AI 호출 없이 건너뜀"""
+    with tempfile.TemporaryDirectory() as tmp:
+        ai_client = FakeAIClient()
+        bulk_service, diary_repo, _ = _build(Path(tmp), ai_client)
+        diary_repo.save(Diary(diary_date=date(2024, 3, 1), content="직접 쓴 일기"))
+
+        summary = bulk_service.run("test", _transcript_tasks(bulk_service, 2))
+        assert (summary.created, summary.skipped) == (1, 1)
+        assert ai_client.call_count == 1
+        assert diary_repo.diaries[date(2024, 3, 1)].content == "직접 쓴 일기"
+
+
+def test_rate_limit_pauses_and_retries():
+    """요청 한도 초과 시 잠시 멈춘 뒤 재시도"""
+    with tempfile.TemporaryDirectory() as tmp:
+        bulk_service, diary_repo, sleeps = _build(Path(tmp), RateLimitedAIClient(failures=2), max_workers=1)
+
+        summary = bulk_service.run("test", _transcript_tasks(bulk_service, 1))
+        assert summary.created == 1
+        assert summary.results[0].attempts == 3
+        assert len(sleeps) == 2 and sleeps[1] > sleeps[0]
+
+
+def test_rate_limit_is_retried_only_by_limiter():
+    """AI 클라이언트는 429를 재시도하지 않아 AI 호출 수 = 작업의 시도 횟수 (재시도가 겹치지 않음)"""
+    with tempfile.TemporaryDirectory() as tmp:
+        provider = RateLimitedAIClient(failures=2)
+        client_sleeps = []
+        ai_client = InstrumentedAIClient(
+            provider,
+            JsonlTelemetryRepository(str(Path(tmp) / "telemetry.jsonl")),
+            provider="fake",
+            retry_policy=RetryPolicy(retry_rate_limits=False),
+            sleep=client_sleeps.append,
+        )
+        bulk_service, _, sleeps = _build(Path(tmp), ai_client, max_workers=1)
+
+        summary = bulk_service.run("test", _transcript_tasks(bulk_service, 1))
+        assert summary.created == 1 and summary.results[0].attempts == 3
+        assert provider.failures == 0 and provider.call_count == 1  # 429 두 번 + 성공 한 번 = 시도 3회
+        assert client_sleeps == [] and len(sleeps) == 2
+
+        # 일시적 오류는 여전히 클라이언트가 재시도
+        policy = RetryPolicy(retry_rate_limits=False)
+        assert policy.should_retry(Exception("503 Service Unavailable"), 1)
+        assert not policy.should_retry(Exception("429 rate limit"), 1)
+
+
+def test_partial_save_checkpoints_only_saved_tasks():
+    """일부만 저장되면 저장된 작업만 완료로 기록하고, 다시 실행하면 실패한 작업만 재시도"""
+    with tempfile.TemporaryDirectory() as tmp:
+        ai_client = FakeAIClient()
+        diary_repo = PartiallyFailingDiaryRepository([date(2024, 3, 2)])
+        bulk_service, _, _ = _build(Path(tmp), ai_client, diary_repo=diary_repo, batch_size=3)
+        tasks = _transcript_tasks(bulk_service, 3)
+
+        summary = bulk_service.run("test", tasks)
+        assert (summary.created, summary.failed) == (2, 1)
+        failed = next(r for r in summary.results if r.status == "failed")
+        assert failed.task_id == "day-1" and "duplicate key" in (failed.error or "")
+        assert sorted(diary_repo.diaries) == [date(2024, 3, 1), date(2024, 3, 3)]
+
+        diary_repo.failing_dates.clear()
+        calls = ai_client.call_count
+        again = bulk_service.run("test", tasks)
+        assert (again.resumed, again.created) == (2, 1)
+        assert ai_client.call_count == calls + 1
+
+
+def test_preferences_are_read_once_and_created_safely():
+    """워커들은 시작 전에 읽은 설정을 공유하고, 설정 파일이 없을 때 동시에 읽어도 손상되지 않음"""
+    with tempfile.TemporaryDirectory() as tmp:
+        bulk_service, _, _ = _build(Path(tmp), FakeAIClient(), max_workers=4, batch_size=10)
+        preferences_service = bulk_service.chat_service.preferences_service
+        reads = []
+        original = preferences_service.get_preferences
+
+        def counting_get_preferences():
+            reads.append(threading.current_thread().name)
+            return original()
+
+        preferences_service.get_preferences = counting_get_preferences
+        summary = bulk_service.run("test", _transcript_tasks(bulk_service, 6))
+        assert summary.created == 6
+        assert not any(name.startswith("diary-gen") for name in reads)
+
+        # 설정 파일이 없는 상태에서 여러 스레드가 동시에 기본 설정을 만들어도 모두 읽을 수 있음
+        repo = FileSystemUserPreferencesRepository(str(Path(tmp) / "concurrent.json"))
+        errors = []
+
+        def read_preferences():
+            try:
+                UserPreferencesService(repo).get_preferences()
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=read_preferences) for _ in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert errors == [] and repo.get() is not None
+
+
+if __name__ == "__main__":
+    print("=== 일괄 일기 생성 테스트 ===\n")
+    test_parse_transcript()
+    print("✓ 대화 기록 파싱")
+    test_generates_in_batches_and_resumes_from_checkpoint()
+    print("✓ 배치 저장 + 체크포인트 재개")
+    test_skips_dates_with_existing_diary()
+    print("✓ 기존 일기 날짜 건너뜀")
+    test_rate_limit_pauses_and_retries()
+    print("✓ 요청 한도 초과 시 대기 후 재시도")
+    test_rate_limit_is_retried_only_by_limiter()
+    print("✓ 요청 한도 초과는 일괄 작업만 재시도 (재시도 중첩 없음)")
+    test_partial_save_checkpoints_only_saved_tasks()
+    print("✓ 일부 저장 실패 시 저장된 작업만 체크포인트")
+    test_preferences_are_read_once_and_created_safely()
+    print("✓ 설정은 시작 전에 한 번만 읽고, 기본 설정은 동시에 만들어도 안전")
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+롤링 요약 컨텍스트 테스트 (오프라인, FakeAIClient 사용)
+
+사용법:
+    python scripts/test_context_window.py
+    uv run pytest scripts/test_context_window.py
+"""
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from diary.data.repositories import FakeAIClient
+from diary.domain.entities import ChatSession, MessageRole
+from diary.domain.services import ContextWindowManager
+from diary.domain.services.context_window import SUMMARY_METADATA_KEY
+
+
+def _new_session() -> ChatSession:
+    session = ChatSession(session_id="s")
+    session.add_message(MessageRole.SYSTEM, "시스템 프롬프트")
+    return session
+
+
+def _add_turn(session: ChatSession, turn: int) -> None:
+    session.add_message(MessageRole.USER, f"{turn}번째 이야기: 오늘 있었던 일을 자세히 적어볼게요. " * 3)
+    session.add_message(MessageRole.ASSISTANT, f"{turn}번째 답변: 그랬군요, 더 들려주세요. " * 3)
+
+
+def test_summary_covered_moves_forward_monotonically():
+    """대화가 길어질수록 요약이 덮는 위치(covered)는 줄지 않고, 요약은 시스템 프롬프트 바로 뒤에 붙음"""
+    ai_client = FakeAIClient()
+    manager = ContextWindowManager(ai_client, request_token_budget=400, min_recent_messages=2)
+    session = _new_session()
+
+    covered_history = []
+    for turn in range(12):
+        _add_turn(session, turn)
+        history = manager.build_history(session)
+        covered_history.append((session.metadata.get(SUMMARY_METADATA_KEY) or {}).get("covered", 0))
+        assert manager.estimator.count_history(history) <= 400
+
+    assert covered_history == sorted(covered_history)
+    assert covered_history[-1] > 0 and len(set(covered_history)) > 2  # 여러 번에 걸쳐 접힘
+    assert covered_history[-1] <= len(session.messages) - 1 - manager.min_recent_messages
+    assert history[1]["role"] == "system" and history[1]["content"].startswith("지금까지의 대화 요약")
+    assert session.metadata[SUMMARY_METADATA_KEY]["text"]
+
+
+def test_summary_is_not_regenerated_without_new_folds():
+    """예산 안이거나 새로 접을 메시지가 없으면 요약을 다시 요청하지 않음"""
+    ai_client = FakeAIClient()
+    manager = ContextWindowManager(ai_client, request_token_budget=400, min_recent_messages=2)
+    session = _new_session()
+
+    _add_turn(session, 0)
+    manager.build_history(session)
+    assert ai_client.call_count == 0 and SUMMARY_METADATA_KEY not in session.metadata
+
+    for turn in range(1, 8):
+        _add_turn(session, turn)
+        manager.build_history(session)
+    summary = dict(session.metadata[SUMMARY_METADATA_KEY])
+    calls = ai_client.call_count
+    assert calls > 0
+
+    # 같은 세션으로 다시 만들면(재전송, 일기 요청 등) 기존 요약을 그대로 사용
+    for _ in range(3):
+        manager.build_history(session)
+    assert ai_client.call_count == calls
+    assert session.metadata[SUMMARY_METADATA_KEY] == summary
+
+
+if __name__ == "__main__":
+    print("=== 롤링 요약 컨텍스트 테스트 ===\n")
+    test_summary_covered_moves_forward_monotonically()
+    print("✓ 요약 위치(covered)는 앞으로만 이동")
+    test_summary_is_not_regenerated_without_new_folds()
+    print("✓ 새로 접을 메시지가 없으면 요약 요청 생략")
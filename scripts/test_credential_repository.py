@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+파일 인증 정보 저장소 테스트 (읽기 캐시, batch 한 번 쓰기, 여러 프로세스 동시 변경)
+
+사용법:
+    python scripts/test_credential_repository.py
+    uv run pytest scripts/test_credential_repository.py
+"""
+
+import multiprocessing
+import sys
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from diary.data.repositories import FileSystemCredentialRepository
+from diary.domain.entities import AICredential, AIProvider
+from diary.domain.services.credential_service import CredentialService
+
+
+class _CountingRepository(FileSystemCredentialRepository):
+    """파일을 읽고 쓴 횟수를 세는 저장소"""
+
+    def __init__(self, *args, **kwargs):
+        self.reads = 0
+        self.writes = 0
+        super().__init__(*args, **kwargs)
+
+    def _read_data(self) -> dict:
+        self.reads += 1
+        return super()._read_data()
+
+    def _write_data(self, data: dict) -> None:
+        self.writes += 1
+        super()._write_data(data)
+
+
+def _credential(repo: FileSystemCredentialRepository, provider: Optional[AIProvider] = None) -> AICredential:
+    """Provider의 인증 정보 (provider가 없으면 기본 인증 정보)"""
+    credential = repo.get_by_provider(provider) if provider else repo.get_default()
+    assert credential is not None
+    return credential
+
+
+def test_reads_use_cache_until_file_changes():
+    """파일이 그대로면 다시 읽지 않고, 다른 저장소(프로세스)가 고치면 다시 읽음"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "credentials.json")
+        repo = _CountingRepository(path)
+        repo.save(AICredential(AIProvider.OPENAI, "sk-openai-key", is_default=True))
+        repo.reads = 0
+
+        for _ in range(10):
+            assert _credential(repo).provider == AIProvider.OPENAI
+            assert repo.exists(AIProvider.OPENAI) and not repo.exists(AIProvider.GOOGLE)
+        assert repo.reads == 0
+
+        # 반환한 객체를 고쳐도 캐시는 그대로
+        repo.get_all()[0].api_key = "changed"
+        assert _credential(repo, AIProvider.OPENAI).api_key == "sk-openai-key"
+
+        FileSystemCredentialRepository(path).save(AICredential(AIProvider.GOOGLE, "google-key"))
+        assert [c.provider for c in repo.get_all()] == [AIProvider.OPENAI, AIProvider.GOOGLE]
+        assert repo.reads == 1
+
+
+def test_batch_writes_once_and_discards_on_error():
+    """서비스의 여러 단계 변경은 한 번만 쓰고, 도중에 예외가 나면 아무것도 저장하지 않음"""
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = _CountingRepository(str(Path(tmp) / "credentials.json"))
+        service = CredentialService(repo)
+        service.save_credential(AIProvider.OPENAI, "sk-openai-key")
+        service.save_credential(AIProvider.ANTHROPIC, "sk-ant-key")
+        repo.reads = repo.writes = 0
+
+        service.set_default_provider(AIProvider.ANTHROPIC)
+        assert (repo.reads, repo.writes) == (0, 1)
+        service.delete_credential(AIProvider.ANTHROPIC)
+        assert repo.writes == 2 and _credential(repo).provider == AIProvider.OPENAI
+
+        try:
+            with repo.batch():
+                repo.save(AICredential(AIProvider.GOOGLE, "google-key"))
+                assert repo.exists(AIProvider.GOOGLE)  # 구간 안에서는 보임
+                repo.delete(AIProvider.ANTHROPIC)  # 없음 → ValueError
+        except ValueError:
+            pass
+        assert not repo.exists(AIProvider.GOOGLE) and repo.writes == 2
+
+
+def _increment(path: str, times: int) -> None:
+    repo = FileSystemCredentialRepository(path)
+    for _ in range(times):
+        with repo.batch():
+            credential = _credential(repo, AIProvider.OPENAI)
+            credential.name = str(int(credential.name or 0) + 1)
+            repo.update(credential)
+
+
+def test_concurrent_processes_do_not_lose_updates():
+    """여러 프로세스가 동시에 읽고 고쳐 써도 변경이 사라지지 않음"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "credentials.json")
+        FileSystemCredentialRepository(path).save(AICredential(AIProvider.OPENAI, "sk-openai-key", name="0"))
+
+        workers = [multiprocessing.Process(target=_increment, args=(path, 25)) for _ in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        assert all(worker.exitcode == 0 for worker in workers)
+        assert _credential(FileSystemCredentialRepository(path), AIProvider.OPENAI).name == "100"
+
+
+if __name__ == "__main__":
+    print("=== 인증 정보 저장소 테스트 ===\n")
+    test_reads_use_cache_until_file_changes()
+    print("✓ 파일이 바뀔 때만 다시 읽음")
+    test_batch_writes_once_and_discards_on_error()
+    print("✓ batch는 한 번만 쓰고 예외가 나면 버림")
+    test_concurrent_processes_do_not_lose_updates()
+    print("✓ 여러 프로세스 동시 변경")
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+일기 초안 선작성 테스트 (오프라인, FakeAIClient 사용)
+
+사용법:
+    python scripts/test_diary_speculation.py
+    uv run pytest scripts/test_diary_speculation.py
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from diary.data.repositories import (
+    FakeAIBehavior,
+    FakeAIClient,
+    FileSystemChatRepository,
+    FileSystemUserPreferencesRepository,
+    FileSystemWritingStyleExamplesRepository,
+)
+from diary.domain.services import ChatService, UserPreferencesService
+from diary.domain.services.chat_service import DIARY_OFFER_PHRASE
+from diary.domain.services.diary_speculation import is_affirmative
+
+
+def _build_chat_service(tmp_dir: Path) -> ChatService:
+    """두 번째 사용자 메시지에 일기 작성을 제안하는 가짜 AI로 ChatService 조립"""
+    preferences_service = UserPreferencesService(
+        FileSystemUserPreferencesRepository(str(tmp_dir / "prefs.json")),
+        FileSystemWritingStyleExamplesRepository(tmp_dir / "examples"),
+    )
+    return ChatService(
+        chat_repo=FileSystemChatRepository(tmp_dir / "chats"),
+        ai_client=FakeAIClient(FakeAIBehavior(offer_after_turns=1)),
+        preferences_service=preferences_service,
+    )
+
+
+def _reach_offer(chat_service: ChatService) -> None:
+    chat_service.start_new_session()
+    chat_service.send_message("오늘은 친구를 만났다")
+    reply, _ = chat_service.send_message("저녁에 같이 영화를 봤다")
+    assert DIARY_OFFER_PHRASE in reply
+
+
+def test_is_affirmative():
+    """짧은 수락만 수락으로 봄"""
+    assert all(is_affirmative(t) for t in ["네", "응 부탁해", "좋아요!", "ㅇㅇ", "yes"])
+    assert not any(is_affirmative(t) for t in ["아니요", "네 근데 하나 더 있어요", "예전에 갔던 곳도 있어", ""])
+
+
+def test_accepting_returns_prepared_draft_without_new_call():
+    """수락하면 미리 만든 초안을 쓰고 AI를 다시 호출하지 않음"""
+    with tempfile.TemporaryDirectory() as tmp:
+        chat_service = _build_chat_service(Path(tmp))
+        _reach_offer(chat_service)
+        speculator, ai_client = chat_service.speculator, chat_service.ai_client
+        assert speculator is not None and speculator._pending is not None
+        assert isinstance(ai_client, FakeAIClient)
+        speculator._pending.future.result(timeout=5)
+        calls = ai_client.call_count
+
+        reply, is_diary = chat_service.send_message("네 좋아요")
+        assert is_diary and chat_service.last_response_speculative
+        assert ai_client.call_count == calls
+
+        session = chat_service.get_current_session()
+        assert session is not None
+        assert session.messages[-2].content == "네 좋아요"
+        assert session.messages[-1].content == reply
+        stats = chat_service.get_speculation_stats()
+        assert stats is not None and stats.hits == 1
+        chat_service.close()
+
+
+def test_continuing_conversation_discards_draft():
+    """대화를 이어가면 초안을 버리고 평소처럼 호출"""
+    with tempfile.TemporaryDirectory() as tmp:
+        chat_service = _build_chat_service(Path(tmp))
+        _reach_offer(chat_service)
+
+        _, is_diary = chat_service.send_message("잠깐, 아직 할 얘기가 남았어요. 밤에 산책도 했어요")
+        assert not is_diary and not chat_service.last_response_speculative
+
+        stats = chat_service.get_speculation_stats()
+        assert stats is not None
+        assert stats.misses == 1 and stats.hits == 0
+        assert stats.started == 2  # 이어간 대화에서 다시 제안하면 새로 선작성
+        chat_service.close()
+
+
+if __name__ == "__main__":
+    print("=== 일기 초안 선작성 테스트 ===\n")
+    test_is_affirmative()
+    print("✓ 수락 답변 판별")
+    test_accepting_returns_prepared_draft_without_new_call()
+    print("✓ 수락 시 미리 만든 초안 사용")
+    test_continuing_conversation_discards_draft()
+    print("✓ 대화를 이어가면 초안 버림")
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+OpenAI 호환 가짜 서버 테스트 (실제 OpenAIClient로 HTTP/SSE 왕복, API 키/외부 네트워크 없음)
+
+사용법:
+    python scripts/test_fake_openai_server.py
+    uv run pytest scripts/test_fake_openai_server.py
+"""
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from diary.data.repositories import FakeAIBehavior
+from diary.data.repositories.fake_openai_server import FakeOpenAIServer
+from diary.data.repositories.openai_client import OpenAIClient
+
+MESSAGES = [
+    {"role": "system", "content": "시스템 프롬프트"},
+    {"role": "user", "content": "오늘은 비가 와서 집에 있었어"},
+]
+
+
+def test_openai_client_round_trips_chat_and_stream():
+    """chat과 chat_stream이 같은 응답을 받고, 요청한 모델과 사용량이 기록됨"""
+    behavior = FakeAIBehavior(chunk_size=4)
+    expected = behavior.respond(MESSAGES)
+
+    with FakeOpenAIServer(behavior) as server:
+        client = OpenAIClient(api_key="test-key", base_url=server.base_url)
+
+        assert client.chat(MESSAGES) == expected
+        usage = client.get_last_usage()
+        assert usage is not None and usage.model == client.get_model_name()
+        assert usage.completion_tokens == len(expected) and usage.prompt_tokens > 0
+
+        chunks = list(client.chat_stream(MESSAGES, model="gpt-4o"))
+        assert "".join(chunks) == expected and len(chunks) > 1
+        usage = client.get_last_usage()
+        assert usage is not None and usage.model == "gpt-4o" and usage.completion_tokens == len(expected)
+
+
+def test_server_errors_surface_as_client_errors():
+    """서버가 오류를 주입하면 클라이언트는 상태 코드가 담긴 예외를 던짐"""
+    with FakeOpenAIServer(FakeAIBehavior(error_rate=1.0)) as server:
+        client = OpenAIClient(api_key="test-key", base_url=server.base_url)
+        try:
+            client.chat(MESSAGES)
+        except Exception as e:
+            assert "OpenAI API 호출 실패" in str(e)
+            assert getattr(e.__cause__, "status_code", None) == 503
+        else:
+            raise AssertionError("오류를 주입하면 예외가 발생해야 함")
+
+
+if __name__ == "__main__":
+    print("=== OpenAI 호환 가짜 서버 테스트 ===\n")
+    test_openai_client_round_trips_chat_and_stream()
+    print("✓ chat / chat_stream 왕복")
+    test_server_errors_surface_as_client_errors()
+    print("✓ 서버 오류 전달")
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Gemini 세션별 채팅 객체 재사용 테스트 (채팅 객체 생성만 확인하므로 네트워크 호출 없음)
+
+사용법:
+    python scripts/test_google_live_chat.py
+    uv run pytest scripts/test_google_live_chat.py
+"""
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from diary.data.repositories.google_ai_client import GoogleAIClient
+
+MODEL = "gemini-1.5-flash"
+SYSTEM = "시스템 프롬프트"
+
+
+def _after_reply(live, previous_turns, user_message: str, reply: str):
+    """chat()이 응답을 받은 뒤 하는 것처럼 채팅 객체의 히스토리 갱신"""
+    live.turns = previous_turns + [("user", user_message), ("assistant", reply)]
+    return live.turns
+
+
+def test_live_chat_is_reused_while_history_matches():
+    """이전 턴이 유지 중인 채팅과 같으면 같은 채팅 객체에 새 메시지만 보냄"""
+    client = GoogleAIClient(api_key="test-key")
+
+    first = client._get_live_chat("s1", MODEL, SYSTEM, [])
+    turns = _after_reply(first, [], "오늘 산책했어", "어디로 가셨어요?")
+
+    second = client._get_live_chat("s1", MODEL, SYSTEM, turns)
+    assert second is first
+    turns = _after_reply(second, turns, "한강에 갔어", "날씨는 어땠나요?")
+    assert client._get_live_chat("s1", MODEL, SYSTEM, turns) is first
+
+    # session_id가 없으면(일회성 요청) 보관하지 않음
+    client._get_live_chat(None, MODEL, SYSTEM, [])
+    assert list(client._live_chats) == ["s1"]
+
+
+def test_live_chat_is_rebuilt_when_history_diverges():
+    """히스토리/시스템 지시사항/모델이 달라지면 전달받은 히스토리로 채팅을 새로 만듦"""
+    client = GoogleAIClient(api_key="test-key")
+    live = client._get_live_chat("s1", MODEL, SYSTEM, [])
+    _after_reply(live, [], "오늘 산책했어", "어디로 가셨어요?")
+
+    # 이어하기/요약으로 앞부분이 바뀐 히스토리
+    resumed = [("user", "(요약된 대화)"), ("assistant", "어디로 가셨어요?")]
+    rebuilt = client._get_live_chat("s1", MODEL, SYSTEM, resumed)
+    assert rebuilt is not live and rebuilt.turns == resumed
+    assert [content.role for content in rebuilt.chat.history] == ["user", "model"]
+    assert client._live_chats["s1"] is rebuilt
+
+    summarized = client._get_live_chat("s1", MODEL, f"{SYSTEM}\n\n지금까지의 대화 요약", resumed)
+    assert summarized is not rebuilt
+
+    routed = client._get_live_chat("s1", "gemini-1.5-pro", f"{SYSTEM}\n\n지금까지의 대화 요약", resumed)
+    assert routed is not summarized and routed.model_name == "gemini-1.5-pro"
+    assert len(client._live_chats) == 1
+
+
+def test_least_recently_used_live_chat_is_evicted():
+    """MAX_LIVE_CHATS를 넘으면 가장 오래 쓰지 않은 세션의 채팅부터 정리"""
+    client = GoogleAIClient(api_key="test-key")
+    limit = GoogleAIClient.MAX_LIVE_CHATS
+
+    for i in range(limit):
+        client._get_live_chat(f"s{i}", MODEL, SYSTEM, [])
+    # s0을 다시 사용하면 가장 최근으로 이동
+    client._get_live_chat("s0", MODEL, SYSTEM, [])
+    client._get_live_chat("new", MODEL, SYSTEM, [])
+
+    assert len(client._live_chats) == limit
+    assert "s1" not in client._live_chats
+    assert "s0" in client._live_chats and list(client._live_chats)[-1] == "new"
+    assert len(client._models) == 1  # 같은 (모델, 시스템 지시사항)은 GenerativeModel 하나를 공유
+
+
+if __name__ == "__main__":
+    print("=== Gemini 세션별 채팅 객체 테스트 ===\n")
+    test_live_chat_is_reused_while_history_matches()
+    print("✓ 히스토리가 같으면 재사용")
+    test_live_chat_is_rebuilt_when_history_diverges()
+    print("✓ 히스토리/모델이 달라지면 다시 생성")
+    test_least_recently_used_live_chat_is_evicted()
+    print("✓ MAX_LIVE_CHATS 초과 시 오래된 채팅 정리")
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+HTTP API 서버 테스트 (오프라인, FakeAIClient + 실제 소켓)
+
+사용법:
+    python scripts/test_http_server.py
+    uv run pytest scripts/test_http_server.py
+"""
+
+import asyncio
+import http.client
+import json
+import sys
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import date
+from pathlib import Path
+from typing import List, Optional, Tuple
+from urllib.parse import quote
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from diary.data.repositories import (
+    FakeAIBehavior,
+    FakeAIClient,
+    FileSystemChatRepository,
+    FileSystemUserPreferencesRepository,
+    FileSystemWritingStyleExamplesRepository,
+)
+from diary.domain.entities import Diary
+from diary.domain.interfaces import DiaryRepositoryInterface
+from diary.domain.services import ChatService, UserPreferencesService
+from diary.domain.services.diary_service import DiaryService
+from diary.presentation.http_server import DiaryHTTPServer
+
+
+class InMemoryDiaryRepository(DiaryRepositoryInterface):
+    """테스트용 메모리 일기 저장소 (search는 인터페이스 기본 구현 사용)"""
+
+    def __init__(self):
+        self.diaries = {}
+
+    def save(self, diary: Diary) -> Diary:
+        diary.diary_id = diary.diary_id or f"id-{diary.diary_date}"
+        self.diaries[diary.diary_date] = diary
+        return diary
+
+    def get_by_date(self, diary_date: date) -> Optional[Diary]:
+        return self.diaries.get(diary_date)
+
+    def get_by_id(self, diary_id: str) -> Optional[Diary]:
+        return next((d for d in self.diaries.values() if d.diary_id == diary_id), None)
+
+    def list_diaries(self, cursor=None, limit=30, start_date=None, end_date=None):
+        diaries = sorted(self.diaries.values(), key=lambda d: d.diary_date, reverse=True)
+        offset = int(cursor or 0)
+        page = diaries[offset:offset + limit]
+        next_cursor = str(offset + limit) if offset + limit < len(diaries) else None
+        return page, next_cursor
+
+    def delete(self, diary_id: str) -> bool:
+        diary = self.get_by_id(diary_id)
+        return bool(diary) and self.diaries.pop(diary.diary_date) is not None
+
+    def exists_on_date(self, diary_date: date) -> bool:
+        return diary_date in self.diaries
+
+
+@contextmanager
+def running_server(tmp_dir: Path, behavior: Optional[FakeAIBehavior] = None):
+    """별도 스레드의 이벤트 루프에서 서버 실행 (사용자별 일기 저장소, AI 클라이언트 하나 공유)"""
+    ai_client = FakeAIClient(behavior or FakeAIBehavior())
+    diary_repos = {}
+
+    def diary_service_factory(user_id: str) -> DiaryService:
+        return DiaryService(diary_repos.setdefault(user_id, InMemoryDiaryRepository()))
+
+    def chat_service_factory(user_id: str) -> ChatService:
+        user_dir = tmp_dir / user_id
+        return ChatService(
+            chat_repo=FileSystemChatRepository(user_dir / "chats"),
+            ai_client=ai_client,
+            preferences_service=UserPreferencesService(
+                FileSystemUserPreferencesRepository(str(user_dir / "prefs.json")),
+                FileSystemWritingStyleExamplesRepository(user_dir / "examples"),
+            ),
+            speculative_diary=False,
+        )
+
+    server = DiaryHTTPServer(diary_service_factory, chat_service_factory, port=0, max_chat_services=4)
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    asyncio.run_coroutine_threadsafe(server.start(), loop).result(timeout=5)
+    try:
+        yield server
+    finally:
+        asyncio.run_coroutine_threadsafe(server.close(), loop).result(timeout=10)
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=5)
+
+
+def request(server, method: str, path: str, body=None, user: str = "alice", headers=None) -> Tuple[int, dict]:
+    """JSON 요청 → (상태 코드, 응답 JSON)"""
+    conn = http.client.HTTPConnection("127.0.0.1", server.port, timeout=10)
+    try:
+        conn.request(
+            method,
+            path,
+            body=json.dumps(body).encode("utf-8") if body is not None else None,
+            headers={"X-User-Id": user, "Content-Type": "application/json", **(headers or {})},
+        )
+        response = conn.getresponse()
+        return response.status, json.loads(response.read().decode("utf-8"))
+    finally:
+        conn.close()
+
+
+def stream_chat(server, message: str, user: str = "alice") -> List[Tuple[str, dict]]:
+    """SSE 채팅 요청 → [(이벤트, 데이터)]"""
+    conn = http.client.HTTPConnection("127.0.0.1", server.port, timeout=10)
+    try:
+        conn.request(
+            "POST",
+            "/chat/messages",
+            body=json.dumps({"message": message}).encode("utf-8"),
+            headers={"X-User-Id": user, "Accept": "text/event-stream"},
+        )
+        response = conn.getresponse()
+        assert response.status == 200
+        assert (response.getheader("Content-Type") or "").startswith("text/event-stream")
+        events = []
+        for frame in response.read().decode("utf-8").split("\n\n"):
+            if frame.strip():
+                event_line, data_line = frame.split("\n")
+                events.append((event_line[len("event: "):], json.loads(data_line[len("data: "):])))
+        return events
+    finally:
+        conn.close()
+
+
+def test_diary_crud_list_and_search():
+    """일기 작성/조회/수정/삭제, 페이지네이션, 검색, 사용자 구분"""
+    with tempfile.TemporaryDirectory() as tmp, running_server(Path(tmp)) as server:
+        for day, content in [(1, "아침에 산책을 했다"), (2, "회사에서 회의"), (3, "저녁 산책과 독서")]:
+            status, created = request(server, "POST", "/diaries", {"date": f"2026-03-0{day}", "content": content})
+            assert status == 201 and created["diary_date"] == f"2026-03-0{day}"
+        assert request(server, "POST", "/diaries", {"date": "2026-03-01", "content": "중복"})[0] == 409
+        assert request(server, "POST", "/diaries", {"date": "2026/03/01", "content": "x"})[0] == 400
+
+        status, page = request(server, "GET", "/diaries?limit=2")
+        assert status == 200 and [d["diary_date"] for d in page["items"]] == ["2026-03-03", "2026-03-02"]
+        _, rest = request(server, "GET", f"/diaries?limit=2&cursor={page['next_cursor']}")
+        assert [d["diary_date"] for d in rest["items"]] == ["2026-03-01"] and rest["next_cursor"] is None
+
+        _, found = request(server, "GET", "/diaries/search?q=" + quote("산책"))
+        assert [d["diary_date"] for d in found["items"]] == ["2026-03-03", "2026-03-01"]
+        assert request(server, "GET", "/diaries/search?q=")[0] == 400
+
+        status, updated = request(server, "PUT", "/diaries/2026-03-02", {"content": "회의가 길었다"})
+        assert status == 200 and updated["content"] == "회의가 길었다"
+        assert request(server, "GET", f"/diaries/{updated['diary_id']}")[1]["content"] == "회의가 길었다"
+        assert request(server, "DELETE", "/diaries/2026-03-02")[1] == {"deleted": True}
+        assert request(server, "GET", "/diaries/2026-03-02")[0] == 404
+
+        assert request(server, "GET", "/diaries", user="bob")[1]["items"] == []
+        assert request(server, "GET", "/diaries", user="../etc")[0] == 400
+        assert request(server, "PATCH", "/diaries")[0] == 405
+
+
+def test_chat_turn_streams_chunks():
+    """SSE로 응답 조각을 보내고 마지막에 전체 응답을 보냄"""
+    with tempfile.TemporaryDirectory() as tmp, running_server(Path(tmp), FakeAIBehavior(chunk_size=4)) as server:
+        status, session = request(server, "POST", "/chat/session")
+        assert status == 201 and session["messages"][0]["role"] == "assistant"
+
+        events = stream_chat(server, "오늘은 바빴어")
+        chunks = [data["text"] for event, data in events if event == "chunk"]
+        assert len(chunks) > 1
+        assert events[-1][0] == "done"
+        assert "".join(chunks) == events[-1][1]["reply"]
+        assert events[-1][1]["session_id"] == session["session_id"]
+
+        status, reply = request(server, "POST", "/chat/messages", {"message": "회의가 많았어"})
+        assert status == 200 and not reply["is_diary"]
+        _, current = request(server, "GET", "/chat/session")
+        assert current["message_count"] == 6  # 시스템 + 인사 + 2턴
+        assert request(server, "POST", "/chat/messages", {"message": " "})[0] == 400
+
+
+def test_concurrent_users_share_one_server():
+    """여러 사용자의 턴을 동시에 처리하고, 세션은 사용자별로 분리"""
+    behavior = FakeAIBehavior(latency_ms=50)
+    with tempfile.TemporaryDirectory() as tmp, running_server(Path(tmp), behavior) as server:
+        users = [f"user{i}" for i in range(8)]
+        with ThreadPoolExecutor(max_workers=len(users)) as pool:
+            replies = list(pool.map(lambda u: request(server, "POST", "/chat/messages", {"message": f"{u}의 하루"}, user=u), users))
+
+        assert all(status == 200 for status, _ in replies)
+        assert len({reply["session_id"] for _, reply in replies}) == len(users)
+        # 유지 개수(4)를 넘은 사용자의 ChatService는 정리되어도 세션은 저장소에서 이어짐
+        assert request(server, "GET", "/health")[1]["chat_sessions"] <= 4
+        _, session = request(server, "GET", "/chat/session", user="user0")
+        assert [m["content"] for m in session["messages"] if m["role"] == "user"] == ["user0의 하루"]
+
+
+if __name__ == "__main__":
+    print("=== HTTP API 서버 테스트 ===\n")
+    test_diary_crud_list_and_search()
+    print("✓ 일기 CRUD + 페이지네이션 + 검색")
+    test_chat_turn_streams_chunks()
+    print("✓ 채팅 응답 스트리밍 (SSE)")
+    test_concurrent_users_share_one_server()
+    print("✓ 여러 사용자 동시 처리")
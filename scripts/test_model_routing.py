@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+요청 종류별 모델 라우팅 테스트 (오프라인, FakeAIClient 사용)
+
+사용법:
+    python scripts/test_model_routing.py
+    uv run pytest scripts/test_model_routing.py
+"""
+
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from diary.data.repositories import (
+    FakeAIClient,
+    FileSystemChatRepository,
+    FileSystemUserPreferencesRepository,
+    FileSystemWritingStyleExamplesRepository,
+    JsonlTelemetryRepository,
+)
+from diary.domain.entities import ChatMessage, MessageRole, UserPreferences
+from diary.domain.entities.model_routing import (
+    DEFAULT_FAST_MODELS,
+    DEFAULT_STRONG_MODELS,
+    ModelRouting,
+    RequestType,
+)
+from diary.domain.services import ChatService, InstrumentedAIClient, UserPreferencesService
+
+
+class RecordingAIClient(FakeAIClient):
+    """호출마다 요청받은 모델을 기록"""
+
+    def __init__(self):
+        super().__init__()
+        self.models = []
+
+    def chat(self, messages, session_id=None, model=None):
+        self.models.append(model)
+        return super().chat(messages, session_id=session_id, model=model)
+
+
+def _run_conversation(tmp_dir: Path, routing_enabled: bool = True):
+    """인사 → 대화 → 일기 요청 → 일괄 생성 순서로 호출하고 (요청 종류, 모델) 기록 반환"""
+    preferences_service = UserPreferencesService(
+        FileSystemUserPreferencesRepository(str(tmp_dir / "prefs.json")),
+        FileSystemWritingStyleExamplesRepository(tmp_dir / "examples"),
+    )
+    preferences_service.set_model_routing_enabled(routing_enabled)
+    recording = RecordingAIClient()
+    telemetry_repo = JsonlTelemetryRepository(str(tmp_dir / "telemetry.jsonl"))
+    chat_service = ChatService(
+        chat_repo=FileSystemChatRepository(tmp_dir / "chats"),
+        ai_client=InstrumentedAIClient(recording, telemetry_repo, provider="openai"),
+        preferences_service=preferences_service,
+        provider="openai",
+        speculative_diary=False,
+    )
+
+    chat_service.start_new_session()
+    chat_service.send_message("오늘은 공원에서 산책을 했어")
+    _, is_diary = chat_service.send_message("일기 써줘")
+    assert is_diary
+    chat_service.generate_diary_from_messages([
+        ChatMessage(role=MessageRole.USER, content="비가 와서 집에서 책을 읽었다", timestamp=datetime.now()),
+    ])
+    chat_service.close()
+
+    records = [(r.request_type, r.model) for r in telemetry_repo.list_records()]
+    return records, recording.models
+
+
+def test_requests_are_routed_by_type():
+    """인사/대화는 빠른 모델, 일기 작성은 상위 모델로 요청"""
+    with tempfile.TemporaryDirectory() as tmp:
+        records, models = _run_conversation(Path(tmp))
+
+        fast, strong = DEFAULT_FAST_MODELS["openai"], DEFAULT_STRONG_MODELS["openai"]
+        assert records == [
+            (RequestType.GREETING.value, fast),
+            (RequestType.SMALL_TALK.value, fast),
+            (RequestType.DIARY.value, strong),
+            (RequestType.DIARY.value, strong),
+        ]
+        assert models == [fast, fast, strong, strong]
+
+
+def test_disabled_routing_uses_client_default_model():
+    """라우팅을 끄면 모든 요청이 모델 없이(클라이언트 기본 모델로) 전달됨"""
+    routing = ModelRouting(enabled=False)
+    assert all(routing.get_model("openai", request_type) is None for request_type in RequestType)
+    assert ModelRouting().get_model("unknown", RequestType.DIARY) is None  # 설정이 없는 Provider
+
+    with tempfile.TemporaryDirectory() as tmp:
+        records, models = _run_conversation(Path(tmp), routing_enabled=False)
+        assert models == [None, None, None, None]
+        assert [model for _, model in records] == ["fake-model"] * 4  # 기록에는 클라이언트 기본 모델
+
+
+def test_from_dict_merges_partial_overrides_with_defaults():
+    """저장된 설정에 일부 Provider만 있으면 나머지는 기본 모델 사용"""
+    routing = ModelRouting.from_dict({"fast_models": {"openai": "my-fast-model"}})
+    assert routing.enabled
+    assert routing.fast_models == {**DEFAULT_FAST_MODELS, "openai": "my-fast-model"}
+    assert routing.strong_models == DEFAULT_STRONG_MODELS
+    assert routing.get_model("openai", RequestType.SMALL_TALK) == "my-fast-model"
+    assert routing.get_model("anthropic", RequestType.SUMMARY) == DEFAULT_FAST_MODELS["anthropic"]
+
+    disabled = ModelRouting.from_dict({"enabled": False, "strong_models": {"google": "gemini-custom"}})
+    assert ModelRouting.from_dict(disabled.to_dict()) == disabled
+    assert disabled.strong_models["google"] == "gemini-custom"
+
+    # 라우팅 설정이 생기기 전에 저장한 설정 파일
+    legacy = UserPreferences.from_dict({"writing_style": "emotional_literary"})
+    assert legacy.model_routing == ModelRouting()
+
+
+if __name__ == "__main__":
+    print("=== 모델 라우팅 테스트 ===\n")
+    test_requests_are_routed_by_type()
+    print("✓ 요청 종류별 모델 선택")
+    test_disabled_routing_uses_client_default_model()
+    print("✓ 라우팅을 끄면 클라이언트 기본 모델")
+    test_from_dict_merges_partial_overrides_with_defaults()
+    print("✓ 저장된 설정과 기본 모델 병합")
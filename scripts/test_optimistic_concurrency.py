@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+세션/일기 낙관적 동시성 제어 테스트 (오프라인, FakeAIClient 사용)
+
+사용법:
+    python scripts/test_optimistic_concurrency.py
+    uv run pytest scripts/test_optimistic_concurrency.py
+"""
+
+import json
+import sys
+import tempfile
+from datetime import date
+from pathlib import Path
+from typing import Optional
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from diary.data.repositories import (
+    FakeAIClient,
+    FileSystemChatRepository,
+    FileSystemUserPreferencesRepository,
+    FileSystemWritingStyleExamplesRepository,
+)
+from diary.domain.entities import ChatSession, Diary, MessageRole
+from diary.domain.exceptions import DiaryConflictError, SessionConflictError
+from diary.domain.interfaces import DiaryRepositoryInterface
+from diary.domain.services import ChatService, DiaryService, UserPreferencesService, WriteBehindSessionWriter
+from diary.domain.services.context_window import SUMMARY_METADATA_KEY
+from diary.domain.services.session_merge import TOKEN_USAGE_METADATA_KEY, save_with_merge
+
+
+class InMemoryDiaryRepository(DiaryRepositoryInterface):
+    """테스트용 메모리 일기 저장소 (버전 비교 후 저장)"""
+
+    def __init__(self):
+        self.rows = {}
+
+    def save(self, diary: Diary) -> Diary:
+        diary.diary_id = diary.diary_id or str(diary.diary_date)
+        stored = self.rows.get(diary.diary_id)
+        if stored and stored.version != diary.version:
+            raise DiaryConflictError(diary.diary_id, diary.version, stored.version)
+        diary.version += 1
+        self.rows[diary.diary_id] = Diary(**vars(diary))
+        return diary
+
+    def get_by_id(self, diary_id: str) -> Optional[Diary]:
+        stored = self.rows.get(diary_id)
+        return Diary(**vars(stored)) if stored else None
+
+    def get_by_date(self, diary_date: date) -> Optional[Diary]:
+        return next((d for d in self.rows.values() if d.diary_date == diary_date), None)
+
+    def list_diaries(self, cursor=None, limit=30, start_date=None, end_date=None):
+        return list(self.rows.values())[:limit], None
+
+    def delete(self, diary_id: str) -> bool:
+        return self.rows.pop(diary_id, None) is not None
+
+    def exists_on_date(self, diary_date: date) -> bool:
+        return self.get_by_date(diary_date) is not None
+
+
+def _build_chat_service(tmp_dir: Path, write_behind: bool = False) -> ChatService:
+    """같은 디렉토리를 쓰는 독립된 ChatService (다른 CLI 인스턴스 역할)"""
+    chat_repo = FileSystemChatRepository(tmp_dir / "chats")
+    return ChatService(
+        chat_repo=chat_repo,
+        ai_client=FakeAIClient(),
+        preferences_service=UserPreferencesService(
+            FileSystemUserPreferencesRepository(str(tmp_dir / "prefs.json")),
+            FileSystemWritingStyleExamplesRepository(tmp_dir / "examples"),
+        ),
+        session_writer=WriteBehindSessionWriter(chat_repo) if write_behind else None,
+        speculative_diary=False,
+    )
+
+
+def _user_messages(session: Optional[ChatSession]) -> list:
+    assert session is not None
+    return [m.content for m in session.messages if m.role == MessageRole.USER]
+
+
+def _load(chat_repo: FileSystemChatRepository, session_id: Optional[str] = None) -> ChatSession:
+    """저장된 세션 (session_id가 없으면 활성 세션)"""
+    session = chat_repo.get_session(session_id) if session_id else chat_repo.get_active_session()
+    assert session is not None
+    return session
+
+
+def test_stale_session_save_is_rejected():
+    """읽은 뒤 다른 곳에서 저장한 세션은 덮어쓰지 않음 (버전 없는 기존 파일은 버전 0)"""
+    with tempfile.TemporaryDirectory() as tmp:
+        chat_repo = FileSystemChatRepository(Path(tmp) / "chats")
+        session = ChatSession(session_id="s")
+        session.add_message(MessageRole.USER, "안녕")
+        chat_repo.save_session(session)
+        assert session.version == 1 and session.unsaved_count == 0
+
+        first, second = _load(chat_repo, "s"), _load(chat_repo, "s")
+        first.add_message(MessageRole.USER, "먼저 저장")
+        chat_repo.save_session(first)
+        second.add_message(MessageRole.USER, "나중에 저장")
+        try:
+            chat_repo.save_session(second)
+            assert False, "충돌해야 함"
+        except SessionConflictError as e:
+            assert (e.expected_version, e.actual_version) == (1, 2)
+        assert _user_messages(chat_repo.get_session("s")) == ["안녕", "먼저 저장"]
+
+        session_file = Path(tmp) / "chats" / "s.json"
+        data = json.loads(session_file.read_text(encoding="utf-8"))
+        del data["version"]
+        session_file.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        (Path(tmp) / "chats" / "s.tail.json").unlink()
+        legacy = _load(chat_repo, "s")
+        assert legacy.version == 0
+        chat_repo.save_session(legacy)
+        assert _load(chat_repo, "s").version == 1
+
+
+def test_concurrent_chat_services_merge_appended_messages():
+    """두 인스턴스가 같은 세션에 이어 말하면 양쪽 메시지를 모두 남김"""
+    with tempfile.TemporaryDirectory() as tmp:
+        first = _build_chat_service(Path(tmp))
+        first.start_new_session()
+        second = _build_chat_service(Path(tmp))
+        second.get_current_session()
+
+        first.send_message("첫 번째 창에서")
+        second.send_message("두 번째 창에서")  # 충돌 → 최신 세션 뒤에 다시 붙여 저장
+        first.send_message("다시 첫 번째 창")
+
+        stored = _load(FileSystemChatRepository(Path(tmp) / "chats"))
+        assert _user_messages(stored) == ["첫 번째 창에서", "두 번째 창에서", "다시 첫 번째 창"]
+        assert len(stored.messages) == 8  # 시스템 + 인사 + 3턴
+        assert _user_messages(second.get_current_session()) == ["첫 번째 창에서", "두 번째 창에서"]
+
+
+def test_write_behind_merge_does_not_duplicate_messages():
+    """백그라운드 저장도 충돌하면 합치고, 이후 저장에서 메시지가 중복되지 않음"""
+    with tempfile.TemporaryDirectory() as tmp:
+        first = _build_chat_service(Path(tmp), write_behind=True)
+        first.start_new_session()
+        assert first.flush(timeout=5)
+        second = _build_chat_service(Path(tmp), write_behind=True)
+        second.get_current_session()
+
+        first.send_message("A1")
+        assert first.flush(timeout=5)
+        second.send_message("B1")
+        assert second.flush(timeout=5)
+        second.send_message("B2")
+        first.send_message("A2")
+        assert second.close(timeout=5) and first.close(timeout=5)
+        assert first.session_writer and first.session_writer.last_error is None
+        assert second.session_writer and second.session_writer.last_error is None
+
+        stored = _load(FileSystemChatRepository(Path(tmp) / "chats"))
+        assert sorted(_user_messages(stored)) == ["A1", "A2", "B1", "B2"]
+        assert _user_messages(stored)[:2] == ["A1", "B1"]
+        assert len(stored.messages) == 10
+
+
+def test_merge_adds_token_usage_and_keeps_longer_summary():
+    """충돌을 합칠 때 누적 토큰 사용량은 양쪽 증가분을 더하고, 요약은 더 많이 덮는 쪽을 남김"""
+    for write_behind in (False, True):
+        with tempfile.TemporaryDirectory() as tmp:
+            first = _build_chat_service(Path(tmp), write_behind=write_behind)
+            first.start_new_session()  # 인사 1회
+            assert first.flush(timeout=5)
+            second = _build_chat_service(Path(tmp), write_behind=write_behind)
+            second.get_current_session()
+
+            first.send_message("A1")
+            assert first.flush(timeout=5)
+            second.send_message("B1")
+            assert second.flush(timeout=5)
+            second.send_message("B2")
+            first.send_message("A2")
+            assert second.close(timeout=5) and first.close(timeout=5)
+
+            stored = _load(FileSystemChatRepository(Path(tmp) / "chats"))
+            assert stored.metadata[TOKEN_USAGE_METADATA_KEY]["requests"] == 5
+
+    with tempfile.TemporaryDirectory() as tmp:
+        chat_repo = FileSystemChatRepository(Path(tmp) / "chats")
+        session = ChatSession(session_id="s")
+        session.add_message(MessageRole.USER, "안녕")
+        chat_repo.save_session(session)
+
+        first, second = _load(chat_repo, "s"), _load(chat_repo, "s")
+        first.add_message(MessageRole.USER, "먼저 저장")
+        first.metadata[SUMMARY_METADATA_KEY] = {"text": "긴 요약", "covered": 4}
+        chat_repo.save_session(first)
+        second.add_message(MessageRole.USER, "나중에 저장")
+        second.metadata[SUMMARY_METADATA_KEY] = {"text": "짧은 요약", "covered": 2}
+        second.metadata["note"] = "이쪽 값"
+        assert save_with_merge(chat_repo, second)
+
+        stored = _load(chat_repo, "s")
+        assert stored.metadata[SUMMARY_METADATA_KEY] == {"text": "긴 요약", "covered": 4}
+        assert stored.metadata["note"] == "이쪽 값"
+
+
+def test_diary_update_with_stale_version_is_rejected():
+    """화면에 보여준 버전과 저장소 버전이 다르면 일기를 덮어쓰지 않음"""
+    diary_repo = InMemoryDiaryRepository()
+    diary_service = DiaryService(diary_repo)
+    diary = diary_repo.save(Diary(diary_date=date(2026, 3, 1), content="처음", diary_id="d"))
+
+    diary_service.update_diary("d", "다른 창에서 수정")
+    try:
+        diary_service.update_diary("d", "늦게 수정", expected_version=diary.version)
+        assert False, "충돌해야 함"
+    except DiaryConflictError as e:
+        assert (e.expected_version, e.actual_version) == (1, 2)
+    stored = diary_repo.get_by_id("d")
+    assert stored is not None and stored.content == "다른 창에서 수정"
+    assert Diary.from_dict(stored.to_dict()).version == 2
+
+
+if __name__ == "__main__":
+    print("=== 낙관적 동시성 제어 테스트 ===\n")
+    test_stale_session_save_is_rejected()
+    print("✓ 오래된 세션 저장 거부")
+    test_concurrent_chat_services_merge_appended_messages()
+    print("✓ 동시에 이어 쓴 대화 합치기")
+    test_write_behind_merge_does_not_duplicate_messages()
+    print("✓ 백그라운드 저장 합치기 (중복 없음)")
+    test_merge_adds_token_usage_and_keeps_longer_summary()
+    print("✓ 토큰 사용량 더하기 + 더 긴 요약 유지")
+    test_diary_update_with_stale_version_is_rejected()
+    print("✓ 오래된 버전의 일기 수정 거부")
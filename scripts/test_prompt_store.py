@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+시스템 프롬프트 중복 저장 제거 테스트 (파일 저장소)
+
+사용법:
+    python scripts/test_prompt_store.py
+    uv run pytest scripts/test_prompt_store.py
+"""
+
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from diary.data.repositories import FileSystemChatRepository
+from diary.data.repositories.prompt_store import PROMPT_REF_KEY
+from diary.domain.entities import ChatSession, MessageRole
+from diary.domain.services.system_prompt_builder import compute_prompt_hash
+
+SYSTEM_PROMPT = "당신은 일기를 작성하는 인터뷰어입니다.\n" + "예시 문장입니다.\n" * 200
+
+
+def _session(session_id: str) -> ChatSession:
+    session = ChatSession(session_id=session_id, is_active=False)
+    session.add_message(MessageRole.SYSTEM, SYSTEM_PROMPT)
+    session.add_message(MessageRole.USER, f"{session_id}의 하루")
+    return session
+
+
+def _load(chat_repo: FileSystemChatRepository, session_id: str) -> ChatSession:
+    session = chat_repo.get_session(session_id)
+    assert session is not None
+    return session
+
+
+def test_sessions_share_one_stored_prompt():
+    """같은 프롬프트는 한 번만 저장하고, 세션에는 해시만 남기고, 읽을 때 복원"""
+    with tempfile.TemporaryDirectory() as tmp:
+        chat_repo = FileSystemChatRepository(Path(tmp) / "chats")
+        for session_id in ["a", "b", "c"]:
+            chat_repo.save_session(_session(session_id))
+
+        prompt_files = list((Path(tmp) / "chats" / "prompts").glob("*.txt"))
+        assert [p.stem for p in prompt_files] == [compute_prompt_hash(SYSTEM_PROMPT)]
+
+        stored = json.loads((Path(tmp) / "chats" / "a.json").read_text(encoding="utf-8"))
+        assert "content" not in stored["messages"][0]
+        assert stored["messages"][0][PROMPT_REF_KEY] == prompt_files[0].stem
+
+        reloaded = FileSystemChatRepository(Path(tmp) / "chats")
+        assert _load(reloaded, "b").messages[0].content == SYSTEM_PROMPT
+        assert all(s.messages[0].content == SYSTEM_PROMPT for s in reloaded.list_sessions())
+
+
+def test_migration_compacts_legacy_sessions_and_reports_savings():
+    """프롬프트 본문이 그대로 들어 있는 예전 세션 파일을 압축하고 절약한 크기를 보고"""
+    with tempfile.TemporaryDirectory() as tmp:
+        chats_dir = Path(tmp) / "chats"
+        chats_dir.mkdir()
+        for session_id in ["a", "b", "c"]:
+            (chats_dir / f"{session_id}.json").write_text(
+                json.dumps(_session(session_id).to_dict(), indent=2, ensure_ascii=False), encoding="utf-8"
+            )
+        chat_repo = FileSystemChatRepository(chats_dir)
+
+        preview = chat_repo.compact_stored_prompts(dry_run=True)
+        assert preview.sessions_compacted == 3
+        assert not list((chats_dir / "prompts").glob("*.txt"))
+
+        report = chat_repo.compact_stored_prompts()
+        assert report.sessions_scanned == 3 and report.sessions_compacted == 3
+        assert report.bytes_after == preview.bytes_after
+        prompt_size = len(SYSTEM_PROMPT.encode("utf-8"))
+        assert report.prompt_bytes == prompt_size
+        assert report.reclaimed_bytes > prompt_size  # 세 벌 중 두 벌 이상 절약
+
+        assert chat_repo.compact_stored_prompts().sessions_compacted == 0  # 다시 실행하면 할 일 없음
+        assert _load(FileSystemChatRepository(chats_dir), "c").messages[0].content == SYSTEM_PROMPT
+
+
+if __name__ == "__main__":
+    print("=== 시스템 프롬프트 중복 저장 제거 테스트 ===\n")
+    test_sessions_share_one_stored_prompt()
+    print("✓ 프롬프트 한 번만 저장 + 읽을 때 복원")
+    test_migration_compacts_legacy_sessions_and_reports_savings()
+    print("✓ 기존 세션 압축 + 절약한 크기 보고")
@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+저장소 계약 테스트 - 모든 일기/채팅 저장소 구현체가 같은 동작을 하는지 확인
+
+일기: SQLiteDiaryRepository
+채팅: FileSystemChatRepository, FileSystemLogChatRepository, SQLiteChatRepository
+DAILY_TEST_MONGODB=1이면 MongoDB 구현체도 확인합니다 (실행 중인 MongoDB 필요,
+테스트용 사용자 ID로만 쓰고 끝나면 지움).
+
+사용법:
+    python scripts/test_repository_contract.py
+    uv run pytest scripts/test_repository_contract.py
+    DAILY_TEST_MONGODB=1 python scripts/test_repository_contract.py
+"""
+
+import os
+import sys
+import tempfile
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Callable, Iterator, List, Tuple
+from uuid import uuid4
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from diary.data.repositories import (
+    FileSystemChatRepository,
+    FileSystemLogChatRepository,
+    SQLiteChatRepository,
+    SQLiteDiaryRepository,
+)
+from diary.domain.entities import ChatSession, Diary, MessageRole
+from diary.domain.exceptions import DiaryConflictError, SessionConflictError
+
+START = date(2026, 3, 1)
+
+
+@contextmanager
+def _sqlite_diary_repo() -> Iterator[SQLiteDiaryRepository]:
+    with tempfile.TemporaryDirectory() as tmp, SQLiteDiaryRepository(Path(tmp) / "daily.db") as diary_repo:
+        yield diary_repo
+
+
+@contextmanager
+def _mongodb_diary_repo():
+    from diary.data.repositories import MongoDBDiaryRepository
+
+    # 실제 데이터와 섞이지 않도록 테스트용 사용자로만 쓰고 지움
+    user_id = f"contract-{uuid4().hex[:12]}"
+    with MongoDBDiaryRepository(user_id=user_id) as diary_repo:
+        try:
+            yield diary_repo
+        finally:
+            diary_repo.diaries.delete_many({"user_id": {"$regex": f"^{user_id}"}})
+
+
+@contextmanager
+def _file_chat_repo() -> Iterator[FileSystemChatRepository]:
+    with tempfile.TemporaryDirectory() as tmp:
+        yield FileSystemChatRepository(Path(tmp) / "chats")
+
+
+@contextmanager
+def _file_log_chat_repo() -> Iterator[FileSystemLogChatRepository]:
+    with tempfile.TemporaryDirectory() as tmp:
+        yield FileSystemLogChatRepository(Path(tmp) / "chats", compact_after=3)
+
+
+@contextmanager
+def _sqlite_chat_repo() -> Iterator[SQLiteChatRepository]:
+    with tempfile.TemporaryDirectory() as tmp, SQLiteChatRepository(Path(tmp) / "daily.db") as chat_repo:
+        yield chat_repo
+
+
+@contextmanager
+def _mongodb_chat_repo():
+    from diary.data.repositories import MongoDBChatRepository
+
+    user_id = f"contract-{uuid4().hex[:12]}"
+    with MongoDBChatRepository(user_id=user_id) as chat_repo:
+        try:
+            yield chat_repo
+        finally:
+            for collection in (chat_repo.sessions, chat_repo.active_session, chat_repo.archived_sessions):
+                collection.delete_many({"user_id": {"$regex": f"^{user_id}"}})
+
+
+def diary_repositories() -> List[Tuple[str, Callable]]:
+    """계약을 확인할 일기 저장소 (이름, 저장소를 만드는 context manager)"""
+    repos: List[Tuple[str, Callable]] = [("sqlite", _sqlite_diary_repo)]
+    if os.getenv("DAILY_TEST_MONGODB") == "1":
+        repos.append(("mongodb", _mongodb_diary_repo))
+    return repos
+
+
+def chat_repositories() -> List[Tuple[str, Callable]]:
+    """계약을 확인할 채팅 저장소 (이름, 저장소를 만드는 context manager)"""
+    repos = [("file", _file_chat_repo), ("file-log", _file_log_chat_repo), ("sqlite", _sqlite_chat_repo)]
+    if os.getenv("DAILY_TEST_MONGODB") == "1":
+        repos.append(("mongodb", _mongodb_chat_repo))
+    return repos
+
+
+def check_diary_contract(diary_repo) -> None:
+    """저장/조회/버전 충돌/페이지네이션/검색/삭제/사용자 범위"""
+    first = diary_repo.save(Diary(diary_date=START, content="Morning RUN 뒤에 회의가 길어졌다."))
+    assert first.diary_id and first.version == 1
+    assert diary_repo.get_by_date(START).content == first.content
+    assert diary_repo.get_by_id(first.diary_id).version == 1 and diary_repo.exists_on_date(START)
+
+    try:
+        diary_repo.save(Diary(diary_date=START, content="같은 날짜"))
+        raise AssertionError("같은 날짜의 새 일기는 ValueError가 발생해야 합니다")
+    except ValueError:
+        pass
+
+    stale = diary_repo.get_by_id(first.diary_id)
+    first.content = "고친 내용: morning run"
+    diary_repo.save(first)
+    try:
+        diary_repo.save(stale)
+        raise AssertionError("DiaryConflictError가 발생해야 합니다")
+    except DiaryConflictError:
+        pass
+
+    saved = diary_repo.save_many([
+        Diary(diary_date=START + timedelta(days=i), content=f"{i}일째 일기. 산책 \"50%\" (a+b)*")
+        for i in range(1, 25)
+    ])
+    assert all(d.version == 1 for d in saved)
+
+    # 페이지를 이어 읽으면 빠짐없이 최신순, 날짜 범위는 양 끝 포함
+    seen, cursor = [], None
+    while True:
+        page, cursor = diary_repo.list_diaries(cursor=cursor, limit=7)
+        seen.extend(d.diary_date for d in page)
+        if not cursor:
+            break
+    assert seen == [START + timedelta(days=i) for i in range(24, -1, -1)]
+    in_range, _ = diary_repo.list_diaries(limit=30, start_date=START + timedelta(days=3), end_date=START + timedelta(days=5))
+    assert [d.diary_date.day for d in in_range] == [6, 5, 4]
+    page, cursor = diary_repo.list_diaries(limit=2, end_date=START + timedelta(days=5))
+    page, _ = diary_repo.list_diaries(cursor=cursor, limit=2, end_date=START + timedelta(days=5))
+    assert [d.diary_date.day for d in page] == [4, 3]
+
+    assert [d.diary_id for d in diary_repo.search("MORNING RUN")] == [first.diary_id]  # 대소문자 무시
+    assert len(diary_repo.search("회의")) == 0  # 고친 내용에는 없음
+    assert len(diary_repo.search("산책", limit=5)) == 5  # 두 글자 검색어
+    assert [d.diary_date.day for d in diary_repo.search("\"50%\" (a+b)*", limit=2)] == [25, 24]  # 특수문자 그대로
+
+    other = diary_repo.for_user(f"{diary_repo.user_id}-other")
+    assert other.get_by_id(first.diary_id) is None and other.list_diaries()[0] == []
+    other.save(Diary(diary_date=START, content="다른 사용자의 같은 날짜"))
+
+    assert diary_repo.delete(first.diary_id) and not diary_repo.delete(first.diary_id)
+    assert not diary_repo.exists_on_date(START) and other.exists_on_date(START)
+
+
+def _session(session_id: str, created_at: datetime, turns: int) -> ChatSession:
+    session = ChatSession(session_id=session_id, created_at=created_at)
+    session.add_message(MessageRole.SYSTEM, "당신은 일기 작성 도우미입니다.")
+    for i in range(turns):
+        session.add_message(MessageRole.USER, f"{session_id} 사용자 {i}")
+        session.add_message(MessageRole.ASSISTANT, f"{session_id} AI {i}")
+    session.updated_at = created_at
+    return session
+
+
+def _contents(session: ChatSession) -> List[str]:
+    return [m.content for m in session.messages]
+
+
+def check_chat_contract(chat_repo) -> None:
+    """저장/이어하기/부분 저장/버전 충돌/목록/보관/삭제/사용자 범위"""
+    now = datetime.now()
+    old = _session("old", now - timedelta(days=60), turns=1)
+    old.end_session()
+    old.updated_at = now - timedelta(days=60)
+    chat_repo.save_session(old)
+
+    session = _session("today", now, turns=5)
+    session.metadata["mood"] = "맑음"
+    chat_repo.save_session(session)
+    assert session.version == 1 and session.unsaved_count == 0
+    for i in range(3):  # 턴마다 저장 (로그 구현체는 도중에 스냅샷으로 합침)
+        session.add_message(MessageRole.USER, f"추가 {i}")
+        chat_repo.save_session(session)
+
+    stored = chat_repo.get_session("today")
+    assert _contents(stored) == _contents(session) and stored.version == 4
+    assert stored.metadata == {"mood": "맑음"} and stored.is_active and stored.messages[1].role == MessageRole.USER
+    assert chat_repo.get_active_session().session_id == "today"
+
+    # 이어하기: 첫 메시지 + 최근 3개, 부분 저장 후에도 전체 대화가 보존됨
+    tail = chat_repo.get_active_session_tail(3)
+    assert tail.version == stored.version  # 이어서 저장할 때 충돌하지 않도록 버전도 읽음
+    assert _contents(tail) == _contents(session)[:1] + _contents(session)[-3:]
+    assert tail.omitted_messages == session.get_message_count() - 4
+    assert [m.content for m in chat_repo.load_messages("today", 1, 3)] == _contents(session)[1:3]
+    tail.add_message(MessageRole.ASSISTANT, "이어서 답변")
+    chat_repo.save_session(tail)
+    assert _contents(chat_repo.get_session("today")) == _contents(session) + ["이어서 답변"]
+
+    session.add_message(MessageRole.USER, "오래된 사본에서")
+    try:
+        chat_repo.save_session(session)
+        raise AssertionError("SessionConflictError가 발생해야 합니다")
+    except SessionConflictError:
+        pass
+
+    newer = _session("newer", now + timedelta(minutes=1), turns=1)
+    chat_repo.save_session(newer)
+    assert chat_repo.get_active_session().session_id == "newer"
+    assert [s.session_id for s in chat_repo.list_sessions(limit=2)] == ["newer", "today"]
+
+    other = chat_repo.for_user(f"{chat_repo.user_id}-other")
+    assert other.get_session("today") is None and other.get_active_session() is None
+
+    newer.end_session()
+    chat_repo.save_session(newer)
+    assert chat_repo.get_active_session() is None
+
+    assert chat_repo.archive_sessions(now - timedelta(days=30)) == 1
+    assert "old" not in [s.session_id for s in chat_repo.list_sessions()]
+    assert _contents(chat_repo.get_session("old")) == _contents(old)
+    assert chat_repo.expire_archived_sessions(now - timedelta(days=30)) == 1
+    assert chat_repo.get_session("old") is None
+
+    assert chat_repo.delete_session("today") and not chat_repo.delete_session("today")
+    assert [s.session_id for s in chat_repo.list_sessions()] == ["newer"]
+
+
+def test_diary_repository_contract():
+    """모든 일기 저장소가 같은 계약을 지킴"""
+    for name, make_repo in diary_repositories():
+        with make_repo() as diary_repo:
+            try:
+                check_diary_contract(diary_repo)
+            except AssertionError as e:
+                raise AssertionError(f"[{name}] {e}") from e
+
+
+def test_chat_repository_contract():
+    """모든 채팅 저장소가 같은 계약을 지킴"""
+    for name, make_repo in chat_repositories():
+        with make_repo() as chat_repo:
+            try:
+                check_chat_contract(chat_repo)
+            except AssertionError as e:
+                raise AssertionError(f"[{name}] {e}") from e
+
+
+def test_mongodb_resumed_tail_saves_without_conflict():
+    """MongoDB: 첫 메시지 + 최근 메시지만 읽은 세션을 충돌 없이 이어서 저장 (DAILY_TEST_MONGODB=1일 때만)"""
+    if os.getenv("DAILY_TEST_MONGODB") != "1":
+        return
+
+    with _mongodb_chat_repo() as chat_repo:
+        session = _session("resume", datetime.now(), turns=10)
+        chat_repo.save_session(session)
+        session.add_message(MessageRole.USER, "한 턴 더")
+        chat_repo.save_session(session)
+
+        tail = chat_repo.get_active_session_tail(2)
+        assert tail is not None and tail.is_partial and tail.version == 2
+        tail.add_message(MessageRole.ASSISTANT, "이어서 답변")
+        chat_repo.save_session(tail)  # SessionConflictError 없이 바로 저장
+
+        stored = chat_repo.get_session("resume")
+        assert stored is not None and stored.version == 3 and _contents(stored) == _contents(session) + ["이어서 답변"]
+
+
+if __name__ == "__main__":
+    print("=== 저장소 계약 테스트 ===\n")
+    test_diary_repository_contract()
+    print(f"✓ 일기 저장소: {', '.join(name for name, _ in diary_repositories())}")
+    test_chat_repository_contract()
+    print(f"✓ 채팅 저장소: {', '.join(name for name, _ in chat_repositories())}")
+    test_mongodb_resumed_tail_saves_without_conflict()
+    if os.getenv("DAILY_TEST_MONGODB") == "1":
+        print("✓ MongoDB 이어하기 세션 저장")
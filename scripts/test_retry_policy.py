@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+AI 호출 재시도/텔레메트리 테스트 (오류 판별, InstrumentedAIClient 재시도, 지연시간 백분위)
+
+사용법:
+    python scripts/test_retry_policy.py
+    uv run pytest scripts/test_retry_policy.py
+"""
+
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from diary.data.repositories import JsonlTelemetryRepository
+from diary.domain.entities.ai_call_record import AICallRecord
+from diary.domain.interfaces.ai_client import AIClientInterface
+from diary.domain.services.retry_policy import RetryPolicy, is_rate_limit_error, is_retryable_error
+from diary.domain.services.telemetry_service import InstrumentedAIClient, TelemetryService, percentile
+
+
+# SDK 예외와 같은 모양의 가짜 예외 (클래스 이름 / status_code로 판별)
+class APIStatusError(Exception):
+    def __init__(self, message: str, status_code: int):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class RateLimitError(APIStatusError):
+    pass
+
+
+class APIConnectionError(Exception):
+    pass
+
+
+class APITimeoutError(APIConnectionError):
+    pass
+
+
+class ResourceExhausted(Exception):
+    """google.api_core 예외처럼 code에 HTTP 상태 코드"""
+    code = 429
+
+
+def _wrapped(error: Exception) -> Exception:
+    """AI 클라이언트처럼 SDK 예외를 원인으로 연결해 다시 던진 오류"""
+    try:
+        try:
+            raise error
+        except Exception as e:
+            raise Exception(f"OpenAI API 호출 실패: {e}") from e
+    except Exception as wrapped:
+        return wrapped
+
+
+class ScriptedAIClient(AIClientInterface):
+    """정해진 오류를 순서대로 던진 뒤 응답하는 AI 클라이언트"""
+
+    def __init__(self, errors: List[Exception], chunks: Optional[List[str]] = None):
+        self.errors = list(errors)
+        self.chunks = chunks or ["안녕", "하세요"]
+        self.calls = 0
+
+    def chat(self, messages, session_id=None, model=None) -> str:
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return "".join(self.chunks)
+
+    def chat_stream(self, messages, session_id=None, model=None) -> Iterator[str]:
+        self.calls += 1
+        for chunk in self.chunks:
+            yield chunk
+            if self.errors:
+                raise self.errors.pop(0)
+
+    def get_last_usage(self):
+        return None
+
+    def get_model_name(self) -> Optional[str]:
+        return "scripted"
+
+
+def test_errors_are_classified_by_status_and_type_before_message():
+    """상태 코드/SDK 예외 종류로 먼저 판별하고, 메시지는 정보가 없을 때만 사용"""
+    assert is_rate_limit_error(_wrapped(RateLimitError("Too Many Requests", 429)))
+    assert is_rate_limit_error(_wrapped(ResourceExhausted("quota")))
+    assert is_retryable_error(_wrapped(APIStatusError("Overloaded", 529)))
+    assert is_retryable_error(_wrapped(APITimeoutError("Request timed out")))
+    assert is_retryable_error(_wrapped(ConnectionResetError("reset by peer")))
+
+    # 400은 메시지에 500/503/timeout이 들어 있어도 재시도하지 않음
+    bad_request = APIStatusError("max_tokens: 1500 > 1024 (request_id: req_503abc, timeout=30)", 400)
+    assert not is_retryable_error(_wrapped(bad_request))
+    assert not is_retryable_error(_wrapped(APIStatusError("Unauthorized", 401)))
+
+    # 상태 코드/예외 종류가 없는 오류만 메시지로 판별 (숫자는 단독으로 쓰인 경우만)
+    assert is_retryable_error(Exception("Fake API 호출 실패: 503 Service Unavailable"))
+    assert is_rate_limit_error(Exception("Fake API 호출 실패: 429 rate limit"))
+    assert not is_retryable_error(Exception("max_tokens: 1500 exceeds limit (req_5030)"))
+    assert not is_retryable_error(ValueError("마지막 메시지는 사용자 메시지여야 합니다"))
+
+    policy = RetryPolicy(max_retries=2, base_delay=0.5, max_delay=1.5)
+    assert [policy.get_delay(attempt) for attempt in (1, 2, 3, 4)] == [0.5, 1.0, 1.5, 1.5]
+    transient = Exception("503")
+    assert policy.should_retry(transient, 2) and not policy.should_retry(transient, 3)
+    assert not policy.should_retry(Exception("400 bad request"), 1)
+
+
+def test_instrumented_client_retries_and_records():
+    """일시적 오류는 백오프 후 재시도하고 재시도 횟수를 기록, 그 외 오류나 스트리밍 도중 오류는 바로 실패"""
+    with tempfile.TemporaryDirectory() as tmp:
+        telemetry_repo = JsonlTelemetryRepository(str(Path(tmp) / "telemetry.jsonl"))
+        sleeps: List[float] = []
+
+        def instrumented(inner: ScriptedAIClient) -> InstrumentedAIClient:
+            return InstrumentedAIClient(
+                inner, telemetry_repo, "openai", RetryPolicy(max_retries=2, base_delay=0.5), sleep=sleeps.append
+            )
+
+        inner = ScriptedAIClient([_wrapped(APIStatusError("Bad Gateway", 502)), _wrapped(APITimeoutError("timeout"))])
+        assert instrumented(inner).chat([]) == "안녕하세요"
+        assert inner.calls == 3 and sleeps == [0.5, 1.0]
+
+        inner = ScriptedAIClient([_wrapped(APIStatusError("bad request 503", 400))])
+        try:
+            instrumented(inner).chat([])
+            raise AssertionError("400 오류는 바로 실패해야 합니다")
+        except Exception as e:
+            assert "bad request" in str(e)
+        assert inner.calls == 1
+
+        # 첫 조각을 받은 뒤의 오류는 재시도하면 중복 출력되므로 그대로 실패
+        inner = ScriptedAIClient([_wrapped(APIStatusError("Service Unavailable", 503))])
+        received = []
+        try:
+            for chunk in instrumented(inner).chat_stream([]):
+                received.append(chunk)
+            raise AssertionError("스트리밍 도중 오류는 재시도하지 않아야 합니다")
+        except Exception as e:
+            assert "Service Unavailable" in str(e)
+        assert received == ["안녕"] and inner.calls == 1
+
+        records = telemetry_repo.list_records()
+        assert [(r.outcome, r.retries) for r in records] == [("ok", 2), ("error", 0), ("error", 0)]
+        assert records[2].ttft_ms is not None and sleeps == [0.5, 1.0]
+
+
+def test_percentiles_and_grouped_stats():
+    """nearest-rank 백분위, provider별 집계"""
+    assert percentile([], 50) == 0.0
+    assert percentile([5.0], 95) == 5.0
+    values = [float(v) for v in range(1, 101)]
+    assert percentile(values, 50) == 50.0 and percentile(values, 95) == 95.0 and percentile(values, 100) == 100.0
+    assert percentile([40.0, 10.0, 30.0, 20.0], 50) == 20.0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        telemetry_repo = JsonlTelemetryRepository(str(Path(tmp) / "telemetry.jsonl"))
+        for i in range(20):
+            telemetry_repo.append(AICallRecord(
+                provider="openai", latency_ms=float(i + 1), prompt_tokens=10, completion_tokens=5,
+                retries=1 if i == 0 else 0, timestamp=datetime.now(),
+            ))
+        telemetry_repo.append(AICallRecord(
+            provider="anthropic", latency_ms=700.0, ttft_ms=120.0, outcome="error", timestamp=datetime.now()
+        ))
+
+        stats = {s.key: s for s in TelemetryService(telemetry_repo).get_stats("provider")}
+        openai = stats["openai"]
+        assert (openai.calls, openai.errors, openai.retries) == (20, 0, 1)
+        assert (openai.latency_p50_ms, openai.latency_p95_ms, openai.ttft_p50_ms) == (10.0, 19.0, None)
+        assert (openai.prompt_tokens, openai.completion_tokens) == (200, 100)
+        assert stats["anthropic"].errors == 1 and stats["anthropic"].ttft_p50_ms == 120.0
+
+
+if __name__ == "__main__":
+    print("=== AI 호출 재시도/텔레메트리 테스트 ===\n")
+    test_errors_are_classified_by_status_and_type_before_message()
+    print("✓ 상태 코드/예외 종류 우선 오류 판별")
+    test_instrumented_client_retries_and_records()
+    print("✓ InstrumentedAIClient 재시도 + 기록")
+    test_percentiles_and_grouped_stats()
+    print("✓ 지연시간 백분위 + 집계")
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+종료 세션 압축 보관 + 보관 기간 만료 테스트 (파일 저장소)
+
+사용법:
+    python scripts/test_session_archive.py
+    uv run pytest scripts/test_session_archive.py
+"""
+
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from diary.data.repositories import FileSystemChatRepository
+from diary.domain.entities import ChatSession, MessageRole
+from diary.domain.services import SessionArchiveService
+
+NOW = datetime(2026, 6, 1, 12, 0)
+
+
+def _session(session_id: str, days_ago: int, is_active: bool = False) -> ChatSession:
+    updated_at = NOW - timedelta(days=days_ago)
+    session = ChatSession(session_id=session_id, created_at=updated_at, is_active=is_active)
+    session.add_message(MessageRole.SYSTEM, "시스템 프롬프트")
+    session.add_message(MessageRole.USER, f"{session_id}의 하루 " * 50)
+    session.updated_at = updated_at
+    return session
+
+
+def test_old_ended_sessions_are_archived_and_still_readable():
+    """오래된 종료 세션만 보관하고, 보관된 세션도 get_session으로 읽힘"""
+    with tempfile.TemporaryDirectory() as tmp:
+        chat_repo = FileSystemChatRepository(Path(tmp) / "chats")
+        for session_id, days_ago in [("old-1", 90), ("old-2", 40), ("recent", 3)]:
+            chat_repo.save_session(_session(session_id, days_ago))
+        chat_repo.save_session(_session("active", 100, is_active=True))
+
+        result = SessionArchiveService(chat_repo, archive_after_days=30).run(now=NOW)
+
+        assert result.archived == 2 and result.expired == 0
+        assert sorted(s.session_id for s in chat_repo.list_sessions()) == ["active", "recent"]
+        assert len(list((Path(tmp) / "chats" / "archive").glob("*.jsonl.*"))) == 2  # 월별 세그먼트
+
+        archived = FileSystemChatRepository(Path(tmp) / "chats").get_session("old-1")
+        assert archived is not None
+        assert archived.messages[1].content == "old-1의 하루 " * 50
+        assert archived.updated_at == NOW - timedelta(days=90)
+
+        assert chat_repo.delete_session("old-2")
+        assert chat_repo.get_session("old-2") is None
+
+
+def test_retention_policy_expires_archived_sessions():
+    """보관 기간이 지난 세션만 삭제하고, 남은 세션은 계속 읽힘"""
+    with tempfile.TemporaryDirectory() as tmp:
+        chat_repo = FileSystemChatRepository(Path(tmp) / "chats")
+        for session_id, days_ago in [("ancient", 400), ("old", 60), ("older", 65)]:
+            chat_repo.save_session(_session(session_id, days_ago))
+
+        service = SessionArchiveService(chat_repo, archive_after_days=30, retention_days=365)
+        result = service.run(now=NOW)
+
+        assert result.archived == 3 and result.expired == 1
+        assert chat_repo.get_session("ancient") is None
+        assert chat_repo.get_session("old") and chat_repo.get_session("older")
+
+
+def test_invalid_policy_is_rejected():
+    """보관 기간이 보관 시작 기간보다 짧으면 오류"""
+    with tempfile.TemporaryDirectory() as tmp:
+        chat_repo = FileSystemChatRepository(Path(tmp) / "chats")
+        for kwargs in [{"archive_after_days": 0}, {"archive_after_days": 30, "retention_days": 7}]:
+            try:
+                SessionArchiveService(chat_repo, **kwargs)
+            except ValueError:
+                continue
+            raise AssertionError(f"ValueError가 발생해야 합니다: {kwargs}")
+
+
+if __name__ == "__main__":
+    print("=== 세션 보관 테스트 ===\n")
+    test_old_ended_sessions_are_archived_and_still_readable()
+    print("✓ 오래된 종료 세션 보관 + 그대로 조회")
+    test_retention_policy_expires_archived_sessions()
+    print("✓ 보관 기간 지난 세션 삭제")
+    test_invalid_policy_is_rejected()
+    print("✓ 잘못된 정책 거부")
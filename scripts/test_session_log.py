@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+스냅샷 + 추가 전용 로그 채팅 저장소 테스트
+
+사용법:
+    python scripts/test_session_log.py
+    uv run pytest scripts/test_session_log.py
+"""
+
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from diary.data.repositories import FileSystemChatRepository, FileSystemLogChatRepository
+from diary.domain.entities import ChatSession, MessageRole
+from diary.domain.exceptions import SessionConflictError
+
+
+def _new_session(session_id: str = "s") -> ChatSession:
+    session = ChatSession(session_id=session_id)
+    session.add_message(MessageRole.SYSTEM, "시스템 프롬프트")
+    session.add_message(MessageRole.ASSISTANT, "안녕하세요!")
+    return session
+
+
+def _load(chat_repo: FileSystemChatRepository, session_id: str) -> ChatSession:
+    session = chat_repo.get_session(session_id)
+    assert session is not None
+    return session
+
+
+def _contents(session: ChatSession) -> list:
+    return [m.content for m in session.messages]
+
+
+def test_turns_append_to_log_without_rewriting_snapshot():
+    """턴마다 로그에 한 줄만 덧붙이고, 다시 읽으면 스냅샷 + 로그가 합쳐짐"""
+    with tempfile.TemporaryDirectory() as tmp:
+        chats_dir = Path(tmp)
+        chat_repo = FileSystemLogChatRepository(chats_dir)
+        session = _new_session()
+        chat_repo.save_session(session)
+        snapshot = (chats_dir / "s.json").read_bytes()
+
+        for i in range(3):
+            session.add_message(MessageRole.USER, f"{i}번째 이야기")
+            session.metadata["turns"] = i + 1
+            chat_repo.save_session(session)
+
+        assert (chats_dir / "s.json").read_bytes() == snapshot
+        events = [json.loads(line) for line in (chats_dir / "s.log.jsonl").read_text(encoding="utf-8").splitlines()]
+        assert [len(e["messages"]) for e in events] == [1, 1, 1] and [e["version"] for e in events] == [2, 3, 4]
+
+        reader = FileSystemLogChatRepository(chats_dir)
+        stored = _load(reader, "s")
+        assert _contents(stored)[-1] == "2번째 이야기" and stored.version == 4 and stored.metadata == {"turns": 3}
+        tail = reader.get_active_session_tail(2)
+        assert tail is not None
+        assert _contents(tail) == ["시스템 프롬프트", "1번째 이야기", "2번째 이야기"] and tail.omitted_messages == 2
+
+        # 다른 인스턴스가 먼저 저장하면 버전이 맞지 않아 충돌
+        tail.add_message(MessageRole.USER, "다른 창에서")
+        reader.save_session(tail)
+        session.add_message(MessageRole.USER, "오래된 창에서")
+        try:
+            chat_repo.save_session(session)
+            raise AssertionError("SessionConflictError가 발생해야 합니다")
+        except SessionConflictError:
+            pass
+        assert _contents(_load(chat_repo, "s"))[-1] == "다른 창에서"
+
+
+def test_compaction_folds_log_into_snapshot():
+    """이벤트가 쌓이거나 세션이 끝나면 스냅샷으로 합치고, 합친 세션은 기존 저장소로도 읽힘"""
+    with tempfile.TemporaryDirectory() as tmp:
+        chats_dir = Path(tmp)
+        chat_repo = FileSystemLogChatRepository(chats_dir, compact_after=2)
+        session = _new_session()
+        chat_repo.save_session(session)
+
+        log_lines = []
+        for i in range(5):
+            session.add_message(MessageRole.USER, f"{i}")
+            chat_repo.save_session(session)
+            log_file = chats_dir / "s.log.jsonl"
+            log_lines.append(len(log_file.read_text().splitlines()) if log_file.exists() else 0)
+        assert log_lines == [1, 2, 0, 1, 2]
+
+        session.end_session()
+        chat_repo.save_session(session)
+        assert not (chats_dir / "s.log.jsonl").exists()
+        stored = _load(FileSystemChatRepository(chats_dir), "s")
+        assert _contents(stored)[2:] == ["0", "1", "2", "3", "4"] and not stored.is_active
+
+        session = _new_session("t")
+        chat_repo.save_session(session)
+        session.add_message(MessageRole.USER, "합치기 전")
+        chat_repo.save_session(session)
+        assert chat_repo.compact_sessions() == 1
+        assert _contents(_load(FileSystemChatRepository(chats_dir), "t"))[-1] == "합치기 전"
+
+
+def test_torn_last_line_is_discarded():
+    """쓰는 중 중단되어 잘린 마지막 줄만 버리고, 다음 저장 때 잘라낸 뒤 덧붙임"""
+    with tempfile.TemporaryDirectory() as tmp:
+        chats_dir = Path(tmp)
+        chat_repo = FileSystemLogChatRepository(chats_dir)
+        session = _new_session()
+        chat_repo.save_session(session)
+        for text in ["첫째", "둘째"]:
+            session.add_message(MessageRole.USER, text)
+            chat_repo.save_session(session)
+
+        log_file = chats_dir / "s.log.jsonl"
+        with open(log_file, "ab") as f:
+            f.write(b'{"version":4,"updated_at":"2026-01-01T00:00:00","mess')
+
+        restarted = FileSystemLogChatRepository(chats_dir)
+        stored = _load(restarted, "s")
+        assert _contents(stored)[-2:] == ["첫째", "둘째"] and stored.version == 3
+
+        stored.add_message(MessageRole.USER, "셋째")
+        restarted.save_session(stored)
+        assert log_file.read_bytes().endswith(b"\n") and len(log_file.read_text().splitlines()) == 3
+        assert _contents(_load(FileSystemLogChatRepository(chats_dir), "s"))[-3:] == ["첫째", "둘째", "셋째"]
+
+
+def test_events_left_over_from_interrupted_compaction_are_skipped():
+    """스냅샷을 쓴 뒤 로그를 지우기 전에 중단되어 남은 이벤트는 다시 적용하지 않음"""
+    with tempfile.TemporaryDirectory() as tmp:
+        chats_dir = Path(tmp)
+        chat_repo = FileSystemLogChatRepository(chats_dir, compact_after=1)
+        session = _new_session()
+        chat_repo.save_session(session)
+        session.add_message(MessageRole.USER, "한 번만")
+        chat_repo.save_session(session)
+        leftover = (chats_dir / "s.log.jsonl").read_bytes()
+
+        session.add_message(MessageRole.USER, "합치는 저장")
+        chat_repo.save_session(session)
+        (chats_dir / "s.log.jsonl").write_bytes(leftover)
+
+        stored = _load(FileSystemLogChatRepository(chats_dir), "s")
+        assert _contents(stored)[2:] == ["한 번만", "합치는 저장"] and stored.version == 3
+
+
+if __name__ == "__main__":
+    print("=== 스냅샷 + 로그 채팅 저장소 테스트 ===\n")
+    test_turns_append_to_log_without_rewriting_snapshot()
+    print("✓ 턴마다 로그에 덧붙임")
+    test_compaction_folds_log_into_snapshot()
+    print("✓ 스냅샷으로 합치기")
+    test_torn_last_line_is_discarded()
+    print("✓ 잘린 마지막 줄만 버림")
+    test_events_left_over_from_interrupted_compaction_are_skipped()
+    print("✓ 합치기 중단 후 남은 이벤트 건너뜀")
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+세션 목록 인덱스(manifest) 테스트 (파일 저장소)
+
+사용법:
+    python scripts/test_session_manifest.py
+    uv run pytest scripts/test_session_manifest.py
+"""
+
+import json
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest import mock
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from diary.data.repositories import FileSystemChatRepository, FileSystemLogChatRepository
+from diary.domain.entities import ChatSession, MessageRole
+
+NOW = datetime(2026, 6, 1, 12, 0)
+
+
+def _session(session_id: str, minutes_ago: int, is_active: bool = False) -> ChatSession:
+    updated_at = NOW - timedelta(minutes=minutes_ago)
+    session = ChatSession(session_id=session_id, created_at=updated_at, is_active=is_active)
+    session.add_message(MessageRole.SYSTEM, "시스템 프롬프트")
+    session.add_message(MessageRole.USER, f"{session_id}의 하루")
+    session.updated_at = updated_at
+    return session
+
+
+def test_listing_and_active_lookup_read_only_what_they_need():
+    """목록은 manifest 순서대로 limit개만 읽고, 활성 세션 조회는 디렉토리를 훑지 않음"""
+    with tempfile.TemporaryDirectory() as tmp:
+        chat_repo = FileSystemChatRepository(Path(tmp))
+        for i in range(20):
+            chat_repo.save_session(_session(f"s{i:02d}", minutes_ago=i))
+        chat_repo.save_session(_session("current", minutes_ago=30, is_active=True))
+
+        reader = FileSystemChatRepository(Path(tmp))
+        with mock.patch.object(reader, "_session_files", side_effect=AssertionError("디렉토리를 훑으면 안 됨")), \
+                mock.patch.object(reader, "_read_session_file", wraps=reader._read_session_file) as read:
+            assert [s.session_id for s in reader.list_sessions(limit=3)] == ["s00", "s01", "s02"]
+            assert read.call_count == 3
+            tail = reader.get_active_session_tail(5)
+            assert tail is not None and tail.session_id == "current"
+
+        manifest = json.loads((Path(tmp) / "manifest.json").read_text(encoding="utf-8"))
+        assert manifest["active_session_id"] == "current"
+        assert not manifest["sessions"]["s05"]["is_active"] and manifest["sessions"]["current"]["is_active"]
+
+
+def test_manifest_follows_end_delete_and_archive():
+    """세션 종료/삭제/보관과 파일이 사라진 항목이 manifest에 반영됨"""
+    with tempfile.TemporaryDirectory() as tmp:
+        chat_repo = FileSystemLogChatRepository(Path(tmp))
+        active = _session("active", minutes_ago=0, is_active=True)
+        chat_repo.save_session(active)
+        for session_id, days_ago in [("old", 60), ("gone", 1), ("recent", 2)]:
+            chat_repo.save_session(_session(session_id, minutes_ago=days_ago * 24 * 60))
+
+        active.end_session()
+        chat_repo.save_session(active)
+        assert chat_repo.get_active_session() is None
+
+        assert chat_repo.delete_session("recent")
+        (Path(tmp) / "gone.json").unlink()
+        assert chat_repo.archive_sessions(NOW - timedelta(days=30)) == 1
+        assert [s.session_id for s in chat_repo.list_sessions()] == ["active"]
+        assert [entry.session_id for entry in chat_repo.manifest.recent()] == ["active"]  # 사라진 파일 항목도 정리
+        assert chat_repo.get_session("old") is not None  # 보관된 세션은 그대로 조회
+
+
+def test_manifest_is_rewritten_only_when_listing_changes():
+    """진행 중인 최신 세션에 턴을 추가해도 manifest를 쓰지 않고, 순서/종료 여부가 바뀔 때만 씀"""
+    with tempfile.TemporaryDirectory() as tmp:
+        chat_repo = FileSystemChatRepository(Path(tmp))
+        older = _session("older", minutes_ago=60)
+        chat_repo.save_session(older)
+        active = _session("active", minutes_ago=30, is_active=True)
+        chat_repo.save_session(active)
+
+        with mock.patch.object(chat_repo.manifest, "_write", wraps=chat_repo.manifest._write) as write:
+            for minute in range(1, 6):
+                active.add_message(MessageRole.USER, f"{minute}분 뒤의 이야기")
+                active.updated_at = NOW - timedelta(minutes=30 - minute)
+                chat_repo.save_session(active)
+            assert write.call_count == 0
+            # 최신 메시지 수는 tail 인덱스에서 읽음
+            tail = chat_repo.get_active_session_tail(3)
+            assert tail is not None and tail.get_message_count() == 7
+
+            # 오래된 세션이 활성 세션보다 최근이 되면 순서만 바뀌므로 fsync 없이 씀
+            older.updated_at = NOW
+            chat_repo.save_session(older)
+            assert write.call_count == 1 and write.call_args[0][1] == "none"
+            assert [e.session_id for e in chat_repo.manifest.recent()] == ["older", "active"]
+
+            active.end_session()
+            chat_repo.save_session(active)
+            assert write.call_count == 2 and write.call_args[0][1] == chat_repo.fsync
+        assert chat_repo.get_active_session() is None
+
+
+def test_manifest_is_rebuilt_from_session_files():
+    """manifest가 없으면(이전 버전 데이터) 세션 파일과 active_session.json으로 만들고, 손상되어도 다시 만듦"""
+    with tempfile.TemporaryDirectory() as tmp:
+        chats_dir = Path(tmp)
+        for session in [_session("a", 10, is_active=True), _session("b", 5, is_active=True), _session("c", 1)]:
+            (chats_dir / f"{session.session_id}.json").write_text(json.dumps(session.to_dict()), encoding="utf-8")
+        (chats_dir / "active_session.json").write_text(json.dumps({"session_id": "a"}), encoding="utf-8")
+
+        chat_repo = FileSystemChatRepository(chats_dir)
+        active = chat_repo.get_active_session()
+        assert active is not None and active.session_id == "a"
+        assert not (chats_dir / "active_session.json").exists()
+        assert [s.session_id for s in chat_repo.list_sessions()] == ["c", "b", "a"]
+
+        (chats_dir / "manifest.json").write_text("{", encoding="utf-8")
+        restarted = FileSystemChatRepository(chats_dir)
+        active = restarted.get_active_session()
+        assert active is not None and active.session_id == "b"  # 가장 최근에 수정한 진행 중 세션
+
+        (chats_dir / "d.json").write_text(json.dumps(_session("d", 0).to_dict()), encoding="utf-8")
+        assert restarted.rebuild_manifest() == 4
+        assert restarted.list_sessions(limit=1)[0].session_id == "d"
+
+
+if __name__ == "__main__":
+    print("=== 세션 목록 인덱스(manifest) 테스트 ===\n")
+    test_listing_and_active_lookup_read_only_what_they_need()
+    print("✓ 목록/활성 세션 조회는 필요한 세션만 읽음")
+    test_manifest_follows_end_delete_and_archive()
+    print("✓ 종료/삭제/보관 반영")
+    test_manifest_is_rewritten_only_when_listing_changes()
+    print("✓ 목록이 바뀔 때만 manifest를 다시 씀")
+    test_manifest_is_rebuilt_from_session_files()
+    print("✓ 세션 파일로 다시 만들기")
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+세션 파일 원자적 쓰기 + 코덱 테스트 (파일 저장소)
+
+사용법:
+    python scripts/test_session_storage.py
+    uv run pytest scripts/test_session_storage.py
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from diary.data.repositories import FileSystemChatRepository
+from diary.data.repositories import atomic_file
+from diary.data.repositories.atomic_file import FSYNC_POLICIES
+from diary.data.repositories.session_codec import MSGPACK_CODEC, available_codecs
+from diary.domain.entities import ChatSession, MessageRole
+
+
+def _session(session_id: str, turns: int) -> ChatSession:
+    session = ChatSession(session_id=session_id)
+    session.add_message(MessageRole.SYSTEM, "시스템 프롬프트")
+    for i in range(turns):
+        session.add_message(MessageRole.USER, f"{i}번째 이야기")
+        session.add_message(MessageRole.ASSISTANT, f"{i}번째 답변")
+    return session
+
+
+def _load(chat_repo: FileSystemChatRepository, session_id: str) -> ChatSession:
+    session = chat_repo.get_session(session_id)
+    assert session is not None
+    return session
+
+
+def test_interrupted_write_keeps_previous_session():
+    """교체 직전에 실패해도 기존 세션 파일은 그대로이고 임시 파일이 남지 않음"""
+    with tempfile.TemporaryDirectory() as tmp:
+        chats_dir = Path(tmp) / "chats"
+        chat_repo = FileSystemChatRepository(chats_dir)
+        session = _session("s", turns=3)
+        chat_repo.save_session(session)
+
+        session.add_message(MessageRole.USER, "저장되지 않을 메시지")
+        with mock.patch.object(atomic_file.os, "replace", side_effect=OSError("disk full")):
+            try:
+                chat_repo.save_session(session)
+                raise AssertionError("OSError가 발생해야 합니다")
+            except OSError:
+                pass
+
+        assert not list(chats_dir.glob("*.tmp")) and not list(chats_dir.glob(".*"))
+        stored = _load(chat_repo, "s")
+        assert len(stored.messages) == 7 and stored.version == 1
+
+
+def test_compact_json_and_fsync_policies():
+    """기본 코덱은 공백 없는 JSON, 모든 fsync 정책에서 저장/조회가 같음"""
+    with tempfile.TemporaryDirectory() as tmp:
+        for policy in FSYNC_POLICIES:
+            chat_repo = FileSystemChatRepository(Path(tmp) / policy, fsync=policy)
+            chat_repo.save_session(_session("s", turns=2))
+            raw = (Path(tmp) / policy / "s.json").read_text(encoding="utf-8")
+            assert "\n" not in raw and '", "' not in raw
+            assert [m.content for m in _load(chat_repo, "s").messages][-1] == "1번째 답변"
+
+        for bad in [{"fsync": "sometimes"}, {"codec": "xml"}]:
+            try:
+                FileSystemChatRepository(Path(tmp) / "bad", **bad)
+                raise AssertionError("ValueError가 발생해야 합니다")
+            except ValueError:
+                pass
+
+
+def test_corrupted_file_is_moved_aside():
+    """읽을 수 없는 세션 파일은 지우지 않고 .corrupt로 옮겨 둠"""
+    with tempfile.TemporaryDirectory() as tmp:
+        chats_dir = Path(tmp) / "chats"
+        chat_repo = FileSystemChatRepository(chats_dir)
+        chat_repo.save_session(_session("s", turns=1))
+        (chats_dir / "s.json").write_bytes(b'{"session_id": "s", "mess')
+
+        assert chat_repo.get_session("s") is None
+        assert (chats_dir / "s.json.corrupt").read_bytes().startswith(b'{"session_id"')
+        assert chat_repo.list_sessions() == []
+
+
+def test_switching_codec_rewrites_on_next_save():
+    """코덱을 바꾸면 기존 파일은 그대로 읽고, 다음 저장 때 새 코덱 파일로 바꿈"""
+    with tempfile.TemporaryDirectory() as tmp:
+        chats_dir = Path(tmp) / "chats"
+        FileSystemChatRepository(chats_dir).save_session(_session("s", turns=2))
+
+        if MSGPACK_CODEC not in available_codecs():
+            try:
+                FileSystemChatRepository(chats_dir, codec=MSGPACK_CODEC)
+                raise AssertionError("msgpack이 없으면 ValueError가 발생해야 합니다")
+            except ValueError:
+                return
+
+        chat_repo = FileSystemChatRepository(chats_dir, codec=MSGPACK_CODEC)
+        session = _load(chat_repo, "s")
+        session.add_message(MessageRole.USER, "새 메시지")
+        chat_repo.save_session(session)
+
+        assert not (chats_dir / "s.json").exists() and (chats_dir / "s.msgpack").exists()
+        assert [s.session_id for s in FileSystemChatRepository(chats_dir).list_sessions()] == ["s"]
+        tail = chat_repo.get_active_session_tail(2)
+        assert tail is not None and tail.messages[-1].content == "새 메시지"
+
+
+if __name__ == "__main__":
+    print("=== 세션 파일 저장 테스트 ===\n")
+    test_interrupted_write_keeps_previous_session()
+    print("✓ 쓰기 중 실패해도 기존 파일 유지")
+    test_compact_json_and_fsync_policies()
+    print("✓ 공백 없는 JSON + fsync 정책")
+    test_corrupted_file_is_moved_aside()
+    print("✓ 손상된 파일은 .corrupt로 보관")
+    test_switching_codec_rewrites_on_next_save()
+    print("✓ 코덱 변경 시 다음 저장에서 변환")
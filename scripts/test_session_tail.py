@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+이어하기 시 최근 메시지만 읽기 테스트 (오프라인, FakeAIClient 사용)
+
+사용법:
+    python scripts/test_session_tail.py
+    uv run pytest scripts/test_session_tail.py
+"""
+
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from diary.data.repositories import (
+    FakeAIClient,
+    FileSystemChatRepository,
+    FileSystemUserPreferencesRepository,
+    FileSystemWritingStyleExamplesRepository,
+)
+from diary.domain.entities import ChatSession, MessageRole
+from diary.domain.services import ChatService, ContextWindowManager, UserPreferencesService
+from diary.domain.services.context_window import SUMMARY_METADATA_KEY
+
+
+def _long_session(turns: int = 30) -> ChatSession:
+    """시스템 프롬프트 + turns번 주고받은 세션"""
+    session = ChatSession(session_id="long")
+    session.add_message(MessageRole.SYSTEM, "시스템 프롬프트")
+    for i in range(turns):
+        session.add_message(MessageRole.USER, f"사용자 {i}")
+        session.add_message(MessageRole.ASSISTANT, f"AI {i}")
+    return session
+
+
+def _tail(chat_repo: FileSystemChatRepository, size: int) -> ChatSession:
+    session = chat_repo.get_active_session_tail(size)
+    assert session is not None
+    return session
+
+
+def _current(chat_service: ChatService) -> ChatSession:
+    session = chat_service.get_current_session()
+    assert session is not None
+    return session
+
+
+def _build_chat_service(chat_repo, context_manager=None) -> ChatService:
+    """테스트용 ChatService 조립"""
+    tmp_dir = chat_repo.data_dir.parent
+    preferences_service = UserPreferencesService(
+        FileSystemUserPreferencesRepository(str(tmp_dir / "prefs.json")),
+        FileSystemWritingStyleExamplesRepository(tmp_dir / "examples"),
+    )
+    return ChatService(
+        chat_repo=chat_repo,
+        ai_client=FakeAIClient(),
+        preferences_service=preferences_service,
+        context_manager=context_manager,
+        speculative_diary=False,
+        resume_tail_size=6,
+    )
+
+
+def test_tail_load_and_partial_save_keep_full_transcript():
+    """최근 메시지만 읽고 저장해도 파일에는 전체 대화가 순서대로 남음"""
+    with tempfile.TemporaryDirectory() as tmp:
+        chat_repo = FileSystemChatRepository(Path(tmp) / "chats")
+        original = _long_session()
+        chat_repo.save_session(original)
+
+        tail = _tail(chat_repo, 6)
+        assert tail.is_partial and tail.omitted_messages == 54
+        assert [m.content for m in tail.messages] == ["시스템 프롬프트"] + [m.content for m in original.messages[-6:]]
+        assert tail.get_message_count() == 61
+
+        tail.add_message(MessageRole.USER, "새 메시지")
+        chat_repo.save_session(tail)
+
+        full = chat_repo.get_session("long")
+        assert full is not None
+        assert [m.content for m in full.messages] == [m.content for m in original.messages] + ["새 메시지"]
+        assert [m.content for m in chat_repo.load_messages("long", 1, 3)] == ["사용자 0", "AI 0"]
+
+
+def test_stale_tail_index_falls_back_to_full_load():
+    """세션 파일이 인덱스 이후에 바뀌었으면 전체를 읽음"""
+    with tempfile.TemporaryDirectory() as tmp:
+        chat_repo = FileSystemChatRepository(Path(tmp) / "chats")
+        chat_repo.save_session(_long_session())
+
+        session_file = Path(tmp) / "chats" / "long.json"
+        data = json.loads(session_file.read_text(encoding="utf-8"))
+        data["messages"].append({**data["messages"][-1], "content": "외부에서 추가"})
+        session_file.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+
+        session = _tail(chat_repo, 6)
+        assert not session.is_partial
+        assert session.messages[-1].content == "외부에서 추가"
+        assert len(chat_repo.list_sessions()) == 1  # tail 인덱스는 세션 목록에서 제외
+
+
+def test_older_messages_are_loaded_only_when_context_needs_them():
+    """요약이 생략된 메시지를 덮고 있으면 읽지 않고, 아니면 필요할 때 읽음"""
+    with tempfile.TemporaryDirectory() as tmp:
+        chat_repo = FileSystemChatRepository(Path(tmp) / "chats")
+        summarized = _long_session()
+        summarized.metadata[SUMMARY_METADATA_KEY] = {"text": "지금까지의 요약", "covered": 56}
+        chat_repo.save_session(summarized)
+
+        chat_service = _build_chat_service(chat_repo, ContextWindowManager(FakeAIClient()))
+        chat_service.send_message("오늘 저녁은 뭐 먹지")
+        assert _current(chat_service).is_partial
+
+        unsummarized = _long_session()  # 요약 없음
+        stored = chat_repo.get_session("long")
+        assert stored is not None
+        unsummarized.version = stored.version
+        chat_repo.save_session(unsummarized)
+        chat_service = _build_chat_service(chat_repo, ContextWindowManager(FakeAIClient()))
+        assert _current(chat_service).is_partial
+        chat_service.send_message("오늘 저녁은 뭐 먹지")
+        session = _current(chat_service)
+        assert not session.is_partial and len(session.messages) == 63
+
+
+if __name__ == "__main__":
+    print("=== 세션 tail 읽기 테스트 ===\n")
+    test_tail_load_and_partial_save_keep_full_transcript()
+    print("✓ 최근 메시지만 읽고 저장해도 전체 대화 유지")
+    test_stale_tail_index_falls_back_to_full_load()
+    print("✓ 오래된 인덱스면 전체 읽기")
+    test_older_messages_are_loaded_only_when_context_needs_them()
+    print("✓ 필요할 때만 이전 메시지 읽기")
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+활성 세션 메모리 유지 + write-behind 저장 테스트 (오프라인, FakeAIClient 사용)
+
+사용법:
+    python scripts/test_session_writer.py
+    uv run pytest scripts/test_session_writer.py
+"""
+
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from diary.data.repositories import (
+    FakeAIClient,
+    FileSystemChatRepository,
+    FileSystemUserPreferencesRepository,
+    FileSystemWritingStyleExamplesRepository,
+)
+from diary.domain.entities import ChatSession, MessageRole
+from diary.domain.services import ChatService, UserPreferencesService, WriteBehindSessionWriter
+
+
+class RecordingChatRepository(FileSystemChatRepository):
+    """저장/조회 호출을 기록하고, 첫 저장을 막아둘 수 있는 파일 저장소"""
+
+    def __init__(self, data_dir: Path, block_first_save: bool = False, failures: int = 0):
+        super().__init__(data_dir)
+        self.saved = []
+        self.active_loads = 0
+        self.failures = failures
+        self.release = threading.Event()
+        if not block_first_save:
+            self.release.set()
+
+    def save_session(self, session: ChatSession) -> None:
+        self.release.wait()
+        if self.failures > 0:
+            self.failures -= 1
+            raise ConnectionError("저장소 연결 실패")
+        self.saved.append((session.session_id, len(session.messages), session.is_active))
+        super().save_session(session)
+
+    def get_active_session_tail(self, tail_size: int):
+        self.active_loads += 1
+        return super().get_active_session_tail(tail_size)
+
+
+class FailOnceAIClient(FakeAIClient):
+    """다음 대화 호출 한 번만 실패하는 가짜 AI"""
+
+    def __init__(self):
+        super().__init__()
+        self.fail_next = False
+
+    def chat(self, messages, session_id=None, model=None):
+        if self.fail_next:
+            self.fail_next = False
+            raise ConnectionError("Fake API 호출 실패: 503")
+        return super().chat(messages, session_id=session_id, model=model)
+
+
+def _build_chat_service(chat_repo, writer=None, ai_client=None) -> ChatService:
+    """테스트용 ChatService 조립"""
+    tmp_dir = chat_repo.data_dir.parent
+    preferences_service = UserPreferencesService(
+        FileSystemUserPreferencesRepository(str(tmp_dir / "prefs.json")),
+        FileSystemWritingStyleExamplesRepository(tmp_dir / "examples"),
+    )
+    return ChatService(
+        chat_repo=chat_repo,
+        ai_client=ai_client or FakeAIClient(),
+        preferences_service=preferences_service,
+        session_writer=writer,
+    )
+
+
+def test_active_session_is_loaded_once():
+    """활성 세션은 처음 한 번만 저장소에서 읽음"""
+    with tempfile.TemporaryDirectory() as tmp:
+        chat_repo = RecordingChatRepository(Path(tmp) / "chats")
+        chat_service = _build_chat_service(chat_repo)
+        chat_service.get_current_session()
+        chat_service.start_new_session()
+        for text in ["오늘은 바빴다", "회의가 많았다", "저녁은 집에서 먹었다"]:
+            chat_service.send_message(text)
+        chat_service.get_current_session()
+
+        assert chat_repo.active_loads == 1
+        assert len(chat_repo.saved) == 4  # 동기 저장 모드: 시작 + 3턴
+
+
+def test_saves_are_coalesced_in_order_and_flushed():
+    """저장이 밀려 있으면 세션별 마지막 스냅샷만, 넣은 순서대로 저장"""
+    with tempfile.TemporaryDirectory() as tmp:
+        chat_repo = RecordingChatRepository(Path(tmp) / "chats", block_first_save=True)
+        writer = WriteBehindSessionWriter(chat_repo)
+        chat_service = _build_chat_service(chat_repo, writer)
+
+        first = chat_service.start_new_session()  # 저장 스레드가 이 저장에서 대기
+        for text in ["오늘은 바빴다", "회의가 많았다"]:
+            chat_service.send_message(text)
+        chat_service.end_current_session()
+        second = chat_service.start_new_session()
+
+        chat_repo.release.set()
+        assert chat_service.close(timeout=5)
+
+        assert [s[0] for s in chat_repo.saved] == [first.session_id, first.session_id, second.session_id]
+        assert chat_repo.saved[1] == (first.session_id, 6, False)  # 최신 스냅샷 하나로 합쳐짐
+
+        reloaded = FileSystemChatRepository(Path(tmp) / "chats")
+        active, first_saved = reloaded.get_active_session(), reloaded.get_session(first.session_id)
+        assert active is not None and active.session_id == second.session_id
+        assert first_saved is not None and len(first_saved.messages) == 6
+
+
+def test_failed_save_is_retried_before_newer_snapshots():
+    """저장 실패 시 잠시 뒤 재시도하고, flush는 저장이 끝날 때까지 대기"""
+    with tempfile.TemporaryDirectory() as tmp:
+        chat_repo = RecordingChatRepository(Path(tmp) / "chats", failures=2)
+        writer = WriteBehindSessionWriter(chat_repo, retry_delay=0.01)
+        session = ChatSession(session_id="s")
+        session.add_message(MessageRole.USER, "안녕")
+        writer.submit(session)
+        session.add_message(MessageRole.ASSISTANT, "반가워요")  # 제출 이후 수정은 다음 저장에서 반영
+        assert writer.flush(timeout=5)
+
+        assert isinstance(writer.last_error, ConnectionError)
+        assert chat_repo.saved == [("s", 1, True)]
+        writer.close()
+
+
+def test_failed_reply_rolls_back_user_message():
+    """AI 호출이 실패하면 사용자 메시지를 되돌려, 다시 보내도 user, assistant 순서가 유지됨"""
+    with tempfile.TemporaryDirectory() as tmp:
+        chat_repo = RecordingChatRepository(Path(tmp) / "chats")
+        ai_client = FailOnceAIClient()
+        chat_service = _build_chat_service(chat_repo, ai_client=ai_client)
+        session = chat_service.start_new_session()
+        saved_before = len(chat_repo.saved)
+
+        ai_client.fail_next = True
+        try:
+            chat_service.send_message("오늘은 바빴다")
+        except ConnectionError:
+            pass
+        else:
+            raise AssertionError("AI 호출 실패가 그대로 전달되어야 함")
+        assert [m.role for m in session.messages] == [MessageRole.SYSTEM, MessageRole.ASSISTANT]
+        assert session.unsaved_count == 0 and len(chat_repo.saved) == saved_before
+
+        chat_service.send_message("오늘은 바빴다")
+        assert [m.role for m in session.messages[1:]] == [
+            MessageRole.ASSISTANT, MessageRole.USER, MessageRole.ASSISTANT,
+        ]
+        stored = FileSystemChatRepository(Path(tmp) / "chats").get_session(session.session_id)
+        assert stored is not None and len(stored.messages) == 4
+
+
+if __name__ == "__main__":
+    print("=== 세션 write-behind 저장 테스트 ===\n")
+    test_active_session_is_loaded_once()
+    print("✓ 활성 세션 한 번만 로드")
+    test_saves_are_coalesced_in_order_and_flushed()
+    print("✓ 순서 유지 + 합쳐서 저장 + 종료 시 flush")
+    test_failed_save_is_retried_before_newer_snapshots()
+    print("✓ 저장 실패 시 재시도")
+    test_failed_reply_rolls_back_user_message()
+    print("✓ AI 호출 실패 시 사용자 메시지 되돌림")
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+SQLite 저장소 테스트 (인덱스 사용, 턴마다 새 메시지 행만 추가, 여러 스레드 동시 저장)
+
+저장소 공통 동작은 test_repository_contract.py에서 확인합니다.
+
+사용법:
+    python scripts/test_sqlite_storage.py
+    uv run pytest scripts/test_sqlite_storage.py
+"""
+
+import sys
+import tempfile
+import threading
+from datetime import date, timedelta
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from diary.data.repositories import SQLiteChatRepository, SQLiteDiaryRepository
+from diary.data.repositories.sqlite_chat_repository import _SELECT_HEAD_AND_TAIL
+from diary.data.repositories.sqlite_diary_repository import _LIST, _SEARCH_FTS
+from diary.domain.entities import ChatSession, Diary, MessageRole
+from diary.domain.exceptions import PartialSaveError
+
+
+def _query_plan(repo, sql: str, params: tuple) -> str:
+    rows = repo.db.connection().execute(f"EXPLAIN QUERY PLAN {sql}", params)
+    return " / ".join(row["detail"] for row in rows)
+
+
+def test_wal_mode_and_index_only_query_plans():
+    """WAL 모드, 목록은 인덱스 순서대로(정렬 없이), 검색은 FTS 결과부터, 이어하기는 기본 키 범위만"""
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "daily.db"
+        diary_repo = SQLiteDiaryRepository(db_path)
+        chat_repo = SQLiteChatRepository(db_path)
+        assert diary_repo.db.connection().execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+        plan = _query_plan(diary_repo, _LIST, ("default", "", "2026-03-01", "2026-03-01", "x", 31))
+        assert "USING INDEX diaries_user_listing" in plan and "TEMP B-TREE" not in plan, plan
+        plan = _query_plan(chat_repo, _SELECT_HEAD_AND_TAIL, (1, 1, 40))
+        assert plan.count("USING PRIMARY KEY") == 2 and "TEMP B-TREE" not in plan, plan
+        if not diary_repo.has_fts:
+            print("  (FTS5 trigram을 지원하지 않는 SQLite: 검색은 내용을 훑음)")
+            return
+
+        plan = _query_plan(diary_repo, _SEARCH_FTS, ('"산책길"', "default", 30))
+        assert plan.startswith("SCAN diaries_fts VIRTUAL TABLE") and "INTEGER PRIMARY KEY" in plan, plan
+
+        # 인덱스를 만들기 전에 저장한 일기도 검색됨 (FTS 인덱스를 새로 만들면 채움)
+        diary_repo.save(Diary(diary_date=date(2026, 3, 1), content="저녁 산책길에 비가 왔다."))
+        conn = diary_repo.db.connection()
+        conn.executescript(
+            "DROP TRIGGER diaries_fts_insert; DROP TRIGGER diaries_fts_delete; "
+            "DROP TRIGGER diaries_fts_update; DROP TABLE diaries_fts;"
+        )
+        diary_repo.close()
+        chat_repo.close()
+        with SQLiteDiaryRepository(db_path) as reopened:
+            assert [d.content for d in reopened.search("산책길")] == ["저녁 산책길에 비가 왔다."]
+
+
+def test_turn_inserts_only_new_message_rows():
+    """턴마다 새 메시지 행만 추가하고, 이어하기는 첫 메시지 + 최근 메시지만 읽음"""
+    with tempfile.TemporaryDirectory() as tmp, SQLiteChatRepository(Path(tmp) / "daily.db") as chat_repo:
+        session = ChatSession(session_id="s")
+        session.add_message(MessageRole.SYSTEM, "시스템 프롬프트 " * 200)
+        for i in range(200):
+            session.add_message(MessageRole.USER, f"{i}번째 이야기")
+        chat_repo.save_session(session)
+
+        conn = chat_repo.db.connection()
+        before = conn.total_changes
+        session.add_message(MessageRole.USER, "새 이야기")
+        session.add_message(MessageRole.ASSISTANT, "새 답변")
+        chat_repo.save_session(session)
+        # 세션 행 1 + 새 메시지 2 + 활성 세션 1
+        assert conn.total_changes - before == 4
+
+        stored_prompt = conn.execute("SELECT content, prompt_ref FROM chat_messages WHERE position = 0").fetchone()
+        assert stored_prompt["content"] is None and stored_prompt["prompt_ref"]
+        assert conn.execute("SELECT COUNT(*) FROM prompts").fetchone()[0] == 1
+
+        tail = chat_repo.get_active_session_tail(2)
+        assert tail is not None
+        assert [m.content for m in tail.messages][1:] == ["새 이야기", "새 답변"] and tail.omitted_messages == 200
+        assert tail.messages[0].content.startswith("시스템 프롬프트")
+
+
+def test_threads_write_concurrently_with_own_connections():
+    """스레드마다 연결을 열고 같은 파일에 동시에 저장해도 잠금 오류 없이 모두 저장됨"""
+    with tempfile.TemporaryDirectory() as tmp:
+        chat_repo = SQLiteChatRepository(Path(tmp) / "daily.db")
+        diary_repo = SQLiteDiaryRepository(database=chat_repo.db)
+        errors = []
+
+        def worker(index: int) -> None:
+            try:
+                user_chats = chat_repo.for_user(f"user{index}")
+                session = ChatSession(session_id=f"s{index}")
+                for turn in range(20):
+                    session.add_message(MessageRole.USER, f"{turn}")
+                    user_chats.save_session(session)
+                diary_repo.for_user(f"user{index}").save(
+                    Diary(diary_date=date(2026, 3, 1) + timedelta(days=index), content=f"{index}")
+                )
+            except Exception as e:  # noqa: BLE001 - 스레드 오류를 메인 스레드에서 확인
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert not errors, errors
+        for i in range(8):
+            stored = chat_repo.for_user(f"user{i}").get_session(f"s{i}")
+            assert stored is not None and stored.version == 20 and len(stored.messages) == 20
+            assert diary_repo.for_user(f"user{i}").list_diaries()[0][0].content == f"{i}"
+        chat_repo.close()
+
+
+def test_save_many_keeps_rows_that_did_not_fail():
+    """날짜가 겹친 일기만 빼고 나머지는 저장하고, 실패한 일기는 PartialSaveError로 알림"""
+    with tempfile.TemporaryDirectory() as tmp, SQLiteDiaryRepository(Path(tmp) / "daily.db") as diary_repo:
+        diary_repo.save(Diary(diary_date=date(2026, 3, 2), content="먼저 쓴 일기"))
+        batch = [Diary(diary_date=date(2026, 3, day), content=f"{day}일") for day in (1, 2, 3)]
+        try:
+            diary_repo.save_many(batch)
+            raise AssertionError("PartialSaveError가 발생해야 합니다")
+        except PartialSaveError as e:
+            assert [d.diary_date.day for d in e.saved] == [1, 3]
+            assert [d.diary_date.day for d, _ in e.failed] == [2] and "이미 존재" in e.failed[0][1]
+
+        assert [d.content for d in diary_repo.list_diaries()[0]] == ["3일", "먼저 쓴 일기", "1일"]
+        assert [d.version for d in batch] == [1, 0, 1]
+
+
+if __name__ == "__main__":
+    print("=== SQLite 저장소 테스트 ===\n")
+    test_wal_mode_and_index_only_query_plans()
+    print("✓ WAL 모드 + 인덱스만 쓰는 쿼리 계획")
+    test_turn_inserts_only_new_message_rows()
+    print("✓ 턴마다 새 메시지 행만 추가")
+    test_threads_write_concurrently_with_own_connections()
+    print("✓ 여러 스레드 동시 저장")
+    test_save_many_keeps_rows_that_did_not_fail()
+    print("✓ 일부 저장 실패 시 나머지는 저장")
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+CLI 시작 시간 회귀 테스트 (python -X importtime 기반)
+
+main.py를 import할 때 무거운 SDK(openai, anthropic, google.generativeai, pymongo)가
+로드되지 않는지, 그리고 전체 import 시간이 예산 안에 있는지 확인합니다.
+
+사용법:
+    python scripts/test_startup_importtime.py
+    uv run pytest scripts/test_startup_importtime.py
+
+환경 변수:
+    STARTUP_IMPORT_BUDGET_MS: main import 누적 시간 예산 (기본: 1500ms)
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+# 프로젝트 루트
+project_root = Path(__file__).parent.parent
+
+# 시작 시 import되면 안 되는 무거운 모듈 (선택된 Provider를 실제로 사용할 때만 로드)
+HEAVY_MODULES = ("openai", "anthropic", "google.generativeai", "pymongo")
+
+DEFAULT_BUDGET_MS = 1500
+
+
+def measure_imports(statement: str) -> dict:
+    """
+    -X importtime으로 import 비용 측정
+
+    Args:
+        statement: 실행할 파이썬 코드 (예: "import main")
+
+    Returns:
+        {모듈 이름: 누적 import 시간(us)}
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=project_root,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    # 형식: "import time:       self [us] |  cumulative | imported package"
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, self_us, cumulative_us, name = [part.strip() for part in line.replace("import time:", "|", 1).split("|")]
+        cumulative[name] = int(cumulative_us)
+
+    return cumulative
+
+
+def _assert_no_heavy_modules(imported: dict, statement: str) -> None:
+    """무거운 모듈이 import되지 않았는지 확인"""
+    loaded = sorted(
+        name for name in imported
+        if any(name == heavy or name.startswith(heavy + ".") for heavy in HEAVY_MODULES)
+    )
+    assert not loaded, f"'{statement}' 실행 시 무거운 모듈이 로드됨: {loaded}"
+
+
+def test_repositories_package_is_lazy():
+    """diary.data.repositories import 시 SDK가 로드되지 않아야 함"""
+    statement = "import diary.data.repositories"
+    _assert_no_heavy_modules(measure_imports(statement), statement)
+
+
+def test_main_import_is_lazy_and_fast():
+    """main import 시 SDK가 로드되지 않고 예산 안에 끝나야 함"""
+    statement = "import main"
+    imported = measure_imports(statement)
+    _assert_no_heavy_modules(imported, statement)
+
+    budget_ms = int(os.getenv("STARTUP_IMPORT_BUDGET_MS", DEFAULT_BUDGET_MS))
+    main_ms = imported.get("main", 0) / 1000
+    assert main_ms <= budget_ms, f"main import {main_ms:.0f}ms > 예산 {budget_ms}ms"
+
+
+if __name__ == "__main__":
+    print("=== CLI 시작 시간 회귀 테스트 ===\n")
+    imported = measure_imports("import main")
+    top = sorted(imported.items(), key=lambda item: item[1], reverse=True)[:10]
+    print("누적 import 시간 상위 10개:")
+    for name, us in top:
+        print(f"  {us / 1000:8.1f} ms  {name}")
+    print()
+
+    test_repositories_package_is_lazy()
+    print("✓ diary.data.repositories: SDK 지연 로딩")
+    test_main_import_is_lazy_and_fast()
+    print("✓ main: SDK 지연 로딩 + 시간 예산 통과")
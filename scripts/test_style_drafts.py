@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+스타일별 일기 초안 동시 생성 테스트 (오프라인, FakeAIClient 사용)
+
+사용법:
+    python scripts/test_style_drafts.py
+    uv run pytest scripts/test_style_drafts.py
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from diary.data.repositories import (
+    FakeAIBehavior,
+    FakeAIClient,
+    FileSystemChatRepository,
+    FileSystemUserPreferencesRepository,
+    FileSystemWritingStyleExamplesRepository,
+)
+from diary.domain.entities import WritingStyle
+from diary.domain.services import ChatService, UserPreferencesService
+
+LATENCY_MS = 300
+
+
+def _build_chat_service(tmp_dir: Path, compare_styles: bool) -> ChatService:
+    """응답마다 LATENCY_MS가 걸리는 가짜 AI로 ChatService 조립 (선작성은 끔)"""
+    preferences_service = UserPreferencesService(
+        FileSystemUserPreferencesRepository(str(tmp_dir / "prefs.json")),
+        FileSystemWritingStyleExamplesRepository(tmp_dir / "examples"),
+    )
+    preferences_service.set_compare_styles(compare_styles)
+    return ChatService(
+        chat_repo=FileSystemChatRepository(tmp_dir / "chats"),
+        ai_client=FakeAIClient(FakeAIBehavior(latency_ms=LATENCY_MS)),
+        preferences_service=preferences_service,
+        speculative_diary=False,
+    )
+
+
+def test_all_styles_are_drafted_concurrently():
+    """세 스타일 초안을 동시에 요청해 한 번 호출 시간과 비슷하게 끝남"""
+    with tempfile.TemporaryDirectory() as tmp:
+        chat_service = _build_chat_service(Path(tmp), compare_styles=True)
+        chat_service.start_new_session()
+        chat_service.send_message("오늘은 친구와 한강에서 자전거를 탔다")
+
+        started = time.perf_counter()
+        _, is_diary = chat_service.send_message("일기 써줘")
+        elapsed = time.perf_counter() - started
+
+        assert is_diary
+        drafts = chat_service.last_style_drafts
+        assert set(drafts) == set(WritingStyle)
+        assert next(iter(drafts)) == WritingStyle.EMOTIONAL_LITERARY  # 현재 스타일이 첫 번째
+        assert elapsed < 2 * LATENCY_MS / 1000
+
+        session = chat_service.get_current_session()
+        assert session is not None
+        usage = session.metadata["token_usage"]
+        assert usage["requests"] == 5  # 인사 + 대화 + 일기 3개
+        chat_service.close()
+
+
+def test_compare_styles_off_keeps_single_draft():
+    """비교를 끄면 초안 하나만 만들고 추가 호출 없음"""
+    with tempfile.TemporaryDirectory() as tmp:
+        chat_service = _build_chat_service(Path(tmp), compare_styles=False)
+        chat_service.start_new_session()
+        _, is_diary = chat_service.send_message("일기 써줘")
+
+        assert is_diary and chat_service.last_style_drafts == {}
+        assert isinstance(chat_service.ai_client, FakeAIClient)
+        assert chat_service.ai_client.call_count == 2
+        chat_service.close()
+
+
+if __name__ == "__main__":
+    print("=== 스타일별 일기 초안 테스트 ===\n")
+    test_all_styles_are_drafted_concurrently()
+    print("✓ 세 스타일 동시 생성")
+    test_compare_styles_off_keeps_single_draft()
+    print("✓ 비교를 끄면 초안 하나")
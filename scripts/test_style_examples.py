@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+스타일 예시 선택 테스트 (대화와 비슷한 예시만 일기 요청에 붙임, 오프라인)
+
+사용법:
+    python scripts/test_style_examples.py
+    uv run pytest scripts/test_style_examples.py
+"""
+
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from diary.data.repositories import (
+    FakeAIClient,
+    FileSystemChatRepository,
+    FileSystemUserPreferencesRepository,
+    FileSystemWritingStyleExamplesRepository,
+)
+from diary.data.repositories import file_writing_style_examples_repository as examples_module
+from diary.domain.entities import WritingStyle
+from diary.domain.services import ChatService, UserPreferencesService
+
+STYLE = WritingStyle.EMOTIONAL_LITERARY
+
+EXAMPLES = [
+    "# 주석은 예시가 아님",
+    "바다는 오늘도 파도를 접어 모래 위에 편지를 남겼다.",
+    "빗방울이 우산 위에서 작은 북을 두드렸다.",
+    "커피잔에 남은 온기가 오후의 졸음을 천천히 데웠다.",
+    "비 오는 골목에서 젖은 우산을 접으며 하루를 내려놓았다.",
+    "회의실의 형광등 아래에서 시간은 종이처럼 얇아졌다.",
+]
+
+
+class RecordingAIClient(FakeAIClient):
+    """호출마다 받은 메시지를 기록"""
+
+    def __init__(self):
+        super().__init__()
+        self.requests = []
+
+    def chat(self, messages, session_id=None, model=None):
+        self.requests.append([dict(m) for m in messages])
+        return super().chat(messages, session_id=session_id, model=model)
+
+
+def _write_examples(examples_dir: Path, lines) -> None:
+    examples_dir.mkdir(parents=True, exist_ok=True)
+    (examples_dir / f"{STYLE.value}.txt").write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def test_similar_examples_use_index_cached_by_file_hash():
+    """대화와 겹치는 표현이 많은 예시부터 고르고, 인덱스는 파일 내용이 바뀔 때만 다시 만듦"""
+    with tempfile.TemporaryDirectory() as tmp:
+        examples_dir = Path(tmp) / "examples"
+        _write_examples(examples_dir, EXAMPLES)
+        repo = FileSystemWritingStyleExamplesRepository(examples_dir)
+
+        similar = repo.find_similar_examples(STYLE, "퇴근길에 비가 와서 우산을 쓰고 골목을 걸었다", 2)
+        assert similar == [EXAMPLES[4], EXAMPLES[2]]
+        assert repo.find_similar_examples(STYLE, "전혀 관계없는 말", 2) == EXAMPLES[1:3]  # 겹치지 않으면 파일 순서
+
+        index_path = examples_dir / ".index" / f"{STYLE.value}.json"
+        source_hash = json.loads(index_path.read_text(encoding="utf-8"))["source_hash"]
+
+        # 다른 프로세스(새 저장소)는 저장된 인덱스를 그대로 사용
+        built = []
+        original_build = examples_module.build_examples_index
+        examples_module.build_examples_index = lambda *args: built.append(args) or original_build(*args)
+        try:
+            reopened = FileSystemWritingStyleExamplesRepository(examples_dir)
+            assert reopened.find_similar_examples(STYLE, "바다와 파도", 1) == [EXAMPLES[1]]
+            assert built == []
+
+            _write_examples(examples_dir, EXAMPLES + ["파도 소리가 창문 너머로 밀려왔다."])
+            assert reopened.find_similar_examples(STYLE, "파도 소리", 1) == ["파도 소리가 창문 너머로 밀려왔다."]
+            assert len(built) == 1
+        finally:
+            examples_module.build_examples_index = original_build
+        assert json.loads(index_path.read_text(encoding="utf-8"))["source_hash"] != source_hash
+
+
+def test_diary_request_appends_bounded_examples_after_system_prompt():
+    """일반 대화에는 예시를 붙이지 않고, 일기 요청에만 비슷한 예시 몇 개를 시스템 프롬프트 뒤에 붙임"""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        # 예시가 많아도 프롬프트에는 STYLE_EXAMPLES_LIMIT개만
+        _write_examples(tmp_dir / "examples", EXAMPLES + [f"{i}번째 하루는 조용히 저물었다." for i in range(500)])
+        preferences_service = UserPreferencesService(
+            FileSystemUserPreferencesRepository(str(tmp_dir / "prefs.json")),
+            FileSystemWritingStyleExamplesRepository(tmp_dir / "examples"),
+        )
+        ai_client = RecordingAIClient()
+        chat_service = ChatService(
+            chat_repo=FileSystemChatRepository(tmp_dir / "chats"),
+            ai_client=ai_client,
+            preferences_service=preferences_service,
+            speculative_diary=False,
+        )
+        session = chat_service.start_new_session()
+        system_prompt = session.messages[0].content
+        assert "예시" not in system_prompt.split("일기 작성 스타일:")[1].split("대화 스타일:")[0]
+
+        chat_service.send_message("비가 와서 우산을 쓰고 골목을 걸었다")
+        assert [m["role"] for m in ai_client.requests[-1]].count("system") == 1
+
+        _, is_diary = chat_service.send_message("일기 써줘")
+        request = ai_client.requests[-1]
+        assert is_diary and request[0]["content"] == system_prompt
+        assert request[1]["role"] == "system" and request[2]["role"] == "assistant"  # 인사 앞
+        lines = [line for line in request[1]["content"].splitlines() if line.startswith("- ")]
+        assert len(lines) == 5 and lines[0] == f"- {EXAMPLES[4]}"
+        chat_service.close()
+
+
+if __name__ == "__main__":
+    print("=== 스타일 예시 선택 테스트 ===\n")
+    test_similar_examples_use_index_cached_by_file_hash()
+    print("✓ 대화와 비슷한 예시 선택 + 파일 해시 기준 인덱스 캐시")
+    test_diary_request_appends_bounded_examples_after_system_prompt()
+    print("✓ 일기 요청에만 예시를 시스템 프롬프트 뒤에 붙임")
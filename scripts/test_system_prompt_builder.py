@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+시스템 프롬프트 캐시 테스트 (오프라인)
+
+사용법:
+    python scripts/test_system_prompt_builder.py
+    uv run pytest scripts/test_system_prompt_builder.py
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from diary.data.repositories import (
+    FileSystemUserPreferencesRepository,
+    FileSystemWritingStyleExamplesRepository,
+)
+from diary.domain.entities import WritingStyle
+from diary.domain.services import UserPreferencesService
+from diary.domain.services.system_prompt_builder import SystemPromptBuilder
+
+
+class CountingExamplesRepository(FileSystemWritingStyleExamplesRepository):
+    """예시 파일을 몇 번 읽었는지 기록"""
+
+    def __init__(self, examples_dir: Path):
+        super().__init__(examples_dir)
+        self.reads = 0
+
+    def get_examples(self, style: WritingStyle) -> list[str]:
+        self.reads += 1
+        return super().get_examples(style)
+
+
+def test_prompt_is_cached_until_style_changes():
+    """스타일이 그대로면 재사용, 바뀌면 다시 조립 (예시 문장은 시스템 프롬프트에 넣지 않음)"""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        examples_repo = CountingExamplesRepository(tmp_dir / "examples")
+        preferences_service = UserPreferencesService(
+            FileSystemUserPreferencesRepository(str(tmp_dir / "prefs.json")), examples_repo
+        )
+        builder = SystemPromptBuilder(preferences_service)
+
+        preferences_service.update_writing_style(WritingStyle.OBJECTIVE_THIRD_PERSON)
+        first = builder.build()
+        assert builder.build() is first
+
+        preferences_service.update_writing_style(WritingStyle.EMOTIONAL_LITERARY)
+        literary = builder.build()
+        assert literary.style == WritingStyle.EMOTIONAL_LITERARY
+        assert literary.prompt_hash != first.prompt_hash
+
+        # 예시 파일이 바뀌어도 프롬프트(Provider 캐시 앞부분)는 그대로
+        (tmp_dir / "examples" / "emotional_literary.txt").write_text("새벽 공기가 유난히 차가웠다.\n", encoding="utf-8")
+        assert builder.build() is literary
+        assert "새벽 공기가" not in literary.text
+        assert examples_repo.reads == 0
+
+
+if __name__ == "__main__":
+    print("=== 시스템 프롬프트 캐시 테스트 ===\n")
+    test_prompt_is_cached_until_style_changes()
+    print("✓ 스타일 변경 시에만 다시 조립")
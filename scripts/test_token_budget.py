@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+토큰 추정 + 요청/세션 예산 테스트 (오프라인, FakeAIClient 사용)
+
+사용법:
+    python scripts/test_token_budget.py
+    uv run pytest scripts/test_token_budget.py
+"""
+
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from diary.data.repositories import (
+    FakeAIClient,
+    FileSystemChatRepository,
+    FileSystemUserPreferencesRepository,
+    FileSystemWritingStyleExamplesRepository,
+)
+from diary.domain.entities import AIProvider, ChatMessage, ChatSession, MessageRole
+from diary.domain.services import ChatService, ContextWindowManager, UserPreferencesService
+from diary.domain.services.token_estimator import TokenEstimator
+
+
+def _build_chat_service(tmp_dir: Path, **kwargs) -> ChatService:
+    """테스트용 ChatService 조립"""
+    preferences_service = UserPreferencesService(
+        FileSystemUserPreferencesRepository(str(tmp_dir / "prefs.json")),
+        FileSystemWritingStyleExamplesRepository(tmp_dir / "examples"),
+    )
+    ai_client = FakeAIClient()
+    return ChatService(
+        chat_repo=FileSystemChatRepository(tmp_dir / "chats"),
+        ai_client=ai_client,
+        preferences_service=preferences_service,
+        **kwargs,
+    )
+
+
+def test_provider_calibration_and_message_cache():
+    """Provider마다 한글 보정값이 다르고, 메시지에 계산 결과를 캐시"""
+    text = "오늘은 친구와 한강에서 자전거를 탔다. It was fun!"
+    openai = TokenEstimator.for_provider(AIProvider.OPENAI).count_text(text)
+    anthropic = TokenEstimator.for_provider(AIProvider.ANTHROPIC).count_text(text)
+    google = TokenEstimator.for_provider(AIProvider.GOOGLE).count_text(text)
+    assert 0 < openai <= google < anthropic
+
+    estimator = TokenEstimator.for_provider(AIProvider.GOOGLE)
+    message = ChatMessage(role=MessageRole.USER, content=text, timestamp=datetime.now())
+    first = estimator.count_message(message)
+    assert message.token_count is not None and message.token_estimator == "google"
+
+    # 캐시된 값이 있으면 다시 계산하지 않음
+    message.token_count = 1
+    assert estimator.count_message(message) == 1 + estimator.message_overhead
+    assert first != 1 + estimator.message_overhead
+
+    restored = ChatMessage.from_dict(message.to_dict())
+    assert restored.token_count == 1 and restored.token_estimator == "google"
+
+
+def test_request_budget_trims_oversized_message():
+    """요약으로도 줄일 수 없는 긴 메시지는 보내기 전에 잘라냄"""
+    manager = ContextWindowManager(FakeAIClient(), request_token_budget=200)
+    session = ChatSession(session_id="s")
+    session.add_message(MessageRole.SYSTEM, "시스템")
+    session.add_message(MessageRole.USER, "가" * 1000)
+
+    history = manager.build_history(session)
+    assert manager.estimator.count_history(history) <= 200
+    assert "중략" in history[-1]["content"]
+    assert session.messages[-1].content == "가" * 1000  # 세션 원본은 그대로
+
+
+def test_session_budget_blocks_before_calling_ai():
+    """세션 예산을 다 쓰면 AI를 호출하지 않고 ValueError"""
+    with tempfile.TemporaryDirectory() as tmp:
+        chat_service = _build_chat_service(Path(tmp), session_token_budget=3000)
+        chat_service.start_new_session()
+
+        ai_client = chat_service.ai_client
+        assert isinstance(ai_client, FakeAIClient)
+        calls = ai_client.call_count
+        try:
+            for _ in range(20):
+                chat_service.send_message("오늘 있었던 일을 길게 이야기해볼게요. " * 20)
+        except ValueError as e:
+            assert "토큰 예산" in str(e)
+        else:
+            raise AssertionError("세션 예산 초과 시 ValueError가 발생해야 함")
+
+        session = chat_service.get_current_session()
+        assert session is not None and chat_service.get_session_token_usage(session) <= 3000
+        assert ai_client.call_count > calls
+
+        for invalid in (0, -100):
+            try:
+                _build_chat_service(Path(tmp), session_token_budget=invalid)
+            except ValueError as e:
+                assert "0보다 커야" in str(e)
+            else:
+                raise AssertionError("0 이하의 세션 예산은 ValueError가 발생해야 함")
+
+
+if __name__ == "__main__":
+    print("=== 토큰 추정 + 예산 테스트 ===\n")
+    test_provider_calibration_and_message_cache()
+    print("✓ Provider별 보정 + 메시지 캐시")
+    test_request_budget_trims_oversized_message()
+    print("✓ 요청 예산 초과 메시지 자르기")
+    test_session_budget_blocks_before_calling_ai()
+    print("✓ 세션 예산 초과 시 AI 호출 전 차단")
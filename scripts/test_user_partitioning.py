@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+사용자별 저장소 분리 테스트 (파일 저장소)
+
+사용법:
+    python scripts/test_user_partitioning.py
+    uv run pytest scripts/test_user_partitioning.py
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from diary.data.repositories import (
+    FileSystemChatRepository,
+    FileSystemCredentialRepository,
+    FileSystemUserPreferencesRepository,
+)
+from diary.domain.entities import (
+    AICredential,
+    AIProvider,
+    ChatSession,
+    MessageRole,
+    UserPreferences,
+    WritingStyle,
+)
+from diary.domain.interfaces import DEFAULT_USER_ID
+
+
+def _session(session_id: str) -> ChatSession:
+    session = ChatSession(session_id=session_id)
+    session.add_message(MessageRole.USER, f"{session_id}의 하루")
+    return session
+
+
+def test_chat_sessions_and_active_session_are_per_user():
+    """사용자마다 세션 목록과 활성 세션이 따로 관리됨"""
+    with tempfile.TemporaryDirectory() as tmp:
+        default_repo = FileSystemChatRepository(Path(tmp) / "chats")
+        alice = default_repo.for_user("alice")
+        bob = default_repo.for_user("bob")
+
+        default_repo.save_session(_session("legacy"))
+        alice.save_session(_session("alice-1"))
+        bob.save_session(_session("bob-1"))
+
+        assert (Path(tmp) / "chats" / "legacy.json").exists()  # 기본 사용자는 기존 경로 그대로
+        assert (Path(tmp) / "users" / "alice" / "chats" / "alice-1.json").exists()
+        assert [s.session_id for s in alice.list_sessions()] == ["alice-1"]
+        assert [s.session_id for s in default_repo.list_sessions()] == ["legacy"]
+        alice_active, bob_active = alice.get_active_session(), bob.get_active_session()
+        assert alice_active is not None and alice_active.session_id == "alice-1"
+        assert bob_active is not None and bob_active.session_id == "bob-1"
+        assert alice.get_session("bob-1") is None
+        assert not alice.delete_session("bob-1")
+
+
+def test_preferences_and_credentials_are_per_user():
+    """설정과 API 키도 사용자별로 저장"""
+    with tempfile.TemporaryDirectory() as tmp:
+        prefs = FileSystemUserPreferencesRepository(str(Path(tmp) / "user_preferences.json"))
+        credentials = FileSystemCredentialRepository(str(Path(tmp) / "credentials.json"))
+        assert prefs.user_id == DEFAULT_USER_ID
+
+        credentials.for_user("alice").save(AICredential(AIProvider.OPENAI, "sk-alice", is_default=True))
+        assert credentials.get_default() is None
+        alice_credential = credentials.for_user("alice").get_default()
+        assert alice_credential is not None and alice_credential.api_key == "sk-alice"
+
+        prefs.for_user("alice").save(UserPreferences(writing_style=WritingStyle.OBJECTIVE_THIRD_PERSON))
+        assert not prefs.exists()
+        alice_prefs = prefs.for_user("alice").get()
+        assert alice_prefs is not None and alice_prefs.writing_style == WritingStyle.OBJECTIVE_THIRD_PERSON
+
+
+def test_invalid_user_id_is_rejected():
+    """경로로 쓸 수 없는 사용자 ID는 거부"""
+    with tempfile.TemporaryDirectory() as tmp:
+        chat_repo = FileSystemChatRepository(Path(tmp) / "chats")
+        for user_id in ["../etc", "", "a/b", ".hidden"]:
+            try:
+                chat_repo.for_user(user_id)
+            except ValueError:
+                continue
+            raise AssertionError(f"ValueError가 발생해야 합니다: {user_id!r}")
+
+
+if __name__ == "__main__":
+    print("=== 사용자별 저장소 분리 테스트 ===\n")
+    test_chat_sessions_and_active_session_are_per_user()
+    print("✓ 사용자별 세션/활성 세션")
+    test_preferences_and_credentials_are_per_user()
+    print("✓ 사용자별 설정/API 키")
+    test_invalid_user_id_is_rejected()
+    print("✓ 잘못된 사용자 ID 거부")